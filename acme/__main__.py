@@ -72,6 +72,7 @@ def parseArgs() -> argparse.Namespace:
 	groupEnableHttp.add_argument('--http', action='store_false', dest='http', default=None, help='run CSE with http server')
 	groupEnableHttp.add_argument('--https', action='store_true', dest='https', default=None, help='run CSE with https server')
 	groupEnableHttp.add_argument('--http-wsgi', action='store_true', dest='httpWsgi', default=None, help='run CSE with http WSGI support')
+	groupEnableHttp.add_argument('--http-asyncio', action='store_true', dest='httpAsyncio', default=None, help='run CSE with the asyncio based http server')
 
 	groupEnableMqtt = parser.add_mutually_exclusive_group()
 	groupEnableMqtt.add_argument('--mqtt', action='store_true', dest='mqttenabled', default=None, help='enable mqtt binding')
@@ -81,6 +82,10 @@ def parseArgs() -> argparse.Namespace:
 	groupEnableWS.add_argument('--ws', action='store_true', dest='wsenabled', default=None, help='enable WebSocket binding')
 	groupEnableWS.add_argument('--no-ws', action='store_false', dest='wsenabled', default=None, help='disable WebSocket binding')
 
+	groupEnableCoAP = parser.add_mutually_exclusive_group()
+	groupEnableCoAP.add_argument('--coap', action='store_true', dest='coapenabled', default=None, help='enable CoAP binding')
+	groupEnableCoAP.add_argument('--no-coap', action='store_false', dest='coapenabled', default=None, help='disable CoAP binding')
+
 	groupRemoteCSE = parser.add_mutually_exclusive_group()
 	groupRemoteCSE.add_argument('--remote-cse', action='store_true', dest='remotecseenabled', default=None, help='enable remote CSE connections')
 	groupRemoteCSE.add_argument('--no-remote-cse', action='store_false', dest='remotecseenabled', default=None, help='disable remote CSE connections')
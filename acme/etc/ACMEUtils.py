@@ -311,14 +311,14 @@ def structuredPathFromRI(ri:str) -> Optional[str]:
 			Structured path, or None in case of an error.
 	"""
 	try:
-		return CSE.storage.identifier(ri)[0]['srn']
+		return CSE.storage.structuredPath(ri)
 	except:
 		return None
 
 
 def riFromStructuredPath(srn: str) -> Optional[str]:
 	""" Get the resource ID from a resource by its structured path. 
-		Makes a lookup to a table in the DB.
+		The mapping is cached, otherwise this makes a lookup to a table in the DB.
 
 		Args:
 			srn: structured path.
@@ -326,7 +326,7 @@ def riFromStructuredPath(srn: str) -> Optional[str]:
 			Resource ID, or None in case of an error.
 	"""
 	try:
-		return CSE.storage.structuredIdentifier(srn)[0]['ri']
+		return CSE.storage.resourceIDFromStructuredPath(srn)
 	except:
 		return None
 
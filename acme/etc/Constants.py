@@ -121,6 +121,9 @@ class Constants(object):
 	attrLocCoordinage = '__locCoordinate__'
 	""" Constant: Name of the 'Resource internal *__locCoordinate__* attribute. This attribute holds the location coordinate of a resource. """
 
+	attrLastWritten = '__lastWritten__'
+	""" Constant: Name of the 'Resource internal *__lastWritten__* attribute. This attribute holds the precise timestamp of the last write of a resource to the database, including updates of attributes that are maintained by the CSE, e.g. *cni*. """
+
 
 	#
 	#	Supported URL schemes
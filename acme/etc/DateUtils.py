@@ -11,7 +11,7 @@ from __future__ import annotations
 from typing import Callable, Union, Tuple, Optional
 
 import time
-from email.utils import formatdate
+from email.utils import formatdate, parsedate_to_datetime
 from datetime import datetime, timedelta, timezone
 import isodate
 
@@ -139,6 +139,22 @@ def rfc1123Date(timeval:Optional[float] = None) -> str:
 	return formatdate(timeval = timeval, localtime = False, usegmt = True)
 
 
+def fromRfc1123Date(date:str) -> Optional[float]:
+	"""	Parse a date time string in RFC 1123 format, e.g. from a HTTP header.
+
+		Args:
+			date: String with the date and time.
+		Return:
+			UTC-based POSIX timestamp, or None if the string cannot be parsed.
+	"""
+	try:
+		if (dt := parsedate_to_datetime(date)).tzinfo is None:	# -0000 means UTC without a time zone
+			dt = dt.replace(tzinfo = timezone.utc)
+		return dt.timestamp()
+	except (TypeError, ValueError):
+		return None
+
+
 def utcDatetime() -> datetime:
 	"""	Return the current datetime, but relative to UTC.
 
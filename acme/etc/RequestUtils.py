@@ -10,6 +10,10 @@ from __future__ import annotations
 
 import cbor2, json
 from typing import Any, cast, Optional, Tuple
+try:
+	import orjson	# Optional, faster JSON codec
+except ImportError:
+	orjson = None
 from urllib.parse import urlparse, urlunparse, parse_qs, urlunparse, urlencode, unquote, ParseResult
 
 from .DateUtils import getResourceDate
@@ -21,6 +25,25 @@ from ..helpers import TextTools
 from ..etc.ResponseStatusCodes import ResponseStatusCode
 
 
+_allowJSONComments = True
+""" Retry decoding JSON without comments if the strict decoding fails. """
+
+_useFastJSONCodec = orjson is not None
+""" Use the faster *orjson* codec, if installed. """
+
+
+def setJSONOptions(allowComments:bool, useFastCodec:bool) -> None:
+	"""	Set the options for JSON serialization and deserialization.
+
+		Args:
+			allowComments: If True then decoding JSON that contains comments is retried after the comments have been removed. Otherwise, such JSON is rejected.
+			useFastCodec: If True then the *orjson* codec is used, but only if it is installed.
+	"""
+	global _allowJSONComments, _useFastJSONCodec
+	_allowJSONComments = allowComments
+	_useFastJSONCodec = useFastCodec and orjson is not None
+
+
 def serializeData(data:JSON, ct:ContentSerializationType) -> Optional[str|bytes|JSON]:
 	"""	Serialize a dictionary, depending on the serialization type.
 
@@ -31,12 +54,20 @@ def serializeData(data:JSON, ct:ContentSerializationType) -> Optional[str|bytes|
 		Return:
 			A data *str* or *byte* object with the serialized data, or *None*.
 	"""
-	if ct == ContentSerializationType.PLAIN:
-		return data
-	encoder = json if ct == ContentSerializationType.JSON else cbor2 if ct == ContentSerializationType.CBOR else None
-	if not encoder:
-		return None
-	return encoder.dumps(data)	# type:ignore[no-any-return]
+	match ct:
+		case ContentSerializationType.PLAIN:
+			return data
+		case ContentSerializationType.JSON:
+			if _useFastJSONCodec:
+				try:
+					return orjson.dumps(data).decode('utf-8')
+				except TypeError:	# e.g. integers that exceed 64 bit. Let the standard codec handle it
+					pass
+			return json.dumps(data)
+		case ContentSerializationType.CBOR:
+			return cbor2.dumps(data)
+		case _:
+			return None
 
 
 def deserializeData(data:bytes, ct:ContentSerializationType) -> Optional[JSON]:
@@ -53,7 +84,19 @@ def deserializeData(data:bytes, ct:ContentSerializationType) -> Optional[JSON]:
 		return {}
 	match ct:
 		case ContentSerializationType.JSON:
-			return cast(JSON, json.loads(TextTools.removeCommentsFromJSON(data.decode('utf-8'))))
+			# Strict decoding first. Comments are not allowed in oneM2M JSON
+			try:
+				if _useFastJSONCodec:
+					try:
+						return cast(JSON, orjson.loads(data))
+					except orjson.JSONDecodeError:
+						pass	# e.g. non-standard constants like NaN. Let the standard codec decide
+				return cast(JSON, json.loads(data))
+			except ValueError:
+				if not _allowJSONComments:
+					raise
+			# Compatibility: retry without comments
+			return cast(JSON, json.loads(TextTools.removeCommentsFromJSON(data.decode('utf-8') if isinstance(data, bytes) else data)))
 		case ContentSerializationType.CBOR:
 			return cast(JSON, cbor2.loads(data))
 		case _:
@@ -228,6 +271,9 @@ def requestFromResult(inResult:Result,
 	if inResult.request.rset is not None:
 		req['rset'] = inResult.request.rset
 
+	# Entity tag of a retrieved resource (ACME specific)
+	if isResponse and inResult.etag:
+		req['etag'] = inResult.etag
 
 
 	# If the response contains a request (ie. for polling), then add that request to the pc
@@ -265,7 +311,10 @@ def requestFromResult(inResult:Result,
 				  resource = inResult.resource, 
 				  request = inResult.request, 
 				  embeddedRequest = inResult.embeddedRequest, 
-				  rsc = inResult.rsc)
+				  rsc = inResult.rsc,
+				  etag = inResult.etag,
+				  lastModified = inResult.lastModified,
+				  notModified = inResult.notModified)
 
 
 def prepareResultForSending(inResult:Result, 
@@ -1937,6 +1937,14 @@ class Result:
 	""" Optional `CSERequest`. """
 	embeddedRequest:Optional[CSERequest]	= None		# May contain a request as a response, e.g. when polling
 	""" Optional embedded `CSERequest`. """
+	retryAfter:Optional[float]				= None		# Set when a request was rejected because the CSE is overloaded
+	""" Optional time in seconds after which a rejected request may be retried. """
+	etag:Optional[str]						= None		# Set for RETRIEVE results of a single resource
+	""" Optional entity tag of the retrieved resource representation. """
+	lastModified:Optional[float]			= None		
+	""" Optional UTC based timestamp of the last modification of the retrieved resource. """
+	notModified:bool						= False		# Set when a conditional RETRIEVE matched
+	""" Indicates that the originator's representation is still current, so the resource is not returned. """
 
 
 	# def errorResultCopy(self) -> Result:
@@ -2393,6 +2401,15 @@ class CSERequest:
 	_ma:Optional[float] = None
 	""" maxAge duration converted """
 
+	inm:Optional[list[str]] = None
+	"""	ifNoneMatch: Entity tags of representations the originator already has (ACME specific). """
+
+	ims:Optional[str] = None
+	"""	ifModifiedSince: Timestamp of the representation the originator already has (ACME specific). """
+
+	_imsUTCts:Optional[float] = None
+	""" ifModifiedSince converted to a UTC based timestamp """
+
 	pc:Optional[JSON] = None
 	""" The request's primitive content as a dictionary. """
 	
@@ -2426,6 +2443,9 @@ class CSERequest:
 	_ot:Optional[float] = None
 	""" The timestamp when this request object was created. """
 
+	_parentResource:Resource = None		# type: ignore # Actually this is a Resource type, but have a circular import problem.
+	"""	The already retrieved parent resource of a CREATE request, e.g. shared between the requests of a batch. """
+
 
 
 	def fillOriginalRequest(self, update:bool = False) -> None:
@@ -0,0 +1,417 @@
+#
+#	AsyncioHttpServer.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	A HTTP/1.1 server based on asyncio that serves a WSGI application
+#
+
+"""	A HTTP/1.1 server based on *asyncio* that serves a WSGI application.
+
+	Connections are handled by a single event loop, so that idle keep-alive connections,
+	slow clients, and the transfer of request and response bodies do not occupy a thread.
+	Only the call of the WSGI application itself is executed in a thread of a bounded pool.
+
+	Note, that the WSGI application is called synchronously. A request that blocks in the
+	application, e.g. a blocking or long-polling request, occupies a thread of the pool for
+	its whole duration. The pool must therefore be sized for the expected number of such
+	requests that are processed in parallel. Further requests wait until a thread is available.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+import asyncio, ssl, sys, io, socket
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http import HTTPStatus
+from urllib.parse import unquote_to_bytes
+
+
+_maxHeaderSize = 65536
+""" Maximum size of the request line and headers of a request. """
+
+
+class AsyncioHttpServer(object):
+	"""	HTTP/1.1 server that runs a WSGI application in an *asyncio* event loop.
+	"""
+
+	__slots__ = (
+		'app',
+		'host',
+		'port',
+		'threads',
+		'connectionLimit',
+		'keepAliveTimeout',
+		'maxBodySize',
+		'sslContext',
+		'sock',
+		'logger',
+		'_loop',
+		'_server',
+		'_executor',
+		'_connectionSemaphore',
+		'_connections',
+	)
+
+	def __init__(self, app:Callable,
+					   host:str,
+					   port:int,
+					   threads:int = 100,
+					   connectionLimit:int = 1000,
+					   keepAliveTimeout:float = 60.0,
+					   maxBodySize:int = 10485760,
+					   sslContext:Optional[ssl.SSLContext] = None,
+					   sock:Optional[socket.socket] = None,
+					   logger:Optional[Callable[[str], Any]] = None) -> None:
+		"""	Initialize the server.
+
+			Args:
+				app: The WSGI application.
+				host: The interface to listen on.
+				port: The port to listen on.
+				threads: The maximum number of threads that call the WSGI application in parallel.
+				connectionLimit: The maximum number of connections that are served in parallel. Further connections wait until a connection is closed.
+				keepAliveTimeout: Time in seconds after which an idle connection is closed.
+				maxBodySize: The maximum size in bytes of a request body. Larger requests are rejected with *413 Content Too Large*.
+				sslContext: Optional SSL context for serving https.
+				sock: Optional already bound and listening socket. If given then *host* and *port* are not used for binding.
+				logger: Optional callable for logging requests.
+		"""
+		self.app = app
+		""" The WSGI application. """
+		self.host = host
+		""" The interface to listen on. """
+		self.port = port
+		""" The port to listen on. """
+		self.threads = threads
+		""" The maximum number of threads that call the WSGI application in parallel. """
+		self.connectionLimit = connectionLimit
+		""" The maximum number of connections that are served in parallel. """
+		self.keepAliveTimeout = keepAliveTimeout
+		""" Time in seconds after which an idle connection is closed. """
+		self.maxBodySize = maxBodySize
+		""" The maximum size in bytes of a request body. """
+		self.sslContext = sslContext
+		""" Optional SSL context for serving https. """
+		self.sock = sock
+		""" Optional already bound and listening socket. """
+		self.logger = logger
+		""" Optional callable for logging requests. """
+		self._loop:asyncio.AbstractEventLoop = None
+		""" The event loop of the server. """
+		self._server:asyncio.AbstractServer = None
+		""" The asyncio server. """
+		self._executor:ThreadPoolExecutor = None
+		""" The thread pool for calling the WSGI application. """
+		self._connectionSemaphore:asyncio.Semaphore = None
+		""" Semaphore to limit the number of connections served in parallel. """
+		self._connections:set[asyncio.StreamWriter] = set()
+		""" The currently open connections. """
+
+
+	def serveForever(self) -> None:
+		"""	Run the server. This method only returns after the server is shut down.
+		"""
+		self._executor = ThreadPoolExecutor(max_workers = self.threads, thread_name_prefix = 'httpWorker')
+		try:
+			asyncio.run(self._serve())
+		finally:
+			self._executor.shutdown(wait = False)
+
+
+	def shutdown(self) -> None:
+		"""	Stop the server. This method may be called from any thread.
+		"""
+		if self._loop and self._server:
+			self._loop.call_soon_threadsafe(self._close)
+
+
+	def _close(self) -> None:
+		"""	Close the listening socket and all open connections. This is executed in the event loop.
+		"""
+		self._server.close()
+		for writer in list(self._connections):
+			writer.close()
+
+
+	async def _serve(self) -> None:
+		"""	Create the listening socket and serve connections until the server is closed.
+		"""
+		self._loop = asyncio.get_running_loop()
+		self._connectionSemaphore = asyncio.Semaphore(self.connectionLimit)
+		if self.sock:
+			self._server = await asyncio.start_server(self._handleConnection,
+													  sock = self.sock,
+													  ssl = self.sslContext,
+													  limit = _maxHeaderSize)
+		else:
+			self._server = await asyncio.start_server(self._handleConnection,
+													  self.host,
+													  self.port,
+													  ssl = self.sslContext,
+													  limit = _maxHeaderSize,
+													  reuse_address = True)
+		async with self._server:
+			try:
+				await self._server.serve_forever()
+			except asyncio.CancelledError:
+				pass
+
+
+	async def _handleConnection(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> None:
+		"""	Handle all requests of a single connection.
+
+			Args:
+				reader: The stream reader of the connection.
+				writer: The stream writer of the connection.
+		"""
+		self._connections.add(writer)
+		async with self._connectionSemaphore:
+			try:
+				while await self._handleRequest(reader, writer):
+					pass
+			except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.CancelledError, ssl.SSLError):
+				pass	# Connection closed by the client, timed out, or the server is shut down
+			finally:
+				self._connections.discard(writer)
+				writer.close()
+				try:
+					await writer.wait_closed()
+				except Exception:
+					pass
+
+
+	async def _handleRequest(self, reader:asyncio.StreamReader, writer:asyncio.StreamWriter) -> bool:
+		"""	Read a single request, call the WSGI application, and write the response.
+
+			Args:
+				reader: The stream reader of the connection.
+				writer: The stream writer of the connection.
+
+			Return:
+				True if the connection should be kept open for further requests.
+		"""
+		# Read the request line and headers. Wait at most *keepAliveTimeout* for a new request.
+		try:
+			head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keepAliveTimeout)
+		except asyncio.IncompleteReadError as e:
+			if e.partial.strip():
+				await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+			return False
+		except asyncio.LimitOverrunError:
+			await self._sendError(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+			return False
+
+		lines = head.decode('iso-8859-1').split('\r\n')
+		try:
+			method, target, version = lines[0].split(' ', 2)
+		except ValueError:
+			await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+			return False
+		if version not in ('HTTP/1.1', 'HTTP/1.0'):
+			await self._sendError(writer, HTTPStatus.HTTP_VERSION_NOT_SUPPORTED)
+			return False
+
+		headers:list[tuple[str, str]] = []
+		for line in lines[1:]:
+			if not line:
+				continue
+			name, sep, value = line.partition(':')
+			if not sep:
+				await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+				return False
+			headers.append((name.strip().lower(), value.strip()))
+
+		# Reject ambiguous message framing: more than one Content-Length header, or both a Content-Length and a
+		# Transfer-Encoding header. Otherwise, a proxy in front of the server may determine another request length.
+		contentLengths = [ v for n, v in headers if n == 'content-length' ]
+		transferEncodings = [ v for n, v in headers if n == 'transfer-encoding' ]
+		if len(contentLengths) > 1 or (contentLengths and transferEncodings):
+			await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+			return False
+		headerDict = dict(headers)
+
+		# Determine whether the connection is kept open
+		connection = headerDict.get('connection', '').lower()
+		keepAlive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+		# Read the body. Oversized bodies are rejected before they are read.
+		chunked = 'chunked' in ','.join(transferEncodings).lower()
+		length = 0
+		if not chunked:
+			if contentLengths:
+				if not contentLengths[0].isdigit():	# Only plain digits, no signs, separators or lists
+					await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+					return False
+				length = int(contentLengths[0])
+			if length > self.maxBodySize:
+				await self._sendError(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+				return False
+		if headerDict.get('expect', '').lower() == '100-continue':
+			writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+		if chunked:
+			try:
+				_body = await self._readChunked(reader)
+			except (ValueError, asyncio.LimitOverrunError, asyncio.IncompleteReadError):
+				await self._sendError(writer, HTTPStatus.BAD_REQUEST)
+				return False
+			if _body is None:
+				await self._sendError(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+				return False
+			body = _body
+		else:
+			body = await reader.readexactly(length) if length > 0 else b''
+
+		# Call the WSGI application in a thread of the pool
+		environ = self._buildEnviron(method, target, version, headers, body, writer)
+		status, responseHeaders, responseBody = await self._loop.run_in_executor(self._executor, self._callApplication, environ)
+
+		# Write the response
+		names = { n.lower() for n, _ in responseHeaders }
+		if 'content-length' not in names:
+			responseHeaders.append(('Content-Length', str(len(responseBody))))
+		if 'date' not in names:
+			responseHeaders.append(('Date', formatdate(usegmt = True)))
+		if not keepAlive:
+			responseHeaders.append(('Connection', 'close'))
+		elif version == 'HTTP/1.0':
+			responseHeaders.append(('Connection', 'keep-alive'))
+		response = [ f'{version} {status}\r\n' ]
+		response.extend(f'{n}: {v}\r\n' for n, v in responseHeaders)
+		response.append('\r\n')
+		writer.write(''.join(response).encode('iso-8859-1'))
+		if method != 'HEAD':
+			writer.write(responseBody)
+		await writer.drain()
+
+		if self.logger:
+			self.logger(f'"{lines[0]}" {status.split(" ", 1)[0]} {len(responseBody)}')
+		return keepAlive
+
+
+	async def _readChunked(self, reader:asyncio.StreamReader) -> Optional[bytes]:
+		"""	Read a body with chunked transfer encoding.
+
+			Args:
+				reader: The stream reader of the connection.
+
+			Return:
+				The body, or None if the body exceeds the maximum body size. In this case the remaining body is not read.
+
+			Raises:
+				`ValueError`: If a chunk is malformed.
+				`asyncio.LimitOverrunError`: If a chunk-size or trailer line exceeds the stream limit.
+				`asyncio.IncompleteReadError`: If the connection is closed before the body is complete.
+		"""
+		body = bytearray()
+		while True:
+			size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0].strip(), 16)
+			if size < 0:
+				raise ValueError('negative chunk size')
+			if len(body) + size > self.maxBodySize:
+				return None
+			if size == 0:
+				# Skip optional trailers
+				while (await reader.readuntil(b'\r\n')) != b'\r\n':
+					pass
+				return bytes(body)
+			body += await reader.readexactly(size)
+			if await reader.readexactly(2) != b'\r\n':	# CRLF after each chunk
+				raise ValueError('missing CRLF after chunk')
+
+
+	def _buildEnviron(self, method:str,
+							target:str,
+							version:str,
+							headers:list[tuple[str, str]],
+							body:bytes,
+							writer:asyncio.StreamWriter) -> dict[str, Any]:
+		"""	Build the WSGI environment for a request.
+
+			Args:
+				method: The request method.
+				target: The request target.
+				version: The http version.
+				headers: The request headers with lower case names.
+				body: The request body.
+				writer: The stream writer of the connection.
+
+			Return:
+				The WSGI environment.
+		"""
+		# Remove the scheme and host from an absolute target
+		if target.startswith(('http://', 'https://')):
+			target = '/' + target.split('/', 3)[3] if target.count('/') >= 3 else '/'
+		path, _, query = target.partition('?')
+		peer = writer.get_extra_info('peername') or ('', 0)
+		environ:dict[str, Any] = {
+			'REQUEST_METHOD':		method,
+			'SCRIPT_NAME':			'',
+			'PATH_INFO':			unquote_to_bytes(path).decode('iso-8859-1'),
+			'QUERY_STRING':			query,
+			'REQUEST_URI':			target,
+			'RAW_URI':				target,
+			'SERVER_NAME':			self.host,
+			'SERVER_PORT':			str(self.port),
+			'SERVER_PROTOCOL':		version,
+			'REMOTE_ADDR':			peer[0],
+			'REMOTE_PORT':			str(peer[1]),
+			'CONTENT_LENGTH':		str(len(body)),
+			'wsgi.version':			(1, 0),
+			'wsgi.url_scheme':		'https' if self.sslContext else 'http',
+			'wsgi.input':			io.BytesIO(body),
+			'wsgi.errors':			sys.stderr,
+			'wsgi.multithread':		True,
+			'wsgi.multiprocess':	False,
+			'wsgi.run_once':		False,
+		}
+		for name, value in headers:
+			if name == 'content-type':
+				environ['CONTENT_TYPE'] = value
+			elif name in ('content-length', 'transfer-encoding'):
+				continue
+			else:
+				key = f'HTTP_{name.upper().replace("-", "_")}'
+				environ[key] = f'{environ[key]},{value}' if key in environ else value
+		return environ
+
+
+	def _callApplication(self, environ:dict[str, Any]) -> tuple[str, list[tuple[str, str]], bytes]:
+		"""	Call the WSGI application and collect the response. This is executed in a thread of the pool.
+
+			Args:
+				environ: The WSGI environment.
+
+			Return:
+				Tuple with the status line, the response headers, and the response body.
+		"""
+		response:list[Any] = []
+
+		def startResponse(status:str, headers:list[tuple[str, str]], excInfo:Any = None) -> Callable[[bytes], None]:
+			response[:] = [ status, list(headers) ]
+			return lambda data: chunks.append(data)
+
+		chunks:list[bytes] = []
+		try:
+			result = self.app(environ, startResponse)
+			try:
+				chunks.extend(result)
+			finally:
+				if hasattr(result, 'close'):
+					result.close()
+		except Exception:
+			return f'{HTTPStatus.INTERNAL_SERVER_ERROR.value} {HTTPStatus.INTERNAL_SERVER_ERROR.phrase}', [], b''
+		return response[0], response[1], b''.join(chunks)
+
+
+	async def _sendError(self, writer:asyncio.StreamWriter, status:HTTPStatus) -> None:
+		"""	Send an error response and close the connection.
+
+			Args:
+				writer: The stream writer of the connection.
+				status: The http status to send.
+		"""
+		writer.write(f'HTTP/1.1 {status.value} {status.phrase}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n'.encode('iso-8859-1'))
+		await writer.drain()
@@ -0,0 +1,315 @@
+#
+#	AsyncioWebSocketServer.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	A WebSocket server based on asyncio
+#
+
+"""	A WebSocket server based on *asyncio*.
+
+	All connections, those accepted by the server as well as those opened to other WebSocket
+	servers, are handled by a single event loop, so that idle connections do not occupy a thread.
+	Only the handling of a received message is executed in a thread of a bounded pool.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Optional, Sequence
+from dataclasses import dataclass
+
+import asyncio, ssl
+from concurrent.futures import ThreadPoolExecutor
+
+from websockets.datastructures import Headers
+from websockets.exceptions import ConnectionClosed
+from websockets.legacy.protocol import WebSocketCommonProtocol
+from websockets.legacy.server import serve, WebSocketServer, WebSocketServerProtocol
+from websockets.legacy.client import connect
+
+
+@dataclass
+class AsyncioWebSocketRequest:
+	"""	The opening handshake request of a connection.
+	"""
+	path:str
+	""" The request path. """
+	headers:Headers
+	""" The request headers. """
+
+
+class AsyncioWebSocketConnection(object):
+	"""	Thread-safe wrapper for a WebSocket connection that is handled by the event loop of an `AsyncioWebSocketServer`.
+
+		It provides the same interface as the connections of the synchronous *websockets* implementation,
+		so that both kinds of connections can be used in the same way by callers in other threads.
+	"""
+
+	__slots__ = (
+		'websocket',
+		'loop',
+		'sendTimeout',
+		'id',
+		'subprotocol',
+		'request',
+		'protocol',
+	)
+
+	def __init__(self, websocket:WebSocketCommonProtocol, loop:asyncio.AbstractEventLoop, sendTimeout:float, path:str, headers:Headers) -> None:
+		"""	Initialize the connection.
+
+			Args:
+				websocket: The asyncio WebSocket connection.
+				loop: The event loop that handles the connection.
+				sendTimeout: Time in seconds to wait at most for sending a message.
+				path: The request path of the opening handshake.
+				headers: The request headers of the opening handshake.
+		"""
+		self.websocket = websocket
+		""" The asyncio WebSocket connection. """
+		self.loop = loop
+		""" The event loop that handles the connection. """
+		self.sendTimeout = sendTimeout
+		""" Time in seconds to wait at most for sending a message. """
+		self.id = websocket.id
+		""" The unique ID of the connection. """
+		self.subprotocol = websocket.subprotocol
+		""" The negotiated subprotocol. """
+		self.request = AsyncioWebSocketRequest(path, headers)
+		""" The opening handshake request. """
+		self.protocol = websocket
+		""" The protocol object. Its *state* attribute indicates whether the connection is open or closed. """
+
+
+	def send(self, message:str|bytes) -> None:
+		"""	Send a message and wait until it has been written. This must not be called from the event loop's thread.
+
+			Args:
+				message: The message to send.
+		"""
+		asyncio.run_coroutine_threadsafe(self.websocket.send(message), self.loop).result(self.sendTimeout)
+
+
+	def close(self) -> None:
+		"""	Close the connection. This method does not wait until the connection is closed.
+		"""
+		asyncio.run_coroutine_threadsafe(self.websocket.close(), self.loop)
+
+
+class AsyncioWebSocketServer(object):
+	"""	WebSocket server that handles all connections in an *asyncio* event loop.
+
+		Received messages are passed to the *onMessage* callback, which is executed in a thread of a pool.
+		The messages of a connection are handled in parallel.
+	"""
+
+	__slots__ = (
+		'host',
+		'port',
+		'onConnect',
+		'onMessage',
+		'onClose',
+		'subprotocols',
+		'threads',
+		'compression',
+		'sendTimeout',
+		'sslContext',
+		'logger',
+		'_loop',
+		'_server',
+		'_executor',
+		'_connections',
+	)
+
+	def __init__(self, host:str,
+					   port:int,
+					   onConnect:Callable[[AsyncioWebSocketConnection], Any],
+					   onMessage:Callable[[AsyncioWebSocketConnection, Any, str|bytes], None],
+					   onClose:Callable[[AsyncioWebSocketConnection, Any], None],
+					   subprotocols:Optional[Sequence[str]] = None,
+					   threads:int = 100,
+					   compression:bool = True,
+					   sendTimeout:float = 10.0,
+					   sslContext:Optional[ssl.SSLContext] = None,
+					   logger:Optional[Callable[[str], Any]] = None) -> None:
+		"""	Initialize the server.
+
+			Args:
+				host: The interface to listen on.
+				port: The port to listen on.
+				onConnect: Callback for a new incoming connection. It returns a context object for the connection, or None to close the connection.
+				onMessage: Callback for a received message. It receives the connection, the connection's context, and the message.
+				onClose: Callback for a closed connection. It receives the connection and the connection's context.
+				subprotocols: The supported subprotocols.
+				threads: The maximum number of threads that handle received messages in parallel.
+				compression: Whether the *permessage-deflate* extension is negotiated. Each compressed connection needs additional memory.
+				sendTimeout: Time in seconds to wait at most for sending a message.
+				sslContext: Optional SSL context for serving *wss*.
+				logger: Optional callable for logging errors.
+		"""
+		self.host = host
+		""" The interface to listen on. """
+		self.port = port
+		""" The port to listen on. """
+		self.onConnect = onConnect
+		""" Callback for a new incoming connection. """
+		self.onMessage = onMessage
+		""" Callback for a received message. """
+		self.onClose = onClose
+		""" Callback for a closed connection. """
+		self.subprotocols = subprotocols
+		""" The supported subprotocols. """
+		self.threads = threads
+		""" The maximum number of threads that handle received messages in parallel. """
+		self.compression = compression
+		""" Whether the *permessage-deflate* extension is negotiated. """
+		self.sendTimeout = sendTimeout
+		""" Time in seconds to wait at most for sending a message. """
+		self.sslContext = sslContext
+		""" Optional SSL context for serving *wss*. """
+		self.logger = logger
+		""" Optional callable for logging errors. """
+		self._loop:asyncio.AbstractEventLoop = None
+		""" The event loop of the server. """
+		self._server:WebSocketServer = None
+		""" The asyncio WebSocket server. """
+		self._executor:ThreadPoolExecutor = None
+		""" The thread pool for handling received messages. """
+		self._connections:set[AsyncioWebSocketConnection] = set()
+		""" The currently open connections. """
+
+
+	def serveForever(self) -> None:
+		"""	Run the server. This method only returns after the server is shut down.
+		"""
+		self._executor = ThreadPoolExecutor(max_workers = self.threads, thread_name_prefix = 'wsWorker')
+		try:
+			asyncio.run(self._serve())
+		finally:
+			self._executor.shutdown(wait = False)
+			self._loop = None
+
+
+	def shutdown(self) -> None:
+		"""	Stop the server and close all connections. This method may be called from any thread.
+		"""
+		if self._loop and self._server:
+			self._loop.call_soon_threadsafe(self._close)
+
+
+	def connectionCount(self) -> int:
+		"""	Return the number of open connections.
+
+			Return:
+				The number of incoming and outgoing connections that are currently open.
+		"""
+		return len(self._connections)
+
+
+	def connect(self, url:str,
+					  subprotocols:Sequence[str],
+					  headers:dict[str, str],
+					  context:Any,
+					  timeout:float = 10.0) -> AsyncioWebSocketConnection:
+		"""	Open a connection to another WebSocket server. The connection is handled by the server's event loop,
+			and received messages are passed to the *onMessage* callback like those of incoming connections.
+			This method must not be called from the event loop's thread.
+
+			Args:
+				url: The URL of the WebSocket server.
+				subprotocols: The subprotocols to request.
+				headers: Additional headers for the opening handshake.
+				context: The context object for the connection that is passed to the callbacks.
+				timeout: Time in seconds to wait at most for the connection.
+
+			Return:
+				The connection.
+		"""
+		if not self._loop:
+			raise ConnectionRefusedError('WebSocket server is not running')
+		return asyncio.run_coroutine_threadsafe(self._connect(url, subprotocols, headers, context, timeout), self._loop).result()
+
+
+	def _close(self) -> None:
+		"""	Close the listening socket and all open connections. This is executed in the event loop.
+		"""
+		self._server.close()	# This also closes the incoming connections
+		for connection in list(self._connections):
+			self._loop.create_task(connection.websocket.close())
+
+
+	async def _serve(self) -> None:
+		"""	Create the listening socket and serve connections until the server is closed.
+		"""
+		self._loop = asyncio.get_running_loop()
+		self._server = await serve(self._handleConnection,
+								   self.host,
+								   self.port,
+								   subprotocols = self.subprotocols,	# type:ignore[arg-type]
+								   compression = 'deflate' if self.compression else None,
+								   ssl = self.sslContext,
+								   reuse_address = True)
+		await self._server.wait_closed()
+
+
+	async def _connect(self, url:str, subprotocols:Sequence[str], headers:dict[str, str], context:Any, timeout:float) -> AsyncioWebSocketConnection:
+		"""	Open a connection to another WebSocket server and start receiving its messages. This is executed in the event loop.
+
+			Args:
+				url: The URL of the WebSocket server.
+				subprotocols: The subprotocols to request.
+				headers: Additional headers for the opening handshake.
+				context: The context object for the connection.
+				timeout: Time in seconds to wait at most for the connection.
+
+			Return:
+				The connection.
+		"""
+		websocket = await connect(url,
+								  subprotocols = subprotocols,	# type:ignore[arg-type]
+								  extra_headers = headers,
+								  compression = 'deflate' if self.compression else None,
+								  open_timeout = timeout)
+		connection = AsyncioWebSocketConnection(websocket, self._loop, self.sendTimeout, websocket.path, websocket.request_headers)
+		self._loop.create_task(self._receive(connection, context))
+		return connection
+
+
+	async def _handleConnection(self, websocket:WebSocketServerProtocol) -> None:
+		"""	Handle an incoming connection until it is closed.
+
+			Args:
+				websocket: The WebSocket connection.
+		"""
+		connection = AsyncioWebSocketConnection(websocket, self._loop, self.sendTimeout, websocket.path, websocket.request_headers)
+		if (context := await self._loop.run_in_executor(self._executor, self.onConnect, connection)) is None:
+			return	# Closes the connection
+		await self._receive(connection, context)
+
+
+	async def _receive(self, connection:AsyncioWebSocketConnection, context:Any) -> None:
+		"""	Receive the messages of a connection and pass them to the thread pool until the connection is closed.
+
+			Args:
+				connection: The WebSocket connection.
+				context: The context object for the connection.
+		"""
+		self._connections.add(connection)
+		try:
+			async for message in connection.websocket:
+				self._loop.run_in_executor(self._executor, self.onMessage, connection, context, message).add_done_callback(self._logException)
+		except ConnectionClosed:
+			pass
+		finally:
+			self._connections.discard(connection)
+			self._loop.run_in_executor(self._executor, self.onClose, connection, context).add_done_callback(self._logException)
+
+
+	def _logException(self, future:asyncio.Future) -> None:
+		"""	Log an exception of a callback.
+
+			Args:
+				future: The future of the callback.
+		"""
+		if not future.cancelled() and (e := future.exception()) and self.logger:
+			self.logger(f'Exception during WebSocket callback: {e}')
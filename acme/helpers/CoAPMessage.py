@@ -0,0 +1,430 @@
+#
+#	CoAPMessage.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Encoding and decoding of CoAP messages
+#
+
+"""	Encoding and decoding of CoAP messages (RFC 7252), including the *Block1* and
+	*Block2* options for block-wise transfers (RFC 7959) and the oneM2M specific
+	options of the CoAP binding (TS-0008).
+"""
+
+from __future__ import annotations
+from typing import Optional, Tuple
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+
+class CoAPFormatError(ValueError):
+	"""	Raised when a datagram is not a well-formed CoAP message.
+	"""
+
+
+class CoAPType(IntEnum):
+	"""	CoAP message types.
+	"""
+	CON = 0
+	"""	Confirmable. """
+	NON = 1
+	"""	Non-confirmable. """
+	ACK = 2
+	"""	Acknowledgement. """
+	RST = 3
+	"""	Reset. """
+
+
+def coapCode(codeClass:int, codeDetail:int) -> int:
+	"""	Build a CoAP code from its class and detail, e.g. 2.05 -> *coapCode(2, 5)*.
+
+		Args:
+			codeClass: The code class (0-7).
+			codeDetail: The code detail (0-31).
+
+		Return:
+			The code as an integer.
+	"""
+	return (codeClass << 5) | codeDetail
+
+
+def coapCodeToString(code:int) -> str:
+	"""	Return the dotted representation of a CoAP code, e.g. "2.05".
+
+		Args:
+			code: The code as an integer.
+
+		Return:
+			The code as a string.
+	"""
+	return f'{code >> 5}.{code & 0x1f:02d}'
+
+
+class CoAPCode(IntEnum):
+	"""	CoAP method and response codes.
+	"""
+	EMPTY							= coapCode(0, 0)
+	GET								= coapCode(0, 1)
+	POST							= coapCode(0, 2)
+	PUT								= coapCode(0, 3)
+	DELETE							= coapCode(0, 4)
+
+	CREATED							= coapCode(2, 1)
+	DELETED							= coapCode(2, 2)
+	VALID							= coapCode(2, 3)
+	CHANGED							= coapCode(2, 4)
+	CONTENT							= coapCode(2, 5)
+	CONTINUE						= coapCode(2, 31)
+
+	BAD_REQUEST						= coapCode(4, 0)
+	BAD_OPTION						= coapCode(4, 2)
+	FORBIDDEN						= coapCode(4, 3)
+	NOT_FOUND						= coapCode(4, 4)
+	METHOD_NOT_ALLOWED				= coapCode(4, 5)
+	NOT_ACCEPTABLE					= coapCode(4, 6)
+	REQUEST_ENTITY_INCOMPLETE		= coapCode(4, 8)
+	CONFLICT						= coapCode(4, 9)
+	REQUEST_ENTITY_TOO_LARGE		= coapCode(4, 13)
+	UNSUPPORTED_CONTENT_FORMAT		= coapCode(4, 15)
+
+	INTERNAL_SERVER_ERROR			= coapCode(5, 0)
+	NOT_IMPLEMENTED					= coapCode(5, 1)
+	SERVICE_UNAVAILABLE				= coapCode(5, 3)
+	GATEWAY_TIMEOUT					= coapCode(5, 4)
+
+
+class CoAPOption(IntEnum):
+	"""	CoAP option numbers, including the oneM2M options of the CoAP binding.
+	"""
+	IF_MATCH			= 1
+	URI_HOST			= 3
+	ETAG				= 4
+	IF_NONE_MATCH		= 5
+	URI_PORT			= 7
+	LOCATION_PATH		= 8
+	URI_PATH			= 11
+	CONTENT_FORMAT		= 12
+	MAX_AGE				= 14
+	URI_QUERY			= 15
+	ACCEPT				= 17
+	LOCATION_QUERY		= 20
+	BLOCK2				= 23
+	BLOCK1				= 27
+	SIZE2				= 28
+	PROXY_URI			= 35
+	PROXY_SCHEME		= 39
+	SIZE1				= 60
+
+	ONEM2M_FR			= 256
+	ONEM2M_RQI			= 257
+	ONEM2M_OT			= 259
+	ONEM2M_RQET			= 260
+	ONEM2M_RSET			= 261
+	ONEM2M_OET			= 262
+	ONEM2M_RTURI		= 263
+	ONEM2M_EC			= 264
+	ONEM2M_RSC			= 265
+	ONEM2M_GID			= 266
+	ONEM2M_TY			= 267
+	ONEM2M_CTO			= 268
+	ONEM2M_CTS			= 269
+	ONEM2M_ATI			= 270
+	ONEM2M_RVI			= 271
+	ONEM2M_VSI			= 272
+	ONEM2M_GTM			= 273
+	ONEM2M_AUS			= 274
+	ONEM2M_ASRI			= 275
+	ONEM2M_OMR			= 276
+	ONEM2M_PRPI			= 277
+	ONEM2M_MSU			= 278
+
+
+	@property
+	def isCritical(self) -> bool:
+		"""	Critical options have odd numbers. A request with an unrecognized critical option must be rejected.
+		"""
+		return bool(self.value & 0x01)
+
+
+class CoAPContentFormat(IntEnum):
+	"""	CoAP content formats that are relevant for oneM2M.
+	"""
+	TEXT_PLAIN			= 0
+	APPLICATION_XML		= 41
+	APPLICATION_JSON	= 50
+	APPLICATION_CBOR	= 60
+
+
+def encodeUint(value:int) -> bytes:
+	"""	Encode an unsigned integer option value with the minimal number of bytes.
+
+		Args:
+			value: The value to encode.
+
+		Return:
+			The encoded value. The value *0* is encoded as an empty byte string.
+	"""
+	return value.to_bytes((value.bit_length() + 7) // 8, 'big')
+
+
+def decodeUint(value:bytes) -> int:
+	"""	Decode an unsigned integer option value.
+
+		Args:
+			value: The encoded value.
+
+		Return:
+			The integer value.
+	"""
+	return int.from_bytes(value, 'big')
+
+
+def encodeBlock(num:int, more:bool, szx:int) -> int:
+	"""	Build the value of a *Block1* or *Block2* option.
+
+		Args:
+			num: The block number.
+			more: Flag whether more blocks follow.
+			szx: The size exponent. The block size is 2**(szx+4).
+
+		Return:
+			The option value.
+	"""
+	return (num << 4) | (0x08 if more else 0) | szx
+
+
+def decodeBlock(value:int) -> Tuple[int, bool, int]:
+	"""	Split the value of a *Block1* or *Block2* option into its parts.
+
+		Args:
+			value: The option value.
+
+		Return:
+			Tuple of block number, more-flag and size exponent.
+	"""
+	return value >> 4, bool(value & 0x08), value & 0x07
+
+
+def blockSizeToSzx(size:int) -> int:
+	"""	Return the size exponent for a block size.
+
+		Args:
+			size: The block size. It must be a power of two between 16 and 1024.
+
+		Return:
+			The size exponent.
+	"""
+	return size.bit_length() - 5
+
+
+def szxToBlockSize(szx:int) -> int:
+	"""	Return the block size for a size exponent.
+
+		Args:
+			szx: The size exponent.
+
+		Return:
+			The block size.
+	"""
+	return 1 << (szx + 4)
+
+
+def _encodeOptionNibble(value:int) -> Tuple[int, bytes]:
+	if value < 13:
+		return value, b''
+	if value < 269:
+		return 13, (value - 13).to_bytes(1, 'big')
+	return 14, (value - 269).to_bytes(2, 'big')
+
+
+def _decodeOptionNibble(nibble:int, data:bytes, index:int) -> Tuple[int, int]:
+	match nibble:
+		case 13:
+			if index + 1 > len(data):
+				raise CoAPFormatError('truncated option')
+			return data[index] + 13, index + 1
+		case 14:
+			if index + 2 > len(data):
+				raise CoAPFormatError('truncated option')
+			return int.from_bytes(data[index:index + 2], 'big') + 269, index + 2
+		case 15:
+			raise CoAPFormatError('reserved option nibble')
+	return nibble, index
+
+
+@dataclass
+class CoAPMessage:
+	"""	A CoAP message.
+	"""
+	type:CoAPType
+	"""	The message type. """
+	code:int
+	"""	The method or response code. """
+	mid:int
+	"""	The message ID. """
+	token:bytes = b''
+	"""	The token. """
+	options:list[Tuple[int, bytes]] = field(default_factory = list)
+	"""	The options as (number, value) tuples. Repeatable options occur multiple times in their order. """
+	payload:bytes = b''
+	"""	The payload. """
+
+
+	@property
+	def isEmpty(self) -> bool:
+		"""	Whether the message is an empty message (code 0.00).
+		"""
+		return self.code == CoAPCode.EMPTY
+
+
+	@property
+	def isRequest(self) -> bool:
+		"""	Whether the message is a request (code class 0, except 0.00).
+		"""
+		return self.code >> 5 == 0 and self.code != CoAPCode.EMPTY
+
+
+	def addOption(self, number:int, value:bytes|str|int) -> CoAPMessage:
+		"""	Add an option to the message.
+
+			Args:
+				number: The option number.
+				value: The option value. Strings are UTF-8 encoded, integers are encoded as unsigned integers.
+
+			Return:
+				The message itself.
+		"""
+		if isinstance(value, str):
+			value = value.encode('utf-8')
+		elif isinstance(value, int):
+			value = encodeUint(value)
+		self.options.append((number, value))
+		return self
+
+
+	def getOptions(self, number:int) -> list[bytes]:
+		"""	Return all values of an option.
+
+			Args:
+				number: The option number.
+
+			Return:
+				List of option values, in the order of the message.
+		"""
+		return [ v for n, v in self.options if n == number ]
+
+
+	def getOption(self, number:int) -> Optional[bytes]:
+		"""	Return the first value of an option.
+
+			Args:
+				number: The option number.
+
+			Return:
+				The option value, or None if the option is not present.
+		"""
+		for n, v in self.options:
+			if n == number:
+				return v
+		return None
+
+
+	def getStringOption(self, number:int) -> Optional[str]:
+		"""	Return the first value of an option as a string.
+
+			Args:
+				number: The option number.
+
+			Return:
+				The decoded option value, or None if the option is not present.
+		"""
+		return v.decode('utf-8') if (v := self.getOption(number)) is not None else None
+
+
+	def getUintOption(self, number:int) -> Optional[int]:
+		"""	Return the first value of an option as an unsigned integer.
+
+			Args:
+				number: The option number.
+
+			Return:
+				The decoded option value, or None if the option is not present.
+		"""
+		return decodeUint(v) if (v := self.getOption(number)) is not None else None
+
+
+	def encode(self) -> bytes:
+		"""	Encode the message.
+
+			Return:
+				The datagram.
+		"""
+		result = bytearray()
+		result.append(0x40 | (self.type << 4) | len(self.token))
+		result.append(self.code)
+		result += self.mid.to_bytes(2, 'big')
+		result += self.token
+
+		lastNumber = 0
+		for number, value in sorted(self.options, key = lambda o: o[0]):	# sort is stable, so repeated options keep their order
+			delta, deltaExt = _encodeOptionNibble(number - lastNumber)
+			length, lengthExt = _encodeOptionNibble(len(value))
+			result.append((delta << 4) | length)
+			result += deltaExt
+			result += lengthExt
+			result += value
+			lastNumber = number
+
+		if self.payload:
+			result.append(0xff)
+			result += self.payload
+		return bytes(result)
+
+
+	@classmethod
+	def decode(cls, data:bytes) -> CoAPMessage:
+		"""	Decode a datagram.
+
+			Args:
+				data: The datagram.
+
+			Return:
+				The message.
+
+			Raises:
+				CoAPFormatError: If the datagram is not a well-formed CoAP message.
+		"""
+		if len(data) < 4:
+			raise CoAPFormatError('message too short')
+		if data[0] >> 6 != 1:
+			raise CoAPFormatError(f'unsupported version: {data[0] >> 6}')
+		if (tkl := data[0] & 0x0f) > 8:
+			raise CoAPFormatError(f'invalid token length: {tkl}')
+		if len(data) < 4 + tkl:
+			raise CoAPFormatError('truncated token')
+
+		message = cls(type = CoAPType((data[0] >> 4) & 0x03),
+					  code = data[1],
+					  mid = int.from_bytes(data[2:4], 'big'),
+					  token = data[4:4 + tkl])
+		if message.isEmpty and len(data) > 4:
+			raise CoAPFormatError('empty message with content')
+
+		index = 4 + tkl
+		number = 0
+		while index < len(data):
+			if data[index] == 0xff:
+				if index + 1 == len(data):
+					raise CoAPFormatError('payload marker without payload')
+				message.payload = data[index + 1:]
+				break
+			delta, length = data[index] >> 4, data[index] & 0x0f
+			delta, index = _decodeOptionNibble(delta, data, index + 1)
+			length, index = _decodeOptionNibble(length, data, index)
+			if index + length > len(data):
+				raise CoAPFormatError('truncated option value')
+			number += delta
+			message.options.append((number, data[index:index + length]))
+			index += length
+		return message
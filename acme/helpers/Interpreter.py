@@ -257,8 +257,8 @@ class SSymbol(object):
 		self.length:int = 0
 		""" The length of the symbol. Could be the length of a string, number of items in a list etc. """
 
-		# Try to determine an unknown type
-		if value:
+		# Try to determine an unknown type. False, 0 and empty values are valid values, too
+		if value is not None:
 			match value:
 				case bool():
 					boolean = value
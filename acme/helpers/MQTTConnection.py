@@ -9,10 +9,12 @@
 """ Implementation of an MQTT Client helper class. """
 
 from __future__ import annotations
-from typing import Callable, Any, Tuple, Optional, TypeAlias, cast
+from typing import Callable, Any, Tuple, Optional, TypeAlias, Protocol, cast
 
 import ssl, time
 from dataclasses import dataclass
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 from ..helpers.BackgroundWorker import BackgroundWorkerPool, BackgroundWorker
@@ -41,6 +43,8 @@ class MQTTTopic:
 	""" The callback function for the topic. """
 	callbackArgs:Optional[dict] = None
 	""" The callback arguments for the topic. """
+	filter:Optional[str] = None
+	""" The topic filter to match received messages against. This is the topic without a shared subscription prefix. """
 
 
 class MQTTHandler(object):
@@ -170,6 +174,12 @@ class MQTTConnection(object):
 		'messageHandler',
 		'actor',
 		'subscribedTopics',
+		'workers',
+		'qos',
+		'executor',
+		'publishLock',
+		'publishedCount',
+		'acknowledgedCount',
 	)
 	"""	Slots of the class. """
 
@@ -190,7 +200,9 @@ class MQTTConnection(object):
 					   certfile:Optional[str] = None, 
 					   keyfile:Optional[str] = None,
 					   lowLevelLogging:bool = True,
-					   messageHandler:Optional[MQTTHandler] = None
+					   messageHandler:Optional[MQTTHandler] = None,
+					   workers:int = 0,
+					   qos:int = 0
 				) -> None:
 		"""	Constructor. Initialize the MQTT client.
 
@@ -209,6 +221,8 @@ class MQTTConnection(object):
 				keyfile: The key file for the MQTT client.
 				lowLevelLogging: Indicator whether to log MQTT messages.
 				messageHandler: The message handler.
+				workers: Number of worker threads that handle received messages. If 0 then every message is handled in a new thread.
+				qos: The QoS level for subscriptions and published messages.
 		"""
 		
 		self.address								= address
@@ -254,6 +268,18 @@ class MQTTConnection(object):
 		""" The actor for the MQTT client. """
 		self.subscribedTopics:dict[str, MQTTTopic]	= {}
 		""" The list of subscribed-to topics. """
+		self.workers								= workers
+		""" Number of worker threads that handle received messages. """
+		self.qos									= qos
+		""" The QoS level for subscriptions and published messages. """
+		self.executor:Optional[ThreadPoolExecutor]	= None
+		""" The worker pool for handling received messages. """
+		self.publishLock							= Lock()
+		""" Lock for the publish counters. """
+		self.publishedCount							= 0
+		""" The number of published messages. """
+		self.acknowledgedCount						= 0
+		""" The number of published messages that have been sent (QoS 0) or acknowledged by the broker (QoS 1 and 2). """
 
 	
 	def shutdown(self) -> bool:
@@ -272,9 +298,16 @@ class MQTTConnection(object):
 			# wait a moment for all unsubscribe ACKs to arrive
 			while len(self.subscribedTopics) > 0:
 				time.sleep(0.1)
+			# wait a moment for the outstanding publish ACKs to arrive
+			_timeout = time.time() + self.keepalive
+			while self.isConnected and self.inflightCount() > 0 and time.time() < _timeout:
+				time.sleep(0.1)
 			# Then disconnect. The actor is stoped implicitly
 			self.mqttClient.disconnect()
 			self.actor = None
+		if self.executor:
+			self.executor.shutdown(wait = False)
+			self.executor = None
 
 		self.messageHandler and self.messageHandler.logging(self, logging.INFO, 'MQTT client shut down')
 		return True
@@ -309,6 +342,11 @@ class MQTTConnection(object):
 		self.mqttClient.on_subscribe	= self._onSubscribe
 		self.mqttClient.on_unsubscribe	= self._onUnsubscribe
 		self.mqttClient.on_message		= self._onMessage
+		self.mqttClient.on_publish		= self._onPublish
+
+		# Start the worker pool for received messages
+		if self.workers > 0 and not self.executor:
+			self.executor = ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = 'MQTTWorker')
 
 		try:
 			self.messageHandler and self.messageHandler.logging(self, logging.DEBUG, f'MQTT: connecting to host:{self.address}, port:{self.port}, keepalive: {self.keepalive}, bind: {self.bindIF}')
@@ -403,7 +441,7 @@ class MQTTConnection(object):
 		self.lowLevelLogging and self.messageHandler and self.messageHandler.logging(self, mqtt.LOGGING_LEVEL[cast(mqtt_en.LogLevel, level)], f'MQTT: {buf}')
 	
 
-	def _onSubscribe(self, client:MQTTClient, userdata:Any, mid:int, reason_code_list:list[mqtt_rc.ReasonCode], properties:mqtt_pr.Properties) -> None:
+	def _onSubscribe(self, client:MQTTClient, userdata:Any, mid:int, reason_code_list:list[mqtt_rc.ReasonCode], properties:Optional[mqtt_pr.Properties] = None) -> None:
 		"""	Callback when the client successfulle subscribed to a topic. The topic
 			is also added to the internal topic list.
 
@@ -412,6 +450,7 @@ class MQTTConnection(object):
 				userdata: User data.
 				mid: The message ID.
 				reason_code_list: Reason codes received from the broker for each subscription
+				properties: MQTT v5 properties. Not passed for MQTT v3.1.1 connections.
 		"""
 		# TODO doc, error check when not connected, not subscribed
 		for t in self.subscribedTopics.values():
@@ -451,18 +490,49 @@ class MQTTConnection(object):
 				message: The received message.
 		"""
 		self.lowLevelLogging and self.messageHandler and self.messageHandler.logging(self, logging.DEBUG, f'MQTT: received topic:{message.topic}, payload:{message.payload!r}')
-		for t in self.subscribedTopics.keys():
-			if simpleMatch(message.topic, t, star='#'):
-				if (topic := self.subscribedTopics[t]).callback:
-					# Run actual request handling in a thread
-					# For some reasons mid is not initialized in the on on_message callback, so we use the timestamp for the actor name
-					BackgroundWorkerPool.newActor(topic.callback, name=f'mid_{message.timestamp}').start(	connection=self,
-																											topic=message.topic,
-																											data=message.payload, 
-																											**topic.callbackArgs)
+		for topic in self.subscribedTopics.values():
+			if simpleMatch(message.topic, topic.filter, star='#'):
+				if topic.callback:
+					if self.executor:
+						# Queue the actual request handling for the worker pool
+						self.executor.submit(self._handleMessage, topic, message.topic, message.payload)
+					else:
+						# Run actual request handling in a thread
+						# For some reasons mid is not initialized in the on on_message callback, so we use the timestamp for the actor name
+						BackgroundWorkerPool.newActor(topic.callback, name=f'mid_{message.timestamp}').start(	connection=self,
+																												topic=message.topic,
+																												data=message.payload, 
+																												**topic.callbackArgs)
 					break	# break at first occurence
 
 
+	def _handleMessage(self, topic:MQTTTopic, messageTopic:str, data:bytes) -> None:
+		"""	Call the callback for a received message in a worker thread.
+
+			Args:
+				topic: The subscribed-to topic that matched the message.
+				messageTopic: The topic of the received message.
+				data: The message's payload.
+		"""
+		try:
+			topic.callback(connection = self, topic = messageTopic, data = data, **topic.callbackArgs)
+		except Exception as e:
+			self.messageHandler and self.messageHandler.logging(self, logging.ERROR, f'MQTT: exception during callback {topic.callback.__name__}: {e}')
+
+
+	def _onPublish(self, client:MQTTClient, userdata:Any, mid:int) -> None:
+		"""	Callback when a published message has been sent to the broker (QoS 0),
+			or has been acknowledged by the broker (QoS 1 and 2).
+
+			Args:
+				client: The MQTT client.
+				userdata: User data.
+				mid: The message ID.
+		"""
+		with self.publishLock:
+			self.acknowledgedCount += 1
+
+
 	#
 	#	MQTT messaging methods
 	#
@@ -482,8 +552,13 @@ class MQTTConnection(object):
 			if topic in self.subscribedTopics:
 				self.messageHandler and self.messageHandler.logging(self, logging.WARNING, f'MQTT: topic already subscribed: {topic}')
 				return
-			if (r := self.mqttClient.subscribe(topic))[0] == 0:
-				t = MQTTTopic(topic = topic, mid=r[1], callback=callback, callbackArgs=kwargs)
+			if (r := self.mqttClient.subscribe(topic, qos = self.qos))[0] == 0:
+				# A shared subscription "$share/<group>/<filter>" receives messages with topics that match <filter>
+				t = MQTTTopic(topic = topic, 
+							  mid = r[1], 
+							  callback = callback, 
+							  callbackArgs = kwargs, 
+							  filter = topic.split('/', 2)[2] if topic.startswith('$share/') else topic)
 				self.subscribedTopics[topic] = t
 			else:
 				self.messageHandler and self.messageHandler.logging(self, logging.ERROR, f'MQTT: cannot subscribe: {r[0]}')
@@ -541,14 +616,34 @@ class MQTTConnection(object):
 		return self.subscribedCount == len(self.subscribedTopics)
 
 
-	def publish(self, topic:str, data:bytes) -> None:
+	def publish(self, topic:str, data:bytes) -> bool:
 		"""	Publish the message *data* with the topic *topic* with the MQTT broker.
+			The message is queued for sending, and the method returns without waiting for the 
+			broker's acknowledgement. See `inflightCount()`.
 		
 			Args:
 				topic: The topic to publish to.
 				data: The data to publish.
+
+			Return:
+				True if the message was queued for sending, False otherwise.
 		"""
-		self.mqttClient.publish(topic, data)
+		if (info := self.mqttClient.publish(topic, data, qos = self.qos)).rc != mqtt.MQTT_ERR_SUCCESS:
+			self.messageHandler and self.messageHandler.logging(self, logging.ERROR, f'MQTT: cannot publish: {info.rc} ({mqtt.error_string(info.rc)})')
+			return False
+		with self.publishLock:
+			self.publishedCount += 1
+		return True
+
+
+	def inflightCount(self) -> int:
+		"""	Return the number of published messages that have not been sent (QoS 0) or acknowledged by the broker (QoS 1 and 2) yet.
+
+			Return:
+				The number of in-flight messages.
+		"""
+		with self.publishLock:
+			return max(self.publishedCount - self.acknowledgedCount, 0)
 
 
 
@@ -602,5 +697,11 @@ def mqttToId(mqttId:str, isCSE:Optional[bool] = True) -> Tuple[str, bool]:
 	return mqttId[2:].replace(':', '/'), isCSE
 
 
-MQTTCallback = Callable[[MQTTConnection, str, bytes], None]
-""" Type for an MQTT Callback. """
+class MQTTCallback(Protocol):
+	"""	Type for an MQTT Callback. It is called with the connection, the topic of the received message,
+		and the message's payload as keyword arguments, followed by the additional arguments given
+		when subscribing to the topic.
+	"""
+	__name__:str
+
+	def __call__(self, connection:MQTTConnection, topic:str, data:bytes) -> None: ...
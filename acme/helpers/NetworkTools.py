@@ -83,6 +83,44 @@ def isTCPPortAvailable(port:int) -> bool:
 	return True
 
 
+def supportsReusePort() -> bool:
+	"""	Check whether the operating system supports sharing a listening TCP port between processes.
+
+		Return:
+			True if the *SO_REUSEPORT* socket option is available, or False otherwise.
+	"""
+	return hasattr(socket, 'SO_REUSEPORT')
+
+
+def createReusePortSocket(host:str, port:int, backlog:int = 1024) -> socket.socket:
+	"""	Create a listening TCP socket with the *SO_REUSEPORT* option set. Several processes can
+		listen on the same address and port this way, and the operating system distributes the
+		incoming connections between them.
+
+		Args:
+			host: The network interface or IP address to bind to.
+			port: The port to bind to.
+			backlog: The maximum number of queued connections.
+
+		Return:
+			The listening socket.
+
+		Raises:
+			OSError: In case the socket cannot be created or bound.
+	"""
+	family, _, _, _, address = socket.getaddrinfo(host, port, type = socket.SOCK_STREAM, flags = socket.AI_PASSIVE)[0]
+	sock = socket.socket(family, socket.SOCK_STREAM)
+	try:
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+		sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+		sock.bind(address)
+		sock.listen(backlog)
+	except OSError:
+		sock.close()
+		raise
+	return sock
+
+
 def getIPAddress(hostname:Optional[str] = None) -> str:
 	"""	Lookup and return the IP address for a host name.
 	
@@ -5,6 +5,9 @@
 #	License: BSD 3-Clause License. See the LICENSE file for further details.
 #
 """	This module implements OAuth token retrieval.
+
+	It is used by clients outside of the CSE process, e.g. the test suite, and therefore sends its
+	requests directly and not through the CSE's http connection pool.
 """
 
 from __future__ import annotations
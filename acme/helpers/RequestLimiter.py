@@ -0,0 +1,267 @@
+#
+#	RequestLimiter.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Limiters for the number and the rate of requests
+#
+
+"""	This module provides limiters for the requests that are processed by the CSE.
+
+	The `RequestLimiter` limits the number of requests that are processed in parallel. Requests that
+	exceed the limit wait in a bounded queue for a free slot. Requests that find the queue full, or that
+	do not get a slot before their deadline, are rejected immediately, so that an overloaded CSE answers
+	quickly instead of letting the work pile up until all requests time out.
+
+	The `TokenBucketLimiter` limits the rate of requests per originator, so that a single originator
+	cannot saturate the CSE.
+"""
+
+from __future__ import annotations
+from typing import Dict, Optional, Tuple, Hashable
+from dataclasses import dataclass, asdict
+
+import time
+from threading import Condition, Lock
+
+
+@dataclass
+class RequestLimiterStats:
+	"""	Statistics of a `RequestLimiter` for a single binding.
+	"""
+	inFlight:int = 0
+	""" Number of requests currently being processed. """
+	queued:int = 0
+	""" Number of requests currently waiting for a free slot. """
+	maxQueued:int = 0
+	""" Highest number of requests that waited at the same time. """
+	admitted:int = 0
+	""" Number of admitted requests. """
+	rejected:int = 0
+	""" Number of requests rejected because the queue was full. """
+	expired:int = 0
+	""" Number of requests rejected because their deadline passed while waiting. """
+
+
+class RequestLimiter(object):
+	"""	Limit the number of requests that are processed in parallel.
+
+		A request must be admitted by `admit()` before it is processed, and `release()` must be called
+		after it has been processed. Statistics are kept separately for each binding.
+	"""
+
+	__slots__ = (
+		'maxInFlight',
+		'maxQueued',
+		'queueTimeout',
+		'_condition',
+		'_inFlight',
+		'_queued',
+		'_stats',
+	)
+
+	def __init__(self, maxInFlight:int, maxQueued:int, queueTimeout:float) -> None:
+		"""	Initialize the limiter.
+
+			Args:
+				maxInFlight: Maximum number of requests that are processed in parallel.
+				maxQueued: Maximum number of requests that wait for a free slot. 0 means that requests don't wait.
+				queueTimeout: Maximum time in seconds a request waits for a free slot.
+		"""
+		self.maxInFlight = maxInFlight
+		""" Maximum number of requests that are processed in parallel. """
+		self.maxQueued = maxQueued
+		""" Maximum number of requests that wait for a free slot. """
+		self.queueTimeout = queueTimeout
+		""" Maximum time in seconds a request waits for a free slot. """
+		self._condition = Condition()
+		""" Condition to wait for and signal free slots. """
+		self._inFlight = 0
+		""" Number of requests currently being processed. """
+		self._queued = 0
+		""" Number of requests currently waiting for a free slot. """
+		self._stats:Dict[str, RequestLimiterStats] = {}
+		""" Statistics per binding. """
+
+
+	def admit(self, binding:str, deadline:Optional[float] = None) -> Optional[str]:
+		"""	Admit a request for processing. If all slots are taken then wait in the queue for a free slot.
+
+			Args:
+				binding: The name of the binding that received the request.
+				deadline: Optional UTC-based timestamp after which the request must not wait anymore, e.g. its expiration time.
+
+			Return:
+				None if the request is admitted, otherwise a message that explains why it was rejected.
+		"""
+		with self._condition:
+			if not (stats := self._stats.get(binding)):
+				stats = self._stats[binding] = RequestLimiterStats()
+
+			# Admit immediately if there is a free slot and no other request is waiting for it
+			if self._inFlight < self.maxInFlight and self._queued == 0:
+				self._inFlight += 1
+				stats.inFlight += 1
+				stats.admitted += 1
+				return None
+
+			if self._queued >= self.maxQueued:
+				stats.rejected += 1
+				return f'too many requests in process ({self._inFlight}) and waiting ({self._queued})'
+
+			# Wait for a free slot until the queue timeout or the request's deadline is reached
+			timeout = self.queueTimeout
+			if deadline is not None:
+				timeout = min(timeout, deadline - time.time())
+			endTime = time.monotonic() + timeout
+
+			self._queued += 1
+			stats.queued += 1
+			stats.maxQueued = max(stats.maxQueued, stats.queued)
+			try:
+				while self._inFlight >= self.maxInFlight:
+					if (remaining := endTime - time.monotonic()) <= 0.0:
+						stats.expired += 1
+						return f'no free slot within {self.queueTimeout if deadline is None else max(timeout, 0.0):.3f} seconds'
+					self._condition.wait(remaining)
+				self._inFlight += 1
+				stats.inFlight += 1
+				stats.admitted += 1
+				return None
+			finally:
+				self._queued -= 1
+				stats.queued -= 1
+
+
+	def release(self, binding:str) -> None:
+		"""	Release the slot of an admitted request and wake up a waiting request.
+
+			Args:
+				binding: The name of the binding that received the request.
+		"""
+		with self._condition:
+			self._inFlight -= 1
+			self._stats[binding].inFlight -= 1
+			self._condition.notify()
+
+
+	def getStats(self) -> Dict[str, Dict[str, int]]:
+		"""	Return the statistics for all bindings.
+
+			Return:
+				Dictionary that maps binding names to their statistics.
+		"""
+		with self._condition:
+			return { binding: asdict(stats) for binding, stats in self._stats.items() }
+
+
+class TokenBucketLimiter(object):
+	"""	Limit the rate of requests per originator with token buckets.
+
+		Each originator has its own bucket that holds at most *burst* tokens and is refilled with *rate*
+		tokens per second. Every request takes one token, and requests that find the bucket empty are rejected.
+		
+		Rules can define different rates for requests that match a key, e.g. an operation and a resource type.
+		Requests that match a rule only take a token from the originator's bucket for that rule.
+	"""
+
+	__slots__ = (
+		'rate',
+		'burst',
+		'rules',
+		'maxBuckets',
+		'_lock',
+		'_buckets',
+		'_admitted',
+		'_rejected',
+	)
+
+	def __init__(self, rate:float, burst:int, rules:Optional[Dict[Hashable, Tuple[float, int]]] = None, maxBuckets:int = 10000) -> None:
+		"""	Initialize the limiter.
+
+			Args:
+				rate: Number of tokens per second that are added to a bucket. 0.0 means that only requests that match a rule are limited.
+				burst: Maximum number of tokens in a bucket, ie. the number of requests that may be sent at once.
+				rules: Optional dictionary that maps rule keys to (rate, burst) tuples.
+				maxBuckets: Number of buckets after which buckets that are full again are removed.
+		"""
+		self.rate = rate
+		""" Number of tokens per second that are added to a bucket. """
+		self.burst = burst
+		""" Maximum number of tokens in a bucket. """
+		self.rules = rules if rules else {}
+		""" Dictionary that maps rule keys to (rate, burst) tuples. """
+		self.maxBuckets = maxBuckets
+		""" Number of buckets after which buckets that are full again are removed. """
+		self._lock = Lock()
+		""" Lock for the buckets and counters. """
+		self._buckets:Dict[Tuple[str, Hashable], list] = {}
+		""" Buckets by (originator, rule key). Each bucket is a list [tokens, timestamp of the last update, rate, burst]. """
+		self._admitted = 0
+		""" Number of admitted requests. """
+		self._rejected = 0
+		""" Number of rejected requests. """
+
+
+	def admit(self, originator:str, *keys:Hashable) -> Optional[float]:
+		"""	Take a token from an originator's bucket.
+
+			Args:
+				originator: The originator of the request.
+				keys: Rule keys to check in order. The first key that has a rule determines the bucket.
+					If no key has a rule then the originator's default bucket is used.
+
+			Return:
+				None if the request is admitted, otherwise the time in seconds until a token becomes available.
+		"""
+		ruleKey:Hashable = None
+		rate, burst = self.rate, self.burst
+		for key in keys:
+			if (rule := self.rules.get(key)):
+				ruleKey = key
+				rate, burst = rule
+				break
+		if rate <= 0.0:
+			return None		# not limited
+
+		now = time.monotonic()
+		with self._lock:
+			if not (bucket := self._buckets.get((originator, ruleKey))):
+				if len(self._buckets) >= self.maxBuckets:
+					self._purge(now)
+				bucket = self._buckets[(originator, ruleKey)] = [ float(burst), now, rate, burst ]
+			else:
+				bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+				bucket[1] = now
+			
+			if bucket[0] >= 1.0:
+				bucket[0] -= 1.0
+				self._admitted += 1
+				return None
+			self._rejected += 1
+			return (1.0 - bucket[0]) / rate
+
+
+	def _purge(self, now:float) -> None:
+		"""	Remove the buckets that are full again. If there are still too many buckets then remove the
+			half of the buckets that were least recently used. This must be called while holding the lock.
+
+			Args:
+				now: The current monotonic time.
+		"""
+		for key in [ k for k, (tokens, timestamp, rate, burst) in self._buckets.items() if tokens + (now - timestamp) * rate >= burst ]:
+			del self._buckets[key]
+		if len(self._buckets) >= self.maxBuckets:
+			for key in sorted(self._buckets, key = lambda k: self._buckets[k][1])[:len(self._buckets) // 2]:
+				del self._buckets[key]
+
+
+	def getStats(self) -> Dict[str, int]:
+		"""	Return the statistics of the limiter.
+
+			Return:
+				Dictionary with the number of admitted and rejected requests, and the number of buckets.
+		"""
+		with self._lock:
+			return { 'admitted': self._admitted, 'rejected': self._rejected, 'buckets': len(self._buckets) }
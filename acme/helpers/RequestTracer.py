@@ -0,0 +1,437 @@
+#
+#	RequestTracer.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Lightweight tracing of the processing stages of requests
+#
+
+"""	This module provides a lightweight tracer for the processing stages of requests.
+
+	A trace is started when a request is received and finished when its response is sent. In between,
+	the processing stages record *spans* with monotonic start and end timestamps. The trace of the
+	current request is kept per thread, so that the stages only need to call `span()` or be decorated
+	with `traced()`, and don't need to pass the trace around. When no trace is active for the current
+	thread then both are no-ops.
+
+	Finished traces are kept in memory and can be exported as Chrome trace event files, which can be
+	loaded into *chrome://tracing* or *Perfetto*, or as OTLP JSON files.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
+
+import os, random, time, json
+from collections import deque
+from functools import wraps
+from threading import Lock, local, current_thread
+
+
+_local = local()
+""" Thread-local storage for the trace of the current request. """
+
+_F = TypeVar('_F', bound = Callable[..., Any])
+
+
+class TraceSpan(object):
+	"""	A single processing stage of a trace.
+	"""
+
+	__slots__ = (
+		'name',
+		'start',
+		'end',
+		'parent',
+	)
+
+	def __init__(self, name:str, start:int, parent:int) -> None:
+		self.name = name
+		""" The name of the stage. """
+		self.start = start
+		""" Monotonic start timestamp in nanoseconds. """
+		self.end = 0
+		""" Monotonic end timestamp in nanoseconds, or 0 if the span is not finished. """
+		self.parent = parent
+		""" Index of the parent span in the trace, or -1 for the root span. """
+
+
+	@property
+	def duration(self) -> int:
+		"""	The duration of the span in nanoseconds.
+		"""
+		return self.end - self.start if self.end else 0
+
+
+class RequestTrace(object):
+	"""	The trace of a single request. The first span is the root span of the whole request.
+	"""
+
+	__slots__ = (
+		'traceID',
+		'threadName',
+		'wallStart',
+		'spans',
+		'attributes',
+		'_stack',
+	)
+
+	def __init__(self, name:str) -> None:
+		self.traceID = random.getrandbits(128)
+		""" Random trace ID. """
+		self.threadName = current_thread().name
+		""" Name of the thread that processed the request. """
+		self.wallStart = time.time_ns()
+		""" Wall clock time of the start of the trace in nanoseconds. Used to convert the monotonic timestamps. """
+		self.spans:list[TraceSpan] = [ TraceSpan(name, time.perf_counter_ns(), -1) ]
+		""" The spans of the trace, in the order they were started. """
+		self.attributes:Dict[str, Any] = {}
+		""" Additional attributes of the request, e.g. the operation and target. """
+		self._stack:list[int] = [ 0 ]
+		""" Indexes of the currently open spans. """
+
+
+	@property
+	def name(self) -> str:
+		"""	The name of the trace, which is the name of the root span.
+		"""
+		return self.spans[0].name
+
+
+	@property
+	def duration(self) -> int:
+		"""	The duration of the whole request in nanoseconds.
+		"""
+		return self.spans[0].duration
+
+
+	def startSpan(self, name:str) -> int:
+		"""	Start a new span as a child of the innermost open span.
+
+			Args:
+				name: The name of the span.
+
+			Return:
+				The index of the new span.
+		"""
+		index = len(self.spans)
+		self.spans.append(TraceSpan(name, time.perf_counter_ns(), self._stack[-1]))
+		self._stack.append(index)
+		return index
+
+
+	def endSpan(self, index:int) -> None:
+		"""	End a span.
+
+			Args:
+				index: The index of the span, as returned by `startSpan()`.
+		"""
+		self.spans[index].end = time.perf_counter_ns()
+		if self._stack and self._stack[-1] == index:
+			self._stack.pop()
+
+
+	def finish(self) -> None:
+		"""	Finish the trace. Spans that are still open are ended as well.
+		"""
+		now = time.perf_counter_ns()
+		for index in self._stack:
+			self.spans[index].end = now
+		self._stack.clear()
+
+
+	def wallTime(self, timestamp:int) -> int:
+		"""	Convert a monotonic timestamp of a span to wall clock time.
+
+			Args:
+				timestamp: Monotonic timestamp in nanoseconds.
+
+			Return:
+				Wall clock time in nanoseconds.
+		"""
+		return self.wallStart + (timestamp - self.spans[0].start)
+
+
+class _Span(object):
+	"""	Context manager for a span of the current trace.
+	"""
+
+	__slots__ = (
+		'trace',
+		'name',
+		'index',
+	)
+
+	def __init__(self, trace:RequestTrace, name:str) -> None:
+		self.trace = trace
+		self.name = name
+		self.index = -1
+
+
+	def __enter__(self) -> _Span:
+		self.index = self.trace.startSpan(self.name)
+		return self
+
+
+	def __exit__(self, *args:Any) -> None:
+		self.trace.endSpan(self.index)
+
+
+class _NoSpan(object):
+	"""	Context manager that does nothing. Used when no trace is active.
+	"""
+
+	__slots__ = ()
+
+	def __enter__(self) -> _NoSpan:
+		return self
+
+
+	def __exit__(self, *args:Any) -> None:
+		pass
+
+
+_noSpan = _NoSpan()
+""" Shared no-op span. """
+
+
+def currentTrace() -> Optional[RequestTrace]:
+	"""	Return the trace of the current thread.
+
+		Return:
+			The trace, or None if no trace is active.
+	"""
+	return getattr(_local, 'trace', None)
+
+
+def span(name:str) -> _Span|_NoSpan:
+	"""	Return a context manager that records a span of the current trace.
+
+		Example:
+			with span('http.dissect'):
+				...
+
+		Args:
+			name: The name of the span.
+
+		Return:
+			The context manager. If no trace is active then a shared no-op context manager is returned.
+	"""
+	if (trace := getattr(_local, 'trace', None)) is None:
+		return _noSpan
+	return _Span(trace, name)
+
+
+def traced(name:str) -> Callable[[_F], _F]:
+	"""	Decorator that records a span of the current trace for each call of a function.
+
+		Args:
+			name: The name of the span.
+
+		Return:
+			The decorator.
+	"""
+	def decorator(func:_F) -> _F:
+		@wraps(func)
+		def wrapper(*args:Any, **kwargs:Any) -> Any:
+			if (trace := getattr(_local, 'trace', None)) is None:
+				return func(*args, **kwargs)
+			index = trace.startSpan(name)
+			try:
+				return func(*args, **kwargs)
+			finally:
+				trace.endSpan(index)
+		return cast(_F, wrapper)
+	return decorator
+
+
+def setTraceAttributes(**attributes:Any) -> None:
+	"""	Add attributes to the trace of the current thread, if any.
+
+		Args:
+			attributes: The attributes to add.
+	"""
+	if (trace := getattr(_local, 'trace', None)) is not None:
+		trace.attributes.update(attributes)
+
+
+class RequestTracer(object):
+	"""	Start, sample and collect the traces of requests.
+	"""
+
+	__slots__ = (
+		'enable',
+		'sampleRate',
+		'size',
+		'_traces',
+		'_lock',
+	)
+
+	def __init__(self, enable:bool, sampleRate:float, size:int) -> None:
+		"""	Initialize the tracer.
+
+			Args:
+				enable: Enable tracing.
+				sampleRate: The fraction of requests that are traced, between 0.0 and 1.0.
+				size: The maximum number of finished traces that are kept. Older traces are removed.
+		"""
+		self.enable = enable
+		""" Enable tracing. """
+		self.sampleRate = sampleRate
+		""" The fraction of requests that are traced. """
+		self.size = size
+		""" The maximum number of finished traces that are kept. """
+		self._traces:deque[RequestTrace] = deque(maxlen = size)
+		""" The finished traces, the oldest first. """
+		self._lock = Lock()
+		""" Lock for the finished traces. """
+
+
+	def startTrace(self, name:str) -> Optional[RequestTrace]:
+		"""	Start a trace for the current thread.
+
+			Args:
+				name: The name of the trace, e.g. the binding and operation of the request.
+
+			Return:
+				The new trace, or None if tracing is disabled, the request is not sampled,
+				or a trace is already active for the current thread.
+		"""
+		if not self.enable or getattr(_local, 'trace', None) is not None:
+			return None
+		if self.sampleRate < 1.0 and random.random() >= self.sampleRate:
+			return None
+		trace = RequestTrace(name)
+		_local.trace = trace
+		return trace
+
+
+	def finishTrace(self, trace:Optional[RequestTrace]) -> None:
+		"""	Finish a trace that was started by `startTrace()` and keep it.
+
+			Args:
+				trace: The trace. Nothing happens if it is None.
+		"""
+		if trace is None:
+			return
+		trace.finish()
+		_local.trace = None
+		with self._lock:
+			self._traces.append(trace)
+
+
+	def getTraces(self) -> list[RequestTrace]:
+		"""	Return the finished traces.
+
+			Return:
+				List of traces, the oldest first.
+		"""
+		with self._lock:
+			return list(self._traces)
+
+
+	def clear(self) -> None:
+		"""	Remove all finished traces.
+		"""
+		with self._lock:
+			self._traces.clear()
+
+
+	def getStageSummary(self) -> Dict[str, Tuple[int, int, int]]:
+		"""	Summarize the durations of the spans of all finished traces by name.
+
+			Return:
+				Dictionary of span names to tuples of count, total duration and maximum duration in nanoseconds.
+		"""
+		summary:Dict[str, Tuple[int, int, int]] = {}
+		for trace in self.getTraces():
+			for s in trace.spans:
+				count, total, maximum = summary.get(s.name, (0, 0, 0))
+				summary[s.name] = (count + 1, total + s.duration, max(maximum, s.duration))
+		return summary
+
+
+	def toChromeTrace(self) -> Dict[str, Any]:
+		"""	Return the finished traces in the Chrome trace event format.
+
+			Each trace is shown as a separate thread, so that overlapping requests don't interleave.
+
+			Return:
+				The trace events as a dictionary.
+		"""
+		events:list[Dict[str, Any]] = []
+		pid = os.getpid()
+		for tid, trace in enumerate(self.getTraces(), start = 1):
+			events.append({	'name': 'thread_name',
+							'ph': 'M',
+							'pid': pid,
+							'tid': tid,
+							'args': { 'name': f'{trace.threadName} {trace.traceID:032x}' } })
+			for s in trace.spans:
+				event = {	'name': s.name,
+							'cat': 'request',
+							'ph': 'X',
+							'ts': trace.wallTime(s.start) / 1000,
+							'dur': s.duration / 1000,
+							'pid': pid,
+							'tid': tid }
+				if s.parent == -1 and trace.attributes:
+					event['args'] = trace.attributes
+				events.append(event)
+		return { 'traceEvents': events, 'displayTimeUnit': 'ms' }
+
+
+	def toOTLP(self, serviceName:str) -> Dict[str, Any]:
+		"""	Return the finished traces in the OTLP JSON format.
+
+			Args:
+				serviceName: The service name of the OTLP resource.
+
+			Return:
+				The resource spans as a dictionary.
+		"""
+		def _attribute(key:str, value:Any) -> Dict[str, Any]:
+			if isinstance(value, bool):
+				return { 'key': key, 'value': { 'boolValue': value } }
+			if isinstance(value, int):
+				return { 'key': key, 'value': { 'intValue': str(value) } }
+			return { 'key': key, 'value': { 'stringValue': str(value) } }
+
+		spans:list[Dict[str, Any]] = []
+		for trace in self.getTraces():
+			traceID = f'{trace.traceID:032x}'
+			spanIDs = [ f'{random.getrandbits(64):016x}' for _ in trace.spans ]
+			for index, s in enumerate(trace.spans):
+				otlpSpan:Dict[str, Any] = {	'traceId': traceID,
+								'spanId': spanIDs[index],
+								'name': s.name,
+								'kind': 2 if s.parent == -1 else 1,	# SERVER for the root span, INTERNAL otherwise
+								'startTimeUnixNano': str(trace.wallTime(s.start)),
+								'endTimeUnixNano': str(trace.wallTime(s.end)) }
+				if s.parent == -1:
+					otlpSpan['attributes'] = [ _attribute('thread.name', trace.threadName) ] + [ _attribute(k, v) for k, v in trace.attributes.items() ]
+				else:
+					otlpSpan['parentSpanId'] = spanIDs[s.parent]
+				spans.append(otlpSpan)
+
+		return { 'resourceSpans': [ { 'resource': { 'attributes': [ _attribute('service.name', serviceName) ] },
+									  'scopeSpans': [ { 'scope': { 'name': 'acme.tracing' },
+														'spans': spans } ] } ] }
+
+
+	def exportTraces(self, path:str, exportFormat:str, serviceName:str) -> int:
+		"""	Export the finished traces to a file.
+
+			Args:
+				path: The path of the file.
+				exportFormat: Either *chrome* or *otlp*.
+				serviceName: The service name for the OTLP format.
+
+			Return:
+				The number of exported traces.
+		"""
+		count = len(self.getTraces())
+		data = self.toOTLP(serviceName) if exportFormat == 'otlp' else self.toChromeTrace()
+		with open(path, 'w') as f:
+			json.dump(data, f)
+		return count
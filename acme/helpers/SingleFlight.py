@@ -0,0 +1,119 @@
+#
+#	SingleFlight.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Coalescing of concurrent identical calls
+#
+
+"""	This module provides a helper class to coalesce concurrent identical calls.
+
+	When several threads call the same function with the same key at the same time, then only
+	the first thread actually executes the function. The other threads wait for it to finish and
+	then share its result, or its exception.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from threading import Event, Lock
+
+
+class _Flight(object):
+	"""	A call that is currently in progress.
+	"""
+
+	__slots__ = (
+		'done',
+		'result',
+		'exception',
+		'waiters',
+	)
+
+	def __init__(self) -> None:
+		self.done = Event()
+		""" Set when the call has finished. """
+		self.result:Any = None
+		""" The result of the call. """
+		self.exception:BaseException = None
+		""" The exception raised by the call, if any. """
+		self.waiters = 0
+		""" Number of threads that share the result of the call. """
+
+
+class SingleFlight(object):
+	"""	Coalesce concurrent calls with the same key into a single call.
+
+		Results are not cached. A call that starts after a previous call with the same key has
+		finished is executed again.
+	"""
+
+	__slots__ = (
+		'_lock',
+		'_flights',
+		'_calls',
+		'_shared',
+	)
+
+	def __init__(self) -> None:
+		self._lock = Lock()
+		""" Lock for the calls in progress and the counters. """
+		self._flights:Dict[Hashable, _Flight] = {}
+		""" Calls in progress by key. """
+		self._calls = 0
+		""" Number of executed calls. """
+		self._shared = 0
+		""" Number of calls that shared the result of another call. """
+
+
+	def do(self, key:Hashable, func:Callable[[], Any]) -> Tuple[Any, bool]:
+		"""	Execute a function, or wait for and share the result of a call with the same key that is already in progress.
+
+			Args:
+				key: The key that identifies identical calls.
+				func: The function to execute.
+
+			Return:
+				Tuple of the result and a boolean that indicates whether the result is shared with another call.
+				The result must be treated as read-only if it is shared.
+
+			Raises:
+				Any exception that is raised by *func*, also in the threads that share the call.
+		"""
+		with self._lock:
+			if (flight := self._flights.get(key)):
+				flight.waiters += 1
+				self._shared += 1
+				isLeader = False
+			else:
+				flight = self._flights[key] = _Flight()
+				self._calls += 1
+				isLeader = True
+
+		if not isLeader:
+			flight.done.wait()
+			if flight.exception is not None:
+				raise flight.exception
+			return flight.result, True
+
+		try:
+			flight.result = func()
+		except BaseException as e:
+			flight.exception = e
+			raise
+		finally:
+			with self._lock:
+				del self._flights[key]
+			flight.done.set()
+		return flight.result, flight.waiters > 0
+
+
+	def getStats(self) -> Dict[str, int]:
+		"""	Return the statistics of the coalesced calls.
+
+			Return:
+				Dictionary with the number of executed calls and the number of calls that shared a result.
+		"""
+		with self._lock:
+			return { 'calls': self._calls, 'shared': self._shared }
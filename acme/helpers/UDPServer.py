@@ -8,13 +8,11 @@
 #	modules and entities of the CSE.
 #
 
-import threading
+from __future__ import annotations
 from typing import Callable, Any, Tuple
 import socket
 # Dtls
 import ssl
-from dtls.wrapper import wrap_server, wrap_client, DtlsSocket
-import dtls.sslconnection as sslconnection
 
 from ..helpers.BackgroundWorker import BackgroundWorkerPool
 
@@ -57,47 +55,38 @@ class UdpServer(object):
 		self.received_data_callback = received_data_callback
 		self.useTLS = useDTLS
 		self.tlsVersion = tlsVersion
-		self.ssl_version = { 'tls1.1': sslconnection.PROTOCOL_DTLSv1, 
-		       				 'tls1.2': sslconnection.PROTOCOL_DTLSv1_2, 
-							 'auto': sslconnection.PROTOCOL_DTLS }[self.tlsVersion]
+		self.ssl_version = None
+		if self.useTLS:
+			# The DTLS package is only needed when DTLS is enabled
+			import dtls.sslconnection as sslconnection
+			self.ssl_version = { 'tls1.1': sslconnection.PROTOCOL_DTLSv1, 
+								 'tls1.2': sslconnection.PROTOCOL_DTLSv1_2, 
+								 'auto': sslconnection.PROTOCOL_DTLS }[self.tlsVersion.lower()]
 		self.verifyCertificate	= verifyCertificate
 
 		self.privateKeyFile = privateKeyFile
 		self.certificateFile = certificateFile
 		self.logging = logging
-		self.ssl_ctx:DtlsSocket	= None
+		self.ssl_ctx:Any = None		# DtlsSocket
 		self.mtu = 512 #1500 TODO configurable	
 
 
-	def listen(self, timeout:int = 5) -> None: # This does NOT return
-		self.listen_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-		self.listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+	def bind(self, timeout:float = 5) -> None:
+		"""	Create the server socket and bind it to the address and port. This is done
+			by `listen()` if not done before, but calling it separately allows to
+			detect errors, e.g. a port that is already in use, before listening in the background.
 
+			Args:
+				timeout: Timeout for receiving datagrams. The listen loop checks for a shutdown after each timeout.
 
-		def _listen(listenSocket:Tuple[socket.socket, DtlsSocket]) -> None:
-			self.doListen = True
-			while self.doListen:
-				self.logging(f'UdpServer.listen: In loop: {str(self.doListen)}')
-				try:
-					data, client_address = listenSocket.recvfrom(4096)
-					self.logging(f'UdpServer.listen: client_address: {str(client_address)}')
-					if len(client_address) > 2:
-						client_address = (client_address[0], client_address[1])
-					self.logging(f'UdpServer.listen: receive_datagram (1) - {str(data)}')
-					if data is not None:
-						self.logging(f'UdpServer.listen: receive_datagram - - {str(data)}')
-						BackgroundWorkerPool.runJob(lambda : self.received_data_callback(data, client_address), f'CoAP_{str(client_address)}')	# TODO a better thread name
-						# t = threading.Thread(target=self.received_data_callback, args=(data, client_address))
-						# t.setDaemon(True)
-						# t.start()
-				except socket.timeout:
-					continue
-				except Exception as e:
-					self.logging(f'UdpServer.listen (secure): {str(e)}')
-					continue
-
+			Raises:
+				OSError: In case the socket cannot be created or bound.
+		"""
+		self.listen_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+		self.listen_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
 		if self.useTLS == True:
+			from dtls.wrapper import wrap_server
 
 			# Setup DTLS context
 			self.logging(f'Setup SSL context. Certfile: {self.certificateFile}, KeyFile: {self.privateKeyFile}, TLS version: {self.tlsVersion}')
@@ -119,49 +108,46 @@ class UdpServer(object):
 			self.ssl_ctx.bind((self.addr, self.port))
 			self.ssl_ctx.settimeout(timeout)
 			self.ssl_ctx.listen(0)
-			_listen(self.ssl_ctx)	# Does not return
-			# self.doListen = True
-			# while self.doListen:
-			# 	self.logging(f'UdpServer.listen: In loop: {str(self.doListen)}')
-			# 	try:
-			# 		data, client_address = self.ssl_ctx.recvfrom(4096)
-			# 		self.logging(f'UdpServer.listen: client_address: {str(client_address)}')
-			# 		if len(client_address) > 2:
-			# 			client_address = (client_address[0], client_address[1])
-			# 		self.logging(f'UdpServer.listen: receive_datagram (1) - {str(data)}')
-			# 		if not data is None:
-			# 			self.logging(f'UdpServer.listen: receive_datagram - - {str(data)}')
-			# 			BackgroundWorkerPool.runJob(lambda : self.received_data_callback(data, client_address), f'CoAP_{str(client_address)}')	# TODO a better thread name
-			# 			# t = threading.Thread(target=self.received_data_callback, args=(data, client_address))
-			# 			# t.setDaemon(True)
-			# 			# t.start()
-			# 	except socket.timeout:
-			# 		continue
-			# 	except Exception as e:
-			# 		self.logging(f'UdpServer.listen (secure): {str(e)}')
-			# 		continue
-
 		else:
-			# Initialize and start listening (non-secure)
-			self.listen_socket.bind((self.addr, self.port))
+			# Initialize (non-secure)
+			try:
+				self.listen_socket.bind((self.addr, self.port))
+			except OSError:
+				self.listen_socket.close()
+				self.listen_socket = None
+				raise
 			self.listen_socket.settimeout(timeout)
-			_listen(self.listen_socket)	# Does not return
-
-			# self.doListen = True
-			# while self.doListen:
-			# 	try:
-			# 		data, client_address = self.listen_socket.recvfrom(4096)
-			# 		if len(client_address) > 2:
-			# 			client_address = (client_address[0], client_address[1])
-			# 		Logging.log(f'UdpServer.listen: receive_datagram - {str(data)}')
-			# 		t = threading.Thread(target=self.received_data_callback, args=(data, client_address))
-			# 		t.setDaemon(True)
-			# 		t.start()
-			# 	except socket.timeout:
-			# 		continue
-			# 	except Exception as e:
-			# 		Logging.logWarn(f'UdpServer.listen: {str(e)}')
-			# 		break
+
+
+	def listen(self, timeout:float = 5) -> None: # This does NOT return
+		if not self.listen_socket:
+			self.bind(timeout)
+
+
+		def _listen(listenSocket:Any) -> None:	# socket.socket or DtlsSocket
+			self.doListen = True
+			while self.doListen:
+				try:
+					data, client_address = listenSocket.recvfrom(4096)
+					if len(client_address) > 2:
+						client_address = (client_address[0], client_address[1])
+					if data is not None:
+						self.logging(f'UdpServer.listen: receive_datagram from {str(client_address)} - {str(data)}')
+						# Bind the current values to the lambda, because the loop continues before the job runs
+						BackgroundWorkerPool.runJob(lambda data = data, client_address = client_address: self.received_data_callback(data, client_address), 
+													f'CoAP_{str(client_address)}')	# TODO a better thread name
+						# t = threading.Thread(target=self.received_data_callback, args=(data, client_address))
+						# t.setDaemon(True)
+						# t.start()
+				except socket.timeout:
+					continue
+				except Exception as e:
+					if self.doListen:
+						self.logging(f'UdpServer.listen: {str(e)}')
+					continue
+
+
+		_listen(self.ssl_ctx if self.ssl_ctx else self.listen_socket)	# Does not return
 
 
 	# # def _cb_ignore_listen_exception(self, exception, server):
@@ -225,15 +211,37 @@ class UdpServer(object):
 			self.socket = None
 
 
-	def sendTo(self, datagram):
+	def send(self, data:bytes, address:Tuple[str, int]) -> None:
+		"""	Send a datagram from the server socket, e.g. a response to a received datagram.
+			The datagram is sent from the address and port the server is listening on.
+
+			Args:
+				data: The datagram to send.
+				address: The (host, port) tuple of the receiver.
+		"""
+		self.logging(f'==> UdpServer.send: {str(address)} - {str(data)}')
+		try:
+			if (listenSocket := self.ssl_ctx if self.ssl_ctx else self.listen_socket):
+				listenSocket.sendto(data, address)
+		except Exception as e:
+			self.logging(f'UdpServer.send: {str(e)}')
+
+
+	def sendTo(self, datagram:Tuple[bytes, Tuple[str, int]]) -> None:
+		"""	Send a datagram from a new client socket.
+
+			Args:
+				datagram: The (data, (host, port)) tuple of the datagram and its receiver.
+		"""
 		self.logging(f'==> UdpServer.sendTo: /{str(datagram[0])} - {str(datagram[1])}')
+		sock:Any = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)	# socket or DtlsSocket
 		try:
-			sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 			if self.useTLS == True:
+				from dtls.wrapper import wrap_client
 				sock = wrap_client(sock, cert_reqs = ssl.CERT_REQUIRED, 
 		       							 keyfile = self.privateKeyFile, 
 										 certfile = self.certificateFile, 
-										 ca_certs = self.caCertificateFile, 
+										 #ca_certs = self.caCertificateFile, 
 										 do_handshake_on_connect = True, 
 										 ssl_version = self.ssl_version)
 			sock.sendto(datagram[0], datagram[1])
@@ -107,6 +107,9 @@ class ACP(AnnounceableResource):
 		# Inherited
 		super().deactivate(originator)
 
+		# Remove cached access decisions that depend on this ACP
+		CSE.security.invalidateACPDecisions(self.ri)
+
 		# Remove own resourceID from all acpi
 		L.isDebug and L.logDebug(f'Removing acp.ri: {self.ri} from assigned resource acpi')
 		for r in CSE.storage.searchByFilter(lambda r: (acpi := r.get('acpi')) is not None and self.ri in acpi):	# search for presence in acpi, not perfect match
@@ -117,6 +120,15 @@ class ACP(AnnounceableResource):
 				r.dbUpdate()
 
 
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		super().dbUpdate(finalize)
+
+		# Remove cached access decisions that depend on this ACP
+		CSE.security.invalidateACPDecisions(self.ri)
+		return self
+
+
 	def validateAnnouncedDict(self, dct:JSON) -> JSON:
 		# Inherited
 		if acr := findXPath(dct, f'{ResourceTypes.ACPAnnc.tpe()}/pvs/acr'):
@@ -126,3 +126,28 @@ class CSR(AnnounceableResource):
 					   parentResource:Optional[Resource] = None) -> None:
 		super().validate(originator, dct, parentResource)
 		self._normalizeURIAttribute('poa')
+
+
+	def activate(self, parentResource:Resource, originator:str) -> None:
+		# Inherited
+		super().activate(parentResource, originator)
+
+		# Remove resolved <CSR> resources for remote targets
+		CSE.remote.invalidateCSRCache()
+
+
+	def deactivate(self, originator:str) -> None:
+		# Inherited
+		super().deactivate(originator)
+
+		# Remove resolved <CSR> resources for remote targets
+		CSE.remote.invalidateCSRCache()
+
+
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		super().dbUpdate(finalize)
+
+		# Remove resolved <CSR> resources for remote targets
+		CSE.remote.invalidateCSRCache()
+		return self
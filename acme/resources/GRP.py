@@ -88,6 +88,25 @@ class GRP(AnnounceableResource):
 		CSE.dispatcher.createLocalResource(fanOutPointResource, self, originator)
 
 
+	def deactivate(self, originator:str) -> None:
+		# Inherited
+		super().deactivate(originator)
+
+		# Remove cached access decisions that depend on the group's members
+		CSE.security.invalidateACPDecisions(self.ri)
+		CSE.security.invalidateACPDecisions(self.getSrn())
+
+
+	def dbUpdate(self, finalize:bool = False) -> Resource:
+		# Inherited
+		super().dbUpdate(finalize)
+
+		# Remove cached access decisions that depend on the group's members
+		CSE.security.invalidateACPDecisions(self.ri)
+		CSE.security.invalidateACPDecisions(self.getSrn())
+		return self
+
+
 	def validate(self, originator:Optional[str] = None, 
 					   dct:Optional[JSON] = None, 
 					   parentResource:Optional[Resource] = None) -> None:
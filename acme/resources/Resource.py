@@ -43,6 +43,7 @@ _originator = Constants.attrOriginator
 _modified = Constants.attrModified
 _remoteID = Constants.attrRemoteID
 _rvi = Constants.attrRvi
+_lastWritten = Constants.attrLastWritten
 
 
 class Resource(object):
@@ -68,7 +69,7 @@ class Resource(object):
 
 	internalAttributes	= [ _rtype, _srn, _node, _createdInternallyRI, _imported, 
 							_isInstantiated, _locCoordinate,
-							_originator, _modified, _remoteID, _rvi ]
+							_originator, _modified, _remoteID, _rvi, _lastWritten ]
 	"""	List of internal attributes and which do not belong to the oneM2M resource attributes """
 
 	def __init__(self, 
@@ -1024,8 +1025,8 @@ class Resource(object):
 		if not (pi := self.pi):
 			# L.logErr('PI is None')
 			return rn
-		if len(rpi := CSE.storage.identifier(pi)) == 1:
-			return cast(str, f'{rpi[0]["srn"]}/{rn}')
+		if (psrn := CSE.storage.structuredPath(pi)):
+			return f'{psrn}/{rn}'
 		# L.logErr(traceback.format_stack())
 		L.logErr(f'Parent {pi} not found in DB')
 		return rn # fallback
@@ -359,8 +359,7 @@ class TS(ContainerResource):
 		
 		# If any of mdd, pei or mdt becomes None, or is mdd==False, then stop monitoring this TS
 		if not mdd or not self.pei or not self.mdt:
-			if CSE.timeSeries.isMonitored(self.ri):
-				CSE.timeSeries.pauseMonitoringTimeSeries(self.ri)
+			CSE.timeSeries.pauseMonitoringTimeSeries(self.ri)	# Does nothing if the <TS> is not monitored
 
 
         # If any parameters related to the missing data detection process (missingDataDetectTimer, missingDataMaxNr,
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import atexit, argparse, sys
 from threading import Lock
+from multiprocessing.connection import Connection
 from typing import Dict, Any
 
 from ..helpers.BackgroundWorker import BackgroundWorkerPool
@@ -24,6 +25,7 @@ from ..etc.Utils import runsInIPython
 from ..etc.Types import CSEStatus, CSEType, ContentSerializationType
 from ..etc.ResponseStatusCodes import ResponseException
 from ..services.ActionManager import ActionManager
+from ..services.CoAPServer import CoAPServer
 from ..services.Configuration import Configuration
 from ..services.Console import Console
 from ..services.Dispatcher import Dispatcher
@@ -35,6 +37,7 @@ from ..services.Importer import Importer
 from ..services.LocationManager import LocationManager
 from ..services.MQTTClient import MQTTClient
 from ..services.NotificationManager import NotificationManager
+from ..services.ProcessManager import ProcessManager
 from ..services.RegistrationManager import RegistrationManager
 from ..services.RemoteCSEManager import RemoteCSEManager
 from ..services.ScriptManager import ScriptManager
@@ -61,6 +64,9 @@ action:ActionManager = None
 announce:AnnouncementManager = None
 """	Runtime instance of the `AnnouncementManager`. """
 
+coapServer:CoAPServer = None
+"""	Runtime instance of the `CoAPServer`. """
+
 console:Console = None
 """ Runtime instance of the `Console`. """
 
@@ -88,6 +94,9 @@ mqttClient:MQTTClient = None
 notification:NotificationManager = None
 """	Runtime instance of the `NotificationManager`. """
 
+processes:ProcessManager = None
+"""	Runtime instance of the `ProcessManager`. """
+
 registration:RegistrationManager = None
 """	Runtime instance of the `RegistrationManager`. """
 
@@ -178,6 +187,9 @@ releaseVersion:str = None
 isHeadless = False
 """ Indicator whether the CSE is running in headless mode. """
 
+workerIndex:int = 0
+""" The index of this CSE process in multi-process mode. 0 is the owner process, worker processes have an index > 0. """
+
 cseStatus:CSEStatus = CSEStatus.STOPPED
 """ The CSE's internal runtime status. """
 
@@ -202,13 +214,13 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 		Return:
 			False if the CSE couldn't initialized and started. 
 	"""
-	global action, announce, console, dispatcher, event, groupResource, httpServer, importer, location, mqttClient, notification, registration
+	global action, announce, coapServer, console, dispatcher, event, groupResource, httpServer, importer, location, mqttClient, notification, processes, registration
 	global remote, request, script, security, semantic, statistics, storage, textUI, time, timeSeries, validator, webSocketServer
 	global aeStatistics
 	global supportedReleaseVersions, cseType, defaultSerialization, cseCsi, cseCsiSlash, cseCsiSlashLess, cseAbsoluteSlash
 	global cseSpid, cseSPRelative, cseAbsolute, cseRi, cseRn, releaseVersion, csePOA
 	global cseOriginator
-	global isHeadless, cseStatus
+	global isHeadless, cseStatus, workerIndex
 
 	# Set status
 	cseStatus = CSEStatus.STARTING
@@ -223,6 +235,8 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 		for key, value in kwargs.items():
 			args.__setattr__(key, value)
 
+	workerIndex = args.workerIndex if 'workerIndex' in args else 0
+
 	event = EventManager()					# Initialize the event manager before anything else
 
 	if not Configuration.init(args):
@@ -276,6 +290,7 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 		textUI = TextUI()						# Start the textUI
 		console = Console()						# Start the console
 
+		processes = ProcessManager(args)		# Initialize the process manager
 		storage = Storage()						# Initialize the resource storage
 		statistics = Statistics()				# Initialize the statistics system
 		registration = RegistrationManager()	# Initialize the registration manager
@@ -286,6 +301,7 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 		httpServer = HttpServer()				# Initialize the HTTP server
 		mqttClient = MQTTClient()				# Initialize the MQTT client
 		webSocketServer = WebSocketServer()		# Initialize the WebSocket server
+		coapServer = CoAPServer()				# Initialize the CoAP server
 		notification = NotificationManager()	# Initialize the notification manager
 		groupResource = GroupManager()					# Initialize the group manager
 		timeSeries = TimeSeriesManager()		# Initialize the timeSeries manager
@@ -322,6 +338,15 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 			L.logErr('Terminating', showStackTrace = False)
 			cseStatus = CSEStatus.STOPPED
 			return False
+
+		# Start the CoAP server
+		if not coapServer.run():				# This does return
+			L.logErr('Terminating', showStackTrace = False)
+			cseStatus = CSEStatus.STOPPED
+			return False
+
+		# Start the worker processes after the initial resources were imported
+		processes.startWorkers()
 	
 	except ResponseException as e:
 		L.logErr(f'Error during startup: {e.dbg}')
@@ -354,6 +379,24 @@ def startup(args:argparse.Namespace, **kwargs:Dict[str, Any]) -> bool:
 	return True
 
 
+def runWorker(args:argparse.Namespace, workerIndex:int, connection:Connection) -> None:
+	"""	Entry point of a worker process in multi-process mode. Start and run a CSE that serves requests,
+		but that doesn't run the background monitors. 
+		
+		This function is located here, and not in the `ProcessManager`, so that a new worker process imports
+		this module first.
+
+		Args:
+			args: The startup arguments of the worker process.
+			workerIndex: The index of the worker process. This is always > 0.
+			connection: The worker's end of the pipe to the owner process.
+	"""
+	args.workerIndex = workerIndex
+	args.workerConnection = connection
+	if startup(args):
+		run()
+
+
 def shutdown() -> None:
 	"""	Gracefully shutdown the CSE programmatically. This will end the mail console loop
 		to terminate.
@@ -397,6 +440,7 @@ def _shutdown() -> None:
 	location and location.shutdown()
 	semantic and semantic.shutdown()
 	remote and remote.shutdown()
+	coapServer and coapServer.shutdown()
 	webSocketServer and webSocketServer.shutdown()
 	mqttClient and mqttClient.shutdown()
 	httpServer and httpServer.shutdown()
@@ -412,6 +456,7 @@ def _shutdown() -> None:
 	registration and registration.shutdown()
 	statistics and statistics.shutdown()
 	event and event.shutdown()
+	processes and processes.shutdown()
 	storage  and storage.shutdown()
 	
 	L.isInfo and L.log('CSE shut down')
@@ -426,6 +471,10 @@ def resetCSE() -> None:
 	"""
 	global cseStatus
 
+	# Worker processes let the owner process reset the CSE
+	if processes.resetByOwner():
+		return
+
 	with _cseResetLock:
 		cseStatus = CSEStatus.RESETTING
 		L.isWarn and L.logWarn('Resetting CSE started')
@@ -436,6 +485,7 @@ def resetCSE() -> None:
 		
 		httpServer.pause()
 		mqttClient.pause()
+		coapServer.pause()
 		webSocketServer.shutdown()	# WS Server needs to be shutdown to close connections
 
 		storage.purge()
@@ -450,6 +500,7 @@ def resetCSE() -> None:
 		remote.restart()
 
 		webSocketServer.run()	# WS Server restart
+		coapServer.unpause()
 		mqttClient.unpause()
 		httpServer.unpause()
 
@@ -0,0 +1,735 @@
+#
+#	CoAPServer.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+"""	Implementation of a CoAP server for the CoAP binding (TS-0008).
+"""
+
+from __future__ import annotations
+from typing import Optional, Any, Tuple, cast
+
+import random, time
+from collections import OrderedDict
+from threading import Lock
+
+from ..etc.Types import JSON, ReqResp, Result, CSERequest, Operation, ContentSerializationType
+from ..etc.ResponseStatusCodes import ResponseStatusCode, ResponseException, REQUEST_TIMEOUT, UNSUPPORTED_MEDIA_TYPE
+from ..etc.ACMEUtils import removeNoneValuesFromDict
+from ..etc.DateUtils import getResourceDate
+from ..etc.RequestUtils import serializeData, requestFromResult
+from ..helpers.TextTools import findXPath
+from ..helpers.BackgroundWorker import BackgroundWorker, BackgroundWorkerPool
+from ..helpers.UDPServer import UdpServer
+from ..helpers.CoAPMessage import CoAPMessage, CoAPFormatError, CoAPType, CoAPCode, CoAPOption, CoAPContentFormat
+from ..helpers.CoAPMessage import coapCode, encodeBlock, decodeBlock, blockSizeToSzx, szxToBlockSize, coapCodeToString
+from ..services.Configuration import Configuration
+from ..services import CSE
+from ..services.Logging import Logging as L
+
+
+_exchangeLifetime = 247.0
+"""	Time in seconds for which the response to a message ID is kept to answer duplicates, and for which the state of block-wise transfers is kept (EXCHANGE_LIFETIME, RFC 7252). """
+
+_maxExchanges = 10000
+"""	Maximum number of remembered exchanges. The oldest exchanges are removed first. """
+
+_coapMethods = {
+	CoAPCode.GET:		Operation.RETRIEVE,
+	CoAPCode.POST:		Operation.CREATE,	# or NOTIFY, if no oneM2M-TY option is present
+	CoAPCode.PUT:		Operation.UPDATE,
+	CoAPCode.DELETE:	Operation.DELETE,
+}
+"""	Mapping of CoAP methods to oneM2M operations. """
+
+_contentFormats = {
+	CoAPContentFormat.APPLICATION_JSON:	ContentSerializationType.JSON,
+	CoAPContentFormat.APPLICATION_CBOR:	ContentSerializationType.CBOR,
+}
+"""	Mapping of supported CoAP content formats to content serializations. """
+
+_successCodes = {
+	ResponseStatusCode.OK:									CoAPCode.CONTENT,
+	ResponseStatusCode.CREATED:								CoAPCode.CREATED,
+	ResponseStatusCode.DELETED:								CoAPCode.DELETED,
+	ResponseStatusCode.UPDATED:								CoAPCode.CHANGED,
+	ResponseStatusCode.ACCEPTED:							CoAPCode.CREATED,
+	ResponseStatusCode.ACCEPTED_NON_BLOCKING_REQUEST_SYNC:	CoAPCode.CREATED,
+	ResponseStatusCode.ACCEPTED_NON_BLOCKING_REQUEST_ASYNC:	CoAPCode.CREATED,
+}
+"""	Mapping of successful oneM2M response status codes to CoAP response codes. Error codes are derived from the http status codes. """
+
+_recognizedOptions = frozenset(CoAPOption)
+"""	The options that are recognized by the server. Requests with other critical options are rejected. """
+
+_BlockKey = Tuple[Tuple[str, int], int, Tuple[bytes, ...], Tuple[bytes, ...]]
+"""	Key for the state of a block-wise transfer: client address, method, Uri-Path and Uri-Query options. """
+
+
+class CoAPServer(object):
+	"""	CoAP Server implementation.
+
+		Confirmable requests are answered with piggybacked responses in an acknowledgement, non-confirmable requests
+		with non-confirmable responses. Observations are not supported.
+	"""
+
+	__slots__ = [
+		'enable',
+		'interface',
+		'port',
+		'blockSize',
+		'maxRequestSize',
+		'useDTLS',
+		'dtlsVersion',
+		'verifyCertificate',
+		'certificateFile',
+		'privateKeyFile',
+		'isPaused',
+		'udpServer',
+		'actor',
+		'lock',
+		'exchanges',
+		'requestBlocks',
+		'responseBlocks',
+		'messageID',
+	]
+	""" Define slots for instance variables. """
+
+
+	def __init__(self) -> None:
+		"""	Initialization of the CoAP Server.
+		"""
+
+		# Get the configuration settings
+		self._assignConfig()
+
+		# Add a handler for configuration changes
+		CSE.event.addHandler(CSE.event.configUpdate, self._configUpdate)			# type: ignore
+
+		self.isPaused = False
+		"""	Flag whether the server is currently paused. Requests are not handled when the server is paused. """
+
+		self.udpServer:Optional[UdpServer] = None
+		"""	The UDP server that receives and sends the datagrams. """
+
+		self.actor:Optional[BackgroundWorker] = None
+		"""	The actor for running the UDP server's listen loop in the background. """
+
+		self.lock = Lock()
+		"""	Lock for the exchange and block-wise transfer states. """
+
+		self.exchanges:OrderedDict[Tuple[Tuple[str, int], int], Tuple[float, Optional[bytes]]] = OrderedDict()
+		"""	Recently received messages: (client address, message ID) -> (timestamp, encoded response). The response is None while the request is processed. """
+
+		self.requestBlocks:dict[_BlockKey, Tuple[float, bytearray]] = {}
+		"""	The request payloads that are currently received in blocks (*Block1*): key -> (timestamp, received payload). """
+
+		self.responseBlocks:dict[_BlockKey, Tuple[float, CoAPMessage]] = {}
+		"""	The responses that are currently sent in blocks (*Block2*): key -> (timestamp, complete response). """
+
+		self.messageID = random.randint(0, 0xffff)
+		"""	The last message ID used for non-confirmable responses. """
+
+		L.isInfo and L.log('CoAP server initialized')
+
+
+	def shutdown(self) -> bool:
+		"""	Shutdown the CoAP server.
+		"""
+		L.isInfo and L.log('CoAP server shut down')
+		self._stop()
+		return True
+
+
+	def _assignConfig(self) -> None:
+		"""	Store relevant configuration values in the manager.
+		"""
+		self.enable = Configuration.get('coap.enable')
+		"""	Flag whether the CoAP server is enabled. """
+
+		self.port = Configuration.get('coap.port')
+		"""	The port the CoAP server is listening on."""
+
+		self.interface = Configuration.get('coap.listenIF')
+		"""	The interface the CoAP server is listening on."""
+
+		self.blockSize = Configuration.get('coap.blockSize')
+		"""	The maximum size of a payload block. """
+
+		self.maxRequestSize = Configuration.get('coap.maxRequestSize')
+		"""	The maximum size of a request payload that is received in blocks. """
+
+		self.useDTLS = Configuration.get('coap.security.useDTLS')
+		"""	Flag whether DTLS is used. """
+
+		self.dtlsVersion = Configuration.get('coap.security.dtlsVersion')
+		"""	The DTLS version. """
+
+		self.verifyCertificate = Configuration.get('coap.security.verifyCertificate')
+		"""	Flag whether client certificates are verified. """
+
+		self.certificateFile = Configuration.get('coap.security.certificateFile')
+		"""	The server's certificate file. """
+
+		self.privateKeyFile = Configuration.get('coap.security.privateKeyFile')
+		"""	The server's private key file. """
+
+
+	def _configUpdate(self, name:str,
+						   key:Optional[str] = None,
+						   value:Optional[Any] = None) -> None:
+		"""	Callback for the *configUpdate* event.
+
+			Args:
+				name: Event name.
+				key: Name of the updated configuration setting.
+				value: New value for the config setting.
+		"""
+		if key not in [ 'coap.enable',
+						'coap.port',
+						'coap.listenIF',
+						'coap.blockSize',
+						'coap.maxRequestSize',
+					  ]:
+			return
+
+		# assign new values
+		self._assignConfig()
+		self.shutdown()
+		self.run()		# Restart the server
+
+
+	def run(self) -> bool:
+		"""	Initialize and run the CoAP server as a BackgroundWorker/Actor.
+
+			Return:
+				True if the server is not enabled or was started, False if the server could not be started.
+		"""
+		if not self.enable:
+			L.isInfo and L.log('CoAP: server NOT enabled')
+			return True
+
+		try:
+			self.udpServer = UdpServer(self.interface,
+									   self.port,
+									   self.useDTLS,
+									   self.dtlsVersion,
+									   self.verifyCertificate,
+									   self.privateKeyFile,
+									   self.certificateFile,
+									   self._handleDatagram,
+									   lambda msg: L.isDebug and L.logDebug(msg))
+			self.udpServer.bind(timeout = 1.0)	# Bind now to detect errors, e.g. a port already in use
+		except Exception as e:
+			L.logErr(f'Cannot start CoAP server on {self.interface}:{self.port}: {e}', showStackTrace = False)
+			self.udpServer = None
+			return False
+
+		# Actually start the actor to run the UDP server's listen loop as a thread
+		self.actor = BackgroundWorkerPool.newActor(self.udpServer.listen, name = 'CoAPServer').start()
+		L.isInfo and L.log(f'CoAP server listening on {self.interface}:{self.port}{" (DTLS)" if self.useDTLS else ""}')
+		return True
+
+
+	def _stop(self) -> None:
+		"""	Stop the CoAP server and clear the state of all exchanges.
+		"""
+		if self.udpServer is not None:
+			L.isDebug and L.logDebug('Stopping CoAP server')
+			self.udpServer.close()
+			self.udpServer = None
+		with self.lock:
+			self.exchanges.clear()
+			self.requestBlocks.clear()
+			self.responseBlocks.clear()
+
+
+	def pause(self) -> None:
+		"""	Stop handling requests.
+		"""
+		L.isInfo and L.log('CoAP server paused')
+		self.isPaused = True
+
+
+	def unpause(self) -> None:
+		"""	Continue handling requests.
+		"""
+		L.isInfo and L.log('CoAP server unpaused')
+		self.isPaused = False
+
+
+	#########################################################################
+	#
+	#	Message handling
+	#
+
+	def _send(self, message:CoAPMessage|bytes, address:Tuple[str, int]) -> None:
+		"""	Send a message to a client.
+
+			Args:
+				message: The message, or an already encoded message.
+				address: The client's address.
+		"""
+		if (udpServer := self.udpServer) is not None:
+			udpServer.send(message.encode() if isinstance(message, CoAPMessage) else message, address)
+
+
+	def _nextMessageID(self) -> int:
+		"""	Return the next message ID for a non-confirmable response.
+
+			Return:
+				Message ID.
+		"""
+		with self.lock:
+			self.messageID = (self.messageID + 1) & 0xffff
+			return self.messageID
+
+
+	def _expireStates(self, now:float) -> None:
+		"""	Remove expired exchanges and block-wise transfer states. Must be called with the lock held.
+
+			Args:
+				now: The current time.
+		"""
+		threshold = now - _exchangeLifetime
+		blocks:dict[_BlockKey, Tuple[float, Any]]
+		while self.exchanges and next(iter(self.exchanges.values()))[0] < threshold:
+			self.exchanges.popitem(last = False)
+		for blocks in (self.requestBlocks, self.responseBlocks):
+			for key in [ k for k, v in blocks.items() if v[0] < threshold ]:
+				del blocks[key]
+
+
+	def _handleDatagram(self, data:bytes, address:Tuple[str, int]) -> None:
+		"""	Handle a received datagram. This is the callback for the UDP server.
+
+			Duplicate messages, i.e. messages with the same message ID from the same client, are answered
+			with the response to the first message, without processing the request again.
+
+			Args:
+				data: The received datagram.
+				address: The client's address.
+		"""
+		try:
+			message = CoAPMessage.decode(data)
+		except CoAPFormatError as e:
+			L.isDebug and L.logDebug(f'Invalid CoAP message from {address}: {e}')
+			# Reject a malformed confirmable message if at least its header can be read
+			if len(data) >= 4 and data[0] >> 6 == 1 and (data[0] >> 4) & 0x03 == CoAPType.CON:
+				self._send(CoAPMessage(CoAPType.RST, CoAPCode.EMPTY, int.from_bytes(data[2:4], 'big')), address)
+			return
+
+		if message.type in (CoAPType.ACK, CoAPType.RST):
+			return	# The server doesn't send confirmable messages, so there is nothing to be acknowledged or reset
+		if not message.isRequest:
+			# An empty confirmable message ("CoAP ping"), or an unexpected response
+			if message.type == CoAPType.CON:
+				self._send(CoAPMessage(CoAPType.RST, CoAPCode.EMPTY, message.mid), address)
+			return
+
+		# Detect duplicates
+		exchangeKey = (address, message.mid)
+		with self.lock:
+			now = time.time()
+			self._expireStates(now)
+			if (exchange := self.exchanges.get(exchangeKey)) is not None:
+				L.isDebug and L.logDebug(f'Duplicate CoAP message from {address}: {message.mid}')
+				if exchange[1] is not None:		# Otherwise, the first message is still processed
+					self._send(exchange[1], address)
+				return
+			self.exchanges[exchangeKey] = (now, None)
+			if len(self.exchanges) > _maxExchanges:
+				self.exchanges.popitem(last = False)
+
+		try:
+			response = self._handleRequest(message, address)
+		except Exception as e:
+			L.logErr(f'Error handling CoAP request: {e}', exc = e)
+			response = self._createResponse(message, CoAPCode.INTERNAL_SERVER_ERROR)
+
+		responseData = response.encode()
+		with self.lock:
+			if exchangeKey in self.exchanges:
+				self.exchanges[exchangeKey] = (self.exchanges[exchangeKey][0], responseData)
+		self._send(responseData, address)
+
+
+	def _createResponse(self, message:CoAPMessage, code:int) -> CoAPMessage:
+		"""	Create a response message for a request.
+
+			Confirmable requests are answered with a piggybacked response, non-confirmable requests with a
+			non-confirmable response.
+
+			Args:
+				message: The request message.
+				code: The response code.
+
+			Return:
+				The response message.
+		"""
+		if message.type == CoAPType.CON:
+			return CoAPMessage(CoAPType.ACK, code, message.mid, message.token)
+		return CoAPMessage(CoAPType.NON, code, self._nextMessageID(), message.token)
+
+
+	def _handleRequest(self, message:CoAPMessage, address:Tuple[str, int]) -> CoAPMessage:
+		"""	Handle a CoAP request, including block-wise transfers of the request and response payloads.
+
+			Args:
+				message: The request message.
+				address: The client's address.
+
+			Return:
+				The response message.
+		"""
+		L.isDebug and L.logDebug(f'==> CoAP Request: {address} {coapCodeToString(message.code)} {message.options}')
+
+		# Reject requests with unrecognized critical options
+		for number, _ in message.options:
+			if number & 0x01 and number not in _recognizedOptions:
+				L.isDebug and L.logDebug(f'Unrecognized critical CoAP option: {number}')
+				return self._createResponse(message, CoAPCode.BAD_OPTION)
+
+		if message.code not in _coapMethods:
+			return self._createResponse(message, CoAPCode.METHOD_NOT_ALLOWED)
+
+		blockKey:_BlockKey = (address,
+							  message.code,
+							  tuple(message.getOptions(CoAPOption.URI_PATH)),
+							  tuple(message.getOptions(CoAPOption.URI_QUERY)))
+
+		# Receive the request payload in blocks
+		payload = message.payload
+		block1 = message.getUintOption(CoAPOption.BLOCK1)
+		if block1 is not None:
+			num, more, szx = decodeBlock(block1)
+			if szx == 7:	# BERT is only defined for CoAP over TCP
+				return self._createResponse(message, CoAPCode.BAD_OPTION)
+			with self.lock:
+				if num == 0:
+					self.requestBlocks[blockKey] = (time.time(), bytearray())
+				if (state := self.requestBlocks.get(blockKey)) is None or len(state[1]) != num * szxToBlockSize(szx):
+					self.requestBlocks.pop(blockKey, None)
+					L.isDebug and L.logDebug(f'Unexpected CoAP request block: {num}')
+					return self._createResponse(message, CoAPCode.REQUEST_ENTITY_INCOMPLETE)
+				state[1].extend(message.payload)
+				if len(state[1]) > self.maxRequestSize:
+					self.requestBlocks.pop(blockKey, None)
+					return self._createResponse(message, CoAPCode.REQUEST_ENTITY_TOO_LARGE).addOption(CoAPOption.SIZE1, self.maxRequestSize)
+				if more:
+					return self._createResponse(message, CoAPCode.CONTINUE).addOption(CoAPOption.BLOCK1, block1)
+				payload = bytes(self.requestBlocks.pop(blockKey)[1])
+		elif len(payload) > self.maxRequestSize:
+			return self._createResponse(message, CoAPCode.REQUEST_ENTITY_TOO_LARGE).addOption(CoAPOption.SIZE1, self.maxRequestSize)
+
+		# Send the requested block of a response that was already created
+		blockSize = self.blockSize
+		block2 = message.getUintOption(CoAPOption.BLOCK2)
+		if block2 is not None:
+			num, _, szx = decodeBlock(block2)
+			blockSize = min(blockSize, szxToBlockSize(min(szx, 6)))
+			if num > 0:
+				with self.lock:
+					state2 = self.responseBlocks.get(blockKey)
+				if state2 is not None:
+					return self._responseBlock(message, state2[1], num, blockSize)
+				if message.code != CoAPCode.GET:	# Only a RETRIEVE can be repeated to get the block
+					return self._createResponse(message, CoAPCode.REQUEST_ENTITY_INCOMPLETE)
+
+		response = self._processRequest(message, payload)
+		if block1 is not None:
+			response.addOption(CoAPOption.BLOCK1, block1)
+
+		# Send the response payload in blocks
+		if len(response.payload) > blockSize or (block2 is not None and decodeBlock(block2)[0] > 0):
+			with self.lock:
+				self.responseBlocks[blockKey] = (time.time(), response)
+			return self._responseBlock(message, response, decodeBlock(block2)[0] if block2 is not None else 0, blockSize)
+		return response
+
+
+	def _responseBlock(self, message:CoAPMessage, response:CoAPMessage, num:int, blockSize:int) -> CoAPMessage:
+		"""	Create a response message that contains a single block of a complete response.
+
+			Args:
+				message: The request message.
+				response: The complete response.
+				num: The requested block number.
+				blockSize: The block size.
+
+			Return:
+				The response message.
+		"""
+		if (start := num * blockSize) >= len(response.payload) and num > 0:
+			return self._createResponse(message, CoAPCode.BAD_OPTION)
+		more = start + blockSize < len(response.payload)
+		result = self._createResponse(message, response.code)
+		result.options = [ o for o in response.options ]
+		result.addOption(CoAPOption.BLOCK2, encodeBlock(num, more, blockSizeToSzx(blockSize)))
+		if num == 0:
+			result.addOption(CoAPOption.SIZE2, len(response.payload))
+		result.payload = response.payload[start:start + blockSize]
+		if not more:
+			with self.lock:
+				for key in [ k for k, v in self.responseBlocks.items() if v[1] is response ]:
+					del self.responseBlocks[key]
+		return result
+
+
+	def _processRequest(self, message:CoAPMessage, payload:bytes) -> CoAPMessage:
+		"""	Dissect a complete CoAP request, let the CSE handle it, and build the response.
+
+			Args:
+				message: The request message.
+				payload: The complete request payload.
+
+			Return:
+				The response message.
+		"""
+		accept:Optional[ContentSerializationType] = None
+		try:
+			if (_accept := message.getUintOption(CoAPOption.ACCEPT)) is not None:
+				if (accept := _contentFormats.get(cast(CoAPContentFormat, _accept))) is None:
+					return self._createResponse(message, CoAPCode.NOT_ACCEPTABLE)
+			dissectResult = self._dissectCoAPRequest(message, payload)
+		except ResponseException as e:
+			dissectResult = Result(rsc = e.rsc, request = e.data, dbg = e.dbg)
+
+		if self.isPaused:
+			return self._prepareResponse(message,
+										 Result(rsc = ResponseStatusCode.INTERNAL_SERVER_ERROR,
+												request = dissectResult.request,
+												dbg = 'coap server not running'))
+
+		if dissectResult.rsc != ResponseStatusCode.UNKNOWN:	# any other value right now indicates an error condition
+			# Something went wrong during dissection
+			if dissectResult.request:
+				CSE.request.recordRequest(dissectResult.request, dissectResult)
+			return self._prepareResponse(message, dissectResult)
+
+		try:
+			responseResult = CSE.request.handleRequest(dissectResult.request, 'coap')
+		except Exception as e:
+			responseResult = Result.exceptionToResult(e)
+		return self._prepareResponse(message, responseResult, dissectResult.request, accept)
+
+
+	def _dissectCoAPRequest(self, message:CoAPMessage, payload:bytes) -> Result:
+		"""	Dissect a CoAP request. Combine options and contents into a single structure. Result is returned in Result.request.
+
+			Args:
+				message: The request message.
+				payload: The complete request payload.
+
+			Return:
+				Result with the request.
+		"""
+		cseRequest 					= CSERequest()
+		req:ReqResp 				= {}
+		cseRequest.originalData 	= payload
+
+		# Determine the operation. A POST is a CREATE if it has a resource type, otherwise a NOTIFY
+		ty = message.getUintOption(CoAPOption.ONEM2M_TY)
+		operation = _coapMethods[cast(CoAPCode, message.code)]
+		if operation == Operation.CREATE and ty is None:
+			operation = Operation.NOTIFY
+		cseRequest.op 				= operation
+		req['op']   				= operation.value		# Needed later for validation
+		if ty is not None:
+			req['ty'] = ty
+
+		# resolve the /~ and /_ special prefixs
+		path = '/'.join(p.decode('utf-8') for p in message.getOptions(CoAPOption.URI_PATH))
+		match path[:1]:
+			case '~':
+				path = path[1:]			# ~/xxx -> /xxx
+			case '_':
+				path = f'/{path[1:]}'	# _/xxx -> //xxx
+		req['to'] 		 			= path
+
+		# Copy the oneM2M options
+		for option, attribute in ((CoAPOption.ONEM2M_FR, 'fr'),
+								  (CoAPOption.ONEM2M_RQI, 'rqi'),
+								  (CoAPOption.ONEM2M_RQET, 'rqet'),
+								  (CoAPOption.ONEM2M_RSET, 'rset'),
+								  (CoAPOption.ONEM2M_OET, 'oet'),
+								  (CoAPOption.ONEM2M_RVI, 'rvi'),
+								  (CoAPOption.ONEM2M_VSI, 'vsi'),
+								  (CoAPOption.ONEM2M_OT, 'ot')):
+			if (f := message.getStringOption(option)):
+				req[attribute] = f
+		if (rtu := message.getOptions(CoAPOption.ONEM2M_RTURI)):	# handle rtu as a list AND it might be an empty list!
+			req['rt'] = { 'nu': [ u for v in rtu for u in v.decode('utf-8').split('&') ] }	# req.rt.rtu
+		if (etags := message.getOptions(CoAPOption.ETAG)):
+			req['inm'] = [ e.hex() for e in etags ]
+
+		cseRequest.originalRequest = req 	# Already store now the incomplete request to save the option data
+
+		# Get the media type from the content-format option
+		if (contentFormat := message.getUintOption(CoAPOption.CONTENT_FORMAT)) is not None:
+			if (ct := _contentFormats.get(cast(CoAPContentFormat, contentFormat))) is None:
+				raise UNSUPPORTED_MEDIA_TYPE(L.logWarn(f'Unsupported content format: {contentFormat}'), data = cseRequest)
+			cseRequest.ct = ct
+		else:
+			cseRequest.ct = CSE.defaultSerialization
+
+		# Collect the query arguments. Arguments may occur multiple times
+		args:dict[str, list[str]] = {}
+		for q in message.getOptions(CoAPOption.URI_QUERY):
+			k, _, v = q.decode('utf-8').partition('=')
+			args.setdefault(k, []).append(v)
+		for argName in ('ty', 'cty', 'lbl', 'atrl'):	# conversion to int happens later in fillAndValidateCSERequest()
+			if argName in args:
+				args[argName] = [ t for v in args[argName] for t in v.split() ]
+
+		# Handle some parameters differently.
+		# They are not filter criteria, but request attributes
+		for param in ['rcn', 'rp', 'drt', 'sqi']:
+			if (p := args.pop(param, None)):
+				req[param] = p[0]
+		if (rtv := args.pop('rt', None)):
+			rt = cast(JSON, req.get('rt', {}))
+			rt['rtv'] = rtv[0]		# req.rt.rtv
+			req['rt'] = rt
+
+		# Maxage
+		if (ma := args.pop('ma', None)):
+			cseRequest.ma = ma[0]
+
+		# Handle attributeList
+		attributeList:list[str] = []
+		if (atrl := args.pop('atrl', None)):
+			if len(atrl) == 1:
+				req['to'] = f'{req["to"]}#{atrl[0]}'
+			else:
+				attributeList = atrl
+
+		# add all the other args to the filterCriteria
+		filterCriteria:ReqResp = { k:v if k in ('ty', 'cty', 'lbl') else v[0] for k,v in args.items() }
+		if len(filterCriteria) > 0:
+			req['fc'] = filterCriteria
+
+		if attributeList:
+			req['pc'] = { 'm2m:atrl': attributeList }
+			cseRequest.ct = CSE.defaultSerialization
+
+		else:
+
+			# De-Serialize the content
+			pc = CSE.request.deserializeContent(payload, cseRequest.ct) # may throw an exception
+
+			# Remove 'None' fields *before* adding the pc, because the pc may contain 'None' fields that need to be preserved
+			req = removeNoneValuesFromDict(req)
+
+			# Add the primitive content
+			req['pc'] = pc		# The actual content
+
+		cseRequest.originalRequest	= req	# finally store the oneM2M request object in the cseRequest
+
+		# do validation and copying of attributes of the whole request
+		try:
+			CSE.request.fillAndValidateCSERequest(cseRequest)
+		except REQUEST_TIMEOUT as e:
+			raise e
+		except ResponseException as e:
+			e.dbg = f'invalid arguments/attributes: {e.dbg}'
+			raise e
+
+		# Here, if everything went okay so far, we have a request to the CSE
+		return Result(request = cseRequest)
+
+
+	def _prepareResponse(self, message:CoAPMessage,
+							   result:Result,
+							   originalRequest:Optional[CSERequest] = None,
+							   accept:Optional[ContentSerializationType] = None) -> CoAPMessage:
+		"""	Prepare the response message for a request.
+
+			Args:
+				message: The request message.
+				result: The result of the request.
+				originalRequest: The dissected request, if available.
+				accept: The content serialization requested by the *Accept* option, if any.
+
+			Return:
+				The response message.
+		"""
+		if not result.request:
+			result.request = CSERequest()
+
+		#
+		#  Copy a couple of attributes from the originalRequest to the new request
+		#
+
+		result.request.ct = CSE.defaultSerialization	# default serialization
+		if originalRequest:
+
+			# Determine contentType for the response. Check the 'accept' option first, then the
+			# originator's preference. If this is not possible, the fallback is still the CSE's default
+			result.request.originator = originalRequest.originator
+			if accept:
+				result.request.ct = accept
+			elif csz := CSE.request.getSerializationFromOriginator(originalRequest.originator):
+				result.request.ct = csz[0]
+
+			result.request.rqi = originalRequest.rqi
+			result.request.rvi = originalRequest.rvi
+			result.request.vsi = originalRequest.vsi
+			result.request.ec  = originalRequest.ec
+			result.request.rset = originalRequest.rset
+
+			# Add the validators for a retrieved resource, and check a conditional RETRIEVE
+			CSE.request.applyConditionalRetrieve(originalRequest, result, result.request.ct)
+
+		#
+		#	Transform request to oneM2M request
+		#
+		outResult = requestFromResult(result, isResponse = True)
+		data = cast(JSON, outResult.data)
+
+		# Response code
+		if result.notModified:
+			code = CoAPCode.VALID
+		elif result.retryAfter is not None:		# The request was rejected because the CSE is overloaded
+			code = CoAPCode.SERVICE_UNAVAILABLE
+		elif (code := _successCodes.get(result.rsc)) is None:
+			httpStatus = result.rsc.httpStatusCode()
+			try:
+				code = CoAPCode(coapCode(httpStatus // 100, httpStatus % 100))
+			except ValueError:	# No CoAP equivalent of the http status code
+				code = CoAPCode.INTERNAL_SERVER_ERROR
+		response = self._createResponse(message, code)
+
+		# Build the options
+		if result.rsc:
+			response.addOption(CoAPOption.ONEM2M_RSC, int(result.rsc))
+		response.addOption(CoAPOption.ONEM2M_RQI, findXPath(data, 'rqi') or result.request.rqi or '')
+		if rvi := findXPath(data, 'rvi'):
+			response.addOption(CoAPOption.ONEM2M_RVI, rvi)
+		if vsi := findXPath(data, 'vsi'):
+			response.addOption(CoAPOption.ONEM2M_VSI, vsi)
+		if rset := findXPath(data, 'rset'):
+			response.addOption(CoAPOption.ONEM2M_RSET, str(rset))	# may be a relative time in ms
+		response.addOption(CoAPOption.ONEM2M_OT, getResourceDate())
+		if result.etag:
+			response.addOption(CoAPOption.ETAG, bytes.fromhex(result.etag))
+		if result.retryAfter is not None:
+			response.addOption(CoAPOption.MAX_AGE, max(1, int(result.retryAfter + 0.999)))
+
+		# Return early without a payload if the originator's representation is still current
+		if result.notModified:
+			L.isDebug and L.logDebug(f'<== CoAP Response (2.03 Valid)')
+			return response
+
+		# Assign and encode content accordingly
+		if 'pc' in data:
+			payload = serializeData(data['pc'], result.request.ct)
+			response.payload = payload.encode('utf-8') if isinstance(payload, str) else cast(bytes, payload)
+			response.addOption(CoAPOption.CONTENT_FORMAT, CoAPContentFormat.APPLICATION_CBOR
+														  if result.request.ct == ContentSerializationType.CBOR
+														  else CoAPContentFormat.APPLICATION_JSON)
+			L.isDebug and L.logDebug(f'<== CoAP Response ({result.rsc}, {coapCodeToString(code)}):\nBody: {data["pc"]}')
+		else:
+			L.isDebug and L.logDebug(f'<== CoAP Response ({result.rsc}, {coapCodeToString(code)})')
+		return response
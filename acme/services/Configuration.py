@@ -19,9 +19,9 @@ from rich.console import Console
 
 
 from ..etc.Constants import Constants as C
-from ..etc.Types import CSEType, ContentSerializationType, Permission
+from ..etc.Types import CSEType, ContentSerializationType, Permission, Operation, ResourceTypes
 from ..etc.Utils import normalizeURL
-from ..helpers.NetworkTools import isValidPort, isValidateIpAddress, isValidateHostname
+from ..helpers.NetworkTools import isValidPort, isValidateIpAddress, isValidateHostname, supportsReusePort
 from ..services import Onboarding
 
 # TODO: proper use of the baseDirectory configuration for other values
@@ -29,15 +29,24 @@ from ..services import Onboarding
 documentationLinks = {
 	'cse': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#general',
 	'cse.announcements': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#announcements',
+	'cse.operation.discovery': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_discovery',
 	'cse.operation.jobs': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_jobs',
+	'cse.operation.limits': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_limits',
+	'cse.operation.processes': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_processes',
 	'cse.operation.requests': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_requests',
+	'cse.operation.tracing': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#operation_tracing',
 	'cse.registrar': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#registrar',
 	'cse.registration': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#cse_registration',
 	'cse.security': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#security',
 	'cse.statistics': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#statistics',
+	'coap': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#coap',
+	'coap.security': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#security_coap',
 	'console': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#console',
 	'database': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#database',
 	'http': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#server_http',
+	'http.asyncio': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#http_asyncio',
+	'http.client': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#http_client',
+	'http.compression': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#http_compression',
 	'http.cors': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#http_cors',
 	'http.security': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#security_http',
 	'logging': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#logging',
@@ -54,6 +63,7 @@ documentationLinks = {
 	'scripting': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#scripting',
 	'server.http': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#id_mappings',	# TODO remove later
 	'textui': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#textui',
+	'websocket.asyncio': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#websocket_asyncio',
 	'webui': 'https://github.com/ankraft/ACME-oneM2M-CSE/blob/master/docs/Configuration.md#webui',
 }
 """	Documentation links for configuration settings. These are used in the console and text UIto show the documentation for a configuration setting. """
@@ -96,6 +106,8 @@ class Configuration(object):
 	_defaultConfigFile:str = None
 	""" The default configuration file. """
 
+	_argsCoapEnabled:bool = None
+	""" The CoAP enabled flag passed as argument. This overrides the respective value in the configuration file. """
 	_argsConfigfile:str = None
 	""" The configuration file passed as argument. This overrides the respective value in the configuration file. """
 	_argsLoglevel:str = None
@@ -126,6 +138,8 @@ class Configuration(object):
 	""" The https flag passed as argument. This overrides the respective value in the configuration file. """
 	_argsRunAsHttpWsgi:bool = None
 	""" The http WSGI flag passed as argument. This overrides the respective value in the configuration file. """
+	_argsRunAsHttpAsyncio:bool = None
+	""" The http asyncio flag passed as argument. This overrides the respective value in the configuration file. """
 	_argsStatisticsEnabled:bool = None
 	""" The statistics enabled flag passed as argument. This overrides the respective value in the configuration file. """
 	_argsTextUI:bool = None
@@ -159,6 +173,7 @@ class Configuration(object):
 		Configuration._defaultConfigFile		= f'{pathlib.Path.cwd()}{os.sep}{C.defaultConfigFile}'
 
 		# resolve the args, if any
+		Configuration._argsCoapEnabled			= args.coapenabled if args and 'coapenabled' in args else None
 		Configuration._argsConfigfile			= args.configfile if args and 'configfile' in args else C.defaultUserConfigFile
 		Configuration._argsLoglevel				= args.loglevel if args and 'loglevel' in args else None
 		Configuration._argsDBReset				= args.dbreset if args and 'dbreset' in args else False
@@ -173,6 +188,7 @@ class Configuration(object):
 		Configuration._argsRemoteCSEEnabled		= args.remotecseenabled if args and 'remotecseenabled' in args else None
 		Configuration._argsRunAsHttps			= args.https if args and 'https' in args else None
 		Configuration._argsRunAsHttpWsgi		= args.httpWsgi if args and 'httpWsgi' in args else None
+		Configuration._argsRunAsHttpAsyncio		= args.httpAsyncio if args and 'httpAsyncio' in args else None
 		Configuration._argsStatisticsEnabled	= args.statisticsenabled if args and 'statisticsenabled' in args else None
 		Configuration._argsTextUI				= args.textui if args and 'textui' in args else None
 		Configuration._argsWsEnabled			= args.wsenabled if args and 'wsenabled' in args else None
@@ -238,12 +254,15 @@ class Configuration(object):
 				#	CSE
 				#
 
+				'cse.allowJSONComments'							: config.getboolean('cse', 'allowJSONComments',						fallback = True),
 				'cse.asyncSubscriptionNotifications'			: config.getboolean('cse', 'asyncSubscriptionNotifications',		fallback = True),
 				'cse.checkExpirationsInterval'					: config.getint('cse', 'checkExpirationsInterval',					fallback = 60),		# Seconds
 				'cse.cseID'										: config.get('cse', 'cseID',										fallback = '/id-in'),
 				'cse.defaultSerialization'						: config.get('cse', 'defaultSerialization',							fallback = 'json'),
+				'cse.enableFastJSONCodec'						: config.getboolean('cse', 'enableFastJSONCodec', 					fallback = True),
 				'cse.enableRemoteCSE'							: config.getboolean('cse', 'enableRemoteCSE', 						fallback = True),
 				'cse.enableResourceExpiration'					: config.getboolean('cse', 'enableResourceExpiration', 				fallback = True),
+				'cse.enableRetrieveCoalescing'					: config.getboolean('cse', 'enableRetrieveCoalescing', 				fallback = True),
 				'cse.enableSubscriptionVerificationRequests'	: config.getboolean('cse', 'enableSubscriptionVerificationRequests',fallback = True),
 				'cse.flexBlockingPreference'					: config.get('cse', 'flexBlockingPreference',						fallback = 'blocking'),
 				'cse.maxExpirationDelta'						: config.getint('cse', 'maxExpirationDelta',						fallback = 60*60*24*365*5),	# 5 years, in seconds
@@ -269,6 +288,17 @@ class Configuration(object):
 				'cse.announcements.delayAfterRegistration'			: config.getfloat('cse.announcements', 'delayAfterRegistration',			fallback = 3.0),
 
 
+				#
+				#	CSE Operation : Discovery
+				#
+
+				'cse.operation.discovery.enableParallel'	: config.getboolean('cse.operation.discovery', 'enableParallel',	fallback = False),
+				'cse.operation.discovery.parallelThreshold'	: config.getint('cse.operation.discovery', 'parallelThreshold',		fallback = 100),
+				'cse.operation.discovery.parallelWorkers'	: config.getint('cse.operation.discovery', 'parallelWorkers',		fallback = 4),
+				'cse.operation.discovery.enableResultCache'	: config.getboolean('cse.operation.discovery', 'enableResultCache',	fallback = False),
+				'cse.operation.discovery.resultCacheSize'	: config.getint('cse.operation.discovery', 'resultCacheSize',		fallback = 10000),
+				'cse.operation.discovery.resultCacheTTL'	: config.getfloat('cse.operation.discovery', 'resultCacheTTL',		fallback = 10.0),
+
 				#
 				#	CSE Operation : Jobs
 				#
@@ -277,6 +307,25 @@ class Configuration(object):
 				'cse.operation.jobs.balanceReduceFactor': config.getfloat('cse.operation.jobs', 'jobBalanceReduceFactor', 	fallback = 2.0),
 				'cse.operation.jobs.balanceTarget'		: config.getfloat('cse.operation.jobs', 'jobBalanceTarget',			fallback = 3.0),
 
+				#
+				#	CSE Operation : Limits
+				#
+
+				'cse.operation.limits.enable'			: config.getboolean('cse.operation.limits', 'enable',				fallback = False),
+				'cse.operation.limits.maxInFlight'		: config.getint('cse.operation.limits', 'maxInFlight',				fallback = 100),
+				'cse.operation.limits.maxQueued'		: config.getint('cse.operation.limits', 'maxQueued',				fallback = 200),
+				'cse.operation.limits.queueTimeout'		: config.getfloat('cse.operation.limits', 'queueTimeout',			fallback = 2.0),
+				'cse.operation.limits.enableOriginatorLimits'	: config.getboolean('cse.operation.limits', 'enableOriginatorLimits',	fallback = False),
+				'cse.operation.limits.originatorRate'	: config.getfloat('cse.operation.limits', 'originatorRate',			fallback = 10.0),
+				'cse.operation.limits.originatorBurst'	: config.getint('cse.operation.limits', 'originatorBurst',			fallback = 20),
+				'cse.operation.limits.originatorRules'	: config.getlist('cse.operation.limits', 'originatorRules',			fallback = []),		# type: ignore [attr-defined]
+
+				#
+				#	CSE Operation : Processes
+				#
+
+				'cse.operation.processes.workers'		: config.getint('cse.operation.processes', 'workers',				fallback = 1),
+
 				#
 				#	CSE Operation : Requests
 				#
@@ -284,6 +333,15 @@ class Configuration(object):
 				'cse.operation.requests.enable'			: config.getboolean('cse.operation.requests', 'enable',				fallback = False),
 				'cse.operation.requests.size'			: config.getint('cse.operation.requests', 'size', 					fallback = 1000),
 
+				#
+				#	CSE Operation : Tracing
+				#
+
+				'cse.operation.tracing.enable'			: config.getboolean('cse.operation.tracing', 'enable',				fallback = False),
+				'cse.operation.tracing.sampleRate'		: config.getfloat('cse.operation.tracing', 'sampleRate',			fallback = 1.0),
+				'cse.operation.tracing.size'			: config.getint('cse.operation.tracing', 'size',					fallback = 100),
+				'cse.operation.tracing.exportFormat'	: config.get('cse.operation.tracing', 'exportFormat',				fallback = 'chrome'),
+
 				#
 				#	Registrar CSE
 				#
@@ -291,7 +349,10 @@ class Configuration(object):
 				'cse.registrar.address'					: config.get('cse.registrar', 'address', 							fallback = None),
 				'cse.registrar.checkInterval'			: config.getint('cse.registrar', 'checkInterval', 					fallback = 30),		# Seconds
 				'cse.registrar.cseID'					: config.get('cse.registrar', 'cseID', 								fallback = None),
+				'cse.registrar.enableRemoteResourceCache'	: config.getboolean('cse.registrar', 'enableRemoteResourceCache',	fallback = True),
 				'cse.registrar.excludeCSRAttributes'	: config.getlist('cse.registrar', 'excludeCSRAttributes',			fallback = []),		# type: ignore [attr-defined]
+				'cse.registrar.remoteResourceCacheSize'	: config.getint('cse.registrar', 'remoteResourceCacheSize',			fallback = 1000),
+				'cse.registrar.remoteResourceCacheTTL'	: config.getfloat('cse.registrar', 'remoteResourceCacheTTL',		fallback = 10.0),
 				'cse.registrar.resourceName'						: config.get('cse.registrar', 'resourceName', 						fallback = None),
 				'cse.registrar.root'					: config.get('cse.registrar', 'root', 								fallback = ''),
 				'cse.registrar.serialization'			: config.get('cse.registrar', 'serialization',						fallback = 'json'),
@@ -311,6 +372,9 @@ class Configuration(object):
 
 				'cse.security.enableACPChecks'			: config.getboolean('cse.security', 'enableACPChecks',			 	fallback = True),
 				'cse.security.fullAccessAdmin'			: config.getboolean('cse.security', 'fullAccessAdmin',			 	fallback = True),
+				'cse.security.enableACPDecisionCache'	: config.getboolean('cse.security', 'enableACPDecisionCache',		fallback = True),
+				'cse.security.acpDecisionCacheSize'		: config.getint('cse.security', 'acpDecisionCacheSize',				fallback = 10000),
+				'cse.security.acpDecisionCacheTTL'		: config.getfloat('cse.security', 'acpDecisionCacheTTL',			fallback = 60.0),
 
 				#
 				#	Statistics
@@ -321,15 +385,17 @@ class Configuration(object):
 
 
 				#
-				#	CoAP Client
+				#	CoAP Server
 				#
 
 				'coap.enable'							: config.getboolean('coap', 'enable', 								fallback = False),
 				'coap.listenIF' 						: config.get('coap', 'listenIF',									fallback = '0.0.0.0'),
 				'coap.port' 							: config.getint('coap', 'port', 									fallback = None),	# Default will be determined later (s.b.)
+				'coap.blockSize'						: config.getint('coap', 'blockSize', 								fallback = 1024),
+				'coap.maxRequestSize'					: config.getint('coap', 'maxRequestSize', 							fallback = 1048576),
 
 				#
-				#	CoAP Client Security
+				#	CoAP Server Security
 				#
 
 				'coap.security.certificateFile'			: config.get('coap.security', 'certificateFile', 					fallback = None),
@@ -358,6 +424,7 @@ class Configuration(object):
 				'database.type'							: config.get('database', 'type',			 						fallback = 'tinydb'),
 				'database.resetOnStartup' 				: config.getboolean('database', 'resetOnStartup',					fallback = False),
 				'database.backupPath'					: config.get('database', 'backupPath',								fallback = './data/backup'),
+				'database.identifierCacheSize'			: config.getint('database', 'identifierCacheSize',					fallback = 10000),
 
 				#
 				#	Database PostgreSQL
@@ -384,9 +451,12 @@ class Configuration(object):
 
 				'http.address'							: config.get('http', 'address', 									fallback = 'http://127.0.0.1:8080'),
 				'http.allowPatchForDelete'				: config.getboolean('http', 'allowPatchForDelete', 					fallback = False),
+				'http.enableBatchEndpoint'				: config.getboolean('http', 'enableBatchEndpoint', 					fallback = False),
 				'http.enableStructureEndpoint'			: config.getboolean('http', 'enableStructureEndpoint', 				fallback = False),
 				'http.enableUpperTesterEndpoint'		: config.getboolean('http', 'enableUpperTesterEndpoint', 			fallback = False),
 				'http.listenIF'							: config.get('http', 'listenIF', 									fallback = '0.0.0.0'),
+				'http.maxBatchSize'						: config.getint('http', 'maxBatchSize', 							fallback = 100),
+				'http.maxRequestBodySize'				: config.getint('http', 'maxRequestBodySize', 						fallback = 10485760),
 				'http.port' 							: config.getint('http', 'port', 									fallback = 8080),
 				'http.root'								: config.get('http', 'root', 										fallback = ''),
 				'http.timeout' 							: config.getfloat('http', 'timeout',								fallback = 10.0),
@@ -423,6 +493,35 @@ class Configuration(object):
 				'http.wsgi.threadPoolSize'				: config.getint('http.wsgi', 'threadPoolSize',						fallback = 100),
 
 
+				#
+				#	HTTP Server asyncio
+				#
+
+				'http.asyncio.enable'					: config.getboolean('http.asyncio', 'enable', 						fallback = False),
+				'http.asyncio.connectionLimit'			: config.getint('http.asyncio', 'connectionLimit',					fallback = 1000),
+				'http.asyncio.threadPoolSize'			: config.getint('http.asyncio', 'threadPoolSize',					fallback = 100),
+				'http.asyncio.keepAliveTimeout'			: config.getfloat('http.asyncio', 'keepAliveTimeout',				fallback = 60.0),
+
+
+				#
+				#	HTTP Compression
+				#
+
+				'http.compression.enable'				: config.getboolean('http.compression', 'enable', 					fallback = True),
+				'http.compression.minSize'				: config.getint('http.compression', 'minSize',						fallback = 1024),
+				'http.compression.level'				: config.getint('http.compression', 'level',						fallback = 6),
+
+
+				#
+				#	HTTP Client
+				#
+
+				'http.client.enableConnectionPool'		: config.getboolean('http.client', 'enableConnectionPool',			fallback = True),
+				'http.client.poolSize'					: config.getint('http.client', 'poolSize',							fallback = 10),
+				'http.client.maxHosts'					: config.getint('http.client', 'maxHosts',							fallback = 100),
+				'http.client.idleTimeout'				: config.getfloat('http.client', 'idleTimeout',						fallback = 60.0),
+
+
 				#
 				#	Logging
 				#
@@ -449,8 +548,11 @@ class Configuration(object):
 				'mqtt.keepalive' 						: config.getint('mqtt', 'keepalive',								fallback = 60),
 				'mqtt.listenIF' 						: config.get('mqtt', 'listenIF',									fallback = '0.0.0.0'),
 				'mqtt.port' 							: config.getint('mqtt', 'port', 									fallback = None),	# Default will be determined later (s.b.)
+				'mqtt.qos' 								: config.getint('mqtt', 'qos',										fallback = 0),
+				'mqtt.sharedSubscriptionGroup' 			: config.get('mqtt', 'sharedSubscriptionGroup',						fallback = ''),
 				'mqtt.timeout' 							: config.getfloat('mqtt', 'timeout',								fallback = 10.0),
 				'mqtt.topicPrefix' 						: config.get('mqtt', 'topicPrefix',									fallback = ''),
+				'mqtt.workers' 							: config.getint('mqtt', 'workers',									fallback = 0),
 
 				#
 				#	MQTT Client Security
@@ -492,6 +594,7 @@ class Configuration(object):
 				#	Defaults for Group Resources
 				#
 
+				'resource.grp.fanoutWorkers'			: config.getint('resource.grp', 'fanoutWorkers', 					fallback = 8),
 				'resource.grp.resultExpirationTime'		: config.getint('resource.grp', 'resultExpirationTime', 			fallback = 0),
 
 
@@ -563,6 +666,14 @@ class Configuration(object):
 				'websocket.loglevel'					: config.get('websocket', 'loglevel', 								fallback = 'debug'),
 				'websocket.timeout' 					: config.getfloat('websocket', 'timeout',							fallback = 10.0),
 
+				#
+				#	WebSocket Server asyncio
+				#
+
+				'websocket.asyncio.enable'				: config.getboolean('websocket.asyncio', 'enable', 					fallback = False),
+				'websocket.asyncio.threadPoolSize'		: config.getint('websocket.asyncio', 'threadPoolSize',				fallback = 100),
+				'websocket.asyncio.compression'			: config.getboolean('websocket.asyncio', 'compression',				fallback = True),
+
 				#
 				#	WebSocket Server Security
 				#
@@ -706,6 +817,7 @@ class Configuration(object):
 			return False, fr'Configuration Error: \[logging]:queueSize must be 0 or greater'
 
 		# Overwriting some configurations from command line
+		if Configuration._argsCoapEnabled is not None:			_put('coap.enable', Configuration._argsCoapEnabled)						# Override coap enable
 		if Configuration._argsDBReset is True:					_put('database.resetOnStartup', True)									# Override DB reset from command line
 		if Configuration._argsDBDataDirectory is not None:		_put('database.path', Configuration._argsDBDataDirectory)				# Override DB data directory from command line
 		if Configuration._argsDBStorageMode is not None:		_put('database.type', Configuration._argsDBStorageMode)				# Override DB data directory from command line
@@ -718,6 +830,7 @@ class Configuration(object):
 		if Configuration._argsRemoteCSEEnabled is not None:		_put('cse.enableRemoteCSE', Configuration._argsRemoteCSEEnabled)		# Override remote CSE enablement
 		if Configuration._argsRunAsHttps is not None:			_put('http.security.useTLS', Configuration._argsRunAsHttps)				# Override useTLS
 		if Configuration._argsRunAsHttpWsgi is not None:		_put('http.wsgi.enable', Configuration._argsRunAsHttpWsgi)				# Override use WSGI
+		if Configuration._argsRunAsHttpAsyncio is not None:		_put('http.asyncio.enable', Configuration._argsRunAsHttpAsyncio)		# Override use asyncio
 		if Configuration._argsStatisticsEnabled is not None:	_put('cse.statistics.enable', Configuration._argsStatisticsEnabled)		# Override statistics enablement
 		if Configuration._argsTextUI is not None:				_put('textui.startWithTUI', Configuration._argsTextUI)
 		if Configuration._argsWsEnabled is not None:			_put('websocket.enable', Configuration._argsWsEnabled)						# Override mqtt enable
@@ -755,12 +868,63 @@ class Configuration(object):
 
 
 		# Operation
+		if _get('cse.operation.discovery.parallelThreshold') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.discovery]:parallelThreshold[/i] must be > 0'
+		if _get('cse.operation.discovery.parallelWorkers') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.discovery]:parallelWorkers[/i] must be > 0'
+		if _get('cse.operation.discovery.resultCacheSize') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.discovery]:resultCacheSize[/i] must be > 0'
+		if _get('cse.operation.discovery.resultCacheTTL') <= 0.0:
+			return False, fr'Configuration Error: [i]\[cse.operation.discovery]:resultCacheTTL[/i] must be > 0.0'
+
+		# Security
+		if _get('cse.security.acpDecisionCacheSize') < 1:
+			return False, fr'Configuration Error: [i]\[cse.security]:acpDecisionCacheSize[/i] must be > 0'
+		if _get('cse.security.acpDecisionCacheTTL') <= 0.0:
+			return False, fr'Configuration Error: [i]\[cse.security]:acpDecisionCacheTTL[/i] must be > 0.0'
 		if _get('cse.operation.jobs.balanceTarget') <= 0.0:
 			return False, fr'Configuration Error: [i]\[cse.operation.jobs]:balanceTarget[/i] must be > 0.0'
 		if _get('cse.operation.jobs.balanceLatency') < 0:
 			return False, fr'Configuration Error: [i]\[cse.operation.jobs]:balanceLatency[/i] must be >= 0'
 		if _get('cse.operation.jobs.balanceReduceFactor') < 1.0:
 			return False, fr'Configuration Error: [i]\[cse.operation.jobs]:balanceReduceFactor[/i] must be >= 1.0'
+		if _get('cse.operation.limits.maxInFlight') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.limits]:maxInFlight[/i] must be > 0'
+		if _get('cse.operation.limits.maxQueued') < 0:
+			return False, fr'Configuration Error: [i]\[cse.operation.limits]:maxQueued[/i] must be >= 0'
+		if _get('cse.operation.limits.queueTimeout') <= 0.0:
+			return False, fr'Configuration Error: [i]\[cse.operation.limits]:queueTimeout[/i] must be > 0.0'
+		if _get('cse.operation.limits.originatorRate') < 0.0:
+			return False, fr'Configuration Error: [i]\[cse.operation.limits]:originatorRate[/i] must be >= 0.0'
+		if _get('cse.operation.limits.originatorBurst') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.limits]:originatorBurst[/i] must be > 0'
+		
+		# Originator rate limit rules: <operation>[:<resourceType>]=<rate>/<burst>
+		if isinstance(rules := _get('cse.operation.limits.originatorRules'), list):
+			_rules:Dict[Tuple[Operation, Optional[ResourceTypes]], Tuple[float, int]] = {}
+			for rule in rules:
+				try:
+					key, _, limit = rule.partition('=')
+					op, _, ty = key.strip().partition(':')
+					rate, _, burst = limit.partition('/')
+					_op = Operation.to(op.strip(), insensitive = True)
+					_ty = ResourceTypes.to(ty.strip(), insensitive = True) if ty else None
+					_rate, _burst = float(rate), int(burst)
+				except ValueError:
+					return False, fr'Configuration Error: [i]\[cse.operation.limits]:originatorRules[/i] - invalid rule: {rule}'
+				if _op is None or _op == Operation.NA or (ty and _ty is None) or _rate <= 0.0 or _burst < 1:
+					return False, fr'Configuration Error: [i]\[cse.operation.limits]:originatorRules[/i] - invalid rule: {rule}'
+				_rules[(_op, _ty)] = (_rate, _burst)
+			_put('cse.operation.limits.originatorRules', _rules)
+
+		# Request tracing
+		if not 0.0 <= _get('cse.operation.tracing.sampleRate') <= 1.0:
+			return False, fr'Configuration Error: [i]\[cse.operation.tracing]:sampleRate[/i] must be >= 0.0 and <= 1.0'
+		if _get('cse.operation.tracing.size') < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.tracing]:size[/i] must be > 0'
+		_put('cse.operation.tracing.exportFormat', (exportFormat := _get('cse.operation.tracing.exportFormat').lower()))
+		if exportFormat not in [ 'chrome', 'otlp' ]:
+			return False, fr'Configuration Error: [i]\[cse.operation.tracing]:exportFormat[/i] must be "chrome" or "otlp"'
 
 
 		#
@@ -772,6 +936,10 @@ class Configuration(object):
 			return False, fr'Configuration Error: Invalid port number for [i]\[http]:port[/i]: {_get("http.port")}'
 		if not (isValidateHostname(_get('http.listenIF')) or isValidateIpAddress(_get('http.listenIF'))):
 			return False, fr'Configuration Error: Invalid hostname or IP address for [i]\[http]:listenIF[/i]: {_get("http.listenIF")}'
+		if _get('http.maxBatchSize') < 1:
+			return False, fr'Configuration Error: [i]\[http]:maxBatchSize[/i] must be > 0: {_get("http.maxBatchSize")}'
+		if _get('http.maxRequestBodySize') < 1:
+			return False, fr'Configuration Error: [i]\[http]:maxRequestBodySize[/i] must be > 0: {_get("http.maxRequestBodySize")}'
 		
 		# HTTP TLS & certificates
 		if not _get('http.security.useTLS'):	# clear certificates configuration if not in use
@@ -813,6 +981,30 @@ class Configuration(object):
 		if _get('http.wsgi.connectionLimit') < 1:
 			return False, r'Configuration Error: [i]\[http.wsgi]:connectionLimit[/i] must be > 0'
 
+		# HTTP asyncio
+		if _get('http.asyncio.enable') and _get('http.wsgi.enable'):
+			return False, r'Configuration Error: [i]\[http.asyncio].enable[/i] and [i]\[http.wsgi].enable[/i] cannot both be enabled.'
+		if _get('http.asyncio.threadPoolSize') < 1:
+			return False, r'Configuration Error: [i]\[http.asyncio]:threadPoolSize[/i] must be > 0'
+		if _get('http.asyncio.connectionLimit') < 1:
+			return False, r'Configuration Error: [i]\[http.asyncio]:connectionLimit[/i] must be > 0'
+		if _get('http.asyncio.keepAliveTimeout') <= 0:
+			return False, r'Configuration Error: [i]\[http.asyncio]:keepAliveTimeout[/i] must be > 0'
+
+		# HTTP Compression
+		if _get('http.compression.minSize') < 0:
+			return False, r'Configuration Error: [i]\[http.compression]:minSize[/i] must be >= 0'
+		if not 1 <= _get('http.compression.level') <= 9:
+			return False, r'Configuration Error: [i]\[http.compression]:level[/i] must be between 1 and 9'
+
+		# HTTP Client
+		if _get('http.client.poolSize') < 1:
+			return False, r'Configuration Error: [i]\[http.client]:poolSize[/i] must be > 0'
+		if _get('http.client.maxHosts') < 1:
+			return False, r'Configuration Error: [i]\[http.client]:maxHosts[/i] must be > 0'
+		if _get('http.client.idleTimeout') <= 0:
+			return False, r'Configuration Error: [i]\[http.client]:idleTimeout[/i] must be > 0'
+
 		
 		#
 		#	MQTT client
@@ -823,6 +1015,12 @@ class Configuration(object):
 			return False, fr'Configuration Error: Username or password missing for [i]\[mqtt.security][/i]'
 		# remove empty cid from the list
 		_put('mqtt.security.allowedCredentialIDs', [ cid for cid in _get('mqtt.security.allowedCredentialIDs') if len(cid) ])
+		if _get('mqtt.qos') not in [ 0, 1, 2 ]:
+			return False, r'Configuration Error: [i]\[mqtt]:qos[/i] must be 0, 1, or 2'
+		if any(c in _get('mqtt.sharedSubscriptionGroup') for c in '/+#'):
+			return False, r'Configuration Error: [i]\[mqtt]:sharedSubscriptionGroup[/i] must not contain "/", "+", or "#"'
+		if _get('mqtt.workers') < 0:
+			return False, r'Configuration Error: [i]\[mqtt]:workers[/i] must be >= 0'
 
 
 		#
@@ -841,6 +1039,8 @@ class Configuration(object):
 			_put('websocket.loglevel', ll)
 		else:
 			return False, fr'Configuration Error: Unsupported \[websocket]:loglevel: {logLevel}'
+		if _get('websocket.asyncio.threadPoolSize') < 1:
+			return False, r'Configuration Error: [i]\[websocket.asyncio]:threadPoolSize[/i] must be > 0'
 
 		# WebSocket TLS & certificates
 		if not _get('websocket.security.useTLS'):	# clear certificates configuration if not in use
@@ -860,12 +1060,26 @@ class Configuration(object):
 			if not os.path.exists(val):
 				return False, fr'Configuration Error: [i]\[websocket.security]:caPrivateKeyFile[/i] does not exists or is not accessible: {val}'
 
+		#
+		#	CoAP server
+		#
+		if not _get('coap.port'):	# set the default port depending on whether to use DTLS
+			_put('coap.port', 5684 if _get('coap.security.useDTLS') else 5683)
+		if not isValidPort(_get('coap.port')):
+			return False, fr'Configuration Error: Invalid port number for [i]\[coap]:port[/i]: {_get("coap.port")}'	
+		if not (isValidateHostname(_get('coap.listenIF')) or isValidateIpAddress(_get('coap.listenIF'))):
+			return False, fr'Configuration Error: Invalid hostname or IP address for [i]\[coap]:listenIF[/i]: {_get("coap.listenIF")}'
+		if (val := _get('coap.blockSize')) not in [ 16, 32, 64, 128, 256, 512, 1024 ]:
+			return False, fr'Configuration Error: [i]\[coap]:blockSize[/i] must be a power of two between 16 and 1024: {val}'
+		if _get('coap.maxRequestSize') < _get('coap.blockSize'):
+			return False, r'Configuration Error: [i]\[coap]:maxRequestSize[/i] must be >= [i]\[coap]:blockSize[/i]'
+
 		# COAP TLS & certificates
 		if not _get('coap.security.useDTLS'):	# clear certificates configuration if not in use
 			_put('coap.security.verifyCertificate', False)
-			_put('coap.security.tlsVersion', 'auto')
-			_put('coap.security.caCertificateFile', '')
-			_put('coap.security.caPrivateKeyFile', '')
+			_put('coap.security.dtlsVersion', 'auto')
+			_put('coap.security.certificateFile', '')
+			_put('coap.security.privateKeyFile', '')
 		else:
 			if not (val := _get('coap.security.dtlsVersion')).lower() in [ 'tls1.1', 'tls1.2', 'auto' ]:
 				return False, fr'Configuration Error: Unknown value for [i]\[coap.security]:dtlsVersion[/i]: {val}'
@@ -890,6 +1104,10 @@ class Configuration(object):
 				return False, fr'Configuration Error: Wrong format for [i]\[cse.registrar]:cseID[/i]: {val}'
 			if len(_get('cse.registrar.cseID')) > 0 and len(_get('cse.registrar.resourceName')) == 0:
 				return False, r'Configuration Error: Missing configuration [i]\[cse.registrar]:resourceName[/i]'
+		if _get('cse.registrar.remoteResourceCacheSize') < 1:
+			return False, fr'Configuration Error: [i]\[cse.registrar]:remoteResourceCacheSize[/i] must be > 0'
+		if _get('cse.registrar.remoteResourceCacheTTL') <= 0.0:
+			return False, fr'Configuration Error: [i]\[cse.registrar]:remoteResourceCacheTTL[/i] must be > 0.0'
 
 		# Check default subscription duration
 		if _get('resource.sub.batchNotifyDuration') < 1:
@@ -958,6 +1176,8 @@ class Configuration(object):
 			return False, fr'Configuration Error: [i]\[resource.tsb]:bcni[/i]: configuration value must be an ISO8601 duration'
 		
 		# Check group resource defaults
+		if _get('resource.grp.fanoutWorkers') < 0:
+			return False, fr'Configuration Error: [i]\[resource.grp]:fanoutWorkers[/i] must be >= 0'
 		if _get('resource.grp.resultExpirationTime') < 0:
 			return False, fr'Configuration Error: [i]\[resource.grp]:resultExpirationTime[/i] must be >= 0'
 		
@@ -971,6 +1191,21 @@ class Configuration(object):
 
 		if dbType not in ['tinydb', 'postgresql', 'memory']:
 			return False, fr'Configuration Error: [i]\[database]:type[/i] must be "tinydb", "postgresql", or "memory"'
+		if _get('database.identifierCacheSize') < 0:
+			return False, r'Configuration Error: [i]\[database]:identifierCacheSize[/i] must be >= 0'
+
+		# Multi-process mode
+		if (workers := _get('cse.operation.processes.workers')) < 1:
+			return False, fr'Configuration Error: [i]\[cse.operation.processes]:workers[/i] must be > 0'
+		if workers > 1:
+			if dbType != 'postgresql':
+				return False, fr'Configuration Error: [i]\[cse.operation.processes]:workers[/i] > 1 requires [i]\[database]:type[/i] "postgresql"'
+			if not supportsReusePort():
+				return False, fr'Configuration Error: [i]\[cse.operation.processes]:workers[/i] > 1 is not supported on this operating system'
+			# Other processes are informed about changes asynchronously. Cached ACP decisions and shared storage loads
+			# could therefore be outdated for a short time after a change in another process
+			_put('cse.security.enableACPDecisionCache', False)
+			_put('cse.enableRetrieveCoalescing', False)
 		# Everything is fine
 		return True, None
 
@@ -14,6 +14,7 @@ from typing import List, cast, Optional, Any, Tuple
 
 import csv, datetime, json, os, sys, webbrowser, socket
 from enum import IntEnum, auto
+from rich.console import Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.pretty import Pretty
@@ -265,6 +266,8 @@ class Console(object):
 			'k'					: self.katalogScripts,
 			'l'     			: self.toggleScreenLogging,
 			'L'     			: self.toggleLogging,
+			'p'					: self.showTraces,
+			FunctionKey.CTRL_P	: self.exportTraces,
 			'Q'					: self.shutdownCSE,		# See handler below
 			'r'					: self.registrations,
 			'R'					: self.runScript,
@@ -355,6 +358,8 @@ class Console(object):
 			('^K', 'Show resource continuously'),
 			('l', 'Toggle screen logging on/off'),
 			('L', 'Toggle through log levels'),
+			('p', 'Show request traces'),
+			('^P', 'Export request traces to the [i]tmp[/i] directory'),
 			('r', 'Show CSE registrations'),
 			('s', 'Show statistics'),
 			('^S', 'Show & refresh statistics continuously'),
@@ -1141,6 +1146,56 @@ function createResource() {{
 		CSE.storage.deleteRequests()
 
 
+	def showTraces(self, key:str) -> None:
+		"""	Show a summary of the processing stages and the most recent request traces.
+
+			Args:
+				key: Input key. Ignored.
+		"""
+		L.console('Request Traces', isHeader = True)
+		if not CSE.request.enableTracing:
+			L.console('Request tracing is disabled', isError = True)
+			return
+		L.off()
+		L.console(self.getTracesRich())
+		L.on()
+
+
+	def exportTraces(self, key:str) -> None:
+		"""	Export the request traces to a file in the tmp directory.
+
+			Args:
+				key: Input key. Ignored.
+		"""
+		L.console('Export Request Traces', isHeader = True)
+		L.off()
+		self.doExportTraces()
+		L.on()
+
+
+	def doExportTraces(self) -> Tuple[int, str]:
+		"""	Export the request traces to a file in the tmp directory. The file format
+			is determined by the *[cse.operation.tracing]:exportFormat* setting.
+
+			Return:
+				Tuple of the number of exported traces and the path of the file relative to the base directory.
+		"""
+		if not CSE.request.tracer.getTraces():
+			return 0, L.console('No request traces recorded', isError = True)
+		try:
+			outdir = f'{CSE.Configuration.get("baseDirectory")}/tmp'
+			os.makedirs(outdir, exist_ok = True)
+			filename = f'traces-{CSE.request.tracingExportFormat}-{getResourceDate().rsplit(",", 1)[0]}.json'
+			count = CSE.request.tracer.exportTraces(f'{outdir}/{filename}', 
+													CSE.request.tracingExportFormat, 
+													f'ACME {CSE.cseCsi}')
+			L.console(f'Exported {count} request traces to {filename}')
+		except Exception as e:
+			L.console(str(e), isError = True)
+			return 0, str(e)
+		return count, f'tmp/{filename}'
+
+
 
 	#########################################################################
 	#
@@ -1284,6 +1339,8 @@ function createResource() {{
 				resourceOps +=  f'Notify: {stats.get(Statistics.notifications, 0)}\n'
 				resourceOps += 	'\n'
 				resourceOps +=  f'Expire: {stats.get(Statistics.expiredResources, 0)}\n'
+				if CSE.request.enableOriginatorLimits:
+					resourceOps +=  f'Rate-X: {stats.get(Statistics.originatorRejected, 0)}\n'
 				resourceOps +=  _markup(f'\n[dim]Includes virtual\nresources[/dim]')
 
 				httpReceived  = _markup('[underline]HTTP:R[/underline]\n')
@@ -1293,6 +1350,10 @@ function createResource() {{
 				httpReceived += f'U: {stats.get(Statistics.httpUpdates, 0)}\n'
 				httpReceived += f'D: {stats.get(Statistics.httpDeletes, 0)}\n'
 				httpReceived += f'N: {stats.get(Statistics.httpNotifies, 0)}\n'
+				if CSE.request.enableRequestLimits:
+					httpReceived += '\n'
+					httpReceived += f'Q: {stats.get(Statistics.httpQueued, 0)}\n'
+					httpReceived += f'X: {stats.get(Statistics.httpRejected, 0)}\n'
 
 				httpSent  = 	_markup('[underline]HTTP:S[/underline]\n')
 				httpSent += 	'\n'
@@ -1309,6 +1370,10 @@ function createResource() {{
 				mqttReceived += f'U: {stats.get(Statistics.mqttUpdates, 0)}\n'
 				mqttReceived += f'D: {stats.get(Statistics.mqttDeletes, 0)}\n'
 				mqttReceived += f'N: {stats.get(Statistics.mqttNotifies, 0)}\n'
+				if CSE.request.enableRequestLimits:
+					mqttReceived += '\n'
+					mqttReceived += f'Q: {stats.get(Statistics.mqttQueued, 0)}\n'
+					mqttReceived += f'X: {stats.get(Statistics.mqttRejected, 0)}\n'
 
 				mqttSent  = 	_markup('[underline]MQTT:S[/underline]\n')
 				mqttSent += 	'\n'
@@ -1325,6 +1390,10 @@ function createResource() {{
 				wsReceived +=	f'U: {stats.get(Statistics.wsUpdates, 0)}\n'
 				wsReceived +=	f'D: {stats.get(Statistics.wsDeletes, 0)}\n'
 				wsReceived +=	f'N: {stats.get(Statistics.wsNotifies, 0)}\n'
+				if CSE.request.enableRequestLimits:
+					wsReceived +=	'\n'
+					wsReceived +=	f'Q: {stats.get(Statistics.wsQueued, 0)}\n'
+					wsReceived +=	f'X: {stats.get(Statistics.wsRejected, 0)}\n'
 
 				wsSent  =   	_markup('[underline]WS:S[/underline]\n')
 				wsSent +=   	'\n'
@@ -1684,6 +1753,55 @@ function createResource() {{
 		return '\n'.join([item.rstrip() for item in console.end_capture().splitlines()])
 
 
+	def getTracesRich(self, count:Optional[int] = 10) -> Group:
+		"""	Generate a summary of the processing stages of the recorded request traces,
+			and a list of the most recent traces with their slowest stages.
+
+			The slowest stages are determined by their own duration, without the durations
+			of their nested stages.
+
+			Args:
+				count: The number of most recent traces to list.
+
+			Return:
+				Rich Group object with the tables.
+		"""
+		tracer = CSE.request.tracer
+		traces = tracer.getTraces()
+
+		# Summary per processing stage
+		summaryTable = Table(row_styles = [ '', L.tableRowStyle], expand = True)
+		summaryTable.add_column(_markup('[u]Stage[/u]\n'), no_wrap = True)
+		summaryTable.add_column(_markup('[u]Count[/u]\n'), no_wrap = True, justify = 'right')
+		summaryTable.add_column(_markup('[u]Avg (ms)[/u]\n'), no_wrap = True, justify = 'right')
+		summaryTable.add_column(_markup('[u]Max (ms)[/u]\n'), no_wrap = True, justify = 'right')
+		summaryTable.add_column(_markup('[u]Total (ms)[/u]\n'), no_wrap = True, justify = 'right')
+		for name, (cnt, total, maximum) in sorted(tracer.getStageSummary().items(), key = lambda x: x[1][1], reverse = True):
+			summaryTable.add_row(name, str(cnt), f'{total / cnt / 1e6:.3f}', f'{maximum / 1e6:.3f}', f'{total / 1e6:.3f}')
+
+		# Most recent traces
+		tracesTable = Table(row_styles = [ '', L.tableRowStyle], expand = True)
+		tracesTable.add_column(_markup('[u]Timestamp[/u]\n'), no_wrap = True)
+		tracesTable.add_column(_markup('[u]Request[/u]\n'), no_wrap = True)
+		tracesTable.add_column(_markup('[u]Target[/u]\n'))
+		tracesTable.add_column(_markup('[u]Status[/u]\n'), no_wrap = True)
+		tracesTable.add_column(_markup('[u]Duration (ms)[/u]\n'), no_wrap = True, justify = 'right')
+		tracesTable.add_column(_markup('[u]Slowest Stages (ms)[/u]\n'))
+		for trace in reversed(traces[-count:] if count else traces):
+			selfDurations = [ s.duration for s in trace.spans ]
+			for s in trace.spans[1:]:
+				selfDurations[s.parent] -= s.duration
+			slowest = sorted(range(1, len(trace.spans)), key = lambda i: selfDurations[i], reverse = True)[:3]
+			tracesTable.add_row(toISO8601Date(trace.wallStart / 1e9),
+								trace.name,
+								str(trace.attributes.get('to', '')),
+								str(trace.attributes.get('rsc', trace.attributes.get('status', ''))),
+								f'{trace.duration / 1e6:.3f}',
+								', '.join([ f'{trace.spans[i].name}: {selfDurations[i] / 1e6:.3f}' for i in slowest ]))
+
+		return Group(summaryTable, tracesTable)
+
+
 	def getRequestsRich(self, id:Optional[str] = None) -> Tuple[Table, str]:
 
 
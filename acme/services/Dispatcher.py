@@ -13,11 +13,12 @@
 """
 
 from __future__ import annotations
-from typing import List, Tuple, cast, Sequence, Optional
+from typing import List, Tuple, cast, Sequence, Optional, Any
 
 import operator
 import sys
 from copy import deepcopy
+from threading import BoundedSemaphore, Event, Lock
 
 from ..helpers import TextTools
 from ..etc.Constants import Constants
@@ -32,7 +33,10 @@ from ..etc.ResponseStatusCodes import TARGET_NOT_REACHABLE
 from ..etc.ACMEUtils import localResourceID, isSPRelative, isStructured, resourceModifiedAttributes, filterAttributes, riFromID
 from ..etc.ACMEUtils import srnFromHybrid, uniqueRI, noNamespace, riFromStructuredPath, csiFromSPRelative, toSPRelative, structuredPathFromRI
 from ..helpers.TextTools import findXPath
-from ..etc.DateUtils import waitFor, timeUntilTimestamp, timeUntilAbsRelTimestamp, getResourceDate
+from ..helpers.BackgroundWorker import BackgroundWorkerPool
+from ..helpers.SingleFlight import SingleFlight
+from ..helpers.RequestTracer import traced
+from ..etc.DateUtils import waitFor, timeUntilTimestamp, timeUntilAbsRelTimestamp, getResourceDate, utcTime
 from ..etc.DateUtils import cronMatchesTimestamp
 from ..services import CSE
 from ..services.Configuration import Configuration
@@ -54,6 +58,19 @@ class Dispatcher(object):
 	__slots__ = (
 		'csiSlashLen',
 		'sortDiscoveryResources',
+		'enableParallelDiscovery',
+		'parallelDiscoveryThreshold',
+		'parallelDiscoveryWorkers',
+		'_parallelDiscoverySemaphore',
+		'enableDiscoveryCache',
+		'discoveryCacheSize',
+		'discoveryCacheTTL',
+		'_discoveryCache',
+		'_discoveryCacheIndex',
+		'_discoveryCacheCount',
+		'_discoveryCacheLock',
+		'enableRetrieveCoalescing',
+		'_retrieveFlights',
 
 		'_eventCreateResource',
 		'_eventCreateChildResource',
@@ -67,8 +84,28 @@ class Dispatcher(object):
 
 		self.csiSlashLen 				= len(CSE.cseCsiSlash)
 		""" Length of the CSI with a slash. """
-		self.sortDiscoveryResources 	= Configuration.get('cse.sortDiscoveredResources')
-		""" Sort the discovered resources. """
+
+		self._discoveryCache:dict[Tuple[str, str, Permission, str], Tuple[str, float, list[JSON]]] = {}
+		""" Cache for discovery results. The key is a tuple of (target ri, originator, permission, filter criteria), the value is a tuple of (target srn, expiration timestamp, list of resource dictionaries). """
+		self._discoveryCacheIndex:dict[str, set[Tuple[str, str, Permission, str]]] = {}
+		""" Index of the target srn's to the cached discovery results. """
+		self._discoveryCacheCount = 0
+		""" The number of resources currently held in the discovery cache. """
+		self._discoveryCacheLock = Lock()
+		""" Lock to protect the discovery cache. """
+		self._retrieveFlights = SingleFlight()
+		""" Coalescing of concurrent storage loads for RETRIEVE requests. """
+
+		# Assign configuration values
+		self._assignConfig()
+
+		# Add handler for configuration updates
+		CSE.event.addHandler(CSE.event.configUpdate, self.configUpdate)			# type: ignore
+
+		# Add handlers to invalidate the discovery cache
+		CSE.event.addHandler([CSE.event.createResource, CSE.event.updateResource, CSE.event.deleteResource, CSE.event.expireResource, CSE.event.changeResource], # type: ignore
+							 self._invalidateDiscoveryCache)
+		CSE.event.addHandler(CSE.event.cseReset, lambda _: self.clearDiscoveryCache())	# type: ignore
 
 		self._eventCreateResource = CSE.event.createResource			# type: ignore [attr-defined]
 		""" Event handler for resource creation events. """
@@ -92,6 +129,52 @@ class Dispatcher(object):
 		return True
 
 
+	def _assignConfig(self) -> None:
+		"""	Assign the configuration values.
+		"""
+		self.sortDiscoveryResources 	= Configuration.get('cse.sortDiscoveredResources')
+		""" Sort the discovered resources. """
+		self.enableParallelDiscovery	= Configuration.get('cse.operation.discovery.enableParallel')
+		""" Discover sibling sub-trees in parallel. """
+		self.parallelDiscoveryThreshold	= Configuration.get('cse.operation.discovery.parallelThreshold')
+		""" Minimum number of sibling resources before the sub-trees are discovered in parallel. """
+		self.parallelDiscoveryWorkers	= Configuration.get('cse.operation.discovery.parallelWorkers')
+		""" Maximum number of concurrently running parallel discovery workers. """
+		self._parallelDiscoverySemaphore = BoundedSemaphore(self.parallelDiscoveryWorkers)
+		""" Semaphore that bounds the number of running parallel discovery workers. """
+		self.enableDiscoveryCache		= Configuration.get('cse.operation.discovery.enableResultCache')
+		""" Cache the results of discovery requests. """
+		self.discoveryCacheSize			= Configuration.get('cse.operation.discovery.resultCacheSize')
+		""" Maximum number of resources held in the discovery cache. """
+		self.discoveryCacheTTL			= Configuration.get('cse.operation.discovery.resultCacheTTL')
+		""" Time in seconds after which a cached discovery result expires. """
+		self.enableRetrieveCoalescing	= Configuration.get('cse.enableRetrieveCoalescing')
+		""" Share the storage loads of concurrent identical RETRIEVE requests. """
+
+
+	def configUpdate(self, name:str, 
+						   key:Optional[str] = None, 
+						   value:Any = None) -> None:
+		"""	Handle configuration updates.
+
+			Args:
+				name: The name of the configuration section.
+				key: The key of the configuration value.
+				value: The new value.
+		"""
+		if key not in ( 'cse.sortDiscoveredResources',
+						'cse.operation.discovery.enableParallel',
+						'cse.operation.discovery.parallelThreshold',
+						'cse.operation.discovery.parallelWorkers',
+						'cse.operation.discovery.enableResultCache',
+						'cse.operation.discovery.resultCacheSize',
+						'cse.operation.discovery.resultCacheTTL',
+						'cse.enableRetrieveCoalescing' ):
+			return
+		self._assignConfig()
+		self.clearDiscoveryCache()
+
+
 
 	# The "xxxRequest" methods handle http requests while the "xxxResource"
 	# methods handle actions on the resources. Security/permission checking
@@ -104,6 +187,7 @@ class Dispatcher(object):
 	#	Retrieve resources
 	#
 
+	@traced('dispatcher.retrieve')
 	def processRetrieveRequest(self, request:CSERequest, 
 									 originator:str, 
 									 id:Optional[str] = None) -> Result:
@@ -266,7 +350,10 @@ class Dispatcher(object):
 		#
 		#	Discovery request
 		#
-		resources = self.discoverResources(id, originator, request.fc, permission = permission)
+		if self.enableDiscoveryCache and request.fc.fu == FilterUsage.discoveryCriteria:
+			resources = self._discoverResourcesCached(id, originator, request.fc, permission)
+		else:
+			resources = self.discoverResources(id, originator, request.fc, permission = permission)
 
 		# check and filter by ACP. After this allowedResources only contains the resources that are allowed
 		allowedResources = []
@@ -307,6 +394,7 @@ class Dispatcher(object):
 				raise BAD_REQUEST(f'unsuppored rcn: {rcn} for RETRIEVE')
 
 
+	@traced('dispatcher.resolve')
 	def retrieveResource(self, id:str, 
 							   originator:Optional[str] = None, 
 							   request:Optional[CSERequest] = None, 
@@ -364,6 +452,9 @@ class Dispatcher(object):
 		"""
 		L.isDebug and L.logDebug(f'Retrieve local resource: {ri}|{srn} for originator: {originator}')
 
+		if self.enableRetrieveCoalescing and request is not None and request.op == Operation.RETRIEVE:
+			return self._retrieveLocalResourceCoalesced(ri, srn)
+
 		if ri:
 			return CSE.storage.retrieveResource(ri = ri)		# retrieve via normal ID
 		elif srn:
@@ -382,11 +473,36 @@ class Dispatcher(object):
 
 
 
+	def _retrieveLocalResourceCoalesced(self, ri:Optional[str] = None, 
+											  srn:Optional[str] = None) -> Resource:
+		"""	Retrieve a resource locally for a RETRIEVE request. Concurrent requests for the same
+			resource share a single storage load, but each request gets its own resource instance.
+
+			Args:
+				ri:	The resource ID.
+				srn: The structured resource name.
+
+			Return:
+				The retrieved resource.
+
+			Raises:
+				NOT_FOUND: If the resource cannot be found.
+		"""
+		if not ri and not (srn and (ri := CSE.storage.resourceIDFromStructuredPath(srn))):
+			raise NOT_FOUND('resource not found')
+		# Only share loads that started after the last write. Otherwise a RETRIEVE after an
+		# acknowledged UPDATE could share a load that still returns the old representation.
+		dct, shared = self._retrieveFlights.do((ri, CSE.storage.writeGeneration()), lambda: CSE.storage.retrieveResourceRaw(ri))
+		shared and L.isDebug and L.logDebug(f'Shared storage load for resource: {ri}')
+		return resourceFromDict(dct)		# the resource makes its own copy of the dictionary
+
+
 	#########################################################################
 	#
 	#	Discover Resources
 	#
 
+	@traced('dispatcher.discover')
 	def discoverResources(self,
 						  id:str,
 						  originator:str, 
@@ -448,18 +564,131 @@ class Dispatcher(object):
 
 		# Apply ARP if provided
 		if filterCriteria.arp:
-			_resources = []
-			for resource in discoveredResources:
-				# Check existence and permissions for the .../{arp} resource
-				srn = f'{resource.getSrn()}/{filterCriteria.arp}'
-				_res = self.retrieveResource(srn)
-				if CSE.security.hasAccess(originator, _res, permission):
-					_resources.append(_res)
-			discoveredResources = _resources	# re-assign the new resources to discoveredResources
+			# Retrieve all the .../{arp} resources at once, then check existence and permissions
+			srns = [ f'{resource.getSrn()}/{filterCriteria.arp}' for resource in discoveredResources ]
+			_resources = CSE.storage.retrieveResources(srns = srns)
+			if len(_resources) != len(srns):
+				raise NOT_FOUND('resource not found')
+			discoveredResources = [ r for r in _resources if CSE.security.hasAccess(originator, r, permission) ]	# re-assign the new resources to discoveredResources
 
 		return discoveredResources
 
 
+	def _discoverResourcesCached(self, id:str,
+									   originator:str, 
+									   filterCriteria:FilterCriteria,
+									   permission:Permission) -> list[Resource]:
+		"""	Discover resources and cache the result, or return a cached result.
+
+			The result is cached for the target resource, the originator, the permission, and the normalized
+			filter criteria. It is invalidated when a resource in the target's sub-tree is created, updated or
+			deleted (see `_invalidateDiscoveryCache()`), or when it expires.
+
+			Args:
+				id: The ID of the resource to start discovery from.
+				originator: The originator of the request.
+				filterCriteria: The filter criteria.
+				permission: The permission to use.
+
+			Return:
+				A list of discovered resources.
+		"""
+		rootResource = self.retrieveResource(id)
+		key = (rootResource.ri, originator, permission, str(sorted(filterCriteria.fillCriteriaAttributes().items())))
+
+		with self._discoveryCacheLock:
+			if (entry := self._discoveryCache.pop(key, None)):
+				if entry[1] > utcTime():
+					self._discoveryCache[key] = entry	# re-insert as the most recently used entry
+					L.isDebug and L.logDebug(f'Using cached discovery result for: {rootResource.ri}')
+					return [ resourceFromDict(deepcopy(dct)) for dct in entry[2] ]
+				self._removeDiscoveryCacheEntry(key, entry)
+
+		resources = self.discoverResources(id, originator, filterCriteria, rootResource = rootResource, permission = permission)
+
+		if len(resources) <= self.discoveryCacheSize:
+			dcts = [ deepcopy(r.dict) for r in resources ]	# copy, because the resources might be changed later
+			srn = rootResource.getSrn()
+			with self._discoveryCacheLock:
+				if (entry := self._discoveryCache.pop(key, None)):
+					self._removeDiscoveryCacheEntry(key, entry)
+				# Remove the least recently used entries until the new result fits
+				while self._discoveryCache and self._discoveryCacheCount + len(dcts) > self.discoveryCacheSize:
+					oldestKey = next(iter(self._discoveryCache))
+					self._removeDiscoveryCacheEntry(oldestKey, self._discoveryCache.pop(oldestKey))
+				self._discoveryCache[key] = (srn, utcTime() + self.discoveryCacheTTL, dcts)
+				self._discoveryCacheIndex.setdefault(srn, set()).add(key)
+				self._discoveryCacheCount += len(dcts)
+		return resources
+
+
+	def _invalidateDiscoveryCache(self, name:str, resource:Resource, *args:Any) -> None:
+		"""	Event handler to remove all cached discovery results for the sub-trees that contain a
+			created, updated or deleted resource.
+
+			A change of an <ACP> or <group> resource removes all cached results, because it may change the access to
+			resources anywhere in the resource tree.
+
+			Args:
+				name: The event name.
+				resource: The created, updated or deleted resource.
+				args: Further event arguments. Ignored.
+		"""
+		self.invalidateDiscoveryCache(resource.getSrn(), resource.ty)
+
+
+	def invalidateDiscoveryCache(self, srn:str, ty:ResourceTypes) -> None:
+		"""	Remove all cached discovery results for the sub-trees that contain a created, updated or deleted resource.
+
+			Args:
+				srn: The structured resource name of the changed resource.
+				ty: The resource type of the changed resource.
+		"""
+		if not self._discoveryCache:
+			return
+		if ty in ( ResourceTypes.ACP, ResourceTypes.ACPAnnc, ResourceTypes.GRP ):
+			self.clearDiscoveryCache()
+			return
+		if not srn:
+			return
+
+		with self._discoveryCacheLock:
+			# Check the resource's structured path and all its parent paths
+			while srn:
+				if (keys := self._discoveryCacheIndex.get(srn)):
+					L.isDebug and L.logDebug(f'Invalidating {len(keys)} cached discovery result(s) for: {srn}')
+					for key in list(keys):
+						if (entry := self._discoveryCache.pop(key, None)):
+							self._removeDiscoveryCacheEntry(key, entry)
+				srn = srn.rpartition('/')[0]
+
+
+	def _removeDiscoveryCacheEntry(self, key:Tuple[str, str, Permission, str], 
+										 entry:Tuple[str, float, list[JSON]]) -> None:
+		"""	Remove the index and the resource count of an entry that was removed from the discovery cache.
+
+			The caller must hold the cache lock.
+
+			Args:
+				key: The key of the removed entry.
+				entry: The removed entry.
+		"""
+		self._discoveryCacheCount -= len(entry[2])
+		if (keys := self._discoveryCacheIndex.get(entry[0])) is not None:
+			keys.discard(key)
+			if not keys:
+				del self._discoveryCacheIndex[entry[0]]
+
+
+	def clearDiscoveryCache(self) -> None:
+		"""	Remove all cached discovery results.
+		"""
+		with self._discoveryCacheLock:
+			self._discoveryCache.clear()
+			self._discoveryCacheIndex.clear()
+			self._discoveryCacheCount = 0
+
+
 	def _discoverResources(self, rootResource:Resource,
 								 originator:str, 
 								 level:int, 
@@ -491,7 +720,45 @@ class Dispatcher(object):
 			if len(dcrs := self.retrieveDirectChildResources(rootResource.ri)) == 0:
 				return []
 		
+		# Discover the sub-trees of many siblings in parallel
+		if self.enableParallelDiscovery and len(dcrs) >= self.parallelDiscoveryThreshold:
+			return self._discoverSubTreesParallel(dcrs, 
+												  originator, 
+												  level, 
+												  fo, 
+												  allLen, 
+												  filterCriteria = filterCriteria, 
+												  permission = permission)
+		return self._discoverSubTrees(dcrs, 
+									  originator, 
+									  level, 
+									  fo, 
+									  allLen, 
+									  filterCriteria = filterCriteria, 
+									  permission = permission)
+
+
+	def _discoverSubTrees(self, dcrs:list[Resource],
+								originator:str, 
+								level:int, 
+								fo:int, 
+								allLen:int, 
+								filterCriteria:Optional[FilterCriteria] = None,
+								permission:Optional[Permission] = Permission.DISCOVERY) -> list[Resource]:
+		"""	Discover a list of sibling resources and their sub-trees. This is a helper function for _discoverResources().
+
+			Args:
+				dcrs: The sibling resources to discover.
+				originator: The originator of the request.
+				level: The level of discovery.
+				fo: The filter operation.
+				allLen: The length of all filter criteria.
+				filterCriteria: The filter criteria.
+				permission: The permission to use.
 
+			Return:
+				A list of discovered resources.
+		"""
 		# Filter and add those left to the result
 		discoveredResources = []
 		for resource in dcrs:
@@ -520,6 +787,80 @@ class Dispatcher(object):
 		return discoveredResources
 
 
+	def _discoverSubTreesParallel(self, dcrs:list[Resource],
+										originator:str, 
+										level:int, 
+										fo:int, 
+										allLen:int, 
+										filterCriteria:Optional[FilterCriteria] = None,
+										permission:Optional[Permission] = Permission.DISCOVERY) -> list[Resource]:
+		"""	Discover a list of sibling resources and their sub-trees in parallel.
+
+			The siblings are partitioned into consecutive chunks. Each chunk is discovered by a pooled
+			background job if a worker slot is free, otherwise in the calling thread. The partial
+			results are merged in the order of the chunks, so the result is identical to the
+			result of `_discoverSubTrees()`.
+
+			Args:
+				dcrs: The sibling resources to discover.
+				originator: The originator of the request.
+				level: The level of discovery.
+				fo: The filter operation.
+				allLen: The length of all filter criteria.
+				filterCriteria: The filter criteria.
+				permission: The permission to use.
+
+			Return:
+				A list of discovered resources.
+		"""
+		chunkSize = -(-len(dcrs) // (self.parallelDiscoveryWorkers + 1))	# ceil(). +1 for the calling thread
+		chunks = [ dcrs[i:i + chunkSize] for i in range(0, len(dcrs), chunkSize) ]
+		semaphore = self._parallelDiscoverySemaphore		# keep the semaphore in case the configuration is updated meanwhile
+		results:list[list[Resource]] = [ [] ] * len(chunks)
+		exceptions:list[Exception] = [ None ] * len(chunks)
+		jobs:list[Event] = []
+
+		def _discoverChunk(idx:int, done:Optional[Event] = None) -> None:
+			try:
+				results[idx] = self._discoverSubTrees(chunks[idx], 
+													  originator, 
+													  level, 
+													  fo, 
+													  allLen, 
+													  filterCriteria = filterCriteria, 
+													  permission = permission)
+			except Exception as e:
+				exceptions[idx] = e
+			finally:
+				if done:
+					try:
+						semaphore.release()
+					finally:
+						done.set()
+
+		# Start a job for each chunk except the first one, as long as there are free worker slots.
+		# The remaining chunks are discovered in the calling thread. Never block here, because
+		# this function might be called recursively from a worker.
+		inline = [ 0 ]
+		for idx in range(1, len(chunks)):
+			if semaphore.acquire(blocking = False):
+				jobs.append(done := Event())
+				BackgroundWorkerPool.runJob(lambda idx = idx, done = done: _discoverChunk(idx, done),	# type: ignore[misc]
+											name = 'discovery')
+			else:
+				inline.append(idx)
+		for idx in inline:
+			_discoverChunk(idx)
+
+		# Wait for the jobs to finish and merge the results in chunk order
+		for done in jobs:
+			done.wait()
+		for e in exceptions:
+			if e:
+				raise e
+		return [ r for result in results for r in result ]
+
+
 	def _matchResource(self, r:Resource, fo:int, allLen:int, filterCriteria:FilterCriteria) -> bool:	
 		""" Match a filter to a resource. """
 
@@ -622,6 +963,7 @@ class Dispatcher(object):
 	#	Add resources
 	#
 
+	@traced('dispatcher.create')
 	def processCreateRequest(self, request:CSERequest, 
 								   originator:str, 
 								   id:Optional[str] = None) -> Result:
@@ -673,9 +1015,10 @@ class Dispatcher(object):
 		if not ResourceTypes.isRequestCreatable(ty):
 			raise OPERATION_NOT_ALLOWED(f'CREATE not allowed for type: {ty}')
 
-		# Get parent resource and check permissions
+		# Get parent resource and check permissions. The parent might already have been retrieved, e.g. for a previous request of a batch
 		L.isDebug and L.logDebug(f'Get parent resource and check permissions: {id}')
-		parentResource = self.retrieveResource(id)
+		if (parentResource := request._parentResource) is None:
+			parentResource = self.retrieveResource(id)
 
 		if not CSE.security.hasAccess(originator, parentResource, Permission.CREATE, ty = ty, parentResource = parentResource):
 			if ty == ResourceTypes.AE:
@@ -906,6 +1249,7 @@ class Dispatcher(object):
 	#	Update resources
 	#
 
+	@traced('dispatcher.update')
 	def processUpdateRequest(self, request:CSERequest, 
 								   originator:str, 
 								   id:Optional[str] = None) -> Result: 
@@ -1098,6 +1442,7 @@ class Dispatcher(object):
 	#	Delete resources
 	#
 
+	@traced('dispatcher.delete')
 	def processDeleteRequest(self, request:CSERequest, 
 								   originator:str, 
 								   id:Optional[str] = None) -> Result:
@@ -1299,6 +1644,7 @@ class Dispatcher(object):
 	#	Notify
 	#
 
+	@traced('dispatcher.notify')
 	def processNotifyRequest(self, request:CSERequest, 
 								   originator:Optional[str], 
 								   id:Optional[str] = None) -> Result:
@@ -1318,6 +1664,10 @@ class Dispatcher(object):
 		"""
 		L.isDebug and L.logDebug(f'Process NOTIFY request for id: {request.id}|{request.srn}')
 
+		# A notification from a remote CSE indicates that cached resources of that CSE might have changed
+		if originator:
+			CSE.remote.remoteResourcesChanged(originator)
+
 		# handle transit requests
 		if localResourceID(request.id) is None:
 			return CSE.request.handleTransitNotifyRequest(request)
@@ -1499,12 +1849,20 @@ class Dispatcher(object):
 					hit = ( res, ct )
 			return False
 
-		# Search through the resources with the mapping functions
-		CSE.storage.searchByFilter(filter = determineLatest)
-		if not hit:
+		def searchLatest() -> Optional[JSON]:
+			# Search through the resources with the mapping functions
+			CSE.storage.searchByFilter(filter = determineLatest)
+			return hit[0] if hit else None
+
+		# Concurrent searches for the same parent and type share a single scan
+		if self.enableRetrieveCoalescing:
+			dct, _ = self._retrieveFlights.do((pi, ty, oldest, CSE.storage.writeGeneration()), searchLatest)
+		else:
+			dct = searchLatest()
+		if not dct:
 			return None
 		# Instantiate and return resource
-		return resourceFromDict(hit[0])
+		return resourceFromDict(dct)
 
 
 	def discoverChildren(self, id:str, 
@@ -1689,43 +2047,58 @@ class Dispatcher(object):
 
 
 	def resourceTreeDict(self, resources:list[Resource], targetResource:Resource|JSON) -> list[Resource]:
-		"""	Recursively walk the results and build a sub-resource tree for each resource type.
+		"""	Walk the results and build a sub-resource tree for each resource type.
+
+			The resources are indexed by their parent resource ID first, so that the tree is built in a single pass
+			over the list. Resources that are added to the tree are removed from the *resources* list.
+
+			Args:
+				resources: A list of resources to build the tree from.
+				targetResource: The resource (or dictionary) to which the child resources are added. If it has no *ri* attribute then all resources of the list are candidates for the first level of the tree.
+
+			Return:
+				The list of remaining resources that were not added to the tree.
 		"""
-		rri = targetResource['ri'] if 'ri' in targetResource else None
-		while True:		# go multiple times per level through the resources until the list is empty
-			result = []
-			handledTy = None
-			handledTPE = None
-			idx = 0
-			while idx < len(resources):
-				r = resources[idx]
-
-				if rri and r.pi != rri:	# only direct children
-					idx += 1
-					continue
+		# Index the resources by their parent, keeping the order of the list
+		childrenByPi:dict[str, list[Resource]] = {}
+		for r in resources:
+			childrenByPi.setdefault(r.pi, []).append(r)
+		handled:set[int] = set()	# id()s of the resources that are already added to the tree
+
+		def _addChildren(candidates:list[Resource], target:Resource|JSON) -> None:
+			# Group the candidates by type and TPE (important to distinguish specializations in mgmtObj and fcnt),
+			# keeping the order of the list
+			groups:dict[Tuple[int, str], list[Resource]] = {}
+			for r in candidates:
 				if r.isVirtual():	# Skip latest, oldest etc virtual resources
-					idx += 1
 					continue
-				if handledTy is None:					# ty is an int
-					handledTy = r.ty					# this round we check this type
-					handledTPE = r.tpe					# ... and this TPE (important to distinguish specializations in mgmtObj and fcnt )
-				if r.ty == handledTy and r.tpe == handledTPE:		# handle only resources of the currently handled type and TPE!
-					result.append(r)					# append the found resource 
-					resources.remove(r)						# remove resource from the original list (greedy), but don't increment the idx
-					resources = self.resourceTreeDict(resources, r)	# check recursively whether this resource has children
-				else:
-					idx += 1							# next resource
+				groups.setdefault((r.ty, r.tpe), []).append(r)
 
-			# add all found resources under the same type tag to the rootResource
-			if len(result) > 0:
+			# Handle the groups in the order of the first not yet handled resource of each group
+			for r in candidates:
+				if id(r) in handled or r.isVirtual():
+					continue
+				result = []
+				for each in groups[(r.ty, r.tpe)]:
+					if id(each) in handled:		# might have been added already further down the tree
+						continue
+					handled.add(id(each))
+					result.append(each)
+					_addChildren(childrenByPi.get(each.ri, []), each)	# add the resource's own children
+				
+				# add all found resources under the same type tag to the target resource
 				# sort resources by type and then by lowercase rn
 				if self.sortDiscoveryResources:
-					# result.sort(key=lambda x:(x.ty, x.rn.lower()))
 					result.sort(key = lambda x: (x.ty, x.ct) if ResourceTypes.isInstanceResource(x.ty) else (x.ty, x.rn.lower()))
-				targetResource[result[0].tpe] = [r.asDict(embedded = False) for r in result]
+				target[result[0].tpe] = [each.asDict(embedded = False) for each in result]
 				# TODO not all child resources are lists [...] Handle just to-1 relations
-			else:
-				break # end of list, leave while loop
+
+		if (rri := targetResource['ri'] if 'ri' in targetResource else None):	# only direct children
+			_addChildren(childrenByPi.get(rri, []), targetResource)
+		else:
+			_addChildren(resources, targetResource)
+
+		resources[:] = [ r for r in resources if id(r) not in handled ]	# Remove the handled resources from the original list
 		return resources # Return the remaining list
 
 
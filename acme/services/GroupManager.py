@@ -11,11 +11,14 @@
 
 from __future__ import annotations
 from typing import cast, List, Optional, Any
+from copy import deepcopy
+from threading import BoundedSemaphore, Event
 
 from ..etc.Types import ResourceTypes, Result, ConsistencyStrategy, Permission, Operation
 from ..etc.Types import CSERequest, JSON, ResponseType
 from ..etc.ResponseStatusCodes import MAX_NUMBER_OF_MEMBER_EXCEEDED, INVALID_ARGUMENTS, NOT_FOUND, RECEIVER_HAS_NO_PRIVILEGES
 from ..etc.ResponseStatusCodes import ResponseStatusCode, GROUP_MEMBER_TYPE_INCONSISTENT, ORIGINATOR_HAS_NO_PRIVILEGE, REQUEST_TIMEOUT
+from ..etc.ResponseStatusCodes import ResponseException
 from ..etc.ACMEUtils import isSPRelative, csiFromSPRelative, structuredPathFromRI
 from ..etc.DateUtils import utcTime
 from ..resources.FCNT import FCNT
@@ -23,6 +26,7 @@ from ..resources.MgmtObj import MgmtObj
 from ..resources.Resource import Resource
 from ..resources.GRP_FOPT import GRP_FOPT
 from ..resources.Factory import resourceFromDict
+from ..helpers.BackgroundWorker import BackgroundWorkerPool
 from ..services import CSE
 from ..services.Logging import Logging as L
 from ..services.Configuration import Configuration
@@ -64,6 +68,11 @@ class GroupManager(object):
 		"""	Assign the configuration values.
 		"""
 		self.resultExpirationTime = Configuration.get('resource.grp.resultExpirationTime')
+		""" Time in ms for aggregating the results of a group request. """
+		self.fanoutWorkers = Configuration.get('resource.grp.fanoutWorkers')
+		""" Maximum number of concurrently running fanout workers. """
+		self._fanoutSemaphore = BoundedSemaphore(self.fanoutWorkers)
+		""" Semaphore that bounds the number of running fanout workers. """
 
 
 	def configUpdate(self, name:str, 
@@ -71,7 +80,8 @@ class GroupManager(object):
 						   value:Any = None) -> None:
 		"""	Handle configuration updates.
 		"""
-		if key not in ( 'resource.grp.resultExpirationTime' ):
+		if key not in ( 'resource.grp.resultExpirationTime', 
+						'resource.grp.fanoutWorkers' ):
 			return
 		self._assignConfig()
 
@@ -223,6 +233,11 @@ class GroupManager(object):
 						  originator:str) -> Result:
 		"""	Handle requests to a <`GRP`>'s  <`GRP_FOPT`> fanOutPoint. This method might be called recursivly,
 			in case there are groups in groups.
+
+			The requests to the members are sent in parallel by pooled background jobs, as long as there
+			are free worker slots. Members that are hosted on the same remote CSE are requested one after 
+			the other by the same job. The aggregation stops at the result expiration timestamp. Members
+			that didn't respond until then are left out of the aggregated response.
 		
 			Args:
 				operation: The operation type to perform on the group.
@@ -253,11 +268,17 @@ class GroupManager(object):
 		
 		L.isDebug and L.logDebug(f'Adding additional path elements: {tail}')
 
-		# walk through all members
-		resultList:List[Result] = []
-
 		tail = '/' + tail if len(tail) > 0 else '' # add remaining path, if any
-		_mid = groupResource.mid.copy()	# copy mi because it is changed in the loop
+
+		# Determine the targets of all members. Copy mid because it might be changed while the request is processed
+		_mid = groupResource.mid.copy()
+		targets:list[str] = []
+		for mid in _mid:	
+			# Try to get the SRN and add the tail
+			if srn := structuredPathFromRI(mid):
+				targets.append(srn + tail)
+			else:
+				targets.append(mid + tail)
 
 		# Determine the timeout for aggregating requests.
 		# If Result Expiration Timestamp is present in the request then use that one.
@@ -265,29 +286,77 @@ class GroupManager(object):
 		if request.rset is not None:
 			_timeoutTS = request._rsetUTCts
 		elif self.resultExpirationTime > 0:
-			_timeoutTS = utcTime() + self.resultExpirationTime
+			_timeoutTS = utcTime() + self.resultExpirationTime / 1000.0
 		else:
 			_timeoutTS = 0
 
-		for mid in _mid:	
-			# Try to get the SRN and add the tail
-			if srn := structuredPathFromRI(mid):
-				mid = srn + tail
+		# Partition the members into tasks. Each local member is a task of its own. 
+		# Members hosted on the same remote CSE are sent one after the other by a single task
+		tasks:list[list[int]] = []
+		remoteTasks:dict[str, list[int]] = {}
+		for idx, mid in enumerate(_mid):
+			if isSPRelative(mid) and (csi := csiFromSPRelative(mid)) != CSE.cseCsi:
+				if csi not in remoteTasks:
+					tasks.append(remoteTasks.setdefault(csi, []))
+				remoteTasks[csi].append(idx)
+			else:
+				tasks.append([ idx ])
+
+		semaphore = self._fanoutSemaphore		# keep the semaphore in case the configuration is updated meanwhile
+		results:list[Optional[Result]] = [ None ] * len(targets)
+		exceptions:list[Exception] = [ None ] * len(tasks)
+		jobs:list[Event] = []
+
+		def _fanoutTask(taskIdx:int, taskRequest:CSERequest, done:Optional[Event] = None) -> None:
+			try:
+				for idx in tasks[taskIdx]:
+					# Check for RSET expiration before sending the request to the next member
+					if _timeoutTS and _timeoutTS < utcTime():
+						break
+					try:
+						results[idx] = CSE.request.processRequest(taskRequest, originator, targets[idx])
+					except ResponseException as e:
+						# A failed member doesn't fail the whole group request
+						results[idx] = Result(rsc = e.rsc, dbg = e.dbg)
+			except Exception as e:
+				exceptions[taskIdx] = e
+			finally:
+				if done:
+					try:
+						semaphore.release()
+					finally:
+						done.set()		# Always signal the waiting request, even if the release fails
+
+		# Start a job with its own copy of the request for each task, as long as there are free worker slots.
+		# The remaining tasks are processed in the calling thread. Never block here, because
+		# this function might be called recursively from a worker (groups in groups).
+		inline:list[int] = []
+		for taskIdx in range(len(tasks)):
+			if len(tasks) > 1 and semaphore.acquire(blocking = False):
+				jobs.append(done := Event())
+				BackgroundWorkerPool.runJob(lambda taskIdx = taskIdx, taskRequest = deepcopy(request), done = done: _fanoutTask(taskIdx, taskRequest, done),	# type: ignore[misc]
+											name = 'fanout')
 			else:
-				mid = mid + tail
-			# Invoke the request
-			_result = CSE.request.processRequest(request, originator, mid)
-			# Check for RSET expiration
-			if _timeoutTS and _timeoutTS < utcTime():
-				# Check for blocking request. Then raise a timeout
-				if request.rt == ResponseType.blockingRequest:
-					raise REQUEST_TIMEOUT(L.logDebug('Aggregation timed out'))
-				# Otherwise just interrupt the aggregation
+				inline.append(taskIdx)
+		for taskIdx in inline:
+			_fanoutTask(taskIdx, request)
+
+		# Wait for the jobs to finish, but not longer than the result expiration timestamp
+		for done in jobs:
+			if not done.wait(max(_timeoutTS - utcTime(), 0.0) if _timeoutTS else None):
 				break
-			# Append the result
-			resultList.append(_result)
-			# import time
-			# time.sleep(1.0)
+		for e in exceptions:
+			if e:
+				raise e
+
+		# Collect the results in member order. Unfinished members are left out
+		resultList = [ result for result in list(results) if result is not None ]
+		if len(resultList) != len(targets):
+			# Check for blocking request. Then raise a timeout
+			if request.rt == ResponseType.blockingRequest:
+				raise REQUEST_TIMEOUT(L.logDebug('Aggregation timed out'))
+			# Otherwise just return the partial aggregation
+			L.isDebug and L.logDebug(f'Aggregation timed out. Returning {len(resultList)} of {len(targets)} results')
 
 		# construct aggregated response
 		if len(resultList) > 0:
@@ -299,6 +368,8 @@ class GroupManager(object):
 						}
 				if result.resource and isinstance(result.resource, Resource):
 					item['pc'] = result.resource.asDict()
+				elif result.dbg:
+					item['pc'] = { 'm2m:dbg' : result.dbg }
 
 				items.append(item)
 			rsp = { 'm2m:rsp' : items}
@@ -306,7 +377,8 @@ class GroupManager(object):
 			
 			# if the request is a flexBlocking request and the number of results is not equal to the number of members
 			# then the request must be marked as incomplete. This will be removed later when adding to the <req> resource.
-			if len(_mid) != len(resultList) and request.rt == ResponseType.flexBlocking:
+			# A flexBlocking request that is handled as a blocking request has no <req> resource, so don't mark it.
+			if len(_mid) != len(resultList) and request.rt == ResponseType.flexBlocking and not CSE.request.flexBlockingBlocking:
 				agr['acme:incomplete'] = True # type: ignore
 
 		else:
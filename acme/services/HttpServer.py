@@ -10,19 +10,29 @@
 from __future__ import annotations
 from typing import Any, Callable, cast, Optional
 
-import logging, sys, urllib3, re
+import logging, sys, urllib3, re, gzip, zlib, math, socket
 from copy import deepcopy
+from collections import OrderedDict
+from threading import Lock
+from urllib.parse import urlsplit
+from http import HTTPStatus
+from http.cookiejar import DefaultCookiePolicy
 
 import flask
 from flask import Flask, Request, request
 
 from werkzeug.wrappers import Response
-from werkzeug.serving import WSGIRequestHandler
+from werkzeug.serving import WSGIRequestHandler, make_server
 from werkzeug.datastructures import MultiDict
 from waitress import serve
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
 import isodate
+try:
+	import brotli	# Optional, only used for response compression if installed
+except ImportError:
+	brotli = None
 
 from ..etc.Constants import Constants
 from ..etc.Types import ReqResp, RequestType, Result, ResponseStatusCode, JSON
@@ -31,14 +41,16 @@ from ..etc.ResponseStatusCodes import INTERNAL_SERVER_ERROR, BAD_REQUEST, REQUES
 from ..etc.ACMEUtils import uniqueRI, toSPRelative, removeNoneValuesFromDict
 from ..etc.Utils import renameThread, isURL
 from ..helpers.TextTools import findXPath
-from ..etc.DateUtils import timeUntilAbsRelTimestamp, getResourceDate, rfc1123Date
+from ..etc.DateUtils import timeUntilAbsRelTimestamp, getResourceDate, rfc1123Date, fromRfc1123Date, toISO8601Date, utcTime
 from ..etc.RequestUtils import toHttpUrl, serializeData, deserializeData, requestFromResult, createPositiveResponseResult
-from ..helpers.NetworkTools import isTCPPortAvailable
+from ..helpers.NetworkTools import isTCPPortAvailable, createReusePortSocket
 from ..services.Configuration import Configuration
 from ..services import CSE
 from ..webui.webUI import WebUI
 from ..helpers import TextTools as TextTools
 from ..helpers.BackgroundWorker import BackgroundWorker, BackgroundWorkerPool
+from ..helpers.AsyncioHttpServer import AsyncioHttpServer
+from ..helpers.RequestTracer import span, traced, setTraceAttributes
 from ..helpers.Interpreter import SType
 from ..services.Logging import Logging as L, LogLevel
 
@@ -51,6 +63,30 @@ FlaskHandler = 	Callable[[str], Response]
 """ Type definition for flask handler. """
 
 
+class _PooledSession(object):
+	"""	A pooled *requests* session for a single target host.
+	"""
+	__slots__ = (
+		'session',
+		'lastUsed',
+		'inUse',
+	)
+
+	def __init__(self, poolSize:int) -> None:
+		self.session = requests.Session()
+		""" The session that keeps the connections to the target host alive. """
+		adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = poolSize)
+		self.session.mount('http://', adapter)
+		self.session.mount('https://', adapter)
+		# Don't keep cookies between requests. The session is shared by all requests to the same host,
+		# and cookies set in a response must not be sent with requests of other originators.
+		self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains = []))
+		self.lastUsed = utcTime()
+		""" Timestamp when the session was last used. """
+		self.inUse = 0
+		""" Number of requests that are currently sent through the session. """
+
+
 
 #########################################################################
 #
@@ -77,11 +113,30 @@ class HttpServer(object):
 		'wsgiEnable',
 		'wsgiThreadPoolSize',
 		'wsgiConnectionLimit',
+		'asyncioEnable',
+		'asyncioThreadPoolSize',
+		'asyncioConnectionLimit',
+		'asyncioKeepAliveTimeout',
+		'asyncioServer',
+		'listenSocket',
+		'compressionEnable',
+		'compressionMinSize',
+		'compressionLevel',
+		'enableBatchEndpoint',
+		'maxBatchSize',
+		'maxRequestBodySize',
 		'backgroundActor',
 		'serverID',
 		'_responseHeaders',
 		'webui',
 		'httpActor',
+		'enableClientPool',
+		'clientPoolSize',
+		'clientPoolMaxHosts',
+		'clientPoolIdleTimeout',
+		'_clientSessions',
+		'_clientSessionsLock',
+		'_clientSessionMonitor',
 
 		'_eventHttpRetrieve',
 		'_eventHttpCreate',
@@ -105,6 +160,14 @@ class HttpServer(object):
 
 		self.isStopped					 = False
 		self.backgroundActor:BackgroundWorker = None
+		self.asyncioServer:AsyncioHttpServer = None
+		self.listenSocket:socket.socket = None
+
+		# Pooled sessions for outgoing requests, one per target host
+		self._clientSessions:OrderedDict[str, _PooledSession] = OrderedDict()
+		self._clientSessionsLock = Lock()
+		self._clientSessionMonitor:BackgroundWorker = None
+		self._startClientSessionMonitor()
 
 		self.serverID			= f'ACME {Constants.version}' 	# The server's ID for http response headers
 		self._responseHeaders	= {'Server' : self.serverID}	# Additional headers for other requests
@@ -149,6 +212,11 @@ class HttpServer(object):
 			L.isInfo and L.log(f'Registering upper tester endpoint at: {upperTesterEndpoint}')
 			self.addEndpoint(upperTesterEndpoint, handler = self.handleUpperTester, methods = ['POST'], strictSlashes=False)
 
+		# Register the batch endpoint. It is always registered because it can be enabled and disabled at runtime
+		batchEndpoint = f'{self.rootPath}/__batch__'
+		self.enableBatchEndpoint and L.isInfo and L.log(f'Registering batch endpoint at: {batchEndpoint}')
+		self.addEndpoint(batchEndpoint, handler = self.handleBatch, methods = ['POST'], strictSlashes = False)
+
 		# Allow to use PATCH as a replacement for the DELETE method
 		if Configuration.get('http.allowPatchForDelete'):
 			self.addEndpoint(self.rootPath + '/<path:path>', handler = self.handlePATCH, methods = ['PATCH'])
@@ -187,6 +255,20 @@ class HttpServer(object):
 		self.wsgiEnable			= Configuration.get('http.wsgi.enable')
 		self.wsgiThreadPoolSize	= Configuration.get('http.wsgi.threadPoolSize')
 		self.wsgiConnectionLimit= Configuration.get('http.wsgi.connectionLimit')
+		self.asyncioEnable		= Configuration.get('http.asyncio.enable')
+		self.asyncioThreadPoolSize = Configuration.get('http.asyncio.threadPoolSize')
+		self.asyncioConnectionLimit = Configuration.get('http.asyncio.connectionLimit')
+		self.asyncioKeepAliveTimeout = Configuration.get('http.asyncio.keepAliveTimeout')
+		self.compressionEnable	= Configuration.get('http.compression.enable')
+		self.compressionMinSize	= Configuration.get('http.compression.minSize')
+		self.compressionLevel	= Configuration.get('http.compression.level')
+		self.enableBatchEndpoint= Configuration.get('http.enableBatchEndpoint')
+		self.maxBatchSize		= Configuration.get('http.maxBatchSize')
+		self.maxRequestBodySize	= Configuration.get('http.maxRequestBodySize')
+		self.enableClientPool	= Configuration.get('http.client.enableConnectionPool')
+		self.clientPoolSize		= Configuration.get('http.client.poolSize')
+		self.clientPoolMaxHosts	= Configuration.get('http.client.maxHosts')
+		self.clientPoolIdleTimeout = Configuration.get('http.client.idleTimeout')
 
 
 	def configUpdate(self, name:str, 
@@ -205,28 +287,53 @@ class HttpServer(object):
 						'http.port',
 						'http.allowPatchForDelete',
 						'http.timeout',
+						'http.enableBatchEndpoint',
+						'http.maxBatchSize',
 						'webui.root',
 						'http.cors.enable',
 						'http.cors.resources',
 						'http.wsgi.enable',
 						'http.wsgi.threadPoolSize',
 						'http.wsgi.connectionLimit',
+						'http.asyncio.enable',
+						'http.asyncio.threadPoolSize',
+						'http.asyncio.connectionLimit',
+						'http.asyncio.keepAliveTimeout',
+						'http.compression.enable',
+						'http.compression.minSize',
+						'http.compression.level',
 						'http.security.enableBasicAuth',
-						'http.security.enableTokenAuth'
+						'http.security.enableTokenAuth',
+						'http.client.enableConnectionPool',
+						'http.client.poolSize',
+						'http.client.maxHosts',
+						'http.client.idleTimeout'
 					  ):
 			return
 		self._assignConfig()
 
+		# Pooled sessions were created with the old settings
+		if key.startswith('http.client.'):
+			self.closeClientSessions()
+			self._startClientSessionMonitor()
+
 
 	def run(self) -> bool:
 		"""	Run the http server in a separate thread.
 		"""
-		if isTCPPortAvailable(self.port):
-			self.httpActor = BackgroundWorkerPool.newActor(self._run, name='HTTPServer')
-			self.httpActor.start()
-			return True
-		L.logErr(f'Cannot start HTTP server. Port: {self.port} already in use.', showStackTrace = False)
-		return False
+		if CSE.processes.isMultiProcess:
+			# All CSE processes listen on the same port, and the operating system distributes the connections
+			try:
+				self.listenSocket = createReusePortSocket(self.listenIF, self.port)
+			except OSError as e:
+				L.logErr(f'Cannot start HTTP server on port: {self.port}: {e}', showStackTrace = False)
+				return False
+		elif not isTCPPortAvailable(self.port):
+			L.logErr(f'Cannot start HTTP server. Port: {self.port} already in use.', showStackTrace = False)
+			return False
+		self.httpActor = BackgroundWorkerPool.newActor(self._run, name='HTTPServer')
+		self.httpActor.start()
+		return True
 	
 
 	def shutdown(self) -> bool:
@@ -234,6 +341,14 @@ class HttpServer(object):
 		"""
 		L.isInfo and L.log('HttpServer shut down')
 		self.isStopped = True
+		if self.asyncioServer:
+			self.asyncioServer.shutdown()
+		if self.listenSocket:
+			self.listenSocket.close()
+		if self._clientSessionMonitor:
+			self._clientSessionMonitor.stop()
+			self._clientSessionMonitor = None
+		self.closeClientSessions()
 		return True
 	
 
@@ -265,11 +380,45 @@ class HttpServer(object):
 			try:
 				if self.wsgiEnable:
 					L.isInfo and L.log(f'HTTP server listening on {self.listenIF}:{self.port} (wsgi)')
-					serve(self.flaskApp, 
-		   				  host = self.listenIF, 
-						  port = self.port, 
-						  threads = self.wsgiThreadPoolSize, 
-						  connection_limit = self.wsgiConnectionLimit)
+					if self.listenSocket:
+						serve(self.flaskApp, 
+							  sockets = [ self.listenSocket ], 
+							  threads = self.wsgiThreadPoolSize, 
+							  connection_limit = self.wsgiConnectionLimit)
+					else:
+						serve(self.flaskApp, 
+							  host = self.listenIF, 
+							  port = self.port, 
+							  threads = self.wsgiThreadPoolSize, 
+							  connection_limit = self.wsgiConnectionLimit)
+				elif self.asyncioEnable:
+					L.isInfo and L.log(f'HTTP server listening on {self.listenIF}:{self.port} (asyncio)')
+					# Blocking and long-polling requests occupy a pool thread while they wait. 
+					# Warn if the pool cannot hold all requests the operation limits admit.
+					if Configuration.get('cse.operation.limits.enable'):
+						admitted = Configuration.get('cse.operation.limits.maxInFlight') + Configuration.get('cse.operation.limits.maxQueued')
+						if self.asyncioThreadPoolSize < admitted:
+							L.logWarn(f'[http.asyncio]:threadPoolSize ({self.asyncioThreadPoolSize}) is smaller than the number of requests admitted by [cse.operation.limits] ({admitted})')
+					self.asyncioServer = AsyncioHttpServer(self.flaskApp,
+														   host = self.listenIF,
+														   port = self.port,
+														   threads = self.asyncioThreadPoolSize,
+														   connectionLimit = self.asyncioConnectionLimit,
+														   keepAliveTimeout = self.asyncioKeepAliveTimeout,
+														   maxBodySize = self.maxRequestBodySize,
+														   sslContext = CSE.security.getSSLContextHttp(),
+														   sock = self.listenSocket,
+														   logger = lambda msg: L.enableBindingsLogging and L.isDebug and L.logDebug(f'HTTP: {msg}'))
+					self.asyncioServer.serveForever()
+				elif self.listenSocket:
+					L.isInfo and L.log(f'HTTP server listening on {self.listenIF}:{self.port} (flask http)')
+					make_server(self.listenIF, 
+								self.port, 
+								self.flaskApp, 
+								threaded = True, 
+								request_handler = ACMERequestHandler, 
+								ssl_context = CSE.security.getSSLContextHttp(),
+								fd = self.listenSocket.fileno()).serve_forever()
 				else:
 					L.isInfo and L.log(f'HTTP server listening on {self.listenIF}:{self.port} (flask http)')
 					self.flaskApp.run(host = self.listenIF, 
@@ -302,6 +451,18 @@ class HttpServer(object):
 
 
 	def _handleRequest(self, path:str, operation:Operation) -> Response:
+		"""	Handle a request and trace its processing stages, if tracing is enabled.
+		"""
+		trace = CSE.request.tracer.startTrace(f'http {operation.name}')
+		try:
+			response = self._processRequest(path, operation)
+			setTraceAttributes(status = response.status_code)
+			return response
+		finally:
+			CSE.request.tracer.finishTrace(trace)
+
+
+	def _processRequest(self, path:str, operation:Operation) -> Response:
 		"""	Get and check all the necessary information from the request and
 			build the internal strutures. Then, depending on the operation,
 			call the associated request handler.
@@ -310,7 +471,8 @@ class HttpServer(object):
 		L.isDebug and L.logDebug(f'Operation: {operation.name}')
 		L.isDebug and L.logDebug(f'Headers: \n{str(request.headers).rstrip()}')
 		try:
-			dissectResult = self._dissectHttpRequest(request, operation, path)
+			with span('http.dissect'):
+				dissectResult = self._dissectHttpRequest(request, operation, path)
 		except ResponseException as e:
 			dissectResult = Result(rsc = e.rsc, request = e.data, dbg = e.dbg)
 
@@ -337,7 +499,7 @@ class HttpServer(object):
 			return self._prepareResponse(dissectResult)
 
 		try:
-			responseResult = CSE.request.handleRequest(dissectResult.request)
+			responseResult = CSE.request.handleRequest(dissectResult.request, 'http')
 		except Exception as e:
 			responseResult = Result.exceptionToResult(e)
 		# L.inspect(responseResult)
@@ -468,6 +630,59 @@ class HttpServer(object):
 		return prepareUTResponse(ResponseStatusCode.BAD_REQUEST, None)
 
 
+	def handleBatch(self, path:Optional[str] = None) -> Response:
+		"""	Handle a batch request. The body contains a list of request primitives in the *acme:rqps* attribute.
+			They are handled one after the other, and the response body contains the list of response primitives
+			in the *acme:rsps* attribute, in the same order.
+
+			The *X-M2M-Origin* header is mandatory. Its originator is used for all request primitives of the batch.
+			The *X-M2M-RVI* header, if present, is used for request primitives without a release version indicator.
+
+			When the batch endpoint is disabled then the request is handled like a request to a resource with this name.
+		"""
+		if not self.enableBatchEndpoint:
+			return self.handlePOST('__batch__')
+		if self.isStopped:
+			return Response('Service not available', status = 503)
+		if not self.handleAuthentication():
+			return Response(status = 401)
+		renameThread('HT_B')
+		L.isDebug and L.logDebug(f'==> HTTP Batch Request')
+		L.isDebug and L.logDebug(f'Headers: \n{str(request.headers).rstrip()}')
+
+		_headers = request.headers
+		batchRequest = CSERequest(originator = _headers.get(Constants.hfOrigin),
+								  rqi = _headers.get(Constants.hfRI),
+								  rvi = _headers.get(Constants.hfRVI),
+								  ct = ContentSerializationType.getType(request.content_type.partition(';')[0] if request.content_type else None, 
+																		default = CSE.defaultSerialization),
+								  httpAccept = [ a.strip() for h in _headers.getlist('accept') for a in h.split(',') if not a.startswith('*/*') ])
+		try:
+			if not batchRequest.originator:
+				raise BAD_REQUEST(L.logDebug('originator is mandatory for batch requests'))
+
+			# Decompress and deserialize the body
+			data = request.data
+			if data and (contentEncoding := _headers.get('Content-Encoding')):
+				data = self._decompress(data, contentEncoding)
+			if not isinstance(rqps := findXPath(CSE.request.deserializeContent(data, batchRequest.ct), 'acme:rqps'), list):
+				raise BAD_REQUEST(L.logDebug('batch request must contain a list of request primitives in "acme:rqps"'))
+			if len(rqps) > self.maxBatchSize:
+				raise BAD_REQUEST(L.logDebug(f'too many request primitives in batch: {len(rqps)} (maximum: {self.maxBatchSize})'))
+			L.isDebug and L.logDebug(f'Batch with {len(rqps)} request primitives')
+
+			# Request primitives without a release version use the one of the batch
+			if batchRequest.rvi:
+				for rqp in rqps:
+					if isinstance(rqp, dict):
+						rqp.setdefault('rvi', batchRequest.rvi)
+			result = Result(rsc = ResponseStatusCode.OK, 
+							resource = { 'acme:rsps': CSE.request.handleBatchRequest(rqps, batchRequest.ct, batchRequest.originator, 'http') })
+		except ResponseException as e:
+			result = Result(rsc = e.rsc, dbg = e.dbg)
+		return self._prepareResponse(result, batchRequest)
+
+
 	#########################################################################
 
 	#
@@ -475,13 +690,88 @@ class HttpServer(object):
 	#
 
 	operation2method = {
-		Operation.CREATE	: requests.post,
-		Operation.RETRIEVE	: requests.get,
-		Operation.UPDATE 	: requests.put,
-		Operation.DELETE 	: requests.delete,
-		Operation.NOTIFY 	: requests.post
+		Operation.CREATE	: 'POST',
+		Operation.RETRIEVE	: 'GET',
+		Operation.UPDATE 	: 'PUT',
+		Operation.DELETE 	: 'DELETE',
+		Operation.NOTIFY 	: 'POST'
 	}
 
+
+	def sendRequest(self, method:str, url:str, **kwargs:Any) -> requests.Response:
+		"""	Send an http request to *url*.
+
+			If connection pooling is enabled then the request is sent through a keep-alive session
+			that is shared by all requests to the same target host. Otherwise a new connection
+			is used for the request.
+
+			Args:
+				method: The http method, e.g. "GET".
+				url: The target URL.
+				kwargs: Further arguments that are passed to the *requests* library.
+
+			Return:
+				The *requests* response.
+		"""
+		if not self.enableClientPool:
+			return requests.request(method, url, **kwargs)
+		
+		_url = urlsplit(url)
+		host = f'{_url.scheme}://{_url.netloc}'
+		with self._clientSessionsLock:
+			if (pooled := self._clientSessions.get(host)):
+				self._clientSessions.move_to_end(host)
+			else:
+				L.isDebug and L.logDebug(f'Creating pooled http session for: {host}')
+				pooled = self._clientSessions[host] = _PooledSession(self.clientPoolSize)
+				# Remove the least recently used, idle sessions if there are too many
+				if len(self._clientSessions) > self.clientPoolMaxHosts:
+					for h in [ h for h, s in self._clientSessions.items() if not s.inUse ][:len(self._clientSessions) - self.clientPoolMaxHosts]:
+						self._clientSessions.pop(h).session.close()
+			pooled.inUse += 1
+		try:
+			return pooled.session.request(method, url, **kwargs)
+		finally:
+			with self._clientSessionsLock:
+				pooled.inUse -= 1
+				pooled.lastUsed = utcTime()
+
+
+	def closeClientSessions(self) -> None:
+		"""	Close all pooled http sessions and their connections.
+		"""
+		with self._clientSessionsLock:
+			for pooled in self._clientSessions.values():
+				pooled.session.close()
+			self._clientSessions.clear()
+
+
+	def _startClientSessionMonitor(self) -> None:
+		"""	Start or stop the background worker that closes idle pooled sessions, depending on the configuration.
+		"""
+		if self._clientSessionMonitor:
+			self._clientSessionMonitor.stop()
+			self._clientSessionMonitor = None
+		if self.enableClientPool:
+			self._clientSessionMonitor = BackgroundWorkerPool.newWorker(self.clientPoolIdleTimeout / 2, 
+																		self._clientSessionMonitorWorker, 
+																		'httpSessionMonitor').start()
+
+
+	def _clientSessionMonitorWorker(self) -> bool:
+		"""	Close pooled sessions that have not been used for *idleTimeout* seconds.
+
+			Return:
+				Always True to keep the worker running.
+		"""
+		now = utcTime()
+		with self._clientSessionsLock:
+			for host in [ h for h, s in self._clientSessions.items() if not s.inUse and now - s.lastUsed > self.clientPoolIdleTimeout ]:
+				L.isDebug and L.logDebug(f'Closing idle http session for: {host}')
+				self._clientSessions.pop(host).session.close()
+		return True
+
+
 	def _prepContent(self, content:bytes|str|Any, ct:ContentSerializationType) -> str:
 		if not content:	return ''
 		if isinstance(content, str): return content
@@ -497,7 +787,7 @@ class HttpServer(object):
 		timeout:float = None
 
 		# Set the request method
-		method:Callable = self.operation2method[request.op] 	# type: ignore[assignment]
+		method = self.operation2method[request.op]
 
 		# Add the to to the base url
 		if request.to:
@@ -582,18 +872,19 @@ class HttpServer(object):
 		# ! Don't forget: requests are done through the request library, not flask.
 		# ! The attribute names are different
 		try:
-			L.isDebug and L.logDebug(f'Sending request: {method.__name__.upper()} {url}')
+			L.isDebug and L.logDebug(f'Sending request: {method} {url}')
 			if ct == ContentSerializationType.CBOR:
 				L.isDebug and L.logDebug(f'HTTP Request ==>:\nHeaders: {hds}\nBody: \n{self._prepContent(data, ct)}\n=>\n{str(data) if data else ""}\n')
 			else:
 				L.isDebug and L.logDebug(f'HTTP Request ==>:\nHeaders: {hds}\nBody: \n{self._prepContent(data, ct)}\n')
 			
 			# Actual sending the request
-			r = method(url, 
-					   data = data,
-					   headers = hds,
-					   verify = CSE.security.verifyCertificateHttp,
-					   timeout = timeout)
+			r = self.sendRequest(method,
+								 url, 
+								 data = data,
+								 headers = hds,
+								 verify = CSE.security.verifyCertificateHttp,
+								 timeout = timeout)
 		
 			# Ignore the response to notifications in some cases
 			if ignoreResponse and request.op == Operation.NOTIFY:
@@ -674,6 +965,7 @@ class HttpServer(object):
 
 	#########################################################################
 
+	@traced('http.response')
 	def _prepareResponse(self, result:Result, 
 							   originalRequest:Optional[CSERequest] = None) -> Response:
 		"""	Prepare the response for a request. If `request` is given then
@@ -704,6 +996,9 @@ class HttpServer(object):
 			result.request.vsi = originalRequest.vsi
 			result.request.ec  = originalRequest.ec
 			result.request.rset = originalRequest.rset
+
+			# Add the validators for a retrieved resource, and check a conditional RETRIEVE
+			CSE.request.applyConditionalRetrieve(originalRequest, result, result.request.ct)
 	
 		#
 		#	Transform request to oneM2M request
@@ -730,9 +1025,22 @@ class HttpServer(object):
 		if rset := findXPath(cast(JSON, outResult.data), 'rset'):
 			headers[Constants().hfRST] = rset
 		headers[Constants().hfOT] = getResourceDate()
+		if result.etag:
+			# A weak entity tag, because the same tag is used for all content encodings of the response
+			headers['ETag'] = f'W/"{result.etag}"'
+			headers['Last-Modified'] = rfc1123Date(result.lastModified)
+
+		# Return early without a body if the originator's representation is still current
+		if result.notModified:
+			L.isDebug and L.logDebug(f'<== HTTP Response (304 Not Modified):\nHeaders: {str(headers)}')
+			return Response(status = HTTPStatus.NOT_MODIFIED, headers = headers)
 
 		# HTTP status code
 		statusCode = result.rsc.httpStatusCode()
+		if result.retryAfter is not None:
+			# The request was rejected because the CSE is overloaded
+			statusCode = HTTPStatus.SERVICE_UNAVAILABLE
+			headers['Retry-After'] = str(max(1, math.ceil(result.retryAfter)))
 		
 		# Assign and encode content accordingly
 		headers['Content-Type'] = (cts := result.request.ct.toHttpContentType())
@@ -763,7 +1071,165 @@ class HttpServer(object):
 			L.isDebug and L.logDebug(f'<== HTTP Response ({result.rsc}):\nHeaders: {str(headers)}\nBody: {origData["pc"]}')	# might be different serialization
 		else:
 			L.isDebug and L.logDebug(f'<== HTTP Response ({result.rsc}):\nHeaders: {str(headers)}')
-		return Response(response = outResult.data, status = statusCode, content_type = cts, headers = headers)
+
+		# Compress the body if the client accepts it and the body is large enough
+		data = outResult.data
+		if self.compressionEnable and data and len(data) >= self.compressionMinSize:
+			headers['Vary'] = 'Accept-Encoding'
+			if (encoding := self._negotiateEncoding(request.headers.get('Accept-Encoding'))):
+				data = self._compress(data.encode('utf-8') if isinstance(data, str) else cast(bytes, data), encoding)
+				headers['Content-Encoding'] = encoding
+		return Response(response = data, status = statusCode, content_type = cts, headers = headers)
+
+
+	#########################################################################
+	#
+	#	Compression
+	#
+
+	def _negotiateEncoding(self, acceptEncoding:Optional[str]) -> Optional[str]:
+		"""	Determine the content encoding for a response from an *Accept-Encoding* header.
+
+			Args:
+				acceptEncoding: The value of the *Accept-Encoding* header, or None.
+
+			Return:
+				The name of the encoding, or None if the response should not be compressed.
+		"""
+		if not acceptEncoding:
+			return None
+		
+		# Collect the accepted encodings and their quality values
+		accepted:dict[str, float] = {}
+		for part in acceptEncoding.lower().split(','):
+			name, _, params = part.partition(';')
+			q = 1.0
+			if (qv := params.strip()).startswith('q='):
+				try:
+					q = float(qv[2:])
+				except ValueError:
+					q = 0.0
+			accepted[name.strip()] = q
+
+		# Select the supported encoding with the highest quality value, prefer br, gzip, deflate in this order
+		wildcard = accepted.get('*', 0.0)
+		best:Optional[str] = None
+		bestQ = 0.0
+		for encoding in ('br', 'gzip', 'deflate'):
+			if encoding == 'br' and not brotli:
+				continue
+			if (q := accepted.get(encoding, wildcard)) > bestQ:
+				best, bestQ = encoding, q
+		return best
+
+
+	def _compress(self, data:bytes, encoding:str) -> bytes:
+		"""	Compress data with the given content encoding.
+
+			Args:
+				data: The data to compress.
+				encoding: The content encoding: *br*, *gzip* or *deflate*.
+
+			Return:
+				The compressed data.
+		"""
+		match encoding:
+			case 'gzip':
+				return gzip.compress(data, compresslevel = self.compressionLevel)
+			case 'deflate':
+				return zlib.compress(data, self.compressionLevel)
+			case 'br':
+				return brotli.compress(data, quality = min(self.compressionLevel, 11))
+		return data
+
+
+	def _decompress(self, data:bytes, encoding:str) -> bytes:
+		"""	Decompress a request body with the given content encoding.
+
+			The decompressed size is limited by *[http]:maxRequestBodySize*. Decompression stops
+			as soon as this limit is exceeded.
+
+			Args:
+				data: The compressed data.
+				encoding: The content encoding from the *Content-Encoding* header.
+
+			Return:
+				The decompressed data.
+
+			Raises:
+				`BAD_REQUEST`: If the content encoding is not supported, the data cannot be decompressed, or the decompressed data is too large.
+		"""
+		limit = self.maxRequestBodySize
+		result:Optional[bytes] = None
+		try:
+			match encoding.strip().lower():
+				case 'identity' | '':
+					return data
+				case 'gzip' | 'x-gzip':
+					result = self._inflate(data, 16 + zlib.MAX_WBITS, limit)
+				case 'deflate':
+					try:
+						result = self._inflate(data, zlib.MAX_WBITS, limit)
+					except zlib.error:
+						result = self._inflate(data, -zlib.MAX_WBITS, limit)	# raw deflate without zlib header
+				case 'br' if brotli:
+					result = self._unbrotli(data, limit)
+		except Exception as e:
+			raise BAD_REQUEST(L.logWarn(f'Cannot decompress request body with content encoding: {encoding} - {str(e)}'))
+		if result is None:
+			raise BAD_REQUEST(L.logWarn(f'Unsupported content encoding: {encoding}'))
+		if len(result) > limit:
+			raise BAD_REQUEST(L.logWarn(f'Decompressed request body exceeds the maximum size of {limit} bytes'))
+		return result
+
+
+	def _inflate(self, data:bytes, wbits:int, limit:int) -> bytes:
+		"""	Decompress gzip or deflate data, but produce at most one byte more than *limit*.
+
+			Args:
+				data: The compressed data.
+				wbits: The window size and header format, see *zlib.decompressobj()*.
+				limit: The maximum size of the decompressed data.
+
+			Return:
+				The decompressed data. It is longer than *limit* if the data decompresses to more than *limit* bytes.
+
+			Raises:
+				`zlib.error`: If the data cannot be decompressed or is incomplete.
+		"""
+		decompressor = zlib.decompressobj(wbits)
+		result = decompressor.decompress(data, limit + 1)
+		if len(result) <= limit and not decompressor.eof:
+			raise zlib.error('incomplete compressed data')
+		return result
+
+
+	def _unbrotli(self, data:bytes, limit:int) -> bytes:
+		"""	Decompress brotli data, but stop once more than *limit* bytes are produced.
+
+			Args:
+				data: The compressed data.
+				limit: The maximum size of the decompressed data.
+
+			Return:
+				The decompressed data. It is longer than *limit* if the data decompresses to more than *limit* bytes.
+
+			Raises:
+				`brotli.error`: If the data cannot be decompressed or is incomplete.
+		"""
+		decompressor = brotli.Decompressor()
+		try:
+			result = decompressor.process(data, output_buffer_limit = limit + 1)
+		except TypeError:
+			# Older brotli versions don't support an output limit. Feed the input in small slices instead.
+			result = b''
+			for i in range(0, len(data), 1024):
+				result += decompressor.process(data[i:i + 1024])
+				if len(result) > limit:
+					break
+		if len(result) <= limit and not decompressor.is_finished():
+			raise brotli.error('incomplete compressed data')
+		return result
 
 
 	#########################################################################
@@ -822,8 +1288,20 @@ class HttpServer(object):
 			req['vsi'] = f
 		if f := _headers.get(Constants.hfOT):
 			req['ot'] = f
+		if f := _headers.get('If-None-Match'):
+			req['inm'] = [ t.strip().removeprefix('W/').strip('"') for t in f.split(',') if t.strip() ]
+		if (f := _headers.get('If-Modified-Since')) and (_ts := fromRfc1123Date(f)) is not None:	# invalid dates are ignored
+			req['ims'] = toISO8601Date(_ts + 0.999999)	# http dates have a resolution of one second
 
 		cseRequest.originalRequest = req 	# Already store now the incompliete request to save the header data
+
+		# Decompress the body if it is compressed
+		if cseRequest.originalData and (contentEncoding := _headers.get('Content-Encoding')):
+			try:
+				cseRequest.originalData = self._decompress(cseRequest.originalData, contentEncoding)
+			except ResponseException as e:
+				e.data = cseRequest
+				raise e
 	
 		# parse and extract content-type header
 		if contentType := request.content_type:
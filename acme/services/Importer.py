@@ -77,6 +77,7 @@ class Importer(object):
 				self.importConfigDocs() and
 				self.importScripts()):
 			return False
+		CSE.validator.compileRequestParameterValidators()
 		if CSE.script.scriptDirectories:
 			if not self.importScripts(CSE.script.scriptDirectories):
 				return False
@@ -101,6 +101,8 @@ class LocationManager(object):
 			Args:
 				lcp: The location policy to add.
 		"""
+		if CSE.processes.forwardToOwner('location', 'addLocationPolicy', lcp):
+			return
 		L.isDebug and L.logDebug('Adding location policy')
 		lcpRi = lcp.ri
 		gta = getGeoPolygon(lcp.gta)
@@ -156,6 +158,8 @@ class LocationManager(object):
 			Args:
 				lcp: The LCP to remove.
 		"""
+		if CSE.processes.forwardToOwner('location', 'removeLocationPolicy', lcp):
+			return
 		L.isDebug and L.logDebug('Removing location policy')
 
 		# Stopping the worker and remove the LCP from the internal list
@@ -169,6 +173,8 @@ class LocationManager(object):
 	def updateLocationPolicy(self, lcp:LCP) -> None:
 		"""	Update a location policy. This will remove the old location policy and add a new one.
 		"""
+		if CSE.processes.forwardToOwner('location', 'updateLocationPolicy', lcp):
+			return
 		L.isDebug and L.logDebug('Updating location policy')
 		self.removeLocationPolicy(lcp)
 		self.addLocationPolicy(lcp)
@@ -183,6 +189,8 @@ class LocationManager(object):
 		"""
 		if lcpRi is None:
 			return
+		if CSE.processes.forwardToOwner('location', 'handleLatestRetrieve', latest, lcpRi):
+			return
 		
 		# Check if the location policy is supported
 		if (lcp := CSE.dispatcher.retrieveResource(lcpRi)) is not None:
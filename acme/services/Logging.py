@@ -24,7 +24,7 @@ from logging import LogRecord
 from rich import inspect as richInspect
 from rich.logging import RichHandler
 from rich.style import Style
-from rich.console import Console
+from rich.console import Console, Group
 from rich.status import Status
 from rich.markdown import Markdown
 from rich.text import Text
@@ -186,7 +186,7 @@ class Logging:
 
 			logpath = Configuration.get('logging.path')
 			os.makedirs(logpath, exist_ok = True)# create log directory if necessary
-			logfile = f'{logpath}/cse-{CSE.cseType.name}.log'
+			logfile = f'{logpath}/cse-{CSE.cseType.name}{f"-worker{CSE.workerIndex}" if CSE.workerIndex else ""}.log'
 			logfp = logging.handlers.RotatingFileHandler(logfile,
 														 maxBytes = Configuration.get('logging.size'),
 														 backupCount = Configuration.get('logging.count'))
@@ -466,7 +466,7 @@ class Logging:
 
 
 	@staticmethod
-	def console(msg:Union[str, Text, Tree, Table, JSON] = '&nbsp;', 
+	def console(msg:Union[str, Text, Tree, Table, Group, JSON] = '&nbsp;', 
 				nl:Optional[bool] = False, 
 				nlb:Optional[bool] = False, 
 				end:Optional[str] = '\n', 
@@ -488,7 +488,7 @@ class Logging:
 				_msg = msg if plain else Markdown(msg)
 				Logging._console.print(_msg, style = style, end = end, highlight = False)
 				result = str(_msg)
-			case dict() | Tree() | Table() | Text():
+			case dict() | Tree() | Table() | Text() | Group():
 				Logging._console.print(msg, style = style, end = end)
 				result = str(msg)
 			case _:
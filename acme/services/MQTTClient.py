@@ -11,6 +11,7 @@ from __future__ import annotations
 from typing import Tuple, cast, Dict, Optional, Any, Union
 
 from urllib.parse import unquote
+import os
 
 from ..etc.Types import Operation, CSERequest, ContentSerializationType, RequestType, ResourceTypes, Result, ResponseStatusCode, ResourceTypes
 from ..etc.ResponseStatusCodes import ResponseException
@@ -62,9 +63,13 @@ class MQTTClientHandler(MQTTHandler):
 		"""
 		super().onConnect(connection)
 		L.isDebug and L.logDebug('Connected to MQTT broker')
-		connection.subscribeTopic(f'{self.topicPrefix}/oneM2M/req/+/{idToMQTT(CSE.cseCsi)}/#', self._requestCB)					# Subscribe to general requests
-		connection.subscribeTopic(f'{self.topicPrefix}/oneM2M/resp/{idToMQTT(CSE.cseCsi)}/+/#', self._responseCB)				# Subscribe to responses
-		connection.subscribeTopic(f'{self.topicPrefix}/oneM2M/reg_req/+/{idToMQTT(CSE.cseCsi)}/#', self._registrationRequestCB)	# Subscribe to registration requests
+
+		# Requests are shared with the other CSE instances of the group, if configured. 
+		# Responses are always received by all instances, because only the sender of a request waits for its response.
+		share = f'$share/{group}/' if (group := self.mqttClient.sharedSubscriptionGroup) else ''
+		connection.subscribeTopic(f'{share}{self.topicPrefix}/oneM2M/req/+/{idToMQTT(CSE.cseCsi)}/#', self._requestCB)					# Subscribe to general requests
+		connection.subscribeTopic(f'{self.topicPrefix}/oneM2M/resp/{idToMQTT(CSE.cseCsi)}/+/#', self._responseCB)						# Subscribe to responses
+		connection.subscribeTopic(f'{share}{self.topicPrefix}/oneM2M/reg_req/+/{idToMQTT(CSE.cseCsi)}/#', self._registrationRequestCB)	# Subscribe to registration requests
 		return True
 
 
@@ -267,7 +272,10 @@ class MQTTClientHandler(MQTTHandler):
 		renameThread(_t[1]) # rename threads
 
 		try:
-			responseResult = CSE.request.handleRequest(request)
+			responseResult = CSE.request.handleRequest(request, 'mqtt')
+			# Add the entity tag and check the conditions only for conditional RETRIEVE requests
+			if request.inm is not None or request.ims is not None:
+				CSE.request.applyConditionalRetrieve(request, responseResult, request.ct)
 		except Exception as e:
 			responseResult = Result.exceptionToResult(e)
 		# Send response
@@ -299,6 +307,9 @@ class MQTTClient(object):
 		'enable',
 		'topicPrefix',
 		'requestTimeout',
+		'workers',
+		'qos',
+		'sharedSubscriptionGroup',
 	)
 
 	# TODO move config handling to event handler
@@ -353,6 +364,9 @@ class MQTTClient(object):
 		self.enable = Configuration.get('mqtt.enable')
 		self.topicPrefix = Configuration.get('mqtt.topicPrefix')
 		self.requestTimeout = Configuration.get('mqtt.timeout')
+		self.workers = Configuration.get('mqtt.workers')
+		self.qos = Configuration.get('mqtt.qos')
+		self.sharedSubscriptionGroup = Configuration.get('mqtt.sharedSubscriptionGroup')
 
 
 	def configUpdate(self, name:str, 
@@ -368,6 +382,9 @@ class MQTTClient(object):
 		if key not in [ 'mqtt.enable', 
 						'mqtt.topicPrefix',
 						'mqtt.timeout', 
+						'mqtt.workers',
+						'mqtt.qos',
+						'mqtt.sharedSubscriptionGroup',
 					  ]:
 			return
 
@@ -417,18 +434,23 @@ class MQTTClient(object):
 		"""
 		if self.enable:
 			if not (mqttConnect := self.mqttConnections.get( (address, port) )):
+				clientID = idToMQTTClientID(CSE.cseCsi)
+				if self.sharedSubscriptionGroup:	# Each instance of a group needs its own client ID
+					clientID = f'{clientID}_{os.getpid()}'
 				mqttConnection = MQTTConnection(address				= address,
 												port				= port,
 												keepalive			= Configuration.get('mqtt.keepalive'),
 												interface			= Configuration.get('mqtt.listenIF'),
-												clientID			= idToMQTTClientID(CSE.cseCsi),
+												clientID			= clientID,
 												useTLS				= useTLS,
 												caFile				= CSE.security.caCertificateFileMqtt,
 												verifyCertificate	= CSE.security.verifyCertificateMqtt,
 												username 			= username,
 												password			= password,
 												lowLevelLogging 	= L.enableBindingsLogging,
-												messageHandler 		= MQTTClientHandler	(self))
+												messageHandler 		= MQTTClientHandler	(self),
+												workers				= self.workers,
+												qos					= self.qos)
 				if mqttConnection:
 					self.mqttConnections[(address, port)] = mqttConnection
 			return mqttConnection
@@ -536,13 +558,21 @@ class MQTTClient(object):
 		# Publish the request and wait for the response.
 		# Then return the response as result
 		logRequest(preq, _data, topic, isResponse = False, isIncoming = False)
-		# mqttConnection.publish(topic, cast(bytes, cast(Tuple, preq.data)[1]))
-		mqttConnection.publish(topic, _data)
 
 		# Don't wait for the response if the request is for a notification and a direct URL is used
 		if ignoreResponse and req.request.op == Operation.NOTIFY:
+			if not mqttConnection.publish(topic, _data):
+				return Result(rsc = ResponseStatusCode.TARGET_NOT_REACHABLE, 
+							  dbg = 'Cannot publish MQTT request')
 			L.isDebug and L.logDebug('MQTT: Ignoring response to notification')
 			return Result(rsc = ResponseStatusCode.OK)
+
+		# Register the expected response before publishing, so that a fast response is not missed
+		CSE.request.expectResponse(preq.request.rqi)
+		if not mqttConnection.publish(topic, _data):
+			CSE.request.cancelResponse(preq.request.rqi)
+			return Result(rsc = ResponseStatusCode.TARGET_NOT_REACHABLE, 
+						  dbg = 'Cannot publish MQTT request')
 		
 		# Wait for the response
 		response, responseTopic = CSE.request.waitForResponse(preq.request.rqi, self.requestTimeout) # type: ignore
@@ -33,6 +33,7 @@ from ..resources.Resource import Resource
 from ..resources.CRS import CRS
 from ..resources.SUB import SUB
 from ..helpers.BackgroundWorker import BackgroundWorker, BackgroundWorkerPool
+from ..helpers.RequestTracer import traced
 from ..services.Logging import Logging as L
 
 # TODO: removal policy (e.g. unsuccessful tries)
@@ -235,6 +236,7 @@ class NotificationManager(object):
 		return result
 
 
+	@traced('notification.checkSubscriptions')
 	def checkSubscriptions(	self, 
 							resource:Optional[Resource], 
 							reason:NotificationEventType, 
@@ -0,0 +1,414 @@
+#
+#	ProcessManager.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Manage the owner and worker processes of a multi-process CSE
+#
+
+"""	This module implements the management of the CSE processes when the CSE runs in multi-process mode.
+
+	In multi-process mode the CSE runs as one owner process and additional worker processes. All
+	processes listen on the same http port (*SO_REUSEPORT*), so that the operating system distributes
+	incoming connections between them, and all processes use the same shared database.
+
+	The owner process runs the background monitors, e.g. for resource expiration, remote CSE connections,
+	scripts, <timeSeries> missing data detection, location policies and periodic time sync beacons. Worker
+	processes forward calls to these monitors to the owner process.
+
+	Each worker process is connected to the owner process with a pipe. Changes to resources are sent
+	through these pipes to all other processes, which then invalidate their in-memory caches.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Optional, Tuple, cast
+
+import argparse, copy, multiprocessing
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from threading import Lock, Event
+
+from ..etc.Types import JSON, ResourceTypes
+from ..etc.ResponseStatusCodes import NOT_FOUND
+from ..services import CSE
+from ..services.Configuration import Configuration
+from ..resources.Resource import Resource
+from ..resources.Factory import resourceFromDict
+from ..helpers.BackgroundWorker import BackgroundWorker, BackgroundWorkerPool
+from ..services.Logging import Logging as L
+
+
+class _ResourceArgument(object):
+	"""	Wrapper for a resource that is passed as an argument of a call that is forwarded to the owner process.
+		Only the resource's dictionary is sent, and the resource is created again in the owner process.
+	"""
+
+	__slots__ = ( 'dct', )
+
+	def __init__(self, dct:JSON) -> None:
+		self.dct = dct
+		""" The resource's dictionary. """
+
+
+class ProcessManager(object):
+	"""	This manager entity starts and stops the worker processes, and handles the communication
+		between the owner process and the worker processes.
+
+		Attributes:
+			workers: The number of processes that serve requests, including the owner process.
+			workerIndex: The index of this process. 0 is the owner process, worker processes have an index > 0.
+	"""
+
+	__slots__ = (
+		'workers',
+		'workerIndex',
+		'_args',
+		'_processes',
+		'_connections',
+		'_connectionLocks',
+		'_receiver',
+		'_restarted',
+		'_stopping',
+	)
+
+	def __init__(self, args:argparse.Namespace) -> None:
+		"""	Initialize the process manager.
+
+			Args:
+				args: The startup arguments. They are passed on to the worker processes.
+		"""
+		self.workers = Configuration.get('cse.operation.processes.workers')
+		self.workerIndex = args.workerIndex if 'workerIndex' in args else 0
+		self._args = args
+		""" The startup arguments. """
+		self._processes:Dict[int, BaseProcess] = {}
+		""" The worker processes by worker index. Only used in the owner process. """
+		self._connections:Dict[int, Connection] = {}
+		""" The pipes to the other processes by worker index. A worker process only has a pipe to the owner process (index 0). """
+		self._connectionLocks:Dict[int, Lock] = {}
+		""" Locks for sending through the pipes. """
+		self._receiver:Optional[BackgroundWorker] = None
+		""" Actor that receives messages from the other processes. """
+		self._restarted = Event()
+		""" Set in a worker process when the owner process finished a reset of the CSE. """
+		self._stopping = False
+		""" Indicator that the processes are shutting down. """
+
+		if self.isWorker:
+			self._addConnection(0, args.workerConnection)
+		elif self.isMultiProcess:
+			CSE.event.addHandler(CSE.event.cseReset, lambda _: self._sendToWorkers(('pause', )))			# type: ignore
+			CSE.event.addHandler(CSE.event.cseRestarted, lambda _: self._sendToWorkers(('restarted', )))	# type: ignore
+
+		L.isInfo and L.log(f'ProcessManager initialized ({"worker process " + str(self.workerIndex) if self.isWorker else "owner process"})')
+
+
+	def shutdown(self) -> bool:
+		"""	Shutdown the process manager. The owner process stops all worker processes.
+
+			Return:
+				Boolean, always *True*.
+		"""
+		self._stopping = True
+		if not self.isWorker:
+			self._sendToWorkers(('stop', ))
+			for index, process in list(self._processes.items()):
+				process.join(timeout = 5.0)
+				if process.is_alive():
+					L.isWarn and L.logWarn(f'Terminating worker process: {index}')
+					process.terminate()
+		for connection in list(self._connections.values()):
+			connection.close()
+		L.isInfo and L.log('ProcessManager shut down')
+		return True
+
+
+	@property
+	def isMultiProcess(self) -> bool:
+		"""	Indicator whether the CSE runs with more than one process.
+		"""
+		return self.workers > 1
+
+
+	@property
+	def isWorker(self) -> bool:
+		"""	Indicator whether this process is a worker process.
+		"""
+		return self.workerIndex > 0
+
+
+	def startWorkers(self) -> None:
+		"""	Start the worker processes. This is only done by the owner process in multi-process mode, and
+			after the owner process has imported the initial resources.
+		"""
+		if self.isWorker or not self.isMultiProcess:
+			return
+
+		# Workers don't have a console, don't reset the database, and don't run the bindings
+		# that can only be served by a single process
+		workerArgs = copy.copy(self._args)
+		workerArgs.headless = True
+		workerArgs.textui = False
+		workerArgs.dbreset = False
+		workerArgs.wsenabled = False
+		workerArgs.coapenabled = False
+		if not Configuration.get('mqtt.sharedSubscriptionGroup'):
+			workerArgs.mqttenabled = False
+
+		context = multiprocessing.get_context('spawn')	# Don't fork a process with running threads
+		for index in range(1, self.workers):
+			ownerConnection, workerConnection = context.Pipe()
+			process = context.Process(target = CSE.runWorker,
+									  args = (workerArgs, index, workerConnection),
+									  name = f'worker_{index}',
+									  daemon = True)
+			process.start()
+			workerConnection.close()	# only used by the worker process
+			self._processes[index] = process
+			self._addConnection(index, ownerConnection)
+			L.isInfo and L.log(f'Started worker process: {index} (pid: {process.pid})')
+
+
+	def _addConnection(self, index:int, connection:Connection) -> None:
+		"""	Add the pipe to another process, and start receiving messages if necessary.
+
+			Args:
+				index: The worker index of the other process.
+				connection: The pipe to the other process.
+		"""
+		self._connections[index] = connection
+		self._connectionLocks[index] = Lock()
+		if not self._receiver:
+			self._receiver = BackgroundWorkerPool.newActor(self._receiveMessages, name = 'processReceiver').start()
+
+
+	#########################################################################
+	#
+	#	Sending messages
+	#
+
+	def _send(self, index:int, message:Tuple[Any, ...]) -> None:
+		"""	Send a message to another process.
+
+			Args:
+				index: The worker index of the receiving process.
+				message: The message to send.
+		"""
+		if not (connection := self._connections.get(index)):
+			return
+		try:
+			with self._connectionLocks[index]:
+				connection.send(message)
+		except (OSError, ValueError) as e:
+			if not self._stopping:
+				L.logErr(f'Cannot send message to process: {index}: {e}')
+
+
+	def _sendToWorkers(self, message:Tuple[Any, ...], exclude:Optional[int] = None) -> None:
+		"""	Send a message from the owner process to all worker processes.
+
+			Args:
+				message: The message to send.
+				exclude: Optional index of a worker process that doesn't receive the message.
+		"""
+		for index in list(self._connections):
+			if index != exclude:
+				self._send(index, message)
+
+
+	def resourceChanged(self, resource:Resource, deleted:Optional[bool] = False) -> None:
+		"""	Let the other processes know that a resource was created, updated or deleted, so that they can
+			invalidate their caches. This is called after the resource was written to the database.
+
+			Args:
+				resource: The created, updated or deleted resource.
+				deleted: Indicator whether the resource was deleted.
+		"""
+		if not self.isMultiProcess:
+			return
+		message = ('invalidate', resource.ri, resource.getSrn(), resource.ty, resource.pi, deleted)
+		if self.isWorker:
+			self._send(0, message)			# The owner process sends it on to the other workers
+		else:
+			self._sendToWorkers(message)
+
+
+	def remoteResourcesChanged(self, id:str) -> None:
+		"""	Let the other processes know that resources of a remote CSE might have changed, so that they can
+			invalidate their cached remote resources.
+
+			Args:
+				id: An SP-relative resource ID or originator of the remote CSE.
+		"""
+		if not self.isMultiProcess:
+			return
+		message = ('invalidateRemote', id)
+		if self.isWorker:
+			self._send(0, message)			# The owner process sends it on to the other workers
+		else:
+			self._sendToWorkers(message)
+
+
+	def forwardToOwner(self, service:str, method:str, *args:Any) -> bool:
+		"""	Forward a call of a background monitor method to the owner process.
+
+			Args:
+				service: The name of the CSE service, e.g. "timeSeries".
+				method: The name of the service's method.
+				args: The arguments of the method. Resources are sent as their dictionaries.
+
+			Return:
+				True if the call was forwarded, ie. this is a worker process. The caller must not run the method itself then.
+				False if this is the owner process, and the caller must run the method itself.
+		"""
+		if not self.isWorker:
+			return False
+		L.isDebug and L.logDebug(f'Forwarding call to owner process: {service}.{method}')
+		self._send(0, ('call', service, method, tuple(_ResourceArgument(arg.dict) if isinstance(arg, Resource) else arg for arg in args)))
+		return True
+
+
+	def resetByOwner(self, timeout:float = 30.0) -> bool:
+		"""	Let the owner process reset the CSE, and wait until the reset finished.
+
+			Args:
+				timeout: Maximum time in seconds to wait for the reset.
+
+			Return:
+				True if this is a worker process and the reset was done by the owner process.
+				False if this is the owner process, and the caller must reset the CSE itself.
+		"""
+		if not self.isWorker:
+			return False
+		self._restarted.clear()
+		self._send(0, ('reset', ))
+		if not self._restarted.wait(timeout):
+			L.logErr(f'Owner process did not reset the CSE within {timeout} seconds')
+		return True
+
+
+	#########################################################################
+	#
+	#	Receiving messages
+	#
+
+	def _receiveMessages(self) -> None:
+		"""	Receive and handle the messages from the other processes until the processes shut down.
+		"""
+		while not self._stopping and self._connections:
+			connections = { connection: index for index, connection in self._connections.items() }
+			for ready in wait(list(connections), timeout = 1.0):
+				connection = cast(Connection, ready)
+				index = connections[connection]
+				try:
+					message = cast(Tuple[Any, ...], connection.recv())
+				except (EOFError, OSError):
+					self._connectionClosed(index)
+					continue
+				try:
+					self._handleMessage(index, message)
+				except Exception as e:
+					L.logErr(f'Error handling message from process: {index}: {message[0]}', exc = e)
+
+
+	def _connectionClosed(self, index:int) -> None:
+		"""	Handle a closed pipe to another process.
+
+			Args:
+				index: The worker index of the other process.
+		"""
+		if (connection := self._connections.pop(index, None)):
+			connection.close()
+		if self._stopping:
+			return
+		if self.isWorker:
+			L.logErr('Owner process terminated. Shutting down worker process', showStackTrace = False)
+			CSE.shutdown()
+		else:
+			L.logErr(f'Worker process terminated: {index}', showStackTrace = False)
+			self._processes.pop(index, None)
+
+
+	def _handleMessage(self, index:int, message:Tuple[Any, ...]) -> None:
+		"""	Handle a message from another process.
+
+			Args:
+				index: The worker index of the sending process.
+				message: The received message. The first element is the message type.
+		"""
+		match message[0]:
+			case 'invalidate':
+				if not self.isWorker:
+					self._sendToWorkers(message, exclude = index)	# Send on to the other workers
+				self._invalidate(*message[1:])
+
+			case 'invalidateRemote':
+				if not self.isWorker:
+					self._sendToWorkers(message, exclude = index)	# Send on to the other workers
+				CSE.remote.invalidateRemoteResourceCache(message[1])
+
+			case 'call' if not self.isWorker:
+				_, service, method, args = message
+				args = tuple(resourceFromDict(arg.dct) if isinstance(arg, _ResourceArgument) else arg for arg in args)
+				getattr(getattr(CSE, service), method)(*args)	# Called in order of arrival
+
+			case 'reset' if not self.isWorker:
+				BackgroundWorkerPool.runJob(CSE.resetCSE, name = 'resetCSE')	# Workers are notified by the cseReset and cseRestarted events
+
+			case 'pause' if self.isWorker:
+				CSE.httpServer.pause()
+
+			case 'restarted' if self.isWorker:
+				self._clearCaches()
+				CSE.httpServer.unpause()
+				self._restarted.set()
+
+			case 'stop' if self.isWorker:
+				self._stopping = True
+				CSE.shutdown()
+
+			case _:
+				L.logErr(f'Unexpected message from process: {index}: {message[0]}')
+
+
+	def _invalidate(self, ri:str, srn:str, ty:ResourceTypes, pi:str, deleted:bool) -> None:
+		"""	Invalidate the cached information about a resource that was changed in another process.
+
+			Args:
+				ri: The resource ID of the changed resource.
+				srn: The structured resource name of the changed resource.
+				ty: The resource type of the changed resource.
+				pi: The parent resource ID of the changed resource.
+				deleted: Indicator whether the resource was deleted.
+		"""
+		# Storage loads that started before this point must not be shared with later RETRIEVE requests
+		CSE.storage.advanceWriteGeneration()
+		if deleted:
+			CSE.storage.uncacheIdentifier(ri, srn)
+		CSE.dispatcher.invalidateDiscoveryCache(srn, ty)
+		match ty:
+			case ResourceTypes.ACP | ResourceTypes.ACPAnnc | ResourceTypes.GRP:
+				CSE.security.invalidateACPDecisions(ri)
+				CSE.security.invalidateACPDecisions(srn)
+			case ResourceTypes.CSR:
+				CSE.remote.restoreDescendantCSRs()
+				CSE.remote.invalidateRemoteResourceCache()
+			case ResourceTypes.SCH if pi == CSE.cseRi and not deleted:
+				try:
+					CSE.cseActiveSchedule = CSE.storage.retrieveResource(ri).attribute('se/sce')
+				except NOT_FOUND:
+					pass	# The schedule has been deleted in the meantime
+
+
+	def _clearCaches(self) -> None:
+		"""	Clear all in-memory caches, e.g. after the owner process reset the CSE.
+		"""
+		CSE.storage.advanceWriteGeneration()
+		CSE.storage.clearIdentifierCache()
+		CSE.dispatcher.clearDiscoveryCache()
+		CSE.security.clearACPDecisionCache()
+		CSE.remote.restoreDescendantCSRs()
+		CSE.remote.invalidateRemoteResourceCache()
+		CSE.cseActiveSchedule = []
+
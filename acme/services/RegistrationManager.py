@@ -382,6 +382,9 @@ class RegistrationManager(object):
 		if not self.enableResourceExpiration:
 			L.isDebug and L.logDebug('Expiration disabled. NOT starting expiration monitor')
 			return
+		if CSE.processes.isWorker:
+			L.isDebug and L.logDebug('Worker process. NOT starting expiration monitor')
+			return
 
 		L.isDebug and L.logDebug('Starting expiration monitor')
 		if self.checkExpirationsInterval > 0:
@@ -12,11 +12,14 @@
 """	This module implements remote CSR registration service and helper functions. """
 
 from __future__ import annotations
-from typing import List, Tuple, Dict, cast, Optional, Any
+from typing import List, Tuple, Dict, Set, cast, Optional, Any
+from copy import deepcopy
+from threading import Lock
 
 from ..etc.Types import CSEStatus, ResourceTypes, Result, CSEType, ResponseStatusCode, JSON, CSERequest, Operation
 from ..etc.ResponseStatusCodes import exceptionFromRSC, ResponseException, NOT_FOUND, BAD_REQUEST, INTERNAL_SERVER_ERROR, CONFLICT, TARGET_NOT_REACHABLE
-from ..etc.ACMEUtils import pureResource, csiFromRelativeAbsoluteUnstructured
+from ..etc.ACMEUtils import pureResource, csiFromRelativeAbsoluteUnstructured, isSPRelative, isAbsolute
+from ..etc.DateUtils import utcTime, fromAbsRelTimestamp
 from ..etc.Constants import Constants
 from ..helpers.TextTools import findXPath, setXPath
 from ..resources.CSR import CSR
@@ -46,6 +49,9 @@ class RemoteCSEManager(object):
 			checkLiveliness: Configuration setting. Whether to check remote CSE's connectivity.
 			excludeCSRAttributes: Configuration setting. Optional list of attributes to exclide from the CSR, eg. when not supported by a remote CSE.
 			enableRemoteCSE: Configuration setting. Enable or disable remote registrations.
+			enableRemoteResourceCache: Configuration setting. Enable or disable caching of retrieved remote resources.
+			remoteResourceCacheSize: Configuration setting. The maximum number of cached remote resources.
+			remoteResourceCacheTTL: Configuration setting. The time in seconds after which a cached remote resource expires.
 			registrarCSEURL: The URL to the point-of-access of the registrar CSE. This is a real URL.
 			registrarCSEURI: The registrar CSE's CSE-ID and resource name.
 			csrOnRegistrarURI: The SP-relative ID of the CSR resource on the registrar CSE.
@@ -56,6 +62,10 @@ class RemoteCSEManager(object):
 		'registrarCSE',
 		'connectionMonitor',
 		'descendantCSR',
+		'_csrCache',
+		'_remoteResourceCache',
+		'_remoteResourceCacheIndex',
+		'_remoteResourceCacheLock',
 
 		'registrarAddress',
 		'registrarRoot',
@@ -66,6 +76,9 @@ class RemoteCSEManager(object):
 		'registrarCseRN',
 		'excludeCSRAttributes',
 		'enableRemoteCSE',
+		'enableRemoteResourceCache',
+		'remoteResourceCacheSize',
+		'remoteResourceCacheTTL',
 		'registrarCSEURL',
 		'registrarCSEURI',
 		'csrOnRegistrarURI',
@@ -85,6 +98,10 @@ class RemoteCSEManager(object):
 		self.registrarCSE:Resource							= None 	# The registrar CSE if there is one 
 		self.connectionMonitor:BackgroundWorker				= None	# BackgroundWorker
 		self.descendantCSR:Dict[str, Tuple[Resource, str]]	= {}	# dict of descendantCSR's - "csi : (CSR, registeredATcsi)". CSR is None for CSEs further down 
+		self._csrCache:Dict[str, JSON]						= {}	# Resolved <CSR> resources for remote CSE-IDs - "csi : CSR dictionary". See getCSRFromPath()
+		self._remoteResourceCache:Dict[Tuple[str, str], Tuple[JSON, float, Optional[int]]] = {}	# Retrieved remote resources - "(id, originator) : (resource, expiration, st)". See retrieveRemoteResource()
+		self._remoteResourceCacheIndex:Dict[str, Set[Tuple[str, str]]] = {}	# Keys of the cached remote resources per hosting CSE - "csi : keys"
+		self._remoteResourceCacheLock = Lock()
 
 		# Get the configuration settings
 		self._assignConfig()
@@ -143,6 +160,9 @@ class RemoteCSEManager(object):
 		self.registrarCseRN			= Configuration.get('cse.registrar.resourceName')
 		self.excludeCSRAttributes	= Configuration.get('cse.registrar.excludeCSRAttributes')
 		self.enableRemoteCSE		= Configuration.get('cse.enableRemoteCSE')
+		self.enableRemoteResourceCache	= Configuration.get('cse.registrar.enableRemoteResourceCache')
+		self.remoteResourceCacheSize	= Configuration.get('cse.registrar.remoteResourceCacheSize')
+		self.remoteResourceCacheTTL		= Configuration.get('cse.registrar.remoteResourceCacheTTL')
 
 		# Set other manager attributes
 		# self.registrarCSEURL		= f'{self.registrarAddress}{self.registrarRoot}/{self.registrarCSI}/{self.registrarCseRN}'
@@ -169,11 +189,15 @@ class RemoteCSEManager(object):
 						'cse.registrar.cseID',
 						'cse.registrar.resourceName',
 						'cse.registrar.excludeCSRAttributes',
-						'cse.enableRemoteCSE' ]:
+						'cse.enableRemoteCSE',
+						'cse.registrar.enableRemoteResourceCache',
+						'cse.registrar.remoteResourceCacheSize',
+						'cse.registrar.remoteResourceCacheTTL' ]:
 			return
 
 		# assign new values
 		self._assignConfig()
+		self.invalidateRemoteResourceCache()
 
 
 	#########################################################################
@@ -187,18 +211,11 @@ class RemoteCSEManager(object):
 		if not self.enableRemoteCSE:
 			return
 		
-		L.isDebug and L.logDebug('Rebuild internal descendants list')
-		self.descendantCSR.clear()
-		for eachCsr in CSE.dispatcher.retrieveResourcesByType(ResourceTypes.CSR):
-			if (csi := eachCsr.csi) != self.registrarCSI:			# Skipping the own registrar csr
-				L.isDebug and L.logDebug(f'Addind remote CSE: {csi}')
-				self.descendantCSR[csi] = (eachCsr, CSE.cseCsi)		# Add the direct child CSR
-				
-				# Add the descendant CSE's
-				if eachCsr.dcse:
-					for eachDcse in eachCsr.dcse:
-						L.isDebug and L.logDebug(f'Adding descendant CSE: {csi} -> {eachDcse}')
-						self.descendantCSR[eachDcse] = (None, csi)
+		self.restoreDescendantCSRs()
+
+		# Only the owner process connects to the registrar CSE in multi-process mode
+		if CSE.processes.isWorker:
+			return
 
 		L.isInfo and L.log('Starting remote CSE connection monitor')
 		self.connectionMonitor = BackgroundWorkerPool.newWorker(self.checkInterval, self.connectionMonitorWorker, 'csrMonitor').start()
@@ -207,7 +224,7 @@ class RemoteCSEManager(object):
 	def stop(self) -> None:
 		"""	Stop the connection monitor. Also delete the CSR resources on both sides, if possible.
 		"""
-		if not self.enableRemoteCSE:
+		if not self.enableRemoteCSE or CSE.processes.isWorker:
 			return
 		L.isInfo and L.log('Stopping remote CSE connection monitor')
 
@@ -215,6 +232,8 @@ class RemoteCSEManager(object):
 		if self.connectionMonitor:
 			self.connectionMonitor.stop()
 			self.connectionMonitor = None
+		self.invalidateCSRCache()
+		self.invalidateRemoteResourceCache()
 
 		# Remove <csr> resources
 		if CSE.cseType in [ CSEType.ASN, CSEType.MN ]:
@@ -231,6 +250,24 @@ class RemoteCSEManager(object):
 				pass
 	
 
+	def restoreDescendantCSRs(self) -> None:
+		"""	Rebuild the internal list of descendant CSEs from the <CSR> resources in the database.
+		"""
+		L.isDebug and L.logDebug('Rebuild internal descendants list')
+		self.descendantCSR.clear()
+		self.invalidateCSRCache()
+		for eachCsr in CSE.dispatcher.retrieveResourcesByType(ResourceTypes.CSR):
+			if (csi := eachCsr.csi) != self.registrarCSI:			# Skipping the own registrar csr
+				L.isDebug and L.logDebug(f'Addind remote CSE: {csi}')
+				self.descendantCSR[csi] = (eachCsr, CSE.cseCsi)		# Add the direct child CSR
+				
+				# Add the descendant CSE's
+				if eachCsr.dcse:
+					for eachDcse in eachCsr.dcse:
+						L.isDebug and L.logDebug(f'Adding descendant CSE: {csi} -> {eachDcse}')
+						self.descendantCSR[eachDcse] = (None, csi)
+
+
 	def connectionMonitorWorker(self) -> bool:
 		"""	The background worker that checks periodically whether the connection to the registrar and
 			registree CSEs is still valid.
@@ -285,6 +322,7 @@ class RemoteCSEManager(object):
 		"""
 		self.registrarCSE = registrarCSE
 		self.ownCSRonRegistrarCSE = ownRegistrarCSR
+		self.invalidateCSRCache()
 
 
 	def handleRegistrarDeregistration(self, name:str, registrarCSE:Optional[Resource] = None) -> None:
@@ -296,6 +334,8 @@ class RemoteCSEManager(object):
 		"""
 		self.registrarCSE = None
 		self.ownCSRonRegistrarCSE = None
+		self.invalidateCSRCache()
+		self.invalidateRemoteResourceCache()
 
 
 	def handleRegistreeCSERegistration(self, name:str, registreeCSR:Resource) -> None:
@@ -316,6 +356,7 @@ class RemoteCSEManager(object):
 
 		# Add to the descendant CSE : (remoteCSR, this CSE's csi )
 		self.descendantCSR[registreeCSRcsi] = (registreeCSR, CSE.cseCsi)
+		self.invalidateCSRCache()
 
 		# Update the own dcse list with the dcse's from the remoteCSR
 		if registreeCSR.dcse:	
@@ -358,6 +399,8 @@ class RemoteCSEManager(object):
 			dcse = self.descendantCSR[eachDescendantCsi]	# returns tuple (CSR, csi)
 			if dcse[1] == registreeCSRcsi:	# registered to deregistering remote CSE?
 				del self.descendantCSR[eachDescendantCsi]
+		self.invalidateCSRCache()
+		self.invalidateRemoteResourceCache()
 		
 		if CSE.cseType in [ CSEType.ASN, CSEType.MN ] and registreeCSR.csi != self.registrarCSI:	# No need to update the own CSR on the registrar when deregistering anyway
 			self._updateCSRonRegistrarCSE()
@@ -392,6 +435,8 @@ class RemoteCSEManager(object):
 				if eachDcse in self.descendantCSR:	# don't overwrite existing ones. Can this actually happen?
 					continue
 				self.descendantCSR[eachDcse] = (None, registreeCsi)	# don't have the CSR for further descendants available
+		self.invalidateCSRCache()
+		self.invalidateRemoteResourceCache(registreeCsi)
 
 		if CSE.cseType in [ CSEType.ASN, CSEType.MN ]:	# update own registrar CSR
 			self._updateCSRonRegistrarCSE()
@@ -746,6 +791,11 @@ class RemoteCSEManager(object):
 	def retrieveRemoteResource(self, id:str, originator:Optional[str] = None) -> Resource:
 		"""	Retrieve a remote resource from one of the interconnected CSEs.
 
+			If enabled, the retrieved resource is cached for the originator. A cached resource expires
+			after the configured time-to-live, or earlier at its *expirationTime*. The cached resources
+			of a remote CSE are invalidated when a notification is received from that CSE, when this CSE
+			sends a request that may change a resource on that CSE, or when the registration changes.
+
 			Args:
 				id: The resource ID. It must be at least in SP-relative format.
 				originator: Optional request originator. If *None* is given then the CSE's CSE-ID is used.
@@ -754,6 +804,15 @@ class RemoteCSEManager(object):
 				Result object with the status and, if successful, the resource object in the *resource* attribute.
 		"""
 
+		# Assign fallback originator
+		if not originator:
+			originator = CSE.cseCsi
+
+		# Return a cached copy of the remote resource
+		if self.enableRemoteResourceCache and (dct := self._getCachedRemoteResource(id, originator)):
+			L.isDebug and L.logDebug(f'Using cached remote resource id: {id}')
+			return resourceFromDict(dct)
+
 		# We cannot regularly retrieve a remote resource if we are not fully registered (yet).
 		resourceList = self._retrieveLocalCSRResources(includeRegistrarCSR = True, withRegistreeCSR = True)
 
@@ -763,10 +822,6 @@ class RemoteCSEManager(object):
 				break	# found a matching CSR
 		else: # Not found, so not registered
 			raise NOT_FOUND(L.logDebug(f'Not registered to remote CSE to send request: {id}'))
-			
-		# Assign fallback originator
-		if not originator:
-			originator = CSE.cseCsi
 		
 		# Retrieve the remote resource via its SP-relative ID
 		L.isDebug and L.logDebug(f'Retrieve remote resource id: {id}')
@@ -781,10 +836,117 @@ class RemoteCSEManager(object):
 		_, tpe, _ = pureResource(cast(JSON, res.data))
 		setXPath(cast(JSON, res.data), f'{tpe}/{Constants.attrRemoteID}', id)
 
+		# Cache a copy, because the instantiated resource might be changed by the caller
+		if self.enableRemoteResourceCache:
+			self._cacheRemoteResource(id, originator, cast(JSON, res.data), tpe)
+
 		# Instantiate
 		return resourceFromDict(cast(JSON, res.data))
 
 
+	def _getCachedRemoteResource(self, id:str, originator:str) -> Optional[JSON]:
+		"""	Return a copy of a cached remote resource, if it is cached and not yet expired.
+
+			Args:
+				id: The SP-relative resource ID.
+				originator: The originator that retrieved the resource.
+
+			Return:
+				A copy of the resource's dictionary, or *None*.
+		"""
+		key = (id, originator)
+		with self._remoteResourceCacheLock:
+			if not (entry := self._remoteResourceCache.get(key)):
+				return None
+			if entry[1] <= utcTime():
+				self._removeRemoteResource(key)
+				return None
+			return deepcopy(entry[0])
+
+
+	def _cacheRemoteResource(self, id:str, originator:str, dct:JSON, tpe:str) -> None:
+		"""	Add a retrieved remote resource to the cache.
+
+			The resource expires after the configured time-to-live, or earlier at its *expirationTime*.
+			An already cached resource with a higher *stateTag* is not replaced, because it is the newer one.
+
+			Args:
+				id: The SP-relative resource ID.
+				originator: The originator that retrieved the resource.
+				dct: The resource's dictionary.
+				tpe: The resource's type name, ie. the root key of the dictionary.
+		"""
+		expirationTime = utcTime() + self.remoteResourceCacheTTL
+		if (et := findXPath(dct, f'{tpe}/et')):
+			expirationTime = min(expirationTime, fromAbsRelTimestamp(et))
+		if expirationTime <= utcTime():
+			return
+		st = findXPath(dct, f'{tpe}/st')
+		key = (id, originator)
+		csi, _ = csiFromRelativeAbsoluteUnstructured(id)
+
+		with self._remoteResourceCacheLock:
+			if (entry := self._remoteResourceCache.get(key)) and entry[2] is not None and st is not None and entry[2] > st:
+				return
+			while len(self._remoteResourceCache) >= self.remoteResourceCacheSize and key not in self._remoteResourceCache:
+				self._removeRemoteResource(next(iter(self._remoteResourceCache)))	# remove the oldest entry
+			self._remoteResourceCache[key] = (deepcopy(dct), expirationTime, st)
+			self._remoteResourceCacheIndex.setdefault(csi, set()).add(key)
+
+
+	def _removeRemoteResource(self, key:Tuple[str, str]) -> None:
+		"""	Remove a single cached remote resource and its index entry. The cache lock must be held by the caller.
+
+			Args:
+				key: The cache key of the remote resource.
+		"""
+		if self._remoteResourceCache.pop(key, None) is None:
+			return
+		csi, _ = csiFromRelativeAbsoluteUnstructured(key[0])
+		if (keys := self._remoteResourceCacheIndex.get(csi)):
+			keys.discard(key)
+			if not keys:
+				del self._remoteResourceCacheIndex[csi]
+
+
+	def invalidateRemoteResourceCache(self, id:Optional[str] = None) -> None:
+		"""	Remove cached remote resources.
+
+			Args:
+				id: An SP-relative resource ID or CSE-ID. Only the cached resources of the CSE that hosts this ID are removed. If *None* then all cached remote resources are removed.
+		"""
+		with self._remoteResourceCacheLock:
+			if id is None:
+				self._remoteResourceCache.clear()
+				self._remoteResourceCacheIndex.clear()
+				return
+			csi, _ = csiFromRelativeAbsoluteUnstructured(id)
+			if (keys := self._remoteResourceCacheIndex.pop(csi, None)):
+				L.isDebug and L.logDebug(f'Invalidating {len(keys)} cached remote resource(s) of: {csi}')
+				for key in keys:
+					self._remoteResourceCache.pop(key, None)
+
+
+	def remoteResourcesChanged(self, id:str) -> None:
+		"""	Invalidate the cached remote resources of a remote CSE, also in the other processes.
+
+			This is called when a notification is received from a remote CSE, or when a request that may change
+			a resource is sent to a remote CSE. IDs that don't address a remote CSE are ignored.
+
+			Args:
+				id: An SP-relative or absolute resource ID or originator of the remote CSE.
+		"""
+		if not self.enableRemoteResourceCache:
+			return
+		if isAbsolute(id):	# Convert "//<sp-id>/<csi>/..." to "/<csi>/..."
+			_, ids = csiFromRelativeAbsoluteUnstructured(id)
+			id = '/' + '/'.join(ids[3:])
+		if not isSPRelative(id) or id == CSE.cseCsi or id.startswith(CSE.cseCsiSlash):
+			return
+		self.invalidateRemoteResourceCache(id)
+		CSE.processes.remoteResourcesChanged(id)
+
+
 	def getCSRFromPath(self, id:str) -> Optional[Tuple[Resource, List[str]]]:
 		"""	Try to get a CSR even from a longer path (only the first 2 path elements are relevant). 
 
@@ -820,6 +982,10 @@ class RemoteCSEManager(object):
 			return None, None
 		csi, ids = csiFromRelativeAbsoluteUnstructured(id)
 
+		# Return a copy of an already resolved <CSR>, because the instantiated resource might be changed by the caller
+		if (dct := self._csrCache.get(csi)):
+			return resourceFromDict(deepcopy(dct)), ids
+
 		# Search for a <CSR> that either has the csi attribute set, or that has the looked-for
 		# registree CSE as a descendant CSE.
 
@@ -828,9 +994,20 @@ class RemoteCSEManager(object):
 		except ResponseException as e:
 			registreeCSR = getCSRWithDescendant(f'/{csi}')
 		# L.logWarn(csr)
+
+		if registreeCSR and registreeCSR.ty == ResourceTypes.CSR:
+			self._csrCache[csi] = deepcopy(registreeCSR.dict)
 		return registreeCSR, ids
 
 
+	def invalidateCSRCache(self) -> None:
+		"""	Remove all resolved <CSR> resources from the cache that is used by `getCSRFromPath()`.
+
+			This must be called whenever a <CSR> resource or the list of descendant CSEs changes.
+		"""
+		self._csrCache.clear()
+
+
 	def getRemoteCSEBaseAddress(self, csi:str) -> Optional[str]:
 		"""	Get the SP-relative */csi/ri* resource ID  of a remote CSE from its CSI.
 			The searched for remote CSE must be registered either directly, or
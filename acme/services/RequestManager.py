@@ -10,9 +10,10 @@
 from __future__ import annotations
 from typing import Any, List, Tuple, cast, Dict, Optional, Union
 
-import urllib.parse
+import urllib.parse, heapq, hashlib
 from copy import deepcopy
-from threading import Lock
+from threading import Lock, Condition
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 from ..etc.Types import JSON, BasicType, DesiredIdentifierResultType, FilterOperation, ResourceTypes
 from ..etc.Types import FilterUsage, Operation, RequestCallback, RequestType
@@ -20,10 +21,12 @@ from ..etc.Types import ResponseStatusCode, ResultContentType, RequestStatus, CS
 from ..etc.Types import ResourceTypes, ResponseStatusCode, ResponseType, Result, EventCategory
 from ..etc.Types import CSERequest, ContentSerializationType, RequestResponseList, RequestResponse
 from ..etc.ResponseStatusCodes import ResponseException
+from ..etc.Constants import Constants
 from ..etc.ResponseStatusCodes import BAD_REQUEST, NOT_FOUND, REQUEST_TIMEOUT, RELEASE_VERSION_NOT_SUPPORTED
 from ..etc.ResponseStatusCodes import UNSUPPORTED_MEDIA_TYPE, OPERATION_NOT_ALLOWED, REQUEST_TIMEOUT, TARGET_NOT_REACHABLE
-from ..etc.DateUtils import getResourceDate, fromAbsRelTimestamp, utcTime, waitFor, toISO8601Date, fromDuration
-from ..etc.RequestUtils import requestFromResult, determineSerialization, deserializeData
+from ..etc.ResponseStatusCodes import ORIGINATOR_HAS_NO_PRIVILEGE
+from ..etc.DateUtils import getResourceDate, fromAbsRelTimestamp, utcTime, toISO8601Date, fromDuration
+from ..etc.RequestUtils import requestFromResult, determineSerialization, deserializeData, serializeData, setJSONOptions
 from ..etc.ACMEUtils import isCSERelative, toSPRelative, isValidCSI, isValidAEI, uniqueRI, isAbsolute, isSPRelative
 from ..etc.ACMEUtils import compareIDs, localResourceID, getIDFromPath, getIdFromOriginator
 from ..etc.ACMEUtils import isStructured, structuredPathFromRI
@@ -36,7 +39,9 @@ from ..resources.Resource import Resource
 from ..resources.CSEBase import getCSE
 from ..resources.REQ import REQ
 from ..resources.PCH import PCH
-from ..helpers.BackgroundWorker import BackgroundWorkerPool
+from ..helpers.BackgroundWorker import BackgroundWorkerPool, BackgroundWorker
+from ..helpers.RequestLimiter import RequestLimiter, TokenBucketLimiter
+from ..helpers.RequestTracer import RequestTracer, span, traced, setTraceAttributes
 from ..services.Logging import Logging as L
 
 # Type definition
@@ -52,18 +57,18 @@ TargetDetails = List[ 						#type: ignore[misc]
 				] ]	
 
 
-# This factor determines how often the monitor looks for expired request resources
-expirationCheckFactor = 2.0
-
 class RequestManager(object):
 
 	__slots__ = (
 		'_requestLock',
 		'_requests',
 		'_rqiOriginator',
-		'_pcWorker',
-		'_receivedResponses',
-		'_receivedResponsesLock',
+		'_pollingConditions',
+		'_pollingExpirations',
+		'_pollingExpirationActor',
+		'_pollingExpirationTime',
+		'_responseFutures',
+		'_responseFuturesLock',
 
 
 		'requestHandlers',
@@ -72,6 +77,21 @@ class RequestManager(object):
 		'maxExpirationDelta',
 		'sendToFromInResponses',
 		'enableRequestRecording',
+		'enableRequestLimits',
+		'requestLimitsMaxInFlight',
+		'requestLimitsMaxQueued',
+		'requestLimitsQueueTimeout',
+		'requestLimiter',
+		'enableOriginatorLimits',
+		'originatorLimitsRate',
+		'originatorLimitsBurst',
+		'originatorLimitsRules',
+		'originatorLimiter',
+		'enableTracing',
+		'tracingSampleRate',
+		'tracingSize',
+		'tracingExportFormat',
+		'tracer',
 
 		'_eventRequestReceived',
 		'_eventRequestReceived',
@@ -101,12 +121,15 @@ class RequestManager(object):
 		#
 		#	Structures for pollingChannel requests
 		#
-		self._requestLock = Lock()													# Lock to access the following two dictionaries
+		self._requestLock = Lock()													# Lock to access the following polling structures
 		self._requests:Dict[str, List[ Tuple[CSERequest, RequestType] ] ] = {}		# Dictionary to map request originators to a list of reqeests. Used for handling polling requests.
 		self._rqiOriginator:Dict[str, str] = {}										# Dictionary to map requestIdentifiers to an originator of a request. Used for handling of polling requests.
-		self._pcWorker = BackgroundWorkerPool.newWorker(self.requestExpirationDelta * expirationCheckFactor, self._cleanupPollingRequests, name='pollingChannelExpiration').start()
-		self._receivedResponses:Dict[str, Tuple[Result, str]] = {}
-		self._receivedResponsesLock = Lock()
+		self._pollingConditions:Dict[str, Tuple[Condition, int]] = {}				# Dictionary to map originators to a condition and the number of its waiting pollers
+		self._pollingExpirations:List[Tuple[float, str, str, RequestType]] = []		# Heap of (expiration timestamp, originator, requestIdentifier, request type) of the queued requests
+		self._pollingExpirationActor:BackgroundWorker = None						# Single actor that removes the expired requests
+		self._pollingExpirationTime:float = None									# Timestamp when the actor runs next
+		self._responseFutures:Dict[str, Future] = {}								# Futures for the expected responses to sent requests, by rqi
+		self._responseFuturesLock = Lock()
 
 		# Add a handler when the CSE is reset
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)	# type: ignore
@@ -184,9 +207,9 @@ class RequestManager(object):
 
 
 	def shutdown(self) -> bool:
-		# Stop the PollingChannel Cleanup worker
-		if self._pcWorker:
-			self._pcWorker.stop()
+		# Stop the PollingChannel expiration actor
+		with self._requestLock:
+			self._stopPollingExpiration()
 		L.isInfo and L.log('RequestManager shut down')
 		return True
 
@@ -194,14 +217,15 @@ class RequestManager(object):
 	def restart(self, name:str) -> None:
 		"""	Restart the registrationManager service.
 		"""
-		# Terminate waiting request and pollingQueue actors
+		# Terminate waiting request actors
 		BackgroundWorkerPool.removeWorkers('request_*')
-		BackgroundWorkerPool.removeWorkers('unqueuePolling_*')
 
 		# empty polling channel queues
 		with self._requestLock:
+			self._stopPollingExpiration()
 			self._requests = {}
 			self._rqiOriginator = {}
+			self._pollingExpirations = []
 		L.logDebug('RequestManager restarted')
 	
 
@@ -213,6 +237,32 @@ class RequestManager(object):
 		self.maxExpirationDelta		= Configuration.get('cse.maxExpirationDelta')
 		self.sendToFromInResponses	= Configuration.get('cse.sendToFromInResponses')
 		self.enableRequestRecording	= Configuration.get('cse.operation.requests.enable')
+		self.enableRequestLimits		= Configuration.get('cse.operation.limits.enable')
+		self.requestLimitsMaxInFlight	= Configuration.get('cse.operation.limits.maxInFlight')
+		self.requestLimitsMaxQueued		= Configuration.get('cse.operation.limits.maxQueued')
+		self.requestLimitsQueueTimeout	= Configuration.get('cse.operation.limits.queueTimeout')
+		# A new limiter is created when the configuration changes. Requests that were admitted
+		# by the previous limiter release their slot there.
+		self.requestLimiter = RequestLimiter(self.requestLimitsMaxInFlight,
+											 self.requestLimitsMaxQueued,
+											 self.requestLimitsQueueTimeout) if self.enableRequestLimits else None
+		self.enableOriginatorLimits	= Configuration.get('cse.operation.limits.enableOriginatorLimits')
+		self.originatorLimitsRate	= Configuration.get('cse.operation.limits.originatorRate')
+		self.originatorLimitsBurst	= Configuration.get('cse.operation.limits.originatorBurst')
+		self.originatorLimitsRules	= Configuration.get('cse.operation.limits.originatorRules')
+		self.originatorLimiter = TokenBucketLimiter(self.originatorLimitsRate,
+													self.originatorLimitsBurst,
+													self.originatorLimitsRules) if self.enableOriginatorLimits else None
+		self.enableTracing			= Configuration.get('cse.operation.tracing.enable')
+		self.tracingSampleRate		= Configuration.get('cse.operation.tracing.sampleRate')
+		self.tracingSize			= Configuration.get('cse.operation.tracing.size')
+		self.tracingExportFormat	= Configuration.get('cse.operation.tracing.exportFormat')
+		# A new tracer is created when the configuration changes. Traces that are still active
+		# are finished in the previous tracer.
+		self.tracer = RequestTracer(self.enableTracing,
+									self.tracingSampleRate,
+									self.tracingSize)
+		setJSONOptions(Configuration.get('cse.allowJSONComments'), Configuration.get('cse.enableFastJSONCodec'))
 
 
 	def configUpdate(self, name:str, 
@@ -225,28 +275,98 @@ class RequestManager(object):
 				key: Name of the updated configuration setting.
 				value: New value for the config setting.
 		"""
-		if key not in [ 'cse.flexBlockingPreference', 'cse.requestExpirationDelta', 'cse.maxExpirationDelta', 'cse.operation.requests.enable']:
+		if key not in [ 'cse.flexBlockingPreference', 'cse.requestExpirationDelta', 'cse.maxExpirationDelta', 'cse.operation.requests.enable', 'cse.allowJSONComments', 'cse.enableFastJSONCodec',
+					   'cse.operation.limits.enable', 'cse.operation.limits.maxInFlight', 'cse.operation.limits.maxQueued', 'cse.operation.limits.queueTimeout',
+					   'cse.operation.limits.enableOriginatorLimits', 'cse.operation.limits.originatorRate', 'cse.operation.limits.originatorBurst', 'cse.operation.limits.originatorRules',
+					   'cse.operation.tracing.enable', 'cse.operation.tracing.sampleRate', 'cse.operation.tracing.size', 'cse.operation.tracing.exportFormat' ]:
 			return
 
 		# Configuration values
 		self._assignConfig()
 
-		# restart expiration worker
-		if self._pcWorker:
-			self._pcWorker.restart(self.requestExpirationDelta * expirationCheckFactor)
-
 
 	#########################################################################
 	#
 	# 	Incoming Requests
 	#
 
-	def handleRequest(self, request:Union[CSERequest, JSON]) -> Result:
+	def handleRequest(self, request:Union[CSERequest, JSON], binding:Optional[str] = None) -> Result:
 		"""	Calls the fitting request handler for an operation and let that handle the request.
 
 			Before the request is processed it will be determined whether it is blocking or
 			non-blocking etc.
 
+			Requests that are received by a binding are subject to the request limits. If the
+			CSE is processing too many requests then the request waits for a free slot or is
+			rejected with a *TARGET_NOT_REACHABLE* result. Requests from originators that exceed their
+			request rate are rejected the same way, before any other processing.
+
+			If tracing is enabled then a trace is started for requests that are received by a binding,
+			unless the binding has already started one.
+
+			Args:
+				request: The incoming request.
+				binding: The name of the binding that received the request, or None for internal requests.
+			Return:
+				Request result.
+		"""
+		if binding is None:
+			return self._handleRequest(request)
+
+		trace = self.tracer.startTrace(f'{binding} {request.op.name}' if isinstance(request, CSERequest) else binding)
+		try:
+			result = self._handleLimitedRequest(request, binding)
+			setTraceAttributes(rsc = int(result.rsc))
+			return result
+		finally:
+			self.tracer.finishTrace(trace)
+
+
+	def _handleLimitedRequest(self, request:Union[CSERequest, JSON], binding:str) -> Result:
+		"""	Handle a request that is received by a binding and apply the request and originator limits.
+
+			Args:
+				request: The incoming request.
+				binding: The name of the binding that received the request.
+			Return:
+				Request result.
+		"""
+		if isinstance(request, CSERequest):
+			setTraceAttributes(originator = request.originator, to = request.to)
+
+		if (originatorLimiter := self.originatorLimiter) is not None and isinstance(request, CSERequest):
+			# The resource type is only known for CREATE requests at this point
+			if (retryAfter := originatorLimiter.admit(request.originator,
+													  (request.op, request.ty) if request.op == Operation.CREATE else None,
+													  (request.op, None))) is not None:
+				dbg = f'{binding} request rejected: request rate exceeded for originator: {request.originator}'
+				L.isDebug and L.logDebug(dbg)
+				return Result(rsc = ResponseStatusCode.TARGET_NOT_REACHABLE,
+							  request = request,
+							  dbg = dbg,
+							  retryAfter = retryAfter)
+
+		if (limiter := self.requestLimiter) is None:
+			return self._handleRequest(request)
+
+		with span('request.limits'):
+			reason = limiter.admit(binding, cast(CSERequest, request)._rqetUTCts)
+		if reason is not None:
+			dbg = f'{binding} request rejected: {reason}'
+			L.isDebug and L.logDebug(dbg)
+			return Result(rsc = ResponseStatusCode.TARGET_NOT_REACHABLE, 
+						  request = cast(CSERequest, request), 
+						  dbg = dbg,
+						  retryAfter = limiter.queueTimeout)
+		try:
+			return self._handleRequest(request)
+		finally:
+			limiter.release(binding)
+
+
+	def _handleRequest(self, request:Union[CSERequest, JSON]) -> Result:
+		"""	Handle a request without applying the request limits.
+
 			Args:
 				request: The incoming request.
 			Return:
@@ -279,7 +399,8 @@ class RequestManager(object):
 
 		# Call the appropriate request function
 		try:
-			res = self.requestHandlers[request.op].ownRequest(request)
+			with span('request.handle'):
+				res = self.requestHandlers[request.op].ownRequest(request)
 		except ResponseException as e:
 			res = Result(rsc = e.rsc, dbg = e.dbg, request = e.data)
 
@@ -289,6 +410,157 @@ class RequestManager(object):
 		return res
 
 
+	def handleBatchRequest(self, requests:list[JSON],
+								 contentType:ContentSerializationType,
+								 originator:str,
+								 binding:str) -> list[JSON]:
+		"""	Handle a batch of request primitives that was received in a single request of a binding.
+
+			Each request primitive is validated and handled one after the other, like a single request that is
+			received by the *binding*. This means that the request and originator limits apply to each request
+			primitive. Request primitives without a *from* parameter are sent on behalf of the batch's originator,
+			other originators are not allowed.
+
+			Consecutive CREATE requests to the same target share a single retrieval of the parent resource.
+
+			Args:
+				requests: The request primitives.
+				contentType: The content serialization of the batch.
+				originator: The originator of the batch.
+				binding: The name of the binding that received the batch.
+
+			Return:
+				The response primitives, in the same order as the request primitives.
+		"""
+		responses:list[JSON] = []
+		parentTarget:Optional[str] = None		# Target and parent resource of the previous successful CREATE request
+		parentResource:Optional[Resource] = None
+
+		for rqp in requests:
+			request = CSERequest(ct = contentType)
+			try:
+				if not isinstance(rqp, dict):
+					raise BAD_REQUEST(L.logDebug('request primitive in batch must be an object'))
+				request.originalRequest = rqp
+				request.pc = rqp.get('pc')
+				if rqp.setdefault('fr', originator) != originator:
+					raise ORIGINATOR_HAS_NO_PRIVILEGE(L.logDebug(f'originator of request primitive: {rqp["fr"]} does not match the batch originator: {originator}'))
+				self.fillAndValidateCSERequest(request)
+				if request.requestType == RequestType.RESPONSE:
+					raise BAD_REQUEST(L.logDebug('response primitives are not allowed in a batch'))
+
+				# Reuse the parent resource of the previous CREATE request, unless it has been changed in the meantime by another request
+				if request.op == Operation.CREATE and request.to == parentTarget and parentResource and self._isUnchanged(parentResource):
+					request._parentResource = parentResource
+				result = self.handleRequest(request, binding)
+				if request.inm is not None or request.ims is not None:
+					self.applyConditionalRetrieve(request, result, contentType)
+
+			except ResponseException as e:
+				result = Result(rsc = e.rsc, dbg = e.dbg, request = request)
+				if request.to:
+					self.recordRequest(request, result)
+			except Exception as e:
+				result = Result.exceptionToResult(e)
+
+			# Only keep the parent resource as long as CREATE requests to the same target succeed
+			if request.op == Operation.CREATE and result.rsc == ResponseStatusCode.CREATED and isinstance(result.resource, Resource):
+				if request.to != parentTarget or not parentResource:
+					try:
+						parentTarget, parentResource = request.to, CSE.dispatcher.retrieveLocalResource(result.resource.pi)
+					except ResponseException:
+						parentTarget, parentResource = None, None
+			else:
+				parentTarget, parentResource = None, None
+
+			result.prepareResultFromRequest(request)
+			responses.append(cast(JSON, requestFromResult(result, isResponse = True).data))
+
+		return responses
+
+
+	def _isUnchanged(self, resource:Resource) -> bool:
+		"""	Check whether a resource is still the same as the one in the storage, ie. that it has
+			not been updated or deleted by another request. Only the raw stored resource is retrieved
+			for this, without creating a resource object.
+
+			Args:
+				resource: The resource to check.
+
+			Return:
+				True if the stored resource has the same *lastModifiedTime* and *stateTag* as the given resource.
+		"""
+		try:
+			stored = CSE.storage.retrieveResourceRaw(resource.ri)
+		except ResponseException:
+			return False
+		return stored.get('lt') == resource.lt and stored.get('st') == resource.st
+
+
+	def applyConditionalRetrieve(self, request:CSERequest, 
+									   result:Result, 
+									   ct:ContentSerializationType) -> None:
+		"""	Add the validators of a retrieved resource to a RETRIEVE result, and evaluate the
+			conditions of a conditional RETRIEVE request.
+
+			Only results of RETRIEVE requests with *rcn=attributes* that return a single resource
+			get validators. The <CSEBase> is excluded because its representation changes with
+			every RETRIEVE. The entity tag is a hash of the stored representation of the resource,
+			and of the serialization and release version of the response. It therefore also changes
+			when the CSE updates attributes like *cni* without changing *lt* or *st*. It is 8 bytes
+			long, so that it also fits into a CoAP *ETag* option. The last modification time is the
+			later one of *lt* and the time the resource was last written to the database.
+
+			If the request's *ifNoneMatch* parameter contains the entity tag, or if the request has no
+			*ifNoneMatch* parameter and the resource was not modified after the *ifModifiedSince*
+			timestamp, then the result is marked as *notModified* and its resource is removed.
+
+			Args:
+				request: The RETRIEVE request.
+				result: The result of the request. It is updated in place.
+				ct: The serialization of the response.
+		"""
+		if (request.op != Operation.RETRIEVE or 
+			result.rsc != ResponseStatusCode.OK or
+			request.rcn not in (None, ResultContentType.attributes) or
+			not isinstance(resource := result.resource, Resource) or
+			resource.ty == ResourceTypes.CSEBase or
+			not (lt := resource.lt)):
+			return
+
+		representation = cast(str, serializeData(resource.dict, ContentSerializationType.JSON))
+		result.etag = hashlib.sha1(f'{int(ct)}|{request.rvi}|{representation}'.encode('utf-8')).hexdigest()[:16]
+		result.lastModified = max(fromAbsRelTimestamp(lt), resource.attribute(Constants.attrLastWritten, 0.0))
+
+		if request.inm is not None:
+			result.notModified = '*' in request.inm or result.etag in request.inm
+		elif request._imsUTCts is not None:
+			result.notModified = result.lastModified <= request._imsUTCts
+		if result.notModified:
+			L.isDebug and L.logDebug(f'Resource not modified: {resource.ri}')
+			result.resource = None
+
+
+	def getRequestLimitStats(self) -> Dict[str, Dict[str, int]]:
+		"""	Return the statistics of the request limits.
+
+			Return:
+				Dictionary that maps binding names to the number of requests in process, waiting, admitted, rejected etc.
+				The dictionary is empty if request limits are disabled.
+		"""
+		return self.requestLimiter.getStats() if self.requestLimiter else {}
+
+
+	def getOriginatorLimitStats(self) -> Dict[str, int]:
+		"""	Return the statistics of the originator rate limits.
+
+			Return:
+				Dictionary with the number of admitted and rejected requests, and the number of originator buckets.
+				The dictionary is empty if originator limits are disabled.
+		"""
+		return self.originatorLimiter.getStats() if self.originatorLimiter else {}
+
+
 	def processRequest(self, request:CSERequest, originator:str, id:str) -> Result:
 		"""	Calls the fitting request process handler for an operation and call it.
 
@@ -713,15 +985,24 @@ class RequestManager(object):
 	#	All the requests for all PCU are stored in a single dictionary:
 	#		originator : [ request* ]
 	#
+	#	Pollers wait on a condition per originator that is notified when a request
+	#	for that originator is queued. The expiration timestamps of all queued requests
+	#	are kept in a heap, and a single actor removes the expired requests.
+	#
 
 	def hasPollingRequest(self, originator:str, requestID:str = None, reqType:RequestType = RequestType.REQUEST) -> bool:
 		"""	Check whether there is a pending request or response pending for the tuple (*originator*, *requestID*).
-			This method is also used as a callback for periodic check whether a request or response is queued.
 			If *requestID* is not *None* then the check is for a request with that ID. 
 			Otherwise, *True* will be returned if there is any request for the *originator*.
 		"""
 		with self._requestLock:
-			return (lst := self._requests.get(originator)) is not None and any(	 (r, t) for r,t in lst if (requestID is None or r.rqi == requestID) and (t == reqType) )
+			return self._hasPollingRequest(originator, requestID, reqType)
+
+
+	def _hasPollingRequest(self, originator:str, requestID:str, reqType:RequestType) -> bool:
+		"""	Check whether there is a matching request or response pending. The caller must hold the *_requestLock*.
+		"""
+		return (lst := self._requests.get(originator)) is not None and any(	 (r, t) for r,t in lst if (requestID is None or r.rqi == requestID) and (t == reqType) )
 
 	
 	def queuePollingRequest(self, request:CSERequest, reqType:RequestType=RequestType.REQUEST) -> None:
@@ -766,12 +1047,14 @@ class RequestManager(object):
 
 			if reqType == RequestType.RESPONSE:
 				del self._rqiOriginator[request.rqi]
+			
+			# Remove the request after the timeout (+1 second delay)
+			heapq.heappush(self._pollingExpirations, (request._rqetUTCts + 1.0, originator, request.rqi, reqType))
+			self._schedulePollingExpiration()
 
-		
-		# Start an actor to remove the request after the timeout		
-		BackgroundWorkerPool.newActor(	lambda: self.unqueuePollingRequest(originator, request.rqi, reqType), 
-										delay = request._rqetUTCts - utcTime() + 1.0,	# +1 second delay 
-										name = f'unqueuePolling_{request.rqi}-{reqType}').start()
+			# Wake up the pollers waiting for this originator
+			if (entry := self._pollingConditions.get(originator)):
+				entry[0].notify_all()
 	
 
 	def unqueuePollingRequest(self, originator:str, requestID:str, reqType:RequestType) -> CSERequest:
@@ -779,26 +1062,31 @@ class RequestManager(object):
 		"""
 		L.isDebug and L.logDebug(f'Unqueuing polling request, originator: {originator}, requestID: {requestID}')
 		with self._requestLock:
-			resultRequest = None
-			if lst := self._requests.get(originator):
-				requests = []
-				
-				# extract the queried request or the first one found, and build a new list for the remaining
-				# Building a new list is faster than extracting and removing elements in place
-				for r,t in lst:	
-					if (requestID is None or requestID == r.rqi) and t == reqType and not resultRequest:	# Either get an uspecified reuqest, or a specific one
-						resultRequest = r
-					else:
-						requests.append( (r, t) )
-				if requests:
-					self._requests[originator] = requests
+			return self._unqueuePollingRequest(originator, requestID, reqType)
+
+
+	def _unqueuePollingRequest(self, originator:str, requestID:str, reqType:RequestType) -> CSERequest:
+		"""	Remove a request for the *originator* and with the *requestID* from the polling request queue. 
+			The caller must hold the *_requestLock*.
+
+			Its entry in the expiration heap is not removed. It is just ignored when it expires.
+		"""
+		resultRequest = None
+		if lst := self._requests.get(originator):
+			requests = []
+			
+			# extract the queried request or the first one found, and build a new list for the remaining
+			# Building a new list is faster than extracting and removing elements in place
+			for r,t in lst:	
+				if (requestID is None or requestID == r.rqi) and t == reqType and not resultRequest:	# Either get an uspecified reuqest, or a specific one
+					resultRequest = r
 				else:
-					del self._requests[originator]
-				
-			if resultRequest:
-				BackgroundWorkerPool.stopWorkers(f'unqueuePolling_{resultRequest.rqi}-{reqType}')
-					
-			return resultRequest
+					requests.append( (r, t) )
+			if requests:
+				self._requests[originator] = requests
+			else:
+				del self._requests[originator]
+		return resultRequest
 
 
 	def waitForPollingRequest(self, originator:str, 
@@ -806,9 +1094,9 @@ class RequestManager(object):
 									timeout:float, 
 									reqType:Optional[RequestType] = RequestType.REQUEST, 
 									aggregate:Optional[bool] = False) -> Result:
-		"""	Busy waiting for a polling request.
+		"""	Wait for a polling request.
 			The function returns when there is a new or pending matching request in the queue, or when the
-			*timeout* (in seconds) is met.
+			*timeout* (in seconds) is met. The waiting thread is woken up when a request for the *originator* is queued.
 			
 			Args:
 				originator: Request originator to match.
@@ -821,27 +1109,91 @@ class RequestManager(object):
 		"""
 		L.isDebug and L.logDebug(f'Waiting for: {reqType} for originator: {originator}, requestID: {requestID}')
 
-		if waitFor(timeout, lambda:self.hasPollingRequest(originator, requestID, reqType)):	# Wait until timeout, or the request of the correct type was found
-			L.isDebug and L.logDebug(f'Received {reqType} request for originator: {originator}, requestID: {requestID}, aggregate: {aggregate}')
-
-			if aggregate:
-				lst:list[CSERequest] = []
-				while True:
-					if req := self.unqueuePollingRequest(originator, requestID, reqType):
-						lst.append(req)
-						continue
-					# if fall through then there is no further request available.
-					# build the aggregated request
-					agrp = { 'm2m:agrp' : [ requestFromResult(Result(request = each)).data for each in lst ] }
-					return Result(resource = agrp, rsc = ResponseStatusCode.OK)
-				
-			else:
-				if req := self.unqueuePollingRequest(originator, requestID, reqType):
-					return Result(request = req, rsc = req.rsc)
-			# fall-through
+		endTime = utcTime() + timeout
+		with self._requestLock:
+
+			# Get the condition for the originator, or create a new one, and register as a waiter
+			condition, waiters = self._pollingConditions.get(originator) or (Condition(self._requestLock), 0)
+			self._pollingConditions[originator] = (condition, waiters + 1)
+			try:
+				# Wait until timeout, or the request of the correct type was found. 
+				# The request is taken from the queue while still holding the lock, so no other poller can take it in between.
+				if condition.wait_for(lambda: self._hasPollingRequest(originator, requestID, reqType), endTime - utcTime()):
+					L.isDebug and L.logDebug(f'Received {reqType} request for originator: {originator}, requestID: {requestID}, aggregate: {aggregate}')
+
+					if aggregate:
+						lst:list[CSERequest] = []
+						while req := self._unqueuePollingRequest(originator, requestID, reqType):
+							lst.append(req)
+						# if fall through then there is no further request available.
+						# build the aggregated request
+						agrp = { 'm2m:agrp' : [ requestFromResult(Result(request = each)).data for each in lst ] }
+						return Result(resource = agrp, rsc = ResponseStatusCode.OK)
+					
+					else:
+						req = self._unqueuePollingRequest(originator, requestID, reqType)
+						return Result(request = req, rsc = req.rsc)
+			finally:
+				# Unregister as a waiter, and remove the condition when there are no more waiters
+				condition, waiters = self._pollingConditions[originator]
+				if waiters > 1:
+					self._pollingConditions[originator] = (condition, waiters - 1)
+				else:
+					del self._pollingConditions[originator]
+
 		raise REQUEST_TIMEOUT(L.logWarn(f'Timeout while waiting for: {reqType} for originator: {originator}, requestID: {requestID}'))
 
 
+	def _schedulePollingExpiration(self) -> None:
+		"""	(Re)Schedule the expiration actor for the earliest expiration in the expiration heap,
+			unless it is already scheduled at or before that time. The caller must hold the *_requestLock*.
+		"""
+		if not self._pollingExpirations:
+			return
+		ts = self._pollingExpirations[0][0]
+		if self._pollingExpirationActor and self._pollingExpirationTime <= ts:
+			return
+		self._stopPollingExpiration()
+		self._pollingExpirationTime = ts
+		self._pollingExpirationActor = BackgroundWorkerPool.newActor(self._expirePollingRequests, 
+																	 at = ts,
+																	 name = 'pollingChannelExpiration').start()
+	
+
+	def _stopPollingExpiration(self) -> None:
+		"""	Stop the expiration actor. The caller must hold the *_requestLock*.
+		"""
+		if self._pollingExpirationActor:
+			self._pollingExpirationActor.stop()
+			self._pollingExpirationActor = None
+			self._pollingExpirationTime = None
+
+
+	def _expirePollingRequests(self, _worker:BackgroundWorker) -> bool:
+		"""	Remove all the expired requests from the polling request queue, and schedule
+			the actor again for the next expiration.
+
+			Args:
+				_worker: The running actor.
+		"""
+		with self._requestLock:
+			if _worker is not self._pollingExpirationActor:	# Another actor has been scheduled in the meantime
+				return False
+			self._pollingExpirationActor = None
+			self._pollingExpirationTime = None
+
+			now = utcTime()
+			while self._pollingExpirations and self._pollingExpirations[0][0] <= now:
+				_, originator, rqi, reqType = heapq.heappop(self._pollingExpirations)
+				if self._unqueuePollingRequest(originator, rqi, reqType):	# might have been retrieved already
+					L.isDebug and L.logDebug(f'Removed expired polling request, originator: {originator}, requestID: {rqi}')
+					# Also remove the requestID - originator mapping
+					if reqType == RequestType.REQUEST:
+						self._rqiOriginator.pop(rqi, None)
+			self._schedulePollingExpiration()
+		return False
+
+
 	def queueRequestForPCH(	self, 
 							operation:Operation,
 							pchOriginator:str,
@@ -914,53 +1266,58 @@ class RequestManager(object):
 		return Result(rsc = response.request.rsc, request = response.request)
 
 
-	def _cleanupPollingRequests(self) -> bool:
-		with self._requestLock:
-			# Search all entries in the queue and remove those that have expired in the past
-			# Remove those requests also from 
-			now = utcTime()
-			for originator, requests in list(self._requests.items()):
-				nList = []
-				for tup in list(requests):				# Test all requests for expiration
-					if tup[0]._rqetUTCts > now:	# not expired
-						nList.append(tup)				# add the request tupple again to the list if it hasnt expired
-					else:
-						L.isDebug and L.logDebug(f'Remove old polling request: {tup}')
-						# Also remove the requestID - originator mapping
-						if (rqi := tup[0].rqi) in self._rqiOriginator:
-							del self._rqiOriginator[rqi]
-				if len(nList) > 0:	# Add the lists again if there still more requests for this originator
-					self._requests[originator] = nList
-				else:				# remove the entry
-					del self._requests[originator]
-		return True
-					
-	
 	###########################################################################
 	#
 	#	Request/Response async sequence helpers for polling asynch responses
 
 
+	def expectResponse(self, rqi:str) -> None:
+		"""	Register that a response for the requestIdentifier *rqi* is expected. This must be called
+			before the request is sent, so that a fast response is not missed. The response is then
+			retrieved with `waitForResponse()`.
+
+			Args:
+				rqi: The request identifier of the sent request.
+		"""
+		with self._responseFuturesLock:
+			if rqi not in self._responseFutures:
+				self._responseFutures[rqi] = Future()
+
+
+	def cancelResponse(self, rqi:str) -> None:
+		"""	Remove the expectation of a response for the requestIdentifier *rqi*, e.g. when sending the request failed.
+			A response that arrives later is ignored.
+
+			Args:
+				rqi: The request identifier of the sent request.
+		"""
+		with self._responseFuturesLock:
+			self._responseFutures.pop(rqi, None)
+
+
 	def waitForResponse(self, rqi:str, timeOut:float) -> Tuple[ Optional[Result], Optional[str] ]:
 		"""	Wait for a response with a specific requestIdentifier *rqi*.
+			The waiting thread is woken up by `addResponse()` when the response arrives.
 
-		"""
-		resp = None
-		info = None
-
-		def _receivedResponse() -> bool:
-			nonlocal resp, info
-			with self._receivedResponsesLock:
-				if not self._receivedResponses:
-					return False
-				if rqi in self._receivedResponses:
-					resp, info = self._receivedResponses.pop(rqi)	# return the response (in a Result object), and remove it from the dict.
-					return True
-			return False
+			Args:
+				rqi: The request identifier of the expected response. It should have been registered with `expectResponse()` before.
+				timeOut: Time in seconds to wait at most for the response.
 			
-		if not waitFor(timeOut, _receivedResponse):
+			Return:
+				Tuple of the response (in a Result object) and the additional info, or a *TARGET_NOT_REACHABLE* Result and *None* in case of a timeout.
+		"""
+		with self._responseFuturesLock:
+			if not (future := self._responseFutures.get(rqi)):
+				self._responseFutures[rqi] = (future := Future())
+		
+		try:
+			resp, info = future.result(max(timeOut, 0.0))
+		except FutureTimeoutError:
 			return Result(rsc = ResponseStatusCode.TARGET_NOT_REACHABLE, 
 						  dbg = 'Target not reachable or timeout'), None
+		finally:
+			self.cancelResponse(rqi)
+
 		# resp.data = resp.request.pc					# Add the pc to the data, since components excepct this. 
 													# TODO perhaps unify the use of response values throughout the CSE
 		CSE.event.responseReceived(resp.request)	# type:ignore [attr-defined]
@@ -968,13 +1325,17 @@ class RequestManager(object):
 
 
 	def addResponse(self, response:Result, info:Optional[str] = None) -> None:
-		"""	Add a response and topic to the response dictionary. The key is the *rqi* (requestIdentifier) of
-			the response. 
+		"""	Hand a response and topic to the thread that waits for it. The key is the *rqi* (requestIdentifier) of
+			the response. Responses that are not expected, e.g. because they arrived after the timeout
+			or were received by another CSE instance, are ignored.
 		"""
 		if (rqi := response.request.rqi):
-			L.isDebug and L.logDebug(f'Adding response for rqi: {rqi}')
-			with self._receivedResponsesLock:
-				self._receivedResponses[rqi] = (response, info)
+			with self._responseFuturesLock:
+				if (future := self._responseFutures.get(rqi)) and not future.done():
+					L.isDebug and L.logDebug(f'Adding response for rqi: {rqi}')
+					future.set_result((response, info))
+					return
+			L.isDebug and L.logDebug(f'Ignoring unexpected response for rqi: {rqi}')
 
 
 	###########################################################################
@@ -1001,6 +1362,10 @@ class RequestManager(object):
 		except ResponseException as e:
 			res = [ RequestResponse(request, Result(rsc = e.rsc, dbg = e.dbg, request = e.data)) ]
 
+		# Cached resources of a remote target CSE might have been changed by the request
+		if request.op in [ Operation.CREATE, Operation.UPDATE, Operation.DELETE ] and request.to:
+			CSE.remote.remoteResourcesChanged(request.to)
+
 		# Add to requests database
 		for r in res:
 			self.recordRequest(r.request, r.result)
@@ -1123,6 +1488,7 @@ class RequestManager(object):
 		return dct
 
 
+	@traced('request.validate')
 	def fillAndValidateCSERequest(self, cseRequest:Union[CSERequest, JSON], 
 			       						isResponse:Optional[bool] = False) -> CSERequest:
 		"""	Fill a *cseRequest* object according to its request structure in the *Result.request* attribute.
@@ -1146,7 +1512,7 @@ class RequestManager(object):
 				if greedy:
 					del dct[attribute]
 				try:
-					_, newValue = CSE.validator.validateAttribute(attribute, value, attributeType, rtype = ResourceTypes.REQRESP)
+					newValue = getValidator(attribute, attributeType)(value)
 				except ResponseException as e:
 					#L.inspect(e)
 					e.dbg = f'attribute: {attribute}, value: {value} : {e.dbg}'
@@ -1157,9 +1523,10 @@ class RequestManager(object):
 				# ATTN DON'T remove this, because this is different from validation
 				if attributeType == BasicType.list and checkSubType:
 					newValueList = []
+					validator = getValidator(attribute)
 					for v in newValue:
 						try:
-							_, _nv = CSE.validator.validateAttribute(attribute, v, rtype = ResourceTypes.REQRESP)
+							_nv = validator(v)
 						except ResponseException as e:
 							raise BAD_REQUEST(f'attribute: {attribute}, value: {value} : {e.dbg}', data = cseRequest)
 						newValueList.append(_nv) #type: ignore [index]
@@ -1168,6 +1535,8 @@ class RequestManager(object):
 				return newValue
 			return default
 
+		getValidator = CSE.validator.getRequestParameterValidator	# compiled validators, see Validator.compileRequestParameterValidators()
+
 		if isinstance(cseRequest, dict):
 			cseRequest = CSERequest(originalRequest = cseRequest, pc = cseRequest.get('pc'))
 
@@ -1447,6 +1816,15 @@ class RequestManager(object):
 					cseRequest._ma = fromDuration(ma)
 				except Exception as e:
 					raise BAD_REQUEST(L.logDebug('Wrong format for ma'), data = cseRequest)
+
+			# inm, ims - conditional RETRIEVE (ACME specific)
+			if (inm := gget(cseRequest.originalRequest, 'inm', greedy = False)) is not None:
+				cseRequest.inm = inm
+			if (ims := gget(cseRequest.originalRequest, 'ims', greedy = False)):
+				if (_ts := fromAbsRelTimestamp(ims)) == 0.0:
+					raise BAD_REQUEST(L.logDebug('error in provided ifModifiedSince timestamp'), data = cseRequest)
+				cseRequest.ims = ims
+				cseRequest._imsUTCts = _ts
 				
 		# end of try..except
 		except ValueError as e:
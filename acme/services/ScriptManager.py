@@ -67,13 +67,13 @@ _storageTypes = (SType.tString, SType.tNumber, SType.tBool, SType.tJson, SType.t
 """ Allowed types to put into storage. """
 
 _httpMethods = {
-	'get':		requests.get,
-	'post':		requests.post,
-	'put':		requests.put,
-	'delete':	requests.delete,
-	'patch':	requests.patch,
+	'get':		'GET',
+	'post':		'POST',
+	'put':		'PUT',
+	'delete':	'DELETE',
+	'patch':	'PATCH',
 }
-"""	Internal mapping between http methods and function callbacks. """
+"""	Internal mapping between script http operations and http methods. """
 
 
 
@@ -634,11 +634,12 @@ class ACMEPContext(PContext):
 
 		# send http request
 		try:
-			response = _method(_url, 
-							  data = _body,
-							  headers = _headers, 
-							  verify = CSE.security.verifyCertificateHttp,
-							  timeout = CSE.httpServer.requestTimeout)		# type: ignore[operator, call-arg]
+			response = CSE.httpServer.sendRequest(_method,
+												  _url, 
+												  data = _body,
+												  headers = _headers, 
+												  verify = CSE.security.verifyCertificateHttp,
+												  timeout = CSE.httpServer.requestTimeout)
 		except requests.exceptions.ConnectionError:
 			pcontext.variables['response.status'] = SSymbol()	# nil
 			return pcontext.setResult(SSymbol())
@@ -1623,8 +1624,9 @@ class ScriptManager(object):
 				Boolean, always *True*.
 		"""
 
-		# Look for the shutdown script(s) and run them. 
-		self.runEventScripts(_metaOnShutdown)
+		# Look for the shutdown script(s) and run them. Only the owner process runs them in multi-process mode.
+		if not CSE.processes.isWorker:
+			self.runEventScripts(_metaOnShutdown)
 
 		# Stop the monitors
 		if self.scriptUpdatesMonitor:
@@ -1690,6 +1692,10 @@ class ScriptManager(object):
 		if self.scriptMonitorInterval > 0.0:
 			self.scriptUpdatesMonitor.start()
 
+		# Scheduled and startup scripts are only run by the owner process in multi-process mode
+		if CSE.processes.isWorker:
+			return
+
 		# Add a worker to check scheduled script, fixed interval of 1 second
 		self.scriptCronWorker = BackgroundWorkerPool.newWorker(1, 
 							 								   self.cronMonitor, 
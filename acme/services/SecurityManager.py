@@ -10,14 +10,17 @@
 
 
 from __future__ import annotations
-from typing import List, cast, Optional, Any, Tuple
+from typing import List, cast, Optional, Any, Tuple, Dict, Set, FrozenSet
 
 import ssl
+from threading import Lock
 
 from ..etc.Types import JSON, ResourceTypes, Permission, Result, CSERequest
 from ..etc.ResponseStatusCodes import BAD_REQUEST, ORIGINATOR_HAS_NO_PRIVILEGE, NOT_FOUND, INTERNAL_SERVER_ERROR
 from ..etc.ACMEUtils import isSPRelative, toCSERelative, getIdFromOriginator
+from ..etc.DateUtils import utcTime
 from ..helpers.TextTools import findXPath, simpleMatch
+from ..helpers.RequestTracer import traced
 from ..services import CSE
 from ..services.Configuration import Configuration
 from ..resources.Resource import Resource
@@ -34,6 +37,9 @@ class SecurityManager(object):
 	__slots__ = (
 		'enableACPChecks',
 		'fullAccessAdmin',
+		'enableACPDecisionCache',
+		'acpDecisionCacheSize',
+		'acpDecisionCacheTTL',
 		'useTLSHttp',
 		'verifyCertificateHttp',
 		'tlsVersionHttp',
@@ -53,12 +59,26 @@ class SecurityManager(object):
 		'verifyCertificateWs',
 		'tlsVersionWs',
 		'caCertificateFileWs',
-		'caPrivateKeyFileWs'
+		'caPrivateKeyFileWs',
+
+		'_acpDecisionCache',
+		'_acpDecisionCacheIndex',
+		'_acpDecisionCacheLock',
+		'_acpDecisionCacheGeneration',
 	)
 
 
 	def __init__(self) -> None:
 
+		self._acpDecisionCache:Dict[Tuple[str, FrozenSet[str], Permission, Optional[ResourceTypes]], Tuple[bool, float, Tuple[str, ...]]] = {}
+		""" Cache for access decisions. The key is a tuple of (originator, acpi set, permission, type), the value is a tuple of (decision, expiration timestamp, resource IDs the decision depends on). """
+		self._acpDecisionCacheIndex:Dict[str, Set[Tuple[str, FrozenSet[str], Permission, Optional[ResourceTypes]]]] = {}
+		""" Index of <ACP> and <group> resource IDs to the cached decisions that depend on them. """
+		self._acpDecisionCacheLock = Lock()
+		""" Lock to protect the access decision cache. """
+		self._acpDecisionCacheGeneration = 0
+		""" Counter that is incremented with every invalidation. Decisions that were computed while an invalidation happened are not cached. """
+
 		# Get the configuration settings
 		self._assignConfig()
 		self._readHttpBasicAuthFile()
@@ -88,6 +108,7 @@ class SecurityManager(object):
 		self._assignConfig()
 		self._readHttpBasicAuthFile()
 		self._readHttpTokenAuthFile()
+		self.clearACPDecisionCache()
 		L.logDebug('SecurityManager restarted')
 
 
@@ -97,6 +118,9 @@ class SecurityManager(object):
 
 		self.enableACPChecks 			= Configuration.get('cse.security.enableACPChecks')
 		self.fullAccessAdmin			= Configuration.get('cse.security.fullAccessAdmin')
+		self.enableACPDecisionCache		= Configuration.get('cse.security.enableACPDecisionCache')
+		self.acpDecisionCacheSize		= Configuration.get('cse.security.acpDecisionCacheSize')
+		self.acpDecisionCacheTTL		= Configuration.get('cse.security.acpDecisionCacheTTL')
 
 		# TLS configurations (http)
 		self.useTLSHttp 				= Configuration.get('http.security.useTLS')
@@ -138,6 +162,9 @@ class SecurityManager(object):
 		"""
 		if key not in ( 'cse.security.enableACPChecks', 
 						'cse.security.fullAccessAdmin',
+						'cse.security.enableACPDecisionCache',
+						'cse.security.acpDecisionCacheSize',
+						'cse.security.acpDecisionCacheTTL',
 						'http.security.useTLS',
 						'http.security.verifyCertificate',
 						'http.security.tlsVersion',
@@ -160,11 +187,13 @@ class SecurityManager(object):
 		self._assignConfig()
 		self._readHttpBasicAuthFile()
 		self._readHttpTokenAuthFile()
+		self.clearACPDecisionCache()
 
 
 	###############################################################################################
 
 
+	@traced('security.hasAccess')
 	def hasAccess(self, originator:str, 
 						resource:Resource, 
 						requestedPermission:Permission, 
@@ -287,14 +316,9 @@ class SecurityManager(object):
 				# FALLTHROUGH to the permission checks below
 			
 			else: # handle the permission checks here
-				for a in macp:
-					if not (acp := CSE.dispatcher.retrieveResource(a)):
-						L.isDebug and L.logDebug(f'ACP resource not found: {a}')
-						continue
-					else:
-						if acp.checkPermission(originator, requestedPermission, ty):
-							L.isDebug and L.logDebug('Permission granted')
-							return True
+				if self.checkACPs(originator, macp, requestedPermission, ty):
+					L.isDebug and L.logDebug('Permission granted')
+					return True
 				L.isDebug and L.logDebug('Permission NOT granted')
 				return False
 
@@ -357,28 +381,124 @@ class SecurityManager(object):
 			return False
 
 		# Finally check the acpi
+		if self.checkACPs(originator, acpi, requestedPermission, ty):
+			L.isDebug and L.logDebug('Permission granted')
+			return True
+
+		# no fitting permission identified
+		L.isDebug and L.logDebug(f'Permission NOT granted. Originator: {originator} may not be listed in any of the linked ACPs')
+		return False
+
+
+	def checkACPs(self, originator:str, 
+						acpi:list[str], 
+						requestedPermission:Permission, 
+						ty:Optional[ResourceTypes] = None) -> bool:
+		"""	Check whether any of a list of <ACP> resources grants the requested permission to an originator.
+
+			The decision is cached, if enabled, under a key of the originator, the set of <ACP> resource IDs,
+			the requested permission and the resource type. A cached decision is invalidated when one of
+			the <ACP> resources, or a <group> resource referenced in an *acor* attribute, is updated or deleted
+			(see `invalidateACPDecisions()`), or when it expires. Decisions that depend on remote or
+			missing <ACP> resources, or on *accessControlContexts*, are not cached.
+
+			Args:
+				originator: The originator to check for.
+				acpi: List of <ACP> resource IDs.
+				requestedPermission: The permission to test.
+				ty: Optional resource type. Mandatory for CREATE.
+
+			Return:
+				Boolean indicating access.
+		"""
+		useCache = self.enableACPDecisionCache
+		if useCache:
+			key = (originator, frozenset(acpi), requestedPermission, ty)
+			with self._acpDecisionCacheLock:
+				generation = self._acpDecisionCacheGeneration
+				if (entry := self._acpDecisionCache.get(key)):
+					if entry[1] > utcTime():
+						L.isDebug and L.logDebug(f'Using cached access decision for originator: {originator}')
+						return entry[0]
+					self._removeACPDecision(key)
+
+		result = False
+		cacheable = True
+		dependencies:list[str] = []
 		for a in acpi:
+			if isSPRelative(a) and not a.startswith(CSE.cseCsiSlash):
+				cacheable = False	# remote ACP, updates are not noticed
 			if not (acp := CSE.dispatcher.retrieveResource(a)):
 				L.isDebug and L.logDebug(f'ACP resource not found: {a}')
+				cacheable = False	# The ACP might be created later
 				continue
-			# if checkSelf:	# forced check for self permissions
-			# 	if acp.checkSelfPermission(originator, requestedPermission):
-			# 		L.isDebug and L.logDebug('Permission granted')
-			# 		return True				
-			# else:
-			# 	# L.isWarn and L.logWarn(acp)
-			# 	if acp.checkPermission(originator, requestedPermission, ty):
-			# 		L.isDebug and L.logDebug('Permission granted')
-			# 		return True
-
-			# L.isWarn and L.logWarn(acp)
+			
+			dependencies.append(acp.ri)
+			if acp.ty == ResourceTypes.ACP:
+				for acr in acp['pv/acr']:
+					if acr.get('acco'):
+						cacheable = False	# context-dependent rule
+				for o, t in acp.attribute(ACP._riTyMapping, {}).items():
+					if t == ResourceTypes.GRP:	# decision depends on the group's members
+						dependencies.append(toCSERelative(o) if o.startswith(CSE.cseCsiSlash) else o)
+
 			if acp.checkPermission(originator, requestedPermission, ty):
-				L.isDebug and L.logDebug('Permission granted')
-				return True
+				result = True
+				break
+		
+		if useCache and cacheable:
+			with self._acpDecisionCacheLock:
+				if generation != self._acpDecisionCacheGeneration:
+					L.isDebug and L.logDebug('Access decisions were invalidated meanwhile. Not caching the decision')
+					return result
+				while len(self._acpDecisionCache) >= self.acpDecisionCacheSize:
+					self._removeACPDecision(next(iter(self._acpDecisionCache)))	# remove the oldest entry
+				self._acpDecisionCache[key] = (result, utcTime() + self.acpDecisionCacheTTL, tuple(dependencies))
+				for ri in dependencies:
+					self._acpDecisionCacheIndex.setdefault(ri, set()).add(key)
+		return result
 
-		# no fitting permission identified
-		L.isDebug and L.logDebug(f'Permission NOT granted. Originator: {originator} may not be listed in any of the linked ACPs')
-		return False
+
+	def invalidateACPDecisions(self, ri:str) -> None:
+		"""	Remove all cached access decisions that depend on a resource.
+
+			This is called when an <ACP> or a <group> resource is updated or deleted.
+
+			Args:
+				ri: Resource ID of the <ACP> or <group> resource.
+		"""
+		with self._acpDecisionCacheLock:
+			self._acpDecisionCacheGeneration += 1	# Also invalidate decisions that are currently computed
+			if (keys := self._acpDecisionCacheIndex.pop(ri, None)):
+				L.isDebug and L.logDebug(f'Invalidating {len(keys)} cached access decision(s) for: {ri}')
+				for key in keys:
+					self._removeACPDecision(key)
+
+
+	def clearACPDecisionCache(self) -> None:
+		"""	Remove all cached access decisions.
+		"""
+		with self._acpDecisionCacheLock:
+			self._acpDecisionCacheGeneration += 1
+			self._acpDecisionCache.clear()
+			self._acpDecisionCacheIndex.clear()
+
+
+	def _removeACPDecision(self, key:Tuple[str, FrozenSet[str], Permission, Optional[ResourceTypes]]) -> None:
+		"""	Remove a single cached access decision and its index entries. 
+		
+			The caller must hold the cache lock.
+
+			Args:
+				key: The key of the cached decision.
+		"""
+		if not (entry := self._acpDecisionCache.pop(key, None)):
+			return
+		for ri in entry[2]:
+			if (keys := self._acpDecisionCacheIndex.get(ri)) is not None:
+				keys.discard(key)
+				if not keys:
+					del self._acpDecisionCacheIndex[ri]
 
 
 	def checkAcpiUpdatePermission(self, request:CSERequest, targetResource:Resource, originator:str) -> bool:
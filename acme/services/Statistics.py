@@ -95,6 +95,20 @@ wsSendDeletes		= 'wsSDl'
 """ Attribute name for number of WS SEND DELETE requests. """
 wsSendNotifies		= 'wsSNo'
 """ Attribute name for number of WS SEND NOTIFY requests. """
+httpQueued			= 'htQue'
+""" Attribute name for number of HTTP requests currently waiting to be processed. """
+httpRejected		= 'htRej'
+""" Attribute name for number of HTTP requests rejected because of the request limits. """
+mqttQueued			= 'mqQue'
+""" Attribute name for number of MQTT requests currently waiting to be processed. """
+mqttRejected		= 'mqRej'
+""" Attribute name for number of MQTT requests rejected because of the request limits. """
+wsQueued			= 'wsQue'
+""" Attribute name for number of WS requests currently waiting to be processed. """
+wsRejected			= 'wsRej'
+""" Attribute name for number of WS requests rejected because of the request limits. """
+originatorRejected	= 'orRej'
+""" Attribute name for number of requests rejected because an originator exceeded its request rate. """
 notifications		= 'notif'
 """ Attribute name for number of notifications. """
 logErrors			= 'lgErr'
@@ -108,6 +122,13 @@ cseUpTime			= 'cseUT'
 resourceCount		= 'ctRes'
 """ Attribute name for number of resources in the storage. """
 
+_requestLimitAttributes = {
+	'http':	(httpQueued, httpRejected),
+	'mqtt':	(mqttQueued, mqttRejected),
+	'ws':	(wsQueued, wsRejected),
+}
+""" Mapping of binding names to the attribute names for the request limit statistics. """
+
 # TODO  restartcount, 
 
 StatsT = Dict[str, Union[str, int, float]]
@@ -141,9 +162,11 @@ class Statistics(object):
 
 		if self.statisticsEnabled:
 
-			# Start background worker to handle writing to DB
-			L.isInfo and L.log('Starting statistics DB thread')
-			BackgroundWorkerPool.newWorker(Configuration.get('cse.statistics.writeInterval'), self.statisticsDBWorker, 'statsDBWorker').start()
+			# Start background worker to handle writing to DB. Only the owner process writes the statistics
+			# in multi-process mode
+			if not CSE.processes.isWorker:
+				L.isInfo and L.log('Starting statistics DB thread')
+				BackgroundWorkerPool.newWorker(Configuration.get('cse.statistics.writeInterval'), self.statisticsDBWorker, 'statsDBWorker').start()
 
 			# subscripe vto various events
 			# mypy cannot handle dynamically created attributes
@@ -198,7 +221,7 @@ class Statistics(object):
 			Return:
 				True if shutdown was successful, False otherwise.
 		"""
-		if self.statisticsEnabled:
+		if self.statisticsEnabled and not CSE.processes.isWorker:
 			# Stop the worker
 			L.isInfo and L.log('Stopping statistics DB thread')
 			BackgroundWorkerPool.stopWorkers('statsDBWorker')
@@ -286,6 +309,14 @@ class Statistics(object):
 		s[cseUpTime] = str(datetime.timedelta(seconds=int(utcTime() - int(s[cseStartUpTime]))))
 		s[cseStartUpTime] = toISO8601Date(float(s[cseStartUpTime]))
 		s[resourceCount] = int(s[createdResources]) - int(s[deletedResources])
+
+		# Add the request limit statistics. These are not stored in the database
+		for binding, limitStats in CSE.request.getRequestLimitStats().items():
+			if (attributes := _requestLimitAttributes.get(binding)):
+				s[attributes[0]] = limitStats['queued']
+				s[attributes[1]] = limitStats['rejected'] + limitStats['expired']
+		if (originatorStats := CSE.request.getOriginatorLimitStats()):
+			s[originatorRejected] = originatorStats['rejected']
 		return s
 
 
@@ -24,15 +24,20 @@ from __future__ import annotations
 from typing import Callable, cast, List, Optional, Sequence
 
 import os
+from collections import OrderedDict
+from threading import Lock
 from ..etc.Types import ResourceTypes, JSON, Operation, ResponseStatusCode
 from ..etc.ResponseStatusCodes import NOT_FOUND, INTERNAL_SERVER_ERROR, CONFLICT
 from ..etc.DateUtils import utcTime, fromDuration
+from ..etc.Constants import Constants
 from ..services.Configuration import Configuration
 from ..services import CSE
 from ..resources.Resource import Resource
 from ..resources.ACTR import ACTR
 from ..resources.SCH import SCH
 from ..resources.Factory import resourceFromDict
+from ..helpers.RequestTracer import traced
+from ..helpers.ThreadSafeCounter import ThreadSafeCounter
 from ..services.Logging import Logging as L
 
 from .database.DBBinding import DBBinding
@@ -73,6 +78,12 @@ class Storage(object):
 	__slots__ = (
 		'db',
 		'maxRequests',
+		'identifierCacheSize',
+		'_srnByRI',
+		'_riBySrn',
+		'_identifierCacheLock',
+		'_identifierCacheGeneration',
+		'_writeGeneration',
 	)
 	""" Define slots for instance variables. """
 
@@ -86,6 +97,24 @@ class Storage(object):
 		self.maxRequests = Configuration.get('cse.operation.requests.size') 
 		""" Maximum number of requests to store. """	
 
+		self.identifierCacheSize = Configuration.get('database.identifierCacheSize')
+		""" Maximum number of cached identifier mappings. 0 disables the cache. """
+
+		self._srnByRI:OrderedDict[str, str] = OrderedDict()
+		""" Identifier cache: ri -> srn, in least recently used order. """
+
+		self._riBySrn:dict[str, str] = {}
+		""" Identifier cache: srn -> ri. """
+
+		self._identifierCacheLock = Lock()
+		""" Lock for the identifier cache. """
+
+		self._identifierCacheGeneration = 0
+		""" Incremented whenever mappings are removed from the identifier cache. """
+
+		self._writeGeneration = ThreadSafeCounter()
+		""" Incremented after every resource is created, updated or deleted. See `writeGeneration()`. """
+
 		self.db:DBBinding = None
 		""" The database object. """
 	
@@ -129,8 +158,8 @@ class Storage(object):
 		dbReset = Configuration.get('database.resetOnStartup') # Indicator that the database should be reset or cleared during start-up. """
 		
 
-		# Reset dbs?
-		if dbReset:
+		# Reset dbs? Worker processes never reset the database shared with the owner process
+		if dbReset and not CSE.processes.isWorker:
 			self.backupDB()	# In this case do a backup *before* removing everything.
 			self.purge()
 
@@ -163,11 +192,31 @@ class Storage(object):
 	def purge(self) -> None:
 		"""	Reset and clear the databases.
 		"""
+		self.clearIdentifierCache()
 		try:
 			self.db.purgeDB()
 		except Exception as e:
 			L.logErr(f'Exception during purge: {e}', exc=e)
 			quit()
+		self._writeGeneration.increment()
+
+
+	def writeGeneration(self) -> int:
+		"""	Return the current write generation. It is incremented after every resource is
+			created, updated or deleted. A read that starts after a write has finished therefore sees a
+			different generation than a read that started before.
+
+			Return:
+				The write generation.
+		"""
+		return self._writeGeneration.value()
+
+
+	def advanceWriteGeneration(self) -> None:
+		"""	Increment the write generation for a write that was done outside of this storage instance,
+			e.g. by another CSE process that shares the database.
+		"""
+		self._writeGeneration.increment()
 
 
 	def _validateDB(self) -> bool:
@@ -221,6 +270,7 @@ class Storage(object):
 	##	Resources
 	##
 
+	@traced('storage.create')
 	def createResource(self, resource:Resource, overwrite:Optional[bool] = True) -> None:
 		"""	Create a new resource in the database.
 		
@@ -235,6 +285,7 @@ class Storage(object):
 		_pi = resource.pi
 		_ty = resource.ty
 		_srn = resource.getSrn()
+		resource.dict[Constants.attrLastWritten] = utcTime()
 		
 		if overwrite:
 			L.isDebug and L.logDebug('Resource enforced overwrite')
@@ -257,6 +308,7 @@ class Storage(object):
 			  'ri' : _ri 
 			}, 
 			_ri, _srn)	# type:ignore[arg-type]
+		self._cacheIdentifier(_ri, _srn)
 
 		# Add record to childResources db
 		self.db.upsertChildResource(
@@ -265,6 +317,8 @@ class Storage(object):
 			  'ty' : _ty,
 			  'ch' : [] 
 			}, _ri)
+		self._writeGeneration.increment()
+		CSE.processes.resourceChanged(resource)
 
 
 	def hasResource(self, ri:Optional[str] = None, srn:Optional[str] = None) -> bool:
@@ -282,6 +336,7 @@ class Storage(object):
 		return (ri is not None and self.db.hasResource(ri = ri)) or (srn is not None and self.db.hasResource(srn = srn))
 
 
+	@traced('storage.retrieve')
 	def retrieveResource(self,	ri:Optional[str] = None, 
 								csi:Optional[str] = None,
 								srn:Optional[str] = None, 
@@ -312,7 +367,8 @@ class Storage(object):
 		elif srn:	# get a resource by its structured rn
 			# L.logDebug(f'Retrieving resource srn: {srn}')
 			# get the ri via the srn from the identifers table
-			resources = self.db.searchResources(srn = srn)
+			if (_ri := self.resourceIDFromStructuredPath(srn)):
+				resources = self.db.searchResources(ri = _ri)
 
 		elif csi:	# get the CSE by its csi
 			# L.logDebug(f'Retrieving resource csi: {csi}')
@@ -330,6 +386,42 @@ class Storage(object):
 		raise INTERNAL_SERVER_ERROR('database inconsistency')
 
 
+	def retrieveResources(self, ris:Optional[list[str]] = None, 
+								srns:Optional[list[str]] = None) -> list[Resource]:
+		"""	Retrieve multiple resources by their resource IDs or structured resource names in a single database lookup.
+
+			Only one of the parameters *ris* or *srns* may be used at a time.
+
+			Args:
+				ris: A list of resource IDs.
+				srns: A list of structured resource names.
+
+			Returns:
+				A list of resources in the order of the given IDs. IDs for which no resource exists are skipped.
+		"""
+		return [ resourceFromDict(d) for d in self.retrieveResourcesRaw(ris = ris, srns = srns) ]
+
+
+	@traced('storage.retrieve')
+	def retrieveResourcesRaw(self, ris:Optional[list[str]] = None, 
+								   srns:Optional[list[str]] = None) -> list[JSON]:
+		"""	Retrieve multiple resources as raw dictionaries by their resource IDs or structured resource names
+			in a single database lookup.
+
+			Only one of the parameters *ris* or *srns* may be used at a time.
+
+			Args:
+				ris: A list of resource IDs.
+				srns: A list of structured resource names.
+
+			Returns:
+				A list of raw resource dictionaries in the order of the given IDs. IDs for which no resource exists are skipped.
+		"""
+		if not ris and not srns:
+			return []
+		return self.db.searchResourcesByIDs(ris = ris, srns = srns)
+
+
 	def retrieveResourceRaw(self, ri:str) -> JSON:
 		"""	Retrieve a resource as a raw dictionary.
 
@@ -366,6 +458,7 @@ class Storage(object):
 		return self.db.searchResources(ty = int(ty))
 
 
+	@traced('storage.update')
 	def updateResource(self, resource:Resource) -> Resource:
 		"""	Update a resource in the database.
 
@@ -377,10 +470,14 @@ class Storage(object):
 		"""
 		ri = resource.ri
 		# L.logDebug(f'Updating resource (ty: {resource.ty}, ri: {ri}, rn: {resource.rn})')
+		resource.dict[Constants.attrLastWritten] = utcTime()
 		resource.dict = self.db.updateResource(resource.dict, ri)
+		self._writeGeneration.increment()
+		CSE.processes.resourceChanged(resource)
 		return resource
 
 
+	@traced('storage.delete')
 	def deleteResource(self, resource:Resource) -> None:
 		"""	Delete a resource from the database.
 
@@ -394,15 +491,20 @@ class Storage(object):
 		try:
 			_ri = resource.ri
 			_pi = resource.pi
+			_srn = resource.getSrn()
 			self.db.deleteResource(_ri)
-			self.db.deleteIdentifier(_ri, resource.getSrn())
+			self.db.deleteIdentifier(_ri, _srn)
+			self.uncacheIdentifier(_ri, _srn)
 			self.db.removeChildResource(_ri, _pi)
+			self._writeGeneration.increment()
+			CSE.processes.resourceChanged(resource, deleted = True)
 		except KeyError:
 			raise NOT_FOUND(L.logDebug(f'Cannot remove: {resource.ri} (NOT_FOUND). Could be an expected error.'))
 
 
 	# TODO split this into two methods (one for resources, one for raw resources)
 		
+	@traced('storage.children')
 	def directChildResources(self, pi:str, 
 								   ty:Optional[ResourceTypes|list[ResourceTypes]] = None, 
 								   raw:Optional[bool] = False) -> list[JSON]|list[Resource]:
@@ -417,9 +519,8 @@ class Storage(object):
 				Return a list of resources, or a list of raw resource dictionaries.
 		"""
 		if (_ris := self.db.searchChildResourceIDsByParentRIAndType(pi, ty)):
-			docs = [self.db.searchResources(ri = _ri)[0] for _ri in _ris]
-			return docs if raw else cast(List[Resource], list(map(lambda x: resourceFromDict(x), docs)))
-		return []	# type:ignore[return-value]
+			return self.retrieveResourcesRaw(ris = _ris) if raw else self.retrieveResources(ris = _ris)
+		return []
 	
 
 	def directChildResourcesRI(self, pi:str, 
@@ -482,6 +583,110 @@ class Storage(object):
 		return self.db.searchIdentifiers(srn = srn)
 
 
+	def structuredPath(self, ri:str) -> Optional[str]:
+		"""	Return the structured resource name for an unstructured resource ID.
+
+			The mapping is taken from the identifier cache, or from the identifiers table
+			if it is not cached yet.
+
+			Args:
+				ri: Unstructured resource ID.
+
+			Return:
+				The structured resource name, or None if the resource does not exist.
+		"""
+		generation = None
+		if self.identifierCacheSize:
+			with self._identifierCacheLock:
+				if (srn := self._srnByRI.get(ri)) is not None:
+					self._srnByRI.move_to_end(ri)
+					return srn
+				generation = self._identifierCacheGeneration
+		if not (identifiers := self.db.searchIdentifiers(ri = ri)):
+			return None
+		srn = identifiers[0]['srn']
+		self._cacheIdentifier(ri, srn, generation)
+		return srn
+
+
+	def resourceIDFromStructuredPath(self, srn:str) -> Optional[str]:
+		"""	Return the unstructured resource ID for a structured resource name.
+
+			The mapping is taken from the identifier cache, or from the identifiers table
+			if it is not cached yet.
+
+			Args:
+				srn: Structured resource name.
+
+			Return:
+				The resource ID, or None if the resource does not exist.
+		"""
+		generation = None
+		if self.identifierCacheSize:
+			with self._identifierCacheLock:
+				if (ri := self._riBySrn.get(srn)) is not None:
+					self._srnByRI.move_to_end(ri)
+					return ri
+				generation = self._identifierCacheGeneration
+		if not (identifiers := self.db.searchIdentifiers(srn = srn)):
+			return None
+		ri = identifiers[0]['ri']
+		self._cacheIdentifier(ri, srn, generation)
+		return ri
+
+
+	def _cacheIdentifier(self, ri:str, srn:str, generation:Optional[int] = None) -> None:
+		"""	Add a mapping to the identifier cache. The least recently used mappings are removed
+			when the cache is full.
+
+			Args:
+				ri: Unstructured resource ID.
+				srn: Structured resource name.
+				generation: The cache generation before the mapping was read from the database. If mappings were removed in the meantime then the mapping is not added, because it might be outdated.
+		"""
+		if not self.identifierCacheSize:
+			return
+		with self._identifierCacheLock:
+			if generation is not None and generation != self._identifierCacheGeneration:
+				return
+			if (_srn := self._srnByRI.pop(ri, None)) is not None:
+				self._riBySrn.pop(_srn, None)
+			if (_ri := self._riBySrn.pop(srn, None)) is not None:
+				self._srnByRI.pop(_ri, None)
+			self._srnByRI[ri] = srn
+			self._riBySrn[srn] = ri
+			while len(self._srnByRI) > self.identifierCacheSize:
+				_ri, _srn = self._srnByRI.popitem(last = False)
+				self._riBySrn.pop(_srn, None)
+
+
+	def uncacheIdentifier(self, ri:str, srn:str) -> None:
+		"""	Remove a mapping from the identifier cache.
+
+			Args:
+				ri: Unstructured resource ID.
+				srn: Structured resource name.
+		"""
+		if not self.identifierCacheSize:
+			return
+		with self._identifierCacheLock:
+			self._identifierCacheGeneration += 1
+			if (_srn := self._srnByRI.pop(ri, None)) is not None:
+				self._riBySrn.pop(_srn, None)
+			if (_ri := self._riBySrn.pop(srn, None)) is not None:
+				self._srnByRI.pop(_ri, None)
+
+
+	def clearIdentifierCache(self) -> None:
+		"""	Remove all mappings from the identifier cache.
+		"""
+		with self._identifierCacheLock:
+			self._identifierCacheGeneration += 1
+			self._srnByRI.clear()
+			self._riBySrn.clear()
+
+
+	@traced('storage.search')
 	def searchByFragment(self, dct:dict, filter:Optional[Callable[[JSON], bool]] = None) -> list[Resource]:
 		""" Search and return all resources that match the given fragment dictionary/document.
 
@@ -497,6 +702,7 @@ class Storage(object):
 				] 
 
 
+	@traced('storage.search')
 	def searchByFilter(self, filter:Callable[[JSON], bool]) -> list[Resource]:
 		"""	Return a list of resources that match the given filter, or an empty list.
 
@@ -532,6 +738,7 @@ class Storage(object):
 		return subs[0]
 
 
+	@traced('storage.subscriptions')
 	def getSubscriptionsForParent(self, pi:str) -> list[JSON]:
 		"""	Retrieve all subscriptions representations (not oneM2M `Resource` objects) for a parent resource.
 
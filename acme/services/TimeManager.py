@@ -44,9 +44,10 @@ class TimeManager(object):
 		# Add a handler when the CSE is reset
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)	# type: ignore
 
-		# Read all periofics and add them (again)
-		for each in self._getAllPeriodicTimeSyncBeacons():
-			self.addPeriodicTimeSyncBeacon(each)
+		# Read all periofics and add them (again). Only the owner process sends periodic beacons in multi-process mode
+		if not CSE.processes.isWorker:
+			for each in self._getAllPeriodicTimeSyncBeacons():
+				self.addPeriodicTimeSyncBeacon(each)
 		
 		# Register to receive events
 		CSE.event.addHandler(CSE.event.requestReceived, self.requestReveivedHandler)			# type: ignore
@@ -139,6 +140,8 @@ class TimeManager(object):
 			Args:
 				tsb: timeSyncBeacon resource
 		"""
+		if CSE.processes.forwardToOwner('time', 'addPeriodicTimeSyncBeacon', tsb):
+			return
 
 		def periodicWorker() -> bool:
 			"""	Worker to send a time sync notification.
@@ -208,6 +211,8 @@ class TimeManager(object):
 			Args:
 				tsb: The timeSyncBeacon resource.
 		"""
+		if CSE.processes.forwardToOwner('time', 'removePeriodicTimeSyncBeacon', tsb):
+			return
 		if (ri := tsb.ri) in self.periodicTimeSyncBeacons:
 			self.periodicTimeSyncBeacons[ri].stop()
 			del self.periodicTimeSyncBeacons[tsb.ri]
@@ -22,7 +22,8 @@ runningTimeserieses:dict[str, LastTSInstance] = {}	# Holds and maps the active T
 class TimeSeriesManager(object):
 
 	def __init__(self) -> None:
-		self._restoreTimeSeriesStructures()	# Restore structures after a complete restart
+		if not CSE.processes.isWorker:		# Only the owner process monitors the <TS> resources in multi-process mode
+			self._restoreTimeSeriesStructures()	# Restore structures after a complete restart
 		CSE.event.addHandler(CSE.event.cseReset, self.restart)		# type: ignore
 		L.isInfo and L.log('TimeSeriesManager initialized')
 
@@ -144,6 +145,8 @@ class TimeSeriesManager(object):
 		"""	Add or update to the internal monitor DB.
 			The monitoring is started  when a first TSI is added for a <TS>.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'updateTimeSeries', timeSeries, instance):
+			return
 
 		arrivedAt = fromAbsRelTimestamp(instance.ct)
 		pei  = timeSeries.pei / 1000.0  # ms -> s
@@ -212,6 +215,8 @@ class TimeSeriesManager(object):
 			Return:
 				Boolean indicating success.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'stopMonitoringTimeSeries', tsRi):
+			return True
 		L.isDebug and L.logDebug(f'Remove <ts> from monitoring: {tsRi}')
 		if tsRi in runningTimeserieses:
 			rts = runningTimeserieses.pop(tsRi)	# removes (!) it also from the dict
@@ -228,6 +233,8 @@ class TimeSeriesManager(object):
 			Return:
 				Boolean indicating success.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'pauseMonitoringTimeSeries', tsRi):
+			return True
 		if tsRi in runningTimeserieses:
 			rts = runningTimeserieses.get(tsRi)
 			rts.running = False
@@ -243,6 +250,8 @@ class TimeSeriesManager(object):
 	def addSubscription(self, timeSeries:Resource, subscription:Resource) -> None:
 		"""	Add a subscription for the <TS> resource. Setup the internal structures.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'addSubscription', timeSeries, subscription):
+			return
 		if NotificationEventType.reportOnGeneratedMissingDataPoints in subscription['enc/net']:
 			L.isDebug and L.logDebug(f'Adding missing-data <sub>: {subscription.ri}. Not started yet.')
 			tsRi = timeSeries.ri
@@ -256,6 +265,8 @@ class TimeSeriesManager(object):
 	def updateSubscription(self, timeSeries:Resource, subscription:Resource) -> None:
 		""" Update an existing missing data subscription.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'updateSubscription', timeSeries, subscription):
+			return
 		if NotificationEventType.reportOnGeneratedMissingDataPoints in subscription['enc/net']:
 			L.isDebug and L.logDebug(f'Updating missing data <sub>: {subscription.ri}')
 			if (rts := runningTimeserieses.get(timeSeries.ri)) and (md := rts.missingData.get(subscription.ri)):
@@ -266,6 +277,8 @@ class TimeSeriesManager(object):
 	def removeSubscription(self, timeSeries:Resource, subscription:Resource) -> None:
 		"""	Remove a subcription from a <TS> resource. Remove the internal structures.
 		"""
+		if CSE.processes.forwardToOwner('timeSeries', 'removeSubscription', timeSeries, subscription):
+			return
 		if NotificationEventType.reportOnGeneratedMissingDataPoints in subscription['enc/net']:
 			L.isDebug and L.logDebug(f'Removing missing data <sub>: {subscription.ri}')
 			if (rts := runningTimeserieses.get(timeSeries.ri)) and subscription.ri in rts.missingData:
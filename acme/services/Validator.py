@@ -8,7 +8,7 @@
 #
 
 from __future__ import annotations
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Callable, Dict, Tuple, Optional
 
 from copy import deepcopy
 import re, json
@@ -58,6 +58,9 @@ complexTypeAttributes:dict[str, list[str]] = {}
 attributesComplexTypes:dict[str, list[str]] = {}
 # TODO doc
 
+RequestParameterValidator = Callable[[Any], Any]
+""" Signature of a compiled request parameter validator. It receives a parameter value and returns the validated and converted value, or raises a *BAD_REQUEST* exception. """
+
 
 # TODO make this more generic!
 _valueNameMappings = {
@@ -84,6 +87,9 @@ class Validator(object):
 
 
 	def __init__(self) -> None:
+		self._requestParameterValidators:dict[Tuple[str, Optional[BasicType]], RequestParameterValidator] = {}
+		""" Compiled request parameter validators. { (attribute, attributeType) : validator } """
+
 		L.isInfo and L.log('Validator initialized')
 
 
@@ -268,6 +274,133 @@ class Validator(object):
 		raise BAD_REQUEST(f'validation for attribute {attribute} not defined for resource type: {rtype}')
 
 
+	def getRequestParameterValidator(self, attribute:str, 
+										   attributeType:Optional[BasicType] = None) -> RequestParameterValidator:
+		"""	Return the compiled validator for a request parameter.
+
+			The validator is compiled on first use and then cached. It behaves like
+			`validateAttribute()` with *rtype* = *REQRESP*, but it only returns the converted value.
+
+			Args:
+				attribute: Name of the request parameter.
+				attributeType: If set then that type is taken to perform the check, otherwise the type is determined from the attribute policy.
+
+			Return:
+				Validator function.
+		"""
+		try:
+			return self._requestParameterValidators[(attribute, attributeType)]
+		except KeyError:
+			validator = self._requestParameterValidators[(attribute, attributeType)] = self._compileRequestParameterValidator(attribute, attributeType)
+			return validator
+
+
+	def compileRequestParameterValidators(self) -> None:
+		"""	Compile the validators for all request parameters that have an attribute policy.
+
+			This is called after the attribute policies have been imported.
+		"""
+		self._requestParameterValidators.clear()
+		for rtype, attribute in list(attributePolicies.keys()):
+			if rtype == ResourceTypes.REQRESP:
+				self.getRequestParameterValidator(attribute)
+		L.isDebug and L.logDebug(f'Compiled {len(self._requestParameterValidators)} request parameter validators')
+
+
+	def _compileRequestParameterValidator(self, attribute:str, 
+												attributeType:Optional[BasicType]) -> RequestParameterValidator:
+		"""	Compile a validator function for a request parameter.
+
+			Simple types are checked and converted directly. All other types are validated by `_validateType()`.
+			Errors are the same as for `validateAttribute()`.
+
+			Args:
+				attribute: Name of the request parameter.
+				attributeType: If set then that type is taken to perform the check, otherwise the type is determined from the attribute policy.
+
+			Return:
+				Validator function.
+		"""
+		policy:AttributePolicy = None
+		if attributeType is not None:	# use the given attribute type instead of determining it
+			dataType = attributeType
+		elif (policy := self.getAttributePolicy(ResourceTypes.REQRESP, attribute)):
+			dataType = policy.type
+		else:
+			def _undefined(value:Any) -> Any:
+				raise BAD_REQUEST(f'validation for attribute {attribute} not defined for resource type: {ResourceTypes.REQRESP}')
+			return _undefined
+
+		def _typeMismatch(value:Any) -> None:
+			raise BAD_REQUEST(f'type mismatch or unknown; expected type: {str(dataType)}, value type: {type(value).__name__}')
+
+		match dataType:
+			case BasicType.positiveInteger |\
+				 BasicType.nonNegInteger |\
+				 BasicType.unsignedInt |\
+				 BasicType.unsignedLong |\
+				 BasicType.integer |\
+				 BasicType.enum:
+				minValue, expected = { BasicType.positiveInteger:	(1, 'positive integer'),
+									   BasicType.nonNegInteger:		(0, 'non-negative integer'),
+									   BasicType.unsignedInt:		(None, 'unsigned integer'),
+									   BasicType.unsignedLong:		(None, 'unsigned integer'),
+									 }.get(dataType, (None, 'integer'))
+				evalues = policy.evalues if dataType == BasicType.enum and policy is not None and policy.evalues else None
+
+				def _integer(value:Any) -> Any:
+					if value is None:
+						return None
+					if isinstance(value, str):
+						try:
+							value = int(value)
+						except Exception as e:
+							raise BAD_REQUEST(str(e))
+					if not isinstance(value, int) or (minValue is not None and value < minValue):
+						raise BAD_REQUEST(f'invalid type: {type(value).__name__}. Expected: {expected}')
+					if evalues is not None and value not in evalues:
+						raise BAD_REQUEST('undefined enum value')
+					return value
+				return _integer
+
+			case BasicType.boolean:
+				def _boolean(value:Any) -> Any:
+					if value is None:
+						return None
+					if isinstance(value, str):
+						try:
+							value = strToBool(value)
+						except Exception as e:
+							raise BAD_REQUEST(str(e))
+					if not isinstance(value, bool):
+						raise BAD_REQUEST(f'invalid type: {type(value).__name__}. Expected: bool')
+					return value
+				return _boolean
+
+			case BasicType.string | BasicType.anyURI | BasicType.ID:
+				def _string(value:Any) -> Any:
+					if value is None or isinstance(value, str):
+						return value
+					_typeMismatch(value)
+				return _string
+
+			case BasicType.list | BasicType.listNE if policy is None or policy.ltype is None:
+				def _list(value:Any) -> Any:
+					if value is None:
+						return None
+					if not isinstance(value, list):
+						_typeMismatch(value)
+					if dataType == BasicType.listNE and len(value) == 0:
+						raise BAD_REQUEST('empty list is not allowed')
+					return value
+				return _list
+
+			case _:
+				def _generic(value:Any) -> Any:
+					return self._validateType(dataType, value, True, policy = policy)[1]
+				return _generic
+
+
 	#
 	#	Validate complex types
 	#
@@ -582,6 +715,7 @@ class Validator(object):
 		if (rtype, attr) in attributePolicies:
 			L.logErr(f'Policy {(rtype, attr)} is already registered')
 		attributePolicies[(rtype, attr)] = attrPolicy
+		self._requestParameterValidators.clear()	# re-compile on next use
 
 		# Collect a list of attributes for complex types
 		if attrPolicy.ctype:
@@ -674,6 +808,7 @@ class Validator(object):
 		"""	Clear the attribute policies.
 		"""
 		attributePolicies.clear()
+		self._requestParameterValidators.clear()
 
 
 	def getShortnameLongNameMapping(self) -> dict[str, str]:
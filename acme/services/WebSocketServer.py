@@ -8,10 +8,11 @@
 """
 
 from __future__ import annotations
-from typing import Optional, Any, Tuple
+from typing import Optional, Any, Tuple, TypeAlias
 import logging, uuid
+from threading import Lock
 
-from websockets.sync.connection import Connection as WSConnection
+from websockets.sync.connection import Connection
 from websockets.sync.server import WebSocketServer as WSServer, serve, ServerConnection
 from websockets.sync.client import connect
 from websockets.protocol import State
@@ -19,6 +20,7 @@ from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 from ..etc.Constants import Constants
 from ..helpers.BackgroundWorker import BackgroundWorkerPool
+from ..helpers.AsyncioWebSocketServer import AsyncioWebSocketServer, AsyncioWebSocketConnection
 from ..helpers.ThreadSafeCounter import ThreadSafeCounter
 from ..etc.RequestUtils import prepareResultForSending, createPositiveResponseResult, createRequestResultFromURI
 from ..etc.ACMEUtils import uniqueID, csiFromSPRelative
@@ -30,6 +32,10 @@ from ..services import CSE
 from ..resources.Resource import Resource
 from ..services.Logging import Logging as L
 
+
+WSConnection:TypeAlias = Connection | AsyncioWebSocketConnection
+""" A WebSocket connection, either of the synchronous or of the asyncio based server. """
+
 class WebSocketServer(object):
 	"""	WebSocket Server implementation.
 	"""
@@ -46,7 +52,13 @@ class WebSocketServer(object):
 		'associatedConnections', 
 		'connectionUsedCounter',
 		'operationEvents',
-		'actor'
+		'actor',
+		'asyncioEnable',
+		'asyncioThreadPoolSize',
+		'asyncioCompression',
+		'asyncioServer',
+		'connectLock',
+		'targetConnectLocks',
 	]
 	""" Define slots for instance variables. """
 
@@ -79,6 +91,15 @@ class WebSocketServer(object):
 		self.connectionUsedCounter:dict[uuid.UUID, ThreadSafeCounter] = {}	# websocket.id -> counter
 		"""	A counter for each opened WS connection opened by the CSE. """
 
+		self.asyncioServer:Optional[AsyncioWebSocketServer] = None
+		"""	The asyncio based WebSocket server object, if enabled. """
+
+		self.connectLock = Lock()
+		"""	Lock for looking up and registering the connections for sending requests. """
+
+		self.targetConnectLocks:dict[str, Lock] = {}	# target -> lock
+		"""	Locks for establishing a connection to a target, so that concurrent requests to the same target share a connection, and connecting to one target doesn't block requests to other targets. """
+
 		self.operationEvents = {
 			Operation.CREATE:		[CSE.event.wsCreate, 'WS_C'],		# type: ignore [attr-defined]
 			Operation.RETRIEVE: 	[CSE.event.wsRetrieve, 'WS_R'],		# type: ignore [attr-defined]
@@ -124,6 +145,15 @@ class WebSocketServer(object):
 		self.requestTimeout = Configuration.get('websocket.timeout')
 		"""	The timeout for requests."""
 
+		self.asyncioEnable = Configuration.get('websocket.asyncio.enable')
+		"""	Flag whether the asyncio based WebSocket server is used. """
+
+		self.asyncioThreadPoolSize = Configuration.get('websocket.asyncio.threadPoolSize')
+		"""	The number of threads that handle received messages in the asyncio based server. """
+
+		self.asyncioCompression = Configuration.get('websocket.asyncio.compression')
+		"""	Flag whether the asyncio based server negotiates per-message compression. """
+
 
 	def _configUpdate(self, name:str, 
 						   key:Optional[str] = None, 
@@ -139,7 +169,10 @@ class WebSocketServer(object):
 						'websocket.port',
 						'websocket.listenIF',
 						'websocket.loglevel',
-						'websocket.timeout'
+						'websocket.timeout',
+						'websocket.asyncio.enable',
+						'websocket.asyncio.threadPoolSize',
+						'websocket.asyncio.compression',
 					  ]:
 			return
 
@@ -193,6 +226,25 @@ class WebSocketServer(object):
 	def _run(self) -> None:
 		"""	WebSocket server main loop.
 		"""
+		if self.asyncioEnable:
+			self.asyncioServer = AsyncioWebSocketServer(self.interface,
+														self.port,
+														onConnect = self._openIncomingConnection,
+														onMessage = self._handleMessage,
+														onClose = lambda websocket, context: self.removeConnection(websocket, context[0]),
+														subprotocols = ContentSerializationType.supportedContentSerializationsWS(),	# type:ignore[arg-type]
+														threads = self.asyncioThreadPoolSize,
+														compression = self.asyncioCompression,
+														sendTimeout = self.requestTimeout,
+														sslContext = CSE.security.getSSLContextWs(),
+														logger = L.logErr)
+			logging.getLogger('websockets.server').setLevel(self.logLevel)
+			logging.getLogger('websockets.client').setLevel(self.logLevel)
+			L.isInfo and L.log(f'WebSocket server listening on {self.interface}:{self.port} (asyncio)')
+			self.asyncioServer.serveForever()	# Will block until the server is shutdown
+			L.isDebug and L.logDebug('WebSocket server shut down')
+			return
+
 		self.websocketServer = serve(self.handleIncomingConnection, 
 							   		 self.interface, 
 									 self.port, 
@@ -211,6 +263,10 @@ class WebSocketServer(object):
 			L.isDebug and L.logDebug('Stopping WebSocket server')
 			self.websocketServer.shutdown()
 			self.websocketServer = None
+		if self.asyncioServer is not None:
+			L.isDebug and L.logDebug('Stopping WebSocket server')
+			self.asyncioServer.shutdown()
+			self.asyncioServer = None
 
 
 	def pause(self) -> None:
@@ -302,8 +358,12 @@ class WebSocketServer(object):
 		L.isDebug and L.logDebug(f'Removing WS connection: {websocket.id} and originator: {originator}')
 		if websocket.id in self.wsConnections:
 			del self.wsConnections[websocket.id]
-		if originator in self.associatedConnections:
+		# Only remove the association if the originator is not associated with another connection meanwhile
+		if self.associatedConnections.get(originator) == websocket.id:
 			del self.associatedConnections[originator]
+		# Also remove associations that were made after the connection was opened, e.g. by an AE registration
+		for _originator in [ o for o, i in self.associatedConnections.items() if i == websocket.id ]:
+			del self.associatedConnections[_originator]
 
 
 	def closeConnectionForOriginator(self, originator:str) -> None:
@@ -355,7 +415,7 @@ class WebSocketServer(object):
 		return True
 
 
-	def receiveLoop(self, websocket:WSConnection, wsOriginator:str, ct:ContentSerializationType) -> None:
+	def receiveLoop(self, websocket:Connection, wsOriginator:str, ct:ContentSerializationType) -> None:
 		"""	Receive loop for the WebSocket server. This is the main entry point for handling a received message,
 			whether the connection was initiated by the server or the client.
 
@@ -371,8 +431,8 @@ class WebSocketServer(object):
 				# L.isDebug and L.logDebug(f'Received WS message: {message}')
 				if not self._checkIsServerRunning(websocket):
 					continue
-				# Run the message handling in a separate thread
-				BackgroundWorkerPool.runJob(lambda: self._handleReceivedMessage(websocket, message, wsOriginator, ct), name = f'ws_{uniqueID()}')
+				# Run the message handling in a separate thread. Bind the message now, because the next one may be received before the job runs.
+				BackgroundWorkerPool.runJob(lambda message = message: self._handleReceivedMessage(websocket, message, wsOriginator, ct), name = f'ws_{uniqueID()}')
 		except ConnectionClosedError as e:
 			L.isWarn and L.logWarn('Connection closed: {e}')
 		except ConnectionClosedOK:
@@ -390,14 +450,47 @@ class WebSocketServer(object):
 				websocket: The WebSocket connection.
 		"""
 
-		# Variable for this connection's originator
-		wsOriginator = None	# This is valid until the first message is received. Then the originator is determined from the message
-
 		# Rename thread
 		renameThread(prefix = 'ws')
 
-		if not self._checkIsServerRunning(websocket):
+		if (context := self._openIncomingConnection(websocket)) is None:
 			return
+		wsOriginator, contentType = context
+
+		try:
+			# Handle incoming requests in separate threads as long as there is no error or the server is stopped
+			# or the client closes the connection
+			while (message := websocket.recv()) is not None:	# recv() is blocking
+				L.isDebug and L.logDebug(f'Received WS message: {message!r}')
+				if not self._checkIsServerRunning(websocket):
+					continue
+				# Run the message handling in a separate thread
+				BackgroundWorkerPool.runJob(lambda: self._handleReceivedMessage(websocket, message, wsOriginator, contentType),
+											name = f'ws_{uniqueID()}')
+		except ConnectionClosedError as e:
+			L.isWarn and L.logWarn('Connection closed: {e}')
+		except ConnectionClosedOK:
+			L.isDebug and L.logDebug('Connection closed by client')
+		
+		# Remove the connection from the list of unassociated connections or from the list of associated connections
+		self.removeConnection(websocket, wsOriginator)
+
+
+	def _openIncomingConnection(self, websocket:WSConnection) -> Optional[Tuple[Optional[str], ContentSerializationType]]:
+		"""	Register a new incoming WebSocket connection and associate it with the originator from the request headers, if present.
+
+			Args:
+				websocket: The WebSocket connection.
+
+			Returns:
+				Tuple of the connection's originator (or None if not yet known) and content type, or None if the server is not running.
+		"""
+
+		# Variable for this connection's originator
+		wsOriginator = None	# This is valid until the first message is received. Then the originator is determined from the message
+
+		if not self._checkIsServerRunning(websocket):
+			return None
 
 		L.isDebug and L.logDebug('New WS connection')
 		L.logDebug(f'Received subprotocol: {websocket.subprotocol}')
@@ -421,23 +514,21 @@ class WebSocketServer(object):
 		if wsOriginator is not None:
 			self.associateConnectionWithOriginator(websocket, wsOriginator)
 
-		try:
-			# Handle incoming requests in separate threads as long as there is no error or the server is stopped
-			# or the client closes the connection
-			while (message := websocket.recv()) is not None:	# recv() is blocking
-				L.isDebug and L.logDebug(f'Received WS message: {message!r}')
-				if not self._checkIsServerRunning(websocket):
-					continue
-				# Run the message handling in a separate thread
-				BackgroundWorkerPool.runJob(lambda: self._handleReceivedMessage(websocket, message, wsOriginator, contentType),
-											name = f'ws_{uniqueID()}')
-		except ConnectionClosedError as e:
-			L.isWarn and L.logWarn('Connection closed: {e}')
-		except ConnectionClosedOK:
-			L.isDebug and L.logDebug('Connection closed by client')
-		
-		# Remove the connection from the list of unassociated connections or from the list of associated connections
-		self.removeConnection(websocket, wsOriginator)
+		return wsOriginator, contentType
+
+
+	def _handleMessage(self, websocket:WSConnection, context:Tuple[Optional[str], ContentSerializationType], message:str|bytes) -> None:
+		"""	Handle a message that was received by the asyncio based server. This is called in a thread of the server's pool.
+
+			Args:
+				websocket: The WebSocket connection.
+				context: Tuple of the connection's originator and content type.
+				message: The received message.
+		"""
+		L.isDebug and L.logDebug(f'Received WS message: {message!r}')
+		if not self._checkIsServerRunning(websocket):
+			return
+		self._handleReceivedMessage(websocket, message, *context)
 
 
 	def _handleReceivedMessage(self, websocket:WSConnection, message:str|bytes, wsOriginator:str, contentType:ContentSerializationType) -> None:
@@ -503,7 +594,10 @@ class WebSocketServer(object):
 			L.isDebug and L.logDebug(f'Operation: {request.op}')
 			L.isDebug and L.logDebug(f'Originator: {requestOriginator}')
 
-			responseResult = CSE.request.handleRequest(request)
+			responseResult = CSE.request.handleRequest(request, 'ws')
+			# Add the entity tag and check the conditions only for conditional RETRIEVE requests
+			if request.inm is not None or request.ims is not None:
+				CSE.request.applyConditionalRetrieve(request, responseResult, request.ct)
 
 			# Associate the connection with the originator, if not yet done.
 			# wsOriginator is None if the connection is not yet associated with an originator, and this
@@ -552,45 +646,80 @@ class WebSocketServer(object):
 					The WebSocket connection and a flag whether the connection is one that is initiated by the CSE.
 			"""
 
-			# TODO check whether we need a lock() here
-
-
-			# Check whether the target is alredy associated with an established connection
-			if target in self.associatedConnections:
-				L.isDebug and L.logDebug(f'Sending request via established WS Connection to: {target}')
-				webSocket = self.wsConnections.get(self.associatedConnections[target])
-				self.incrementConnection(webSocket)	# Increment the counter for the connection
-				return webSocket, False
-		
-			# From here on it is assumed that there is no established connection with the target
-	
-			# Check whether the url is the default unreachable target url.
-			# If so, then no WS connection is established
-			if url == Constants.defaultWebSocketSchema:
-				raise TARGET_NOT_REACHABLE(L.logWarn(f'No WS connection established. Target is not reachable by default.'))	# No WS connection established
-
-			# Else connect to the target WS server using the URL
-			L.isDebug and L.logDebug(f'Establishing new temporary WS connection to send request to: {target}')
-			try:
-				websocket = connect(url, 
-									subprotocols=[ct.toWSContentType()], 					# type:ignore[list-item]
-									additional_headers = { 'X-m2m-Origin': CSE.cseCsi})
-			except Exception as e:
-				raise TARGET_NOT_REACHABLE(L.logWarn(f'Error connecting to WS server: {url} - {e}'))
+			def establishedConnection() -> Optional[Tuple[WSConnection, bool]]:
+				"""	Return the established connection that is associated with the target, if any. 
+					This must be called while holding the *connectLock*.
+				"""
+				if target in self.associatedConnections:
+					if (webSocket := self.wsConnections.get(self.associatedConnections[target])) is not None:
+						L.isDebug and L.logDebug(f'Sending request via established WS Connection to: {target}')
+						self.incrementConnection(webSocket)	# Increment the counter for the connection
+						# A connection initiated by the CSE must be released again by this request
+						return webSocket, webSocket.id in self.connectionUsedCounter
+					# The associated connection has been closed meanwhile
+					self.dissociateConnectionFromOriginator(target)
+				return None
+
+			# Concurrent requests to the same target share one connection. Their responses are matched by the request identifier.
+			with self.connectLock:
+
+				# Check whether the target is alredy associated with an established connection
+				if (established := establishedConnection()) is not None:
+					return established
 			
-			# Associate the WS connection with the originator
-			self.addConnection(websocket, True)
-			self.associateConnectionWithOriginator(websocket, target) # In this case, the target is the originator
-
-			BackgroundWorkerPool.runJob(lambda: self.receiveLoop(websocket, target, ct),
-										name = f'ws_{uniqueID()}')
+				# From here on it is assumed that there is no established connection with the target
+		
+				# Check whether the url is the default unreachable target url.
+				# If so, then no WS connection is established
+				if url == Constants.defaultWebSocketSchema:
+					raise TARGET_NOT_REACHABLE(L.logWarn(f'No WS connection established. Target is not reachable by default.'))	# No WS connection established
+				
+				targetLock = self.targetConnectLocks.setdefault(target, Lock())
+
+			# Only requests to the same target wait while a connection is established
+			with targetLock:
+
+				# Another request may have established a connection meanwhile
+				with self.connectLock:
+					if (established := establishedConnection()) is not None:
+						return established
+
+				# Else connect to the target WS server using the URL
+				L.isDebug and L.logDebug(f'Establishing new temporary WS connection to send request to: {target}')
+				websocket:WSConnection
+				try:
+					if self.asyncioServer:
+						# The connection is handled by the event loop of the asyncio server
+						websocket = self.asyncioServer.connect(url, 
+															   subprotocols = [ct.toWSContentType()], 		# type:ignore[list-item]
+															   headers = { 'X-m2m-Origin': CSE.cseCsi},
+															   context = (target, ct),
+															   timeout = self.requestTimeout)
+					else:
+						websocket = connect(url, 
+											subprotocols=[ct.toWSContentType()], 					# type:ignore[list-item]
+											additional_headers = { 'X-m2m-Origin': CSE.cseCsi})
+				except Exception as e:
+					raise TARGET_NOT_REACHABLE(L.logWarn(f'Error connecting to WS server: {url} - {e}'))
+				
+				# Associate the WS connection with the originator
+				with self.connectLock:
+					self.addConnection(websocket, True)
+					self.associateConnectionWithOriginator(websocket, target) # In this case, the target is the originator
+
+			# Connections of the asyncio server are received by its event loop. Others need a receive loop.
+			if isinstance(websocket, Connection):
+				BackgroundWorkerPool.runJob(lambda: self.receiveLoop(websocket, target, ct),
+											name = f'ws_{uniqueID()}')
 			return websocket, True
 
 
 		def disconnectWS(target:str, doClose:bool) -> None:
 			if doClose:
 				L.isDebug and L.logDebug(f'Closing temporary WS connection to: {target}')
-				self.closeConnectionForOriginator(target)
+				# Release the connection while no other request can pick it up
+				with self.connectLock:
+					self.closeConnectionForOriginator(target)
 
 		try: 
 			# Get the serialization format
@@ -622,14 +751,17 @@ class WebSocketServer(object):
 			message = prepareResultForSending(req)[1]
 			L.isDebug and L.logDebug(f'WS Request ==>: {targetOriginator if not isSenderWS else self._getWSSendingTargetName(targetOriginator)}')
 			L.isDebug and L.logDebug(f'Body: {message!r}')
+			CSE.request.expectResponse(req.request.rqi)
 			websocket.send(message)
 		except Exception as e:
+			CSE.request.cancelResponse(req.request.rqi)
 			disconnectWS(targetOriginator, isSenderWS)
 			return Result(rsc = ResponseStatusCode.INTERNAL_SERVER_ERROR, dbg = f'Error sending WS request: {e}')	
 
 		# Ignore the response to notifications in some cases
 		if ignoreResponse and request.op == Operation.NOTIFY:
 			L.isDebug and L.logDebug('WS: Ignoring response to notification')
+			CSE.request.cancelResponse(req.request.rqi)
 			disconnectWS(targetOriginator, isSenderWS)
 			return createPositiveResponseResult()
 
@@ -125,6 +125,25 @@ class DBBinding(ABC):
 		...
 	
 
+	@abstractmethod
+	def searchResourcesByIDs(self, ris:Optional[list[str]] = None, 
+								   srns:Optional[list[str]] = None) -> list[JSON]:
+		"""	Search for multiple resources by their resource IDs or structured resource names in a single lookup.
+
+			Only one of the parameters may be used at a time. The order of precedence is: structured resource names,
+			resource IDs.
+
+			Args:
+				ris: A list of resource IDs.
+				srns: A list of structured resource names.
+
+			Return:
+				A list of found resource documents in the order of the given IDs. IDs for which no resource
+				is found are skipped.
+		"""
+		...
+
+
 	@abstractmethod
 	def discoverResourcesByFilter(self, func:Callable[[JSON], bool]) -> list[JSON]:
 		"""	Search for resources by a filter function. This goes through all resources in the database and
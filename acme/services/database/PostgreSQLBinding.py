@@ -277,6 +277,13 @@ class PostgreSQLBinding(DBBinding):
 				PREPARE getResourcesByPIandTY AS
 					SELECT resource FROM {self.tableResources} 
 					WHERE resource->>'pi' = $1 AND resource->>'ty' = $2;
+				PREPARE getResourcesByRIs AS
+					SELECT ri, resource FROM {self.tableResources} 
+					WHERE ri = ANY($1);
+				PREPARE getResourcesBySRNs AS
+					SELECT i.srn, r.resource FROM {self.tableIdentidiers} i
+					JOIN {self.tableResources} r ON r.ri = i.ri
+					WHERE i.srn = ANY($1);
 
 				PREPARE countResources AS
 					SELECT COUNT(*) FROM {self.tableResources};
@@ -571,6 +578,21 @@ class PostgreSQLBinding(DBBinding):
 		return []
 	
 
+	def searchResourcesByIDs(self, ris:Optional[list[str]] = None, 
+								   srns:Optional[list[str]] = None) -> list[JSON]:
+		# L.isDebug and L.logDebug(f'Searching for resources: ris={ris}, srns={srns}')
+		if srns:
+			ids, statement = srns, 'getResourcesBySRNs (%s)'
+		elif ris:
+			ids, statement = ris, 'getResourcesByRIs (%s)'
+		else:
+			return []
+		# The rows are returned in any order, so map them to the requested IDs
+		found = self._executePrepared(statement, (list(ids),), 
+									  lambda c: { r[0]: r[1] for r in c })
+		return [ found[i] for i in ids if i in found ]
+
+
 	def discoverResourcesByFilter(self, func:Callable[[JSON], bool]) -> list[JSON]:
 		# L.isDebug and L.logDebug(f'Discovering resources by filter')
 		return self._executePrepared('getResources', (), 
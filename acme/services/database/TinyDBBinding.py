@@ -463,6 +463,20 @@ class TinyDBBinding(DBBinding):
 		return []
 
 
+	def searchResourcesByIDs(self, ris:Optional[list[str]] = None, 
+								   srns:Optional[list[str]] = None) -> list[JSON]:
+		_r:Document
+
+		# for SRNs find the ris first
+		if srns:
+			with self.lockStructuredIDs:
+				ris = [ _r['ri'] for srn in srns if (_r := self.tabStructuredIDs.get(doc_id = srn)) ]	# type:ignore[arg-type, assignment]
+		if not ris:
+			return []
+		with self.lockResources:
+			return [ _r for ri in ris if (_r := self.tabResources.get(doc_id = ri)) ]	# type:ignore[arg-type, assignment, misc]
+
+
 	def discoverResourcesByFilter(self, func:Callable[[JSON], bool]) -> list[JSON]:
 		with self.lockResources:
 			return cast(list[JSON], self.tabResources.search(func))	# type: ignore [arg-type]
@@ -10,6 +10,7 @@
 from __future__ import annotations
 from typing import cast
 
+from rich.console import Group
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
@@ -50,5 +51,8 @@ class ACMEContainerInfo(Container):
 
 	def _statsUpdate(self, force:bool = False) -> None:
 		if force or self.tuiApp.tabs.active == tabInfo:
-			self.statsView.update(CSE.console.getStatisticsRich())
+			if CSE.request.enableTracing:
+				self.statsView.update(Group(CSE.console.getStatisticsRich(), CSE.console.getTracesRich()))
+			else:
+				self.statsView.update(CSE.console.getStatisticsRich())
 
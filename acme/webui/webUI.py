@@ -73,6 +73,10 @@ class WebUI(object):
 		self.oauthToken:Token	= None
 		""" The oauth token. """
 
+		self.session			= requests.Session()
+		""" Keep-alive session for the requests that are forwarded to the CSE in stand-alone mode. 
+			The CSE's own connection pool (see `HttpServer.sendRequest()`) is not available in this process. """
+
 		# Append / if necessary
 		if self.redirectURL is not None and self.redirectURL[-1] != '/':
 			self.redirectURL += '/'
@@ -184,14 +188,14 @@ class WebUI(object):
 		
 		# Retrieve / refresh an oauth token (if configured)
 		if doOauth:
-			if (token := getOAuthToken(self.oauthToken)) is None:
+			if (token := getOAuthToken(self.oauthToken, session = self.session)) is None:
 				if doLogging:
 					console.log(f'Error retrieving oauth token')
 				return Response('', 500)
 			self.oauthToken = token
 			requestHeaders['Authorization'] = f'Bearer {self.oauthToken.token}'	
 
-		resp = requests.request(
+		resp = self.session.request(
 			method=request.method,
 			url=url,
 			headers=requestHeaders,
@@ -324,7 +328,8 @@ _expirationLeeway	= 5.0		# 5 seconds leeway for token expiration
 
 
 def getOAuthToken(token:Optional[Token] = None, 
-				  kind:Optional[str] = 'keycloak') -> Optional[Token]:
+				  kind:Optional[str] = 'keycloak',
+				  session:Optional[requests.Session] = None) -> Optional[Token]:
 	"""	Retrieve and return a oauth2 token. If there is a provided token that is still valid, then that token
 		is returned.
 
@@ -334,6 +339,7 @@ def getOAuthToken(token:Optional[Token] = None,
 		Args:
 			token: The token to check. If None, a new token is retrieved.
 			kind: The kind of token to retrieve. Currently only 'keycloak' is supported.
+			session: Optional keep-alive session to send the token request.
 
 		Returns:
 			The token, or None in case of an error.
@@ -355,7 +361,7 @@ def getOAuthToken(token:Optional[Token] = None,
 			'client_secret'	: clientSecret,
 			'client_id'		: clientID,
 		}
-		if (response := requests.post(oauthServerUrl	, data=formData, headers=headers)).status_code == 200:
+		if (response := (session or requests).post(oauthServerUrl	, data=formData, headers=headers)).status_code == 200:
 			data = response.json()
 			if data is None or 'access_token' not in data or 'expires_in' not in data:
 				return None
@@ -0,0 +1,18 @@
+;;
+;;	testsDisableBatchEndpoint.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name disableBatchEndpoint
+@description (Tests) Restore the enablement of the http batch endpoint
+@usage disableBatchEndpoint
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: disableBatchEndpoint")
+		(quit-with-error)))
+
+(include-script "functions")
+
+(restore-config-value "http.enableBatchEndpoint")
@@ -0,0 +1,19 @@
+;;
+;;	testsDisableDiscoveryCache.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name disableDiscoveryCache
+@description (Tests) Disable the discovery result cache
+@usage disableDiscoveryCache
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: disableDiscoveryCache")
+		(quit-with-error)))
+
+(include-script "functions")
+
+(restore-config-value "cse.operation.discovery.enableResultCache")
+(restore-config-value "cse.operation.discovery.resultCacheTTL")
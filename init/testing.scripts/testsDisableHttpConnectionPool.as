@@ -0,0 +1,20 @@
+;;
+;;	testsDisableHttpConnectionPool.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name disableHttpConnectionPool
+@description (Tests) Disable pooled keep-alive sessions for outgoing http requests
+@usage disableHttpConnectionPool
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: disableHttpConnectionPool")
+		(quit-with-error)))
+
+(include-script "functions")
+
+;; Disable the connection pool and return the original enablement
+(quit 
+	(set-and-store-config-value "http.client.enableConnectionPool" false))
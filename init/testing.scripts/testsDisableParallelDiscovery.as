@@ -0,0 +1,19 @@
+;;
+;;	testsDisableParallelDiscovery.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name disableParallelDiscovery
+@description (Tests) Disable parallel discovery of sibling sub-trees
+@usage disableParallelDiscovery
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: disableParallelDiscovery")
+		(quit-with-error)))
+
+(include-script "functions")
+
+(restore-config-value "cse.operation.discovery.enableParallel")
+(restore-config-value "cse.operation.discovery.parallelThreshold")
@@ -0,0 +1,20 @@
+;;
+;;	testsEnableBatchEndpoint.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name enableBatchEndpoint
+@description (Tests) Enable the http batch endpoint
+@usage enableBatchEndpoint
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: enableBatchEndpoint")
+		(quit-with-error)))
+
+(include-script "functions")
+
+;; Enable the batch endpoint and return the original enablement
+(quit 
+	(set-and-store-config-value "http.enableBatchEndpoint" true))
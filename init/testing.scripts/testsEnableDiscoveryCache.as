@@ -0,0 +1,22 @@
+;;
+;;	testsEnableDiscoveryCache.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name enableDiscoveryCache
+@description (Tests) Enable the discovery result cache
+@usage enableDiscoveryCache <ttl>
+@uppertester
+
+(if (!= argc 2)
+	( (log-error "Wrong number of arguments: enableDiscoveryCache <ttl>")
+	  (quit-with-error)))
+
+(include-script "functions")
+
+(set-and-store-config-value "cse.operation.discovery.resultCacheTTL" (to-number (argv 1)))
+
+;; Enable the discovery cache and return the original enablement
+(quit 
+	(set-and-store-config-value "cse.operation.discovery.enableResultCache" true))
@@ -0,0 +1,18 @@
+;;
+;;	testsEnableHttpConnectionPool.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name enableHttpConnectionPool
+@description (Tests) Restore the pooled keep-alive sessions setting for outgoing http requests
+@usage enableHttpConnectionPool
+@uppertester
+
+(if (> argc 1)
+	(	(log-error "Wrong number of arguments: enableHttpConnectionPool")
+		(quit-with-error)))
+
+(include-script "functions")
+
+(restore-config-value "http.client.enableConnectionPool")
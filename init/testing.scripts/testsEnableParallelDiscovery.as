@@ -0,0 +1,22 @@
+;;
+;;	testsEnableParallelDiscovery.as
+;;
+;;	This script is supposed to be called by the test system via the upper tester interface
+;;
+
+@name enableParallelDiscovery
+@description (Tests) Enable parallel discovery of sibling sub-trees
+@usage enableParallelDiscovery <threshold>
+@uppertester
+
+(if (!= argc 2)
+	( (log-error "Wrong number of arguments: enableParallelDiscovery <threshold>")
+	  (quit-with-error)))
+
+(include-script "functions")
+
+(set-and-store-config-value "cse.operation.discovery.parallelThreshold" (to-number (argv 1)))
+
+;; Enable parallel discovery and return the original enablement
+(quit 
+	(set-and-store-config-value "cse.operation.discovery.enableParallel" true))
@@ -7,7 +7,7 @@
 #	Configurations for unit tests
 #
 
-BINDING						= 'http'	# possible values: http, https, mqtt, ws
+BINDING						= 'http'	# possible values: http, https, mqtt, ws, coap
 
 match BINDING:
 	case 'mqtt':
@@ -35,9 +35,14 @@ match BINDING:
 		CONFIGPROTOCOL			= 'http'
 		NOTIFICATIONPROTOCOL	= 'http'
 		REMOTEPROTOCOL			= 'http'
+	case 'coap':
+		PROTOCOL				= 'coap'
+		CONFIGPROTOCOL			= 'http'
+		NOTIFICATIONPROTOCOL	= 'http'
+		REMOTEPROTOCOL			= 'http'
 
 	case _:
-		assert False, 'Supported values for BINDING are "mqtt", "ws", "http", and "https"'
+		assert False, 'Supported values for BINDING are "mqtt", "ws", "coap", "http", and "https"'
 
 # TODO ENCODING 			= 
 
@@ -97,6 +102,16 @@ wsSubProtocols		= ('oneM2M.json',)
 
 ##############################################################################
 
+#
+#	CoAP (if configured)
+#
+
+coapAddress			= 'localhost'
+coapPort			= 5683
+coapBlockSize		= 1024				# Maximum block size for sending request payloads
+
+##############################################################################
+
 #
 #	OAuth2 authentication
 #	When using OAuth to access a CSE
@@ -153,3 +168,9 @@ NOTIFICATIONDELAY   = 0.5	# Time to wait for some async notifications
 UTURL	= f'{CONFIGPROTOCOL}://{CSEHOST}:{CSEPORT}/__ut__'	# CSE's Upper Tester URL
 UTCMD	= 'X-M2M-UTCMD'
 UTRSP	= 'X-M2M-UTRSP'
+
+
+#
+#	Batch requests
+#
+BATCHURL	= f'{CONFIGPROTOCOL}://{CSEHOST}:{CSEPORT}/__batch__'	# CSE's batch endpoint URL
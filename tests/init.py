@@ -10,15 +10,15 @@
 from __future__ import annotations
 from typing import Any, Callable, Tuple, cast, Optional
 
-from urllib.parse import ParseResult, urlparse, parse_qs
-import sys, io, atexit, base64
+from urllib.parse import ParseResult, urlparse, parse_qs, unquote, unquote_plus
+import sys, io, atexit, base64, socket
 import unittest
 
 from rich.console import Console
 import requests, sys, json, time, ssl, urllib3, random, re, random
 from datetime import datetime, timezone
-from threading import Thread
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from threading import Thread, Lock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import cbor2
 from websockets.sync.client import connect, ClientConnection
 from websockets.sync.connection import Connection as WSConnection
@@ -31,6 +31,7 @@ from acme.etc import RequestUtils, DateUtils
 from acme.etc.Types import ContentSerializationType, Parameters, JSON, Operation, ResourceTypes, ResponseStatusCode
 import acme.helpers.OAuth as OAuth
 from acme.helpers.MQTTConnection import MQTTConnection, MQTTHandler
+from acme.helpers.CoAPMessage import CoAPMessage, CoAPType, CoAPCode, CoAPOption, CoAPContentFormat, encodeBlock, decodeBlock, blockSizeToSzx
 from acme.etc.Constants import Constants as C
 from acme.etc.ResponseStatusCodes import INTERNAL_SERVER_ERROR
 from config import *
@@ -388,6 +389,9 @@ def sendRequest(operation:Operation, url:str, originator:str, ty:ResourceTypes=N
 			case Operation.NOTIFY:
 				return sendWsRequest(Operation.NOTIFY, url=url, originator=originator, ty=ty, data=data, ct=ct, timeout=timeout, headers=headers)
 
+	elif url.startswith('coap'):
+		return sendCoapRequest(operation, url=url, originator=originator, ty=ty, data=data, ct=ct, timeout=timeout, headers=headers)
+
 	else:
 		print('ERROR')
 		return None, 5103
@@ -718,6 +722,151 @@ def sendWsRequest(operation:Operation, url:str, originator:str, ty:int=None, dat
 	return None
 
 
+coapMessageID:int = random.randint(0, 0xffff)
+coapLock = Lock()
+
+def openCoapSocket() -> socket.socket:
+	"""	Open a UDP socket that is connected to the CSE's CoAP server. 
+	
+		Parallel requests should use their own sockets, so that they don't receive each other's responses.
+		All messages of a block-wise transfer must be sent from the same socket.
+
+		Return:
+			The socket. It must be closed by the caller.
+	"""
+	sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+	sock.connect((coapAddress, coapPort))
+	return sock
+
+
+def exchangeCoapMessage(sock:socket.socket, message:CoAPMessage, timeout:float = 10.0) -> Optional[CoAPMessage]:
+	"""	Send a CoAP message to the CSE and wait for the response with the same token.
+		Confirmable messages are retransmitted until a response is received or the timeout expires.
+
+		Args:
+			sock: The socket to use. See `openCoapSocket()`.
+			message: The message to send. If its message ID is None then a new message ID is assigned.
+			timeout: Timeout in seconds.
+
+		Return:
+			The response message, or None in case of a timeout.
+	"""
+	global coapMessageID
+	if message.mid is None:
+		with coapLock:
+			coapMessageID = (coapMessageID + 1) & 0xffff
+			message.mid = coapMessageID
+	data = message.encode()
+
+	deadline = time.time() + timeout
+	retransmitTimeout = 2.0		# ACK_TIMEOUT
+	while (remaining := deadline - time.time()) > 0:
+		sock.send(data)
+		sock.settimeout(min(retransmitTimeout, remaining))
+		try:
+			while True:
+				response = CoAPMessage.decode(sock.recv(4096))
+				if response.token == message.token or (response.type == CoAPType.RST and response.mid == message.mid):
+					return response
+		except socket.timeout:
+			retransmitTimeout *= 2
+	return None
+
+
+def sendCoapRequest(operation:Operation, url:str, originator:str, ty:int=None, data:JSON|str=None, ct:str=None, timeout:float=None, headers:Parameters=None) -> Tuple[STRING|JSON, int]:	# type: ignore # TODO Constants
+	req, rqi, urlComponents = _packRequest(operation, url, originator, ty, data, ct, headers)
+	timeout = timeout if timeout else 10.0
+
+	# The request's attributes are sent in options
+	method = { Operation.CREATE: CoAPCode.POST, 
+			   Operation.RETRIEVE: CoAPCode.GET, 
+			   Operation.UPDATE: CoAPCode.PUT, 
+			   Operation.DELETE: CoAPCode.DELETE, 
+			   Operation.NOTIFY: CoAPCode.POST }[operation]
+	options:list[Tuple[int, bytes|str|int]] = []
+	path = urlComponents.path[1:]
+	if path.startswith('//'):
+		path = f'_{path[1:]}'
+	elif path.startswith('/'):
+		path = f'~{path}'
+	options.extend([ (CoAPOption.URI_PATH, unquote(p)) for p in path.split('/') ])
+	options.extend([ (CoAPOption.URI_QUERY, unquote_plus(q)) for q in urlComponents.query.split('&') if q ])
+	if originator is not None:
+		options.append((CoAPOption.ONEM2M_FR, originator))
+	options.append((CoAPOption.ONEM2M_RQI, rqi))
+	if ty:
+		options.append((CoAPOption.ONEM2M_TY, ty if isinstance(ty, int) else str(ty)))	# invalid types are sent as-is
+	for attribute, option in [ ('rvi', CoAPOption.ONEM2M_RVI), ('vsi', CoAPOption.ONEM2M_VSI), ('rqet', CoAPOption.ONEM2M_RQET), 
+							   ('oet', CoAPOption.ONEM2M_OET), ('ot', CoAPOption.ONEM2M_OT), ('rset', CoAPOption.ONEM2M_RSET) ]:
+		if (v := req.get(attribute)) is not None:
+			options.append((option, str(v)))
+	if (nu := findXPath(req, 'rt/nu')) is not None:
+		options.append((CoAPOption.ONEM2M_RTURI, '&'.join(nu)))
+	if headers and (inm := headers.get('If-None-Match')):
+		options.extend([ (CoAPOption.ETAG, bytes.fromhex(e.strip().strip('"'))) for e in inm.split(',') ])
+
+	payload = b''
+	if data is not None:
+		payload = data.encode('utf-8') if isinstance(data, str) else cast(bytes, RequestUtils.serializeData(data, ContentSerializationType.JSON))
+		if isinstance(payload, str):
+			payload = payload.encode('utf-8')
+		options.append((CoAPOption.CONTENT_FORMAT, CoAPContentFormat.APPLICATION_JSON))
+
+	def _request(sock:socket.socket, blockOptions:list[Tuple[int, int]], body:bytes) -> Optional[CoAPMessage]:
+		message = CoAPMessage(CoAPType.CON, method, None, random.randbytes(4))	# type: ignore [arg-type]
+		for o in options + blockOptions:
+			message.addOption(*o)
+		message.payload = body
+		if verboseRequests:
+			console.print('\n[b u]Request')
+			console.print(f'[dark_orange]{PROTOCOL}://{coapAddress}:{coapPort}[/dark_orange]')
+			console.print(message)
+		return exchangeCoapMessage(sock, message, timeout)
+
+	with openCoapSocket() as sock:
+		# Send the request payload, in blocks if necessary
+		if len(payload) > coapBlockSize:
+			szx = blockSizeToSzx(coapBlockSize)
+			for num, start in enumerate(range(0, len(payload), coapBlockSize)):
+				more = start + coapBlockSize < len(payload)
+				if (response := _request(sock, [ (CoAPOption.BLOCK1, encodeBlock(num, more, szx)) ], payload[start:start + coapBlockSize])) is None:
+					return None, 5103
+				if more and response.code != CoAPCode.CONTINUE:
+					break
+		elif (response := _request(sock, [], payload)) is None:
+			return None, 5103
+
+		# Receive the remaining blocks of the response payload
+		responsePayload = response.payload
+		while (block2 := response.getUintOption(CoAPOption.BLOCK2)) is not None and decodeBlock(block2)[1]:
+			num, _, szx = decodeBlock(block2)
+			if (response := _request(sock, [ (CoAPOption.BLOCK2, encodeBlock(num + 1, False, szx)) ], b'')) is None:
+				return None, 5103
+			responsePayload += response.payload
+
+	if verboseRequests:
+		console.print('\n[b u]Response')
+		console.print(response)
+
+	# Since the tests usually work with http binding headers, some response options are mapped
+	hds = dict()
+	for f, option in [ (C.hfRVI, CoAPOption.ONEM2M_RVI), (C.hfVSI, CoAPOption.ONEM2M_VSI), (C.hfOT, CoAPOption.ONEM2M_OT), (C.hfRST, CoAPOption.ONEM2M_RSET) ]:
+		if (v := response.getStringOption(option)) is not None:
+			hds[f] = v
+	if (etag := response.getOption(CoAPOption.ETAG)) is not None:
+		hds['ETag'] = f'"{etag.hex()}"'
+	setLastHeaders(hds)
+
+	rsc = response.getUintOption(CoAPOption.ONEM2M_RSC)
+	if rsc is None:		# Not a oneM2M response, e.g. a reset or a CoAP error
+		return None, 5103
+	if not responsePayload:
+		return None, rsc
+	if response.getUintOption(CoAPOption.CONTENT_FORMAT) == CoAPContentFormat.APPLICATION_CBOR:
+		return cbor2.loads(responsePayload), rsc
+	return json.loads(responsePayload.decode('utf-8')), rsc
+
+
 _lastRequstID = None
 
 def setLastRequestID(rid:str) -> None:
@@ -734,6 +883,20 @@ def lastRequestID() -> str:
 	return _lastRequstID
 
 
+def batchEndpointEnabled() -> bool:
+	"""	Check whether the CSE's batch endpoint is enabled. 
+
+		Return:
+			True if the batch endpoint is available.
+	"""
+	try:
+		headers:Parameters = {}
+		addHttpAuthorizationHeader(headers)
+		return requests.post(BATCHURL, headers = headers, verify = verifyCertificate).status_code not in (404, 405)
+	except Exception:
+		return False
+
+
 def connectionPossible(url:str) -> bool:
 	"""	Check whether a connection to the CSE is possible and the CSE is running. This is
 		done by retrieving the CSEBase using the protocol binding that is used also
@@ -882,6 +1045,110 @@ def isShortRequestExpirations() -> bool:
 	return _orgRequestExpirationDelta != -1.0
 
 
+# Reconfigure the server to discover sibling sub-trees in parallel. This is set to the
+# old value in the tearDowndClass() method.
+def enableParallelDiscovery(threshold:int = 1) -> None:
+	"""	Enable the parallel discovery in the CSE.
+
+		Args:
+			threshold: Minimum number of sibling resources for parallel discovery.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'enableParallelDiscovery {threshold}'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def disableParallelDiscovery() -> None:
+	"""	Disable the parallel discovery in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'disableParallelDiscovery'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def enableDiscoveryCache(ttl:float = 60.0) -> None:
+	"""	Enable the discovery result cache in the CSE.
+
+		Args:
+			ttl: Time in seconds after which a cached result expires.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'enableDiscoveryCache {ttl}'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def disableDiscoveryCache() -> None:
+	"""	Disable the discovery result cache in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'disableDiscoveryCache'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def disableHttpConnectionPool() -> None:
+	"""	Disable the pooled keep-alive sessions for outgoing http requests in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'disableHttpConnectionPool'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def enableHttpConnectionPool() -> None:
+	"""	Restore the original setting for pooled keep-alive sessions for outgoing http requests in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'enableHttpConnectionPool'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def enableBatchEndpoint() -> None:
+	"""	Enable the batch endpoint in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'enableBatchEndpoint'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
+def disableBatchEndpoint() -> None:
+	"""	Restore the original enablement of the batch endpoint in the CSE.
+	"""
+	if not RECONFIGURATIONENABLED:
+		return
+
+	# Send UT request
+	headers = { UTCMD: f'disableBatchEndpoint'}
+	addHttpAuthorizationHeader(headers)
+	requests.post(UTURL, headers = headers)
+
+
 def testCaseStart(name:str) -> None:
 	"""	Indicate the start of a new test case to the CSE via the UT interface.
 
@@ -927,9 +1194,35 @@ if not verifyCertificate:
 #	Notification Server
 #
 
+notificationConnections:set[socket.socket]	= set()
+""" Open (keep-alive) connections to the notification server. """
+notificationLock								= Lock()
+""" Lock to handle notifications one after the other, even if received on different connections. """
+notificationCount								= 0
+""" Number of notifications received by the notification server. """
+
+
 class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'	# Allow keep-alive connections
+
+	def setup(self) -> None:
+		super().setup()
+		notificationConnections.add(self.connection)
+
+
+	def finish(self) -> None:
+		super().finish()
+		notificationConnections.discard(self.connection)
+
 		
 	def do_POST(self) -> None:
+		global notificationCount
+		with notificationLock:
+			notificationCount += 1
+			self._handlePOST()
+
+
+	def _handlePOST(self) -> None:
 		global nextNotificationResult
 
 		# Construct return header
@@ -938,6 +1231,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
 		self.send_header(C.hfRSC, str(int(nextNotificationResult)))
 		self.send_header(C.hfOT, DateUtils.getResourceDate())
 		self.send_header(C.hfOrigin, ORIGINATORNotifResp)
+		self.send_header('Content-Length', '0')
 		if C.hfRI in self.headers:
 			self.send_header(C.hfRI, self.headers[C.hfRI])
 		nextNotificationResult = ResponseStatusCode.OK
@@ -976,11 +1270,19 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
 		pass
 
 
+class NotificationHTTPServer(ThreadingHTTPServer):
+
+	def handle_error(self, request:Any, client_address:Any) -> None:
+		# Ignore connections that were closed by the client or when stopping the server
+		if not isinstance(sys.exc_info()[1], ConnectionError):
+			super().handle_error(request, client_address)
+
+
 notificationServerIsRunning = False
 
 def runNotificationServer() -> None:
 	global notificationServerIsRunning
-	httpd = HTTPServer(('', NOTIFICATIONPORT), SimpleHTTPRequestHandler)
+	httpd = NotificationHTTPServer(('', NOTIFICATIONPORT), SimpleHTTPRequestHandler)
 	if PROTOCOL == 'https':
 		# init ssl socket
 		context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)					# Create a SSL Context
@@ -990,6 +1292,14 @@ def runNotificationServer() -> None:
 	notificationServerIsRunning = True
 	while notificationServerIsRunning:
 		httpd.handle_request()
+	
+	# Close the server and all connections that are still kept alive by a client
+	httpd.server_close()
+	for connection in list(notificationConnections):
+		try:
+			connection.shutdown(socket.SHUT_RDWR)
+		except OSError:
+			pass
 
 
 def startNotificationServer() -> None:
@@ -1018,6 +1328,15 @@ def isNotificationServerRunning() -> bool:
 	except Exception:
 		return False
 
+def getNotificationCount() -> int:
+	"""	Return the number of notifications received by the notification server so far.
+
+		Return:
+			The number of received notifications.
+	"""
+	return notificationCount
+
+
 lastNotification:JSON						= None
 lastNotificationHeaders:Parameters 			= {}
 lastNotificationArguments:Parameters 		= {}
@@ -1257,6 +1576,7 @@ match PROTOCOL:
 # It checks whether there actually is a CSE running.
 noCSE = not connectionPossible(cseURL)
 noRemote = not connectionPossible(REMOTEcseURL)
+noBatch = noCSE or not (RECONFIGURATIONENABLED or batchEndpointEnabled())	# The tests enable the batch endpoint via the upper tester
 
 if UPPERTESTERENABLED:
 	try:
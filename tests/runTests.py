@@ -234,8 +234,8 @@ if __name__ == '__main__':
 						f'{v[2]:8.4f} | {v[6]:6.2f} | {v[3]:8.4f}' if v[0] > 0 else f'{0:8.4f} | {0:6.2f} | {0:8.4f}', 
 						# f'{v[6]:.2f}',
 						# f'{v[3]:.4f}' if v[0] > 0 else '',
-						f'{(v[2]/v[0]):7.4f} | {(v[2]/v[5]):7.4f}' if v[0] > 0 else f'{0:7.4f} | {0:7.4f}',
-						f'{(v[3]/v[0]):7.4f} | {(v[3]/v[5]):7.4f}' if v[0] > 0 else f'{0:7.4f} | {0:7.4f}',
+						f'{(v[2]/v[0]):7.4f} | {(v[2]/v[5] if v[5] > 0 else 0):7.4f}' if v[0] > 0 else f'{0:7.4f} | {0:7.4f}',
+						f'{(v[3]/v[0]):7.4f} | {(v[3]/v[5] if v[5] > 0 else 0):7.4f}' if v[0] > 0 else f'{0:7.4f} | {0:7.4f}',
 						f'{v[5]}',
 						style=style)
 	console.print(table)
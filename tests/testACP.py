@@ -831,6 +831,156 @@ class TestACP(unittest.TestCase):
 		DELETE(grp2URL, ORIGINATOR)
 		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
 
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_updateACPRevokesCachedAccess(self) -> None:
+		"""	Test that a previously granted access is revoked immediately after an ACP update """
+
+		#
+		#	CSEBase                             
+		#    ├─acp                       
+		#    └─cnt                      
+
+		DELETE(acpURL, ORIGINATOR)
+		dct = 	{ "m2m:acp": {
+					"rn": acpRN,
+					"pv": {
+						"acr": [ {
+							"acor": [ self.acpORIGINATOR ],
+							"acop": Permission.RETRIEVE,
+						}]
+					},
+					"pvs": { 
+						"acr": [ {
+							"acor": [ ORIGINATOR ],
+							"acop": Permission.ALL
+						} ]
+					},
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.ACP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		acpRi = findXPath(r, 'm2m:acp/ri')
+
+		dct = 	{ "m2m:cnt": {
+					"rn": cntRN,
+					"acpi": [ acpRi ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# Retrieve the CNT several times -> OK
+		for _ in range(3):
+			r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', self.acpORIGINATOR)
+			self.assertEqual(rsc, RC.OK, r)
+
+		# Replace the originator in the ACP
+		dct = 	{ "m2m:acp": {
+					"pv": {
+						"acr": [ {
+							"acor": [ self.acpORIGINATOR2 ],
+							"acop": Permission.RETRIEVE,
+						}]
+					}
+				}}
+		r, rsc = UPDATE(acpURL, ORIGINATOR, dct)
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+		# Retrieve the CNT with the old originator -> Fail
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', self.acpORIGINATOR)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# Retrieve the CNT with the new originator -> OK
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', self.acpORIGINATOR2)
+		self.assertEqual(rsc, RC.OK, r)
+
+		# cleanup
+		DELETE(acpURL, ORIGINATOR)
+		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_updateGRPRevokesCachedAccess(self) -> None:
+		"""	Test that a previously granted access through a GRP in acor is revoked immediately after a GRP update """
+
+		#
+		#	CSEBase                             
+		#    ├─grp                       
+		#    ├─acp                       
+		#    └─cnt                      
+
+		DELETE(aeURL, ORIGINATOR)
+		DELETE(acpURL, ORIGINATOR)
+		DELETE(grp2URL, ORIGINATOR)
+		dct = 	{ 'm2m:ae' : {
+			'rn': aeRN, 
+			'api': APPID,
+			'rr': False,
+			'srv': [ RELEASEVERSION ],
+		}}
+		ae, rsc = CREATE(cseURL, 'C', T.AE, dct)
+		self.assertEqual(rsc, RC.CREATED, ae)
+		originator = findXPath(ae, 'm2m:ae/aei')
+
+		# grp with the AE as member
+		dct = 	{ 'm2m:grp' : { 
+					'rn' : grpRN,
+					'mt' : T.MIXED,
+					'mnm': 1,
+					'mid': [ findXPath(ae, 'm2m:ae/ri') ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.GRP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		grpRi = findXPath(r, 'm2m:grp/ri')
+
+		dct = 	{ "m2m:acp": {
+					"rn": acpRN,
+					"pv": {
+						"acr": [ {
+							"acor": [ grpRi ],
+							"acop": Permission.RETRIEVE,
+						}]
+					},
+					"pvs": { 
+						"acr": [ {
+							"acor": [ ORIGINATOR ],
+							"acop": Permission.ALL
+						} ]
+					},
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.ACP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		acpRi = findXPath(r, 'm2m:acp/ri')
+
+		dct = 	{ "m2m:cnt": {
+					"rn": cntRN,
+					"acpi": [ acpRi ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# Retrieve the CNT several times -> OK
+		for _ in range(3):
+			r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', originator)
+			self.assertEqual(rsc, RC.OK, r)
+
+		# Remove the originator from the group
+		dct = 	{ 'm2m:grp' : { 
+					'mid': [ ]
+				}}
+		r, rsc = UPDATE(grp2URL, ORIGINATOR, dct)
+		self.assertEqual(rsc, RC.UPDATED, r)
+
+		# Retrieve the CNT -> Fail
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', originator)
+		self.assertEqual(rsc, RC.ORIGINATOR_HAS_NO_PRIVILEGE, r)
+
+		# cleanup
+		DELETE(aeURL, ORIGINATOR)
+		DELETE(acpURL, ORIGINATOR)
+		DELETE(grp2URL, ORIGINATOR)
+		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
+
+
 # TODO reference a non-acp resource in acpi
 # TODO acod/specialization
 
@@ -897,6 +1047,8 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 
 	# ACPT with GRP tests
 	addTest(suite, TestACP('test_testACPacorGRP'))
+	addTest(suite, TestACP('test_updateACPRevokesCachedAccess'))
+	addTest(suite, TestACP('test_updateGRPRevokesCachedAccess'))
 
 	result = unittest.TextTestRunner(verbosity=testVerbosity, failfast=testFailFast).run(suite)
 	printResult(result)
@@ -129,6 +129,41 @@ class TestCNT(unittest.TestCase):
 		self.assertEqual(findXPath(cnt, 'm2m:cnt/st'), 1)
 
 
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipUnless(BINDING in [ 'http', 'https' ], 'Only when testing with http(s) binding')
+	def test_retrieveCNTConditional(self) -> None:
+		"""	Retrieve <CNT> with If-None-Match and If-Modified-Since """
+		r, rsc = RETRIEVE(cntURL, TestCNT.originator)
+		self.assertEqual(rsc, RC.OK)
+		self.assertIsNotNone(findXPath(r, 'm2m:cnt'))
+		self.assertIn('ETag', lastHeaders())
+		self.assertIn('Last-Modified', lastHeaders())
+		etag = lastHeaders()['ETag']
+		lastModified = lastHeaders()['Last-Modified']
+
+		# Not modified
+		r, rsc = RETRIEVE(cntURL, TestCNT.originator, headers = { 'If-None-Match': etag })
+		self.assertEqual(rsc, RC.OK)
+		self.assertFalse(r)
+		self.assertEqual(lastHeaders()['ETag'], etag)
+		r, rsc = RETRIEVE(cntURL, TestCNT.originator, headers = { 'If-Modified-Since': lastModified })
+		self.assertEqual(rsc, RC.OK)
+		self.assertFalse(r)
+
+		# Different entity tag
+		r, rsc = RETRIEVE(cntURL, TestCNT.originator, headers = { 'If-None-Match': '"anotherTag"' })
+		self.assertEqual(rsc, RC.OK)
+		self.assertIsNotNone(findXPath(r, 'm2m:cnt'))
+
+		# Modified
+		_, rsc = UPDATE(cntURL, TestCNT.originator, { 'm2m:cnt' : { 'lbl' : [ 'aTag' ] }})
+		self.assertEqual(rsc, RC.UPDATED)
+		r, rsc = RETRIEVE(cntURL, TestCNT.originator, headers = { 'If-None-Match': etag })
+		self.assertEqual(rsc, RC.OK)
+		self.assertIsNotNone(findXPath(r, 'm2m:cnt'))
+		self.assertNotEqual(lastHeaders()['ETag'], etag)
+
+
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	def test_updateCNTTy(self) -> None:
 		"""	Update <CNT> TY -> Fail """
@@ -267,6 +302,44 @@ class TestCNT(unittest.TestCase):
 		self.assertEqual(rsc, RC.DELETED)
 
 
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_recreateCNTUnderCSEWithSameName(self) -> None:
+		"""	Create, delete and create again <CNT> with the same name. The structured path must resolve to the new <CNT>"""
+		dct = 	{ 'm2m:cnt' : { 
+					'rn' : cntRN
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		oldRI = findXPath(r, 'm2m:cnt/ri')
+
+		# Resolve the structured and the unstructured ID
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cnt/ri'), oldRI, r)
+		r, rsc = RETRIEVE(f'{CSEURL}{oldRI}', ORIGINATOR)
+		self.assertEqual(rsc, RC.OK, r)
+
+		_, rsc = DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED)
+		_, rsc = RETRIEVE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.NOT_FOUND)
+
+		# Create again with the same name
+		r, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		newRI = findXPath(r, 'm2m:cnt/ri')
+		self.assertNotEqual(newRI, oldRI)
+
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cnt/ri'), newRI, r)
+		_, rsc = RETRIEVE(f'{CSEURL}{oldRI}', ORIGINATOR)
+		self.assertEqual(rsc, RC.NOT_FOUND)
+
+		_, rsc = DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED)
+
+
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	@unittest.skipUnless(BINDING in [ 'http', 'https' ], 'Only when testing with http(s) binding')
 	def test_createCNTWithoutOriginator(self) -> None:
@@ -295,6 +368,7 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestCNT('test_retrieveCNTWithWrongOriginator'))
 	addTest(suite, TestCNT('test_attributesCNT'))
 	addTest(suite, TestCNT('test_updateCNT'))
+	addTest(suite, TestCNT('test_retrieveCNTConditional'))
 	addTest(suite, TestCNT('test_updateCNTTy'))
 	addTest(suite, TestCNT('test_updateCNTempty'))
 	addTest(suite, TestCNT('test_updateCNTPi'))
@@ -311,6 +385,7 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestCNT('test_createCNTUnderCSE'))
 	addTest(suite, TestCNT('test_retrieveCNTUnderCSE'))
 	addTest(suite, TestCNT('test_deleteCNTUnderCSE'))
+	addTest(suite, TestCNT('test_recreateCNTUnderCSEWithSameName'))
 
 	addTest(suite, TestCNT('test_createCNTWithoutOriginator'))
 	addTest(suite, TestCNT('test_createCNTwithWrongTPE'))
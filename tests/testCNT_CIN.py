@@ -165,6 +165,49 @@ class TestCNT_CIN(unittest.TestCase):
 		self.assertEqual(findXPath(r, 'm2m:cin/con'), 'bValue')
 
 
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipUnless(BINDING in [ 'http', 'https' ], 'Only when testing with http(s) binding')
+	def test_retrieveCNTConditionalAfterAddCIN(self) -> None:
+		"""	Retrieve <CNT> with If-None-Match and If-Modified-Since after adding a <CIN> -> Modified """
+		dct = 	{ 'm2m:cnt' : { 
+					'rn'  : f'{cntRN}Conditional'
+				}}
+		r, rsc = CREATE(aeURL, TestCNT_CIN.originator, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		url = f'{aeURL}/{cntRN}Conditional'
+		r, rsc = RETRIEVE(url, TestCNT_CIN.originator)
+		self.assertEqual(rsc, RC.OK)
+		self.assertEqual(findXPath(r, 'm2m:cnt/cni'), 0)
+		self.assertFalse([ a for a in r['m2m:cnt'] if a.startswith('__') ], r)	# no internal attributes
+		etag = lastHeaders()['ETag']
+		lastModified = lastHeaders()['Last-Modified']
+
+		# Adding a <CIN> changes cni and cbs, but not lt and st of the <CNT>
+		testSleep(1.1)	# http dates have a resolution of one second
+		dct = 	{ 'm2m:cin' : {
+					'con' : testValue
+				}}
+		r, rsc = CREATE(url, TestCNT_CIN.originator, T.CIN, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# The old validators must not match anymore
+		r, rsc = RETRIEVE(url, TestCNT_CIN.originator, headers = { 'If-None-Match': etag })
+		self.assertEqual(rsc, RC.OK)
+		self.assertEqual(findXPath(r, 'm2m:cnt/cni'), 1)
+		self.assertNotEqual(lastHeaders()['ETag'], etag)
+		r, rsc = RETRIEVE(url, TestCNT_CIN.originator, headers = { 'If-Modified-Since': lastModified })
+		self.assertEqual(rsc, RC.OK)
+		self.assertEqual(findXPath(r, 'm2m:cnt/cni'), 1)
+
+		# The new entity tag matches
+		r, rsc = RETRIEVE(url, TestCNT_CIN.originator, headers = { 'If-None-Match': lastHeaders()['ETag'] })
+		self.assertEqual(rsc, RC.OK)
+		self.assertFalse(r)
+
+		r, rsc = DELETE(url, TestCNT_CIN.originator)
+		self.assertEqual(rsc, RC.DELETED, r)
+
+
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	def test_changeCNTMni(self) -> None:
 		"""	Change <CNT>.MNI to 1 -> OL == LA """
@@ -586,6 +629,7 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestCNT_CIN('test_addMoreCIN'))
 	addTest(suite, TestCNT_CIN('test_retrieveCNTLa'))
 	addTest(suite, TestCNT_CIN('test_retrieveCNTOl'))
+	addTest(suite, TestCNT_CIN('test_retrieveCNTConditionalAfterAddCIN'))
 	addTest(suite, TestCNT_CIN('test_changeCNTMni'))
 	addTest(suite, TestCNT_CIN('test_deleteCINCheckCNT'))
 	addTest(suite, TestCNT_CIN('test_deleteCNT'))
@@ -0,0 +1,196 @@
+#
+#	testCoAP.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Unit tests for the CoAP binding
+#
+
+import unittest, sys, random
+if '..' not in sys.path:
+	sys.path.append('..')
+from typing import Tuple
+from acme.etc.Types import ResourceTypes as T, ResponseStatusCode as RC
+from init import *
+
+
+def coapMessage(type:CoAPType, code:CoAPCode, path:str, payload:JSON = None, mid:int = None) -> CoAPMessage:
+	"""	Build a CoAP request message for the CSE with the admin originator.
+	"""
+	message = CoAPMessage(type, code, mid, random.randbytes(4))	# type: ignore [arg-type]
+	for p in path.split('/'):
+		message.addOption(CoAPOption.URI_PATH, p)
+	message.addOption(CoAPOption.ONEM2M_FR, ORIGINATOR)
+	message.addOption(CoAPOption.ONEM2M_RQI, uniqueID())
+	message.addOption(CoAPOption.ONEM2M_RVI, RELEASEVERSION)
+	if payload:
+		message.addOption(CoAPOption.CONTENT_FORMAT, CoAPContentFormat.APPLICATION_JSON)
+		message.payload = json.dumps(payload).encode('utf-8')
+	return message
+
+
+@unittest.skipIf(BINDING != 'coap', 'only for coap')
+class TestCoAP(unittest.TestCase):
+
+	@classmethod
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def setUpClass(cls) -> None:
+		testCaseStart('Setup TestCoAP')
+		dct = 	{ 'm2m:cnt' : {
+					'rn' : cntRN
+				}}
+		_, rsc = CREATE(cseURL, ORIGINATOR, T.CNT, dct)
+		assert rsc == RC.CREATED, 'cannot create container'
+		testCaseEnd('Setup TestCoAP')
+
+
+	@classmethod
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def tearDownClass(cls) -> None:
+		if not isTearDownEnabled():
+			return
+		testCaseStart('TearDown TestCoAP')
+		DELETE(f'{cseURL}/{cntRN}', ORIGINATOR)	# Ignore whether it exists or not
+		testCaseEnd('TearDown TestCoAP')
+
+
+	def setUp(self) -> None:
+		testCaseStart(self._testMethodName)
+
+
+	def tearDown(self) -> None:
+		testCaseEnd(self._testMethodName)
+
+
+	#########################################################################
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_pingCSE(self) -> None:
+		"""	Send an empty CON message -> RST """
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, CoAPMessage(CoAPType.CON, CoAPCode.EMPTY, None))	# type: ignore [arg-type]
+		self.assertIsNotNone(response)
+		self.assertEqual(response.type, CoAPType.RST)
+		self.assertTrue(response.isEmpty)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_retrieveCNTConfirmable(self) -> None:
+		"""	RETRIEVE <CNT> with a CON request -> piggybacked ACK """
+		message = coapMessage(CoAPType.CON, CoAPCode.GET, f'{CSERN}/{cntRN}')
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(response)
+		self.assertEqual(response.type, CoAPType.ACK)
+		self.assertEqual(response.mid, message.mid)
+		self.assertEqual(response.code, CoAPCode.CONTENT)
+		self.assertEqual(response.getUintOption(CoAPOption.ONEM2M_RSC), RC.OK)
+		self.assertEqual(response.getUintOption(CoAPOption.CONTENT_FORMAT), CoAPContentFormat.APPLICATION_JSON)
+		self.assertEqual(findXPath(json.loads(response.payload), 'm2m:cnt/rn'), cntRN)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_retrieveCNTNonConfirmable(self) -> None:
+		"""	RETRIEVE <CNT> with a NON request -> NON response """
+		message = coapMessage(CoAPType.NON, CoAPCode.GET, f'{CSERN}/{cntRN}')
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(response)
+		self.assertEqual(response.type, CoAPType.NON)
+		self.assertEqual(response.token, message.token)
+		self.assertEqual(response.code, CoAPCode.CONTENT)
+		self.assertEqual(response.getUintOption(CoAPOption.ONEM2M_RSC), RC.OK)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_createCINDuplicateMessage(self) -> None:
+		"""	CREATE <CIN> and send the same message twice -> created only once """
+		message = coapMessage(CoAPType.CON, CoAPCode.POST, f'{CSERN}/{cntRN}', { 'm2m:cin' : { 'rn' : 'coapCin', 'con' : 'aValue' }})
+		message.addOption(CoAPOption.ONEM2M_TY, T.CIN)
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+			self.assertIsNotNone(response)
+			self.assertEqual(response.code, CoAPCode.CREATED)
+			self.assertEqual(response.getUintOption(CoAPOption.ONEM2M_RSC), RC.CREATED)
+
+			# Retransmission of the same message is answered from the cache
+			duplicate = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(duplicate)
+		self.assertEqual(duplicate, response)
+
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cnt/cni'), 1)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_createLargeCINBlockwise(self) -> None:
+		"""	CREATE and RETRIEVE a <CIN> larger than the block size -> Block1 and Block2 transfers """
+		con = 'x' * (coapBlockSize * 3 + 100)
+		r, rsc = CREATE(f'{cseURL}/{cntRN}', ORIGINATOR, T.CIN, { 'm2m:cin' : { 'con' : con }})
+		self.assertEqual(rsc, RC.CREATED, r)
+		self.assertEqual(findXPath(r, 'm2m:cin/con'), con)
+
+		r, rsc = RETRIEVE(f'{cseURL}/{cntRN}/la', ORIGINATOR)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cin/con'), con)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_createOutOfOrderBlockFail(self) -> None:
+		"""	CREATE <CIN> starting with Block1 number 1 -> 4.08 Request Entity Incomplete """
+		message = coapMessage(CoAPType.CON, CoAPCode.POST, f'{CSERN}/{cntRN}', { 'm2m:cin' : { 'con' : 'aValue' }})
+		message.addOption(CoAPOption.ONEM2M_TY, T.CIN)
+		message.addOption(CoAPOption.BLOCK1, encodeBlock(1, False, blockSizeToSzx(coapBlockSize)))
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(response)
+		self.assertEqual(response.code, CoAPCode.REQUEST_ENTITY_INCOMPLETE)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_retrieveUnknownCriticalOptionFail(self) -> None:
+		"""	RETRIEVE <CNT> with an unknown critical option -> 4.02 Bad Option """
+		message = coapMessage(CoAPType.CON, CoAPCode.GET, f'{CSERN}/{cntRN}')
+		message.addOption(9, b'x')	# unassigned, odd option number
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(response)
+		self.assertEqual(response.code, CoAPCode.BAD_OPTION)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_createUnsupportedContentFormatFail(self) -> None:
+		"""	CREATE <CIN> with an XML content format -> UNSUPPORTED_MEDIA_TYPE """
+		message = coapMessage(CoAPType.CON, CoAPCode.POST, f'{CSERN}/{cntRN}')
+		message.addOption(CoAPOption.ONEM2M_TY, T.CIN)
+		message.addOption(CoAPOption.CONTENT_FORMAT, CoAPContentFormat.APPLICATION_XML)
+		message.payload = b'<m2m:cin><con>aValue</con></m2m:cin>'
+		with openCoapSocket() as sock:
+			response = exchangeCoapMessage(sock, message)
+		self.assertIsNotNone(response)
+		self.assertEqual(response.code, CoAPCode.UNSUPPORTED_CONTENT_FORMAT)
+		self.assertEqual(response.getUintOption(CoAPOption.ONEM2M_RSC), RC.UNSUPPORTED_MEDIA_TYPE)
+
+
+def run(testFailFast:bool) -> Tuple[int, int, int, float]:
+	suite = unittest.TestSuite()
+
+	addTest(suite, TestCoAP('test_pingCSE'))
+	addTest(suite, TestCoAP('test_retrieveCNTConfirmable'))
+	addTest(suite, TestCoAP('test_retrieveCNTNonConfirmable'))
+	addTest(suite, TestCoAP('test_createCINDuplicateMessage'))
+	addTest(suite, TestCoAP('test_createLargeCINBlockwise'))
+	addTest(suite, TestCoAP('test_createOutOfOrderBlockFail'))
+	addTest(suite, TestCoAP('test_retrieveUnknownCriticalOptionFail'))
+	addTest(suite, TestCoAP('test_createUnsupportedContentFormatFail'))
+
+	result = unittest.TextTestRunner(verbosity=testVerbosity, failfast=testFailFast).run(suite)
+	printResult(result)
+	return result.testsRun, len(result.errors + result.failures), len(result.skipped), getSleepTimeCount()
+
+
+if __name__ == '__main__':
+	r, errors, s, t = run(True)
+	sys.exit(errors)
@@ -23,6 +23,7 @@ from init import *
 cnt2RN = f'{cntRN}2' 
 cnt3RN = f'{cntRN}3'
 cnt4RN = f'{cntRN}4'
+cntCacheRN = f'{cntRN}Cache'
 cntARPRN = 'arpCnt'
 bat2RN	= f'{batRN}2'
 nodeID  = 'urn:sn:1234'
@@ -652,6 +653,118 @@ class TestDiscovery(unittest.TestCase):
 		self.assertEqual(rsc, RC.DELETED)
 
 
+	# Test adding arp for multiple results
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_appendArpMultiple(self) -> None:
+		""" Append arp to multiple results, and fail if one is missing """
+		dct = 	{ 'm2m:cnt' : { 
+					'rn'  : cntARPRN,
+				}}
+		_, rsc = CREATE(cntURL, TestDiscovery.originator, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED)
+
+		# arp container is missing under cnt2 -> NOT_FOUND
+		_, rsc = RETRIEVE(f'{aeURL}?rcn={int(RCN.childResources)}&ty={int(T.CNT)}&lvl=1&arp=arpCnt', TestDiscovery.originator)
+		self.assertEqual(rsc, RC.NOT_FOUND)
+
+		_, rsc = CREATE(f'{aeURL}/{cnt2RN}', TestDiscovery.originator, T.CNT, dct)
+		self.assertEqual(rsc, RC.CREATED)
+		r, rsc = RETRIEVE(f'{aeURL}?rcn={int(RCN.childResources)}&ty={int(T.CNT)}&lvl=1&arp=arpCnt', TestDiscovery.originator)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(len(findXPath(r, 'm2m:ae/m2m:cnt')), 2, r)
+		self.assertEqual(findXPath(r, 'm2m:ae/m2m:cnt/{0}/rn'), cntARPRN)
+		self.assertEqual(findXPath(r, 'm2m:ae/m2m:cnt/{1}/rn'), cntARPRN)
+		self.assertNotEqual(findXPath(r, 'm2m:ae/m2m:cnt/{0}/ri'), findXPath(r, 'm2m:ae/m2m:cnt/{1}/ri'))
+
+		_, rsc = DELETE(f'{cntURL}/arpCnt', TestDiscovery.originator) # cleanup
+		self.assertEqual(rsc, RC.DELETED)
+		_, rsc = DELETE(f'{aeURL}/{cnt2RN}/arpCnt', TestDiscovery.originator) # cleanup
+		self.assertEqual(rsc, RC.DELETED)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_discoverParallel(self) -> None:
+		""" Discover all resources under <AE> sequentially and in parallel -> same result """
+		r, rsc = RETRIEVE(f'{aeURL}?fu=1&rcn={int(RCN.discoveryResultReferences)}', TestDiscovery.originator)
+		self.assertEqual(rsc, RC.OK, r)
+		sequential = findXPath(r, 'm2m:uril')
+		self.assertGreater(len(sequential), 10)
+		r, rsc = RETRIEVE(f'{aeURL}?rcn={int(RCN.attributesAndChildResources)}', TestDiscovery.originator)
+		self.assertEqual(rsc, RC.OK, r)
+		sequentialTree = r
+
+		enableParallelDiscovery(1)	# discover every set of siblings in parallel
+		try:
+			r, rsc = RETRIEVE(f'{aeURL}?fu=1&rcn={int(RCN.discoveryResultReferences)}', TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(findXPath(r, 'm2m:uril'), sequential)
+			r, rsc = RETRIEVE(f'{aeURL}?rcn={int(RCN.attributesAndChildResources)}', TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(r, sequentialTree)
+		finally:
+			disableParallelDiscovery()
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_discoverWithResultCache(self) -> None:
+		""" Discover <CNT> under <AE> with result cache and CREATE, UPDATE, DELETE in between """
+		url = f'{aeURL}?fu=1&rcn={int(RCN.discoveryResultReferences)}&ty={int(T.CNT)}&lbl=cached'
+		enableDiscoveryCache()
+		try:
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(len(findXPath(r, 'm2m:uril')), 0, r)
+
+			# Create a matching container -> result changes
+			dct = 	{ 'm2m:cnt' : { 
+						'rn'  : cntCacheRN,
+						'lbl' : [ 'cached' ]
+					}}
+			r, rsc = CREATE(aeURL, TestDiscovery.originator, T.CNT, dct)
+			self.assertEqual(rsc, RC.CREATED, r)
+			testSleep(requestCheckDelay)	# cache invalidation is handled asynchronously
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(len(uril := findXPath(r, 'm2m:uril')), 1, r)
+			self.assertTrue(uril[0].endswith(f'/{cntCacheRN}'), r)
+
+			# Same result again
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(findXPath(r, 'm2m:uril'), uril, r)
+
+			# Update the label of the container -> no match anymore
+			dct = 	{ 'm2m:cnt' : { 
+						'lbl' : [ 'notCached' ]
+					}}
+			r, rsc = UPDATE(f'{aeURL}/{cntCacheRN}', TestDiscovery.originator, dct)
+			self.assertEqual(rsc, RC.UPDATED, r)
+			testSleep(requestCheckDelay)	# cache invalidation is handled asynchronously
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(len(findXPath(r, 'm2m:uril')), 0, r)
+
+			# Change back, and delete the container -> no match anymore
+			dct = 	{ 'm2m:cnt' : { 
+						'lbl' : [ 'cached' ]
+					}}
+			r, rsc = UPDATE(f'{aeURL}/{cntCacheRN}', TestDiscovery.originator, dct)
+			self.assertEqual(rsc, RC.UPDATED, r)
+			testSleep(requestCheckDelay)	# cache invalidation is handled asynchronously
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(len(findXPath(r, 'm2m:uril')), 1, r)
+			r, rsc = DELETE(f'{aeURL}/{cntCacheRN}', TestDiscovery.originator)
+			self.assertEqual(rsc, RC.DELETED, r)
+			testSleep(requestCheckDelay)	# cache invalidation is handled asynchronously
+			r, rsc = RETRIEVE(url, TestDiscovery.originator)
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(len(findXPath(r, 'm2m:uril')), 0, r)
+		finally:
+			disableDiscoveryCache()
+			DELETE(f'{aeURL}/{cntCacheRN}', TestDiscovery.originator)
+
+
 	# Test CREATE and RCN=9 (modifiedAttributes)
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	def test_createCNTwithRCN9(self) -> None:
@@ -974,6 +1087,9 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestDiscovery('test_retrieveCNTunderAEUnstructured'))
 	addTest(suite, TestDiscovery('test_rcn4WithDifferentFUs'))
 	addTest(suite, TestDiscovery('test_appendArp'))
+	addTest(suite, TestDiscovery('test_appendArpMultiple'))
+	addTest(suite, TestDiscovery('test_discoverParallel'))
+	addTest(suite, TestDiscovery('test_discoverWithResultCache'))
 	addTest(suite, TestDiscovery('test_createCNTwithRCN9'))
 	addTest(suite, TestDiscovery('test_updateCNTwithRCN9'))
 	addTest(suite, TestDiscovery('test_createCNTwithRCN0'))
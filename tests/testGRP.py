@@ -11,7 +11,7 @@ import unittest, sys
 if '..' not in sys.path:
 	sys.path.append('..')
 from typing import Tuple
-from acme.etc.Types import ResourceTypes as T, ResponseStatusCode as RC
+from acme.etc.Types import ResourceTypes as T, ResponseStatusCode as RC, ResponseType
 from init import *
 
 
@@ -490,6 +490,111 @@ class TestGRP(unittest.TestCase):
 		self.assertIsInstance(rsp, list)
 		self.assertEqual(len(rsp), 2)
 
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_retrieveSlowMembersViaFopt(self) -> None:
+		""" RETRIEVE slow members via fopt in parallel. Each member is a <GRP> that long-polls a <PCU>"""
+		# Create a <PCH> whose <PCU> doesn't return before the request expires
+		dct:JSON = 	{ 'm2m:pch' : { 
+					'rn' : pchRN
+				}}
+		r, rsc = CREATE(aeURL, TestGRP.originator, T.PCH, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		pchRI = findXPath(r, 'm2m:pch/ri')
+
+		# Create some groups with the <PCH> as their only member, and a group of these groups
+		mid = []
+		for i in range(3):
+			dct = 	{ 'm2m:grp' : { 
+						'rn'  : f'{grpRN}Slow{i}',
+						'mt'  : T.MIXED,
+						'mnm' : 10,
+						'mid' : [ pchRI ]
+					}}
+			r, rsc = CREATE(aeURL, TestGRP.originator, T.GRP, dct)
+			self.assertEqual(rsc, RC.CREATED, r)
+			mid.append(findXPath(r, 'm2m:grp/ri'))
+		dct = 	{ 'm2m:grp' : { 
+					'rn'  : f'{grpRN}Slow',
+					'mt'  : T.MIXED,
+					'mnm' : 10,
+					'mid' : mid
+				}}
+		r, rsc = CREATE(aeURL, TestGRP.originator, T.GRP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		try:
+			# The members are requested in parallel, so the request doesn't take much longer than a single member
+			startTime = time.time()
+			r, rsc = RETRIEVE(f'{aeURL}/{grpRN}Slow/fopt/fopt/pcu', TestGRP.originator, headers = { C.hfRET : str(int(requestExpirationDelay * 1000)) })
+			duration = time.time() - startTime
+			self.assertEqual(rsc, RC.OK, r)
+			rsp = findXPath(r, 'm2m:agr/m2m:rsp')
+			self.assertIsNotNone(rsp)
+			self.assertIsInstance(rsp, list)
+			self.assertEqual(len(rsp), 3)
+			for c in rsp:
+				self.assertEqual(findXPath(c, 'rsc'), RC.OK)
+			self.assertLess(duration, requestExpirationDelay * 2)
+		finally:
+			DELETE(f'{aeURL}/{grpRN}Slow', ORIGINATOR)
+			for i in range(3):
+				DELETE(f'{aeURL}/{grpRN}Slow{i}', ORIGINATOR)
+			DELETE(f'{aeURL}/{pchRN}', ORIGINATOR)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_retrieveSlowMembersViaFoptWithRset(self) -> None:
+		""" RETRIEVE slow members via fopt with a result expiration that is shorter than the members' delay """
+		# Create a <PCH> whose <PCU> doesn't return before the request expires
+		dct:JSON = 	{ 'm2m:pch' : {
+					'rn' : pchRN
+				}}
+		r, rsc = CREATE(aeURL, TestGRP.originator, T.PCH, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+		pchRI = findXPath(r, 'm2m:pch/ri')
+
+		# Create a group with the <AE> as a fast member (it has no <PCU> child) and the <PCH> as a slow member
+		dct = 	{ 'm2m:grp' : {
+					'rn'  : f'{grpRN}Slow',
+					'mt'  : T.MIXED,
+					'mnm' : 10,
+					'mid' : [ findXPath(TestGRP.ae, 'm2m:ae/ri'), pchRI ]
+				}}
+		r, rsc = CREATE(aeURL, TestGRP.originator, T.GRP, dct)
+		self.assertEqual(rsc, RC.CREATED, r)
+
+		# Without a request expiration the <PCU> member waits for the CSE's default request expiration delta.
+		# The result expiration is much shorter than that.
+		resultExpiration = 1.0
+		headers = { C.hfRST : str(int(resultExpiration * 1000)) }
+		try:
+			# A blocking request times out when not all members responded before the result expiration
+			startTime = time.time()
+			r, rsc = RETRIEVE(f'{aeURL}/{grpRN}Slow/fopt/pcu', TestGRP.originator, headers = headers)
+			duration = time.time() - startTime
+			self.assertEqual(rsc, RC.REQUEST_TIMEOUT, r)
+			self.assertLess(duration, resultExpiration + 1.0)
+			self.assertLess(duration, requestExpirationDelay)
+
+			# A flexBlocking request returns the partial results received before the result expiration
+			startTime = time.time()
+			r, rsc = RETRIEVE(f'{aeURL}/{grpRN}Slow/fopt/pcu?rt={int(ResponseType.flexBlocking)}', TestGRP.originator, headers = headers)
+			duration = time.time() - startTime
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertLess(duration, resultExpiration + 1.0)
+			self.assertLess(duration, requestExpirationDelay)
+			rsp = findXPath(r, 'm2m:agr/m2m:rsp')
+			self.assertIsInstance(rsp, list, r)
+			self.assertEqual(len(rsp), 1, r)		# Only the fast member
+			self.assertEqual(findXPath(rsp[0], 'rsc'), RC.NOT_FOUND, r)
+			self.assertIsInstance(findXPath(rsp[0], 'pc/m2m:dbg'), str, r)
+			self.assertIsNone(findXPath(r, 'acme:incomplete'), r)
+		finally:
+			DELETE(f'{aeURL}/{grpRN}Slow', ORIGINATOR)
+			DELETE(f'{aeURL}/{pchRN}', ORIGINATOR)
+
+
 #TODO check GRP itself: members
 
 
@@ -530,6 +635,9 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestGRP('test_createCNTCNTviaFopt'))
 	addTest(suite, TestGRP('test_deleteGRPByAssignedOriginator'))
 
+	addTest(suite, TestGRP('test_retrieveSlowMembersViaFopt'))
+	addTest(suite, TestGRP('test_retrieveSlowMembersViaFoptWithRset'))
+
 
 
 	result = unittest.TextTestRunner(verbosity=testVerbosity, failfast=testFailFast).run(suite)
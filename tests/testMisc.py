@@ -10,9 +10,9 @@
 import unittest, sys
 if '..' not in sys.path:
 	sys.path.append('..')
-import isodate
+import isodate, gzip, json
 from typing import Tuple
-from acme.etc.Types import NotificationEventType, ResponseStatusCode as RC, ResourceTypes as T
+from acme.etc.Types import NotificationEventType, ResponseStatusCode as RC, ResourceTypes as T, ResultContentType as RCN
 from acme.etc.DateUtils import getResourceDate
 from init import *
 
@@ -277,6 +277,103 @@ class TestMisc(unittest.TestCase):
 		self.assertEqual(rsc, RC.DELETED, r)
 
 
+	#
+	#	Compression
+	#
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_retrieveCompressedResponse(self) -> None:
+		""" Retrieve a large response with Accept-Encoding gzip and deflate (http only)"""
+		r, rsc = RETRIEVE(f'{cseURL}?rcn={int(RCN.attributesAndChildResources)}', ORIGINATOR, headers = { 'Accept-Encoding': 'identity' })
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertNotIn('Content-Encoding', lastHeaders())
+		uncompressed = r
+
+		for encoding in ('gzip', 'deflate'):
+			r, rsc = RETRIEVE(f'{cseURL}?rcn={int(RCN.attributesAndChildResources)}', ORIGINATOR, headers = { 'Accept-Encoding': encoding })
+			self.assertEqual(rsc, RC.OK, r)
+			self.assertEqual(lastHeaders().get('Content-Encoding'), encoding)
+			self.assertEqual(r, uncompressed)
+
+		# Don't use an encoding with q=0
+		r, rsc = RETRIEVE(f'{cseURL}?rcn={int(RCN.attributesAndChildResources)}', ORIGINATOR, headers = { 'Accept-Encoding': 'gzip;q=0, deflate' })
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(lastHeaders().get('Content-Encoding'), 'deflate')
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_retrieveSmallResponseUncompressed(self) -> None:
+		""" Retrieve a small response with Accept-Encoding gzip -> not compressed (http only)"""
+		r, rsc = RETRIEVE(cseURL, ORIGINATOR, headers = { 'Accept-Encoding': 'gzip' })
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertNotIn('Content-Encoding', lastHeaders())
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_createAECompressedRequest(self) -> None:
+		""" Create <AE> with a gzip compressed request body (http only)"""
+		dct = 	{ 'm2m:ae' : {
+					'rn': aeRN,
+					'api': 'Nacme',
+				 	'rr': False,
+				 	'srv': [ RELEASEVERSION ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOREmpty, T.AE, gzip.compress(json.dumps(dct).encode('utf-8')), headers = { 'Content-Encoding': 'gzip' })	# type: ignore[arg-type]
+		self.assertEqual(rsc, RC.CREATED, r)
+		self.assertEqual(findXPath(r, 'm2m:ae/rn'), aeRN)
+
+		# delete it again
+		r, rsc = DELETE(f'{CSEURL}{CSERN}/{aeRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED, r)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_createAEUnsupportedContentEncodingFail(self) -> None:
+		""" Create <AE> with an unsupported Content-Encoding -> Fail (http only)"""
+		dct = 	{ 'm2m:ae' : {
+					'rn': aeRN,
+					'api': 'Nacme',
+				 	'rr': False,
+				 	'srv': [ RELEASEVERSION ]
+				}}
+		r, rsc = CREATE(cseURL, ORIGINATOREmpty, T.AE, dct, headers = { 'Content-Encoding': 'compress' })
+		self.assertEqual(rsc, RC.BAD_REQUEST, r)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_createAECompressedRequestTooLargeFail(self) -> None:
+		""" Create <AE> with a gzip compressed request body that decompresses to more than the maximum body size -> Fail (http only)"""
+		data = gzip.compress(b' ' * 32 * 1024 * 1024)	# larger than the default [http]:maxRequestBodySize
+		r, rsc = CREATE(cseURL, ORIGINATOREmpty, T.AE, data, headers = { 'Content-Encoding': 'gzip' })	# type: ignore[arg-type]
+		self.assertEqual(rsc, RC.BAD_REQUEST, r)
+
+
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	@unittest.skipIf(BINDING not in [ 'http', 'https' ], 'only for http')
+	def test_createAEWithJSONComments(self) -> None:
+		""" Create <AE> with comments in the JSON request body (http only)"""
+		body = f'''{{ "m2m:ae" : {{
+					// A comment
+					"rn": "{aeRN}",
+					"api": "Nacme",
+					/* Another comment */
+					"rr": false,
+					"srv": [ "{RELEASEVERSION}" ]
+				}}}}'''
+		r, rsc = CREATE(cseURL, ORIGINATOREmpty, T.AE, body)	# type: ignore[arg-type]
+		self.assertEqual(rsc, RC.CREATED, r)
+		self.assertEqual(findXPath(r, 'm2m:ae/rn'), aeRN)
+
+		# delete it again
+		r, rsc = DELETE(f'{CSEURL}{CSERN}/{aeRN}', ORIGINATOR)
+		self.assertEqual(rsc, RC.DELETED, r)
+
+
 	#
 	#	Partial RETRIEVE
 	#
@@ -417,6 +514,16 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestMisc('test_subWithoutRN'))
 	addTest(suite, TestMisc('test_createAEContentTypeWithSpacesHeader'))
 
+	# Compression
+	addTest(suite, TestMisc('test_retrieveCompressedResponse'))
+	addTest(suite, TestMisc('test_retrieveSmallResponseUncompressed'))
+	addTest(suite, TestMisc('test_createAECompressedRequest'))
+	addTest(suite, TestMisc('test_createAEUnsupportedContentEncodingFail'))
+	addTest(suite, TestMisc('test_createAECompressedRequestTooLargeFail'))
+
+	# JSON
+	addTest(suite, TestMisc('test_createAEWithJSONComments'))
+
 	# Partial retrieve
 	addTest(suite, TestMisc('test_partialRetrieveCSEBaseSingle'))
 	addTest(suite, TestMisc('test_partialRetrieveCSEBaseMultiple'))
@@ -266,6 +266,26 @@ class TestPCH_PCU(unittest.TestCase):
 		self.assertEqual(rsc, RC.REQUEST_TIMEOUT, r)
 
 
+	@unittest.skipIf(noCSE, 'No CSEBase')
+	def test_createSUBunderCNTNoPollingFail(self) -> None:
+		"""	CREATE <SUB> under <CNT> without polling. Verification request expires -> FAIL """
+		dct = 	{ 'm2m:sub' : { 
+					'rn' : subRN,
+			        'enc': {
+			            'net': [ NET.createDirectChild ]
+					},
+					'nu': [ TestPCH_PCU.originator2 ],
+					'su': TestPCH_PCU.originator2
+				}}
+		r, rsc = CREATE(cntURL, TestPCH_PCU.originator, T.SUB, dct)
+		self.assertEqual(rsc, RC.SUBSCRIPTION_VERIFICATION_INITIATION_FAILED, r)
+
+		# The unanswered verification request must have been removed from the queue after it expired
+		testSleep(requestExpirationDelay / 2.0)
+		r, rsc = RETRIEVE(pcu2URL, TestPCH_PCU.originator2, headers={C.hfRET : str(requestExpirationDelay/2.0*1000)})	# polling request
+		self.assertEqual(rsc, RC.REQUEST_TIMEOUT, r)
+
+
 	@unittest.skipIf(noCSE, 'No CSEBase')
 	def test_createSUBunderCNT(self) -> None:
 		"""	CREATE <SUB> under <CNT> with <PCH>"""
@@ -464,6 +484,7 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestPCH_PCU('test_createPCHunderAE2'))
 	addTest(suite, TestPCH_PCU('test_accessPCUwithshortExpiration'))
 	addTest(suite, TestPCH_PCU('test_retrievePCUunderAE2Fail'))
+	addTest(suite, TestPCH_PCU('test_createSUBunderCNTNoPollingFail'))
 	addTest(suite, TestPCH_PCU('test_createSUBunderCNT'))
 	addTest(suite, TestPCH_PCU('test_DeleteSUBunderCNT'))
 	addTest(suite, TestPCH_PCU('test_accesPCUwithWrongOriginator'))
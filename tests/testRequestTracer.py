@@ -0,0 +1,148 @@
+#
+#	testRequestTracer.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Unit tests for the export formats of the RequestTracer helper. These tests don't need a running CSE.
+#
+
+import unittest, sys, os, json, tempfile
+if '..' not in sys.path:
+	sys.path.append('..')
+from typing import Any
+from acme.helpers.RequestTracer import RequestTracer, span, setTraceAttributes
+from init import *
+
+
+def _traceRequest(tracer:RequestTracer) -> None:
+	"""	Record a trace with a root span, a child span and a grandchild span.
+	"""
+	trace = tracer.startTrace('http.CREATE')
+	setTraceAttributes(op = 1, to = 'cse-in', cached = False)
+	with span('dispatcher.create'):
+		with span('storage.create'):
+			pass
+	tracer.finishTrace(trace)
+
+
+def _export(tracer:RequestTracer, exportFormat:str) -> Any:
+	"""	Export the traces to a temporary file and read them back.
+	"""
+	fd, path = tempfile.mkstemp(suffix = '.json')
+	os.close(fd)
+	try:
+		tracer.exportTraces(path, exportFormat, 'acme-test')
+		with open(path) as f:
+			return json.load(f)
+	finally:
+		os.remove(path)
+
+
+class TestRequestTracer(unittest.TestCase):
+
+	def test_exportChromeTrace(self) -> None:
+		""" Export traces in the Chrome trace event format """
+		tracer = RequestTracer(True, 1.0, 10)
+		_traceRequest(tracer)
+		_traceRequest(tracer)
+		data = _export(tracer, 'chrome')
+
+		self.assertEqual(set(data.keys()), { 'traceEvents', 'displayTimeUnit' })
+		self.assertEqual(data['displayTimeUnit'], 'ms')
+		events = data['traceEvents']
+		self.assertEqual(len(events), 8)	# 1 metadata event and 3 spans per trace
+
+		for tid in (1, 2):
+			traceEvents = [ e for e in events if e['tid'] == tid ]
+			self.assertEqual(len(traceEvents), 4)
+			meta, root, child, grandchild = traceEvents
+			self.assertEqual(meta['ph'], 'M')
+			self.assertEqual(meta['name'], 'thread_name')
+			self.assertIsInstance(meta['args']['name'], str)
+
+			self.assertEqual([ e['name'] for e in (root, child, grandchild) ], [ 'http.CREATE', 'dispatcher.create', 'storage.create' ])
+			for e in (root, child, grandchild):
+				self.assertEqual(e['ph'], 'X')
+				self.assertEqual(e['cat'], 'request')
+				self.assertEqual(e['pid'], os.getpid())
+				self.assertIsInstance(e['ts'], (int, float))
+				self.assertGreaterEqual(e['dur'], 0)
+			# Child spans are within their parent span
+			self.assertGreaterEqual(child['ts'], root['ts'])
+			self.assertGreaterEqual(grandchild['ts'], child['ts'])
+			self.assertLessEqual(grandchild['ts'] + grandchild['dur'], root['ts'] + root['dur'] + 0.001)
+
+			# Only the root span carries the attributes
+			self.assertEqual(root['args'], { 'op': 1, 'to': 'cse-in', 'cached': False })
+			self.assertNotIn('args', child)
+			self.assertNotIn('args', grandchild)
+
+
+	def test_exportOTLP(self) -> None:
+		""" Export traces in the OTLP JSON format """
+		tracer = RequestTracer(True, 1.0, 10)
+		_traceRequest(tracer)
+		data = _export(tracer, 'otlp')
+
+		self.assertEqual(len(data['resourceSpans']), 1)
+		resourceSpans = data['resourceSpans'][0]
+		self.assertEqual(resourceSpans['resource']['attributes'], [ { 'key': 'service.name', 'value': { 'stringValue': 'acme-test' } } ])
+		self.assertEqual(len(resourceSpans['scopeSpans']), 1)
+		self.assertEqual(resourceSpans['scopeSpans'][0]['scope'], { 'name': 'acme.tracing' })
+		spans = resourceSpans['scopeSpans'][0]['spans']
+		self.assertEqual(len(spans), 3)
+		root, child, grandchild = spans
+
+		# IDs are lower-case hex strings of 16 and 8 bytes
+		self.assertRegex(root['traceId'], r'^[0-9a-f]{32}$')
+		self.assertTrue(all(s['traceId'] == root['traceId'] for s in spans))
+		for s in spans:
+			self.assertRegex(s['spanId'], r'^[0-9a-f]{16}$')
+		self.assertEqual(len({ s['spanId'] for s in spans }), 3)
+
+		# Parent relations and kinds
+		self.assertNotIn('parentSpanId', root)
+		self.assertEqual(child['parentSpanId'], root['spanId'])
+		self.assertEqual(grandchild['parentSpanId'], child['spanId'])
+		self.assertEqual([ s['kind'] for s in spans ], [ 2, 1, 1 ])	# SERVER, INTERNAL, INTERNAL
+		self.assertEqual([ s['name'] for s in spans ], [ 'http.CREATE', 'dispatcher.create', 'storage.create' ])
+
+		# Timestamps are integer nanoseconds, encoded as strings
+		for s in spans:
+			self.assertIsInstance(s['startTimeUnixNano'], str)
+			self.assertIsInstance(s['endTimeUnixNano'], str)
+			self.assertLessEqual(int(s['startTimeUnixNano']), int(s['endTimeUnixNano']))
+
+		# Attributes are typed, and only the root span carries them
+		attributes = { a['key']: a['value'] for a in root['attributes'] }
+		self.assertIn('stringValue', attributes['thread.name'])
+		self.assertEqual(attributes['op'], { 'intValue': '1' })
+		self.assertEqual(attributes['to'], { 'stringValue': 'cse-in' })
+		self.assertEqual(attributes['cached'], { 'boolValue': False })
+		self.assertNotIn('attributes', child)
+		self.assertNotIn('attributes', grandchild)
+
+
+	def test_exportEmpty(self) -> None:
+		""" Export without finished traces """
+		tracer = RequestTracer(True, 1.0, 10)
+		self.assertEqual(_export(tracer, 'chrome'), { 'traceEvents': [], 'displayTimeUnit': 'ms' })
+		self.assertEqual(_export(tracer, 'otlp')['resourceSpans'][0]['scopeSpans'][0]['spans'], [])
+
+
+def run(testFailFast:bool) -> Tuple[int, int, int, float]:
+	suite = unittest.TestSuite()
+
+	addTest(suite, TestRequestTracer('test_exportChromeTrace'))
+	addTest(suite, TestRequestTracer('test_exportOTLP'))
+	addTest(suite, TestRequestTracer('test_exportEmpty'))
+
+	result = unittest.TextTestRunner(verbosity = testVerbosity, failfast = testFailFast).run(suite)
+	printResult(result)
+	return result.testsRun, len(result.errors + result.failures), len(result.skipped), getSleepTimeCount()
+
+
+if __name__ == '__main__':
+	r, errors, s, t = run(True)
+	sys.exit(errors)
@@ -35,6 +35,7 @@ class TestRequests(unittest.TestCase):
 		assert rsc == RC.CREATED, 'cannot create parent AE'
 		cls.originator = findXPath(cls.ae, 'm2m:ae/aei')
 		enableShortResourceExpirations()
+		enableBatchEndpoint()
 		testCaseEnd('Setup TestRequests')
 
 
@@ -48,6 +49,7 @@ class TestRequests(unittest.TestCase):
 		DELETE(aeURL, ORIGINATOR)	# Just delete the AE and everything below it. Ignore whether it exists or not
 		stopNotificationServer()
 		disableShortResourceExpirations()
+		disableBatchEndpoint()
 		testCaseEnd('TearDown TestRequests')
 
 
@@ -187,6 +189,66 @@ class TestRequests(unittest.TestCase):
 		self.assertEqual(rsc, RC.NOT_FOUND, r)
 
 
+	#########################################################################
+	#
+	#	Batch requests
+	#
+
+	@unittest.skipIf(noBatch, 'Batch endpoint not enabled')
+	def test_batchCreateCNTAndCINs(self) -> None:
+		"""	Batch: CREATE <CNT>, 3 x CREATE <CIN>, RETRIEVE <CNT> """
+		cntTo = f'{CSERN}/{aeRN}/{cntRN}'
+		rqps = [ { 'op': Operation.CREATE, 'to': f'{CSERN}/{aeRN}', 'rqi': 'cnt', 'ty': T.CNT, 'pc': { 'm2m:cnt': { 'rn': cntRN }}} ]
+		rqps += [ { 'op': Operation.CREATE, 'to': cntTo, 'rqi': f'cin{i}', 'ty': T.CIN, 'pc': { 'm2m:cin': { 'con': f'value{i}' }}} for i in range(3) ]
+		rqps += [ { 'op': Operation.RETRIEVE, 'to': cntTo, 'rqi': 'retrieve' } ]
+		r, rsc = NOTIFY(BATCHURL, TestRequests.originator, { 'acme:rqps': rqps })
+		self.assertEqual(rsc, RC.OK, r)
+		rsps = findXPath(r, 'acme:rsps')
+		self.assertIsInstance(rsps, list, r)
+		self.assertEqual(len(rsps), 5, r)
+		self.assertEqual([ rsp['rqi'] for rsp in rsps ], [ 'cnt', 'cin0', 'cin1', 'cin2', 'retrieve' ])
+		self.assertEqual([ rsp['rsc'] for rsp in rsps ], [ RC.CREATED ] * 4 + [ RC.OK ])
+		self.assertEqual(findXPath(rsps[2], 'pc/m2m:cin/con'), 'value1')
+		self.assertEqual(findXPath(rsps[4], 'pc/m2m:cnt/cni'), 3)
+		self.assertEqual(findXPath(rsps[4], 'pc/m2m:cnt/cbs'), 18)
+
+		r, rsc = RETRIEVE(f'{aeURL}/{cntRN}/la', TestRequests.originator)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cin/con'), 'value2')
+
+
+	@unittest.skipIf(noBatch, 'Batch endpoint not enabled')
+	def test_batchPartialFailure(self) -> None:
+		"""	Batch: failed request primitives don't affect the others """
+		cntTo = f'{CSERN}/{aeRN}/{cntRN}'
+		rqps = [ { 'op': Operation.CREATE, 'to': cntTo, 'rqi': 'wrongFr', 'fr': 'CWrong', 'ty': T.CIN, 'pc': { 'm2m:cin': { 'con': 'x' }}},
+				 { 'op': Operation.CREATE, 'to': f'{cntTo}Unknown', 'rqi': 'notFound', 'ty': T.CIN, 'pc': { 'm2m:cin': { 'con': 'x' }}},
+				 'notAnObject',
+				 { 'op': Operation.CREATE, 'to': cntTo, 'rqi': 'created', 'ty': T.CIN, 'pc': { 'm2m:cin': { 'con': 'x' }}} ]
+		r, rsc = NOTIFY(BATCHURL, TestRequests.originator, { 'acme:rqps': rqps })
+		self.assertEqual(rsc, RC.OK, r)
+		rsps = findXPath(r, 'acme:rsps')
+		self.assertEqual([ rsp['rsc'] for rsp in rsps ], [ RC.ORIGINATOR_HAS_NO_PRIVILEGE, RC.NOT_FOUND, RC.BAD_REQUEST, RC.CREATED ], r)
+
+		r, rsc = RETRIEVE(f'{aeURL}/{cntRN}', TestRequests.originator)
+		self.assertEqual(rsc, RC.OK, r)
+		self.assertEqual(findXPath(r, 'm2m:cnt/cni'), 4)
+
+
+	@unittest.skipIf(noBatch, 'Batch endpoint not enabled')
+	def test_batchMissingOriginatorFail(self) -> None:
+		"""	Batch without originator -> Fail """
+		r, rsc = NOTIFY(BATCHURL, None, { 'acme:rqps': [] })
+		self.assertEqual(rsc, RC.BAD_REQUEST, r)
+
+
+	@unittest.skipIf(noBatch, 'Batch endpoint not enabled')
+	def test_batchWrongContentFail(self) -> None:
+		"""	Batch without a list of request primitives -> Fail """
+		r, rsc = NOTIFY(BATCHURL, TestRequests.originator, { 'acme:rqps': { 'op': Operation.RETRIEVE, 'to': CSERN } })
+		self.assertEqual(rsc, RC.BAD_REQUEST, r)
+
+
 def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	suite = unittest.TestSuite()
 		
@@ -209,6 +271,12 @@ def run(testFailFast:bool) -> Tuple[int, int, int, float]:
 	addTest(suite, TestRequests('test_RSETpastFail'))
 
 	addTest(suite, TestRequests('test_RSETNonBlockingSynchFail'))
+
+	# Batch requests
+	addTest(suite, TestRequests('test_batchCreateCNTAndCINs'))
+	addTest(suite, TestRequests('test_batchPartialFailure'))
+	addTest(suite, TestRequests('test_batchMissingOriginatorFail'))
+	addTest(suite, TestRequests('test_batchWrongContentFail'))
 	
 	result = unittest.TextTestRunner(verbosity=testVerbosity, failfast=testFailFast).run(suite)
 	
@@ -0,0 +1,144 @@
+#
+#	testSingleFlight.py
+#
+#	(c) 2024 by Andreas Kraft
+#	License: BSD 3-Clause License. See the LICENSE file for further details.
+#
+#	Unit tests for the SingleFlight helper. These tests don't need a running CSE.
+#
+
+import unittest, sys
+if '..' not in sys.path:
+	sys.path.append('..')
+from threading import Event, Thread
+from typing import Any
+from acme.helpers.SingleFlight import SingleFlight
+from init import *
+
+
+def _waitForShared(flight:SingleFlight, shared:int) -> None:
+	"""	Wait until the given number of calls has joined a call in progress.
+	"""
+	for _ in range(500):
+		if flight.getStats()['shared'] >= shared:
+			return
+		testSleep(0.01)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+	def test_concurrentCallsShareResult(self) -> None:
+		""" Concurrent calls with the same key share a single execution """
+		flight = SingleFlight()
+		release = Event()
+		executions = 0
+		results:list[Any] = []
+
+		def func() -> dict:
+			nonlocal executions
+			executions += 1
+			release.wait(5)
+			return { 'value': 42 }
+
+		def call() -> None:
+			results.append(flight.do('key', func))
+
+		threads = [ Thread(target = call) for _ in range(5) ]
+		threads[0].start()
+		testSleep(0.1)	# let the first call start the execution
+		for t in threads[1:]:
+			t.start()
+		_waitForShared(flight, 4)
+		release.set()
+		for t in threads:
+			t.join(5)
+
+		self.assertEqual(executions, 1)
+		self.assertEqual(len(results), 5)
+		for result, shared in results:
+			self.assertEqual(result, { 'value': 42 })
+			self.assertTrue(shared)
+		self.assertEqual(flight.getStats(), { 'calls': 1, 'shared': 4 })
+
+
+	def test_exceptionIsShared(self) -> None:
+		""" An exception of the executing call is raised in all waiting calls """
+		flight = SingleFlight()
+		release = Event()
+		errors:list[BaseException] = []
+
+		def func() -> None:
+			release.wait(5)
+			raise ValueError('failed')
+
+		def call() -> None:
+			try:
+				flight.do('key', func)
+			except ValueError as e:
+				errors.append(e)
+
+		threads = [ Thread(target = call) for _ in range(3) ]
+		threads[0].start()
+		testSleep(0.1)
+		for t in threads[1:]:
+			t.start()
+		_waitForShared(flight, 2)
+		release.set()
+		for t in threads:
+			t.join(5)
+
+		self.assertEqual(len(errors), 3)
+		self.assertTrue(all(str(e) == 'failed' for e in errors))
+
+
+	def test_sequentialCallsAreExecutedAgain(self) -> None:
+		""" A call after a finished call with the same key is executed again """
+		flight = SingleFlight()
+		values = iter(range(10))
+		self.assertEqual(flight.do('key', lambda: next(values)), (0, False))
+		self.assertEqual(flight.do('key', lambda: next(values)), (1, False))
+		self.assertEqual(flight.getStats(), { 'calls': 2, 'shared': 0 })
+
+
+	def test_differentKeysAreNotShared(self) -> None:
+		""" A call with a different key, e.g. another write generation, doesn't join a call in progress """
+		flight = SingleFlight()
+		release = Event()
+		results:dict[Any, Any] = {}
+
+		def call(key:Any) -> None:
+			def func() -> Any:
+				release.wait(5)
+				return key
+			results[key] = flight.do(key, func)
+
+		first = Thread(target = call, args = (('ri', 1),))
+		first.start()
+		testSleep(0.1)
+		second = Thread(target = call, args = (('ri', 2),))
+		second.start()
+		testSleep(0.1)
+		release.set()
+		first.join(5)
+		second.join(5)
+
+		self.assertEqual(results, { ('ri', 1): (('ri', 1), False), ('ri', 2): (('ri', 2), False) })
+		self.assertEqual(flight.getStats(), { 'calls': 2, 'shared': 0 })
+
+
+def run(testFailFast:bool) -> Tuple[int, int, int, float]:
+	suite = unittest.TestSuite()
+
+	addTest(suite, TestSingleFlight('test_concurrentCallsShareResult'))
+	addTest(suite, TestSingleFlight('test_exceptionIsShared'))
+	addTest(suite, TestSingleFlight('test_sequentialCallsAreExecutedAgain'))
+	addTest(suite, TestSingleFlight('test_differentKeysAreNotShared'))
+
+	result = unittest.TextTestRunner(verbosity = testVerbosity, failfast = testFailFast).run(suite)
+	printResult(result)
+	return result.testsRun, len(result.errors + result.failures), len(result.skipped), getSleepTimeCount()
+
+
+if __name__ == '__main__':
+	r, errors, s, t = run(True)
+	sys.exit(errors)
@@ -11,7 +11,7 @@
 from __future__ import annotations
 from http.client import HTTPMessage
 from typing import cast
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import email.parser
 import json, argparse, sys, ssl, signal, time
 import cbor2
@@ -42,14 +42,17 @@ failVerification = False
 delayResponse:int = 0
 
 class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'	# Allow keep-alive connections
 
 	def do_GET(self) -> None:
 		"""	Just provide a simple web page.
 		"""
+		page = bytes("<html><head><title>[ACME] Notification Server</title></head><body>This server doesn't provide a web page.</body></html>","utf-8")
 		self.send_response(200)
 		self.send_header('Content-type', 'text/html')
+		self.send_header('Content-Length', str(len(page)))
 		self.end_headers()
-		self.wfile.write(bytes("<html><head><title>[ACME] Notification Server</title></head><body>This server doesn't provide a web page.</body></html>","utf-8")) 
+		self.wfile.write(page) 
 
 
 	def do_POST(self) -> None:
@@ -78,6 +81,7 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
 		self.send_response(200)
 		self.send_header('X-M2M-RSC', '2000' if not failVerification else '4101')
 		self.send_header('X-M2M-RI', requestID)
+		self.send_header('Content-Length', '0')
 		_responseHeaders = self._headers_buffer	# type:ignore [attr-defined]
 		self.end_headers()
 
@@ -327,7 +331,7 @@ if __name__ == '__main__':
 	delayResponse = args.delayResponse
 
 	# run http(s) server
-	httpd = HTTPServer(('', args.port), SimpleHTTPRequestHandler)
+	httpd = ThreadingHTTPServer(('', args.port), SimpleHTTPRequestHandler)
 	
 	if args.usehttps:
 		# init ssl socket